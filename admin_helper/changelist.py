@@ -0,0 +1,112 @@
+import json
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that estimates the number of objects of large PostgreSQL tables instead of counting them.
+
+    An unfiltered queryset is estimated from the table statistics (pg_class.reltuples) and a filtered one from the
+    row estimate of the query plan (EXPLAIN). Only when the estimate reaches ADMIN_ESTIMATED_COUNT_THRESHOLD it is
+    used as the count, smaller results are counted exactly as usual. The estimate is approximate, so the last pages
+    of a large result may be empty or missing.
+    """
+
+    @cached_property
+    def count(self):
+        estimated_count = self.get_estimated_count()
+        if estimated_count is None or estimated_count < settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+            return super().count
+        return estimated_count
+
+    def get_estimated_count(self) -> Optional[int]:
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        with connection.cursor() as cursor:
+            if not queryset.query.where and not queryset.query.distinct:
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+                # reltuples is -1 for a table that has never been analyzed
+                return int(row[0]) if row and row[0] >= 0 else None
+
+            sql, params = queryset.order_by().values("pk").query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class PageAnnotatedChangeList(ChangeList):
+    """ChangeList that lets the model admin annotate the objects of the displayed page after they are fetched"""
+
+    def get_results(self, request):
+        super().get_results(request)
+        self.result_list = self.model_admin.annotate_changelist_page(request, list(self.result_list))
+
+
+class LargeTableChangelistAdminMixin:
+    """
+    Keeps the changelist of a large table fast.
+
+    - The result count is estimated with EstimatedCountPaginator and the unfiltered total count is not shown.
+    - Annotations required by list_display callables (see `requires_annotation`) are computed only for the objects
+      of the displayed page with one extra query, instead of for the whole filtered queryset. get_queryset of the
+      admin must not apply them for the changelist, which suggest_queryset_optimizations takes into account.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    annotates_changelist_page = True
+
+    def get_changelist(self, request, **kwargs):
+        return PageAnnotatedChangeList
+
+    def get_changelist_page_annotations(self, request) -> list[Callable]:
+        """Return the annotation callbacks required by list_display, as functions taking and returning a queryset"""
+        annotations = []
+        for field in self.get_list_display(request):
+            if callable(field):
+                attr = field
+            else:
+                attr = getattr(self, field, None) or getattr(self.model, field, None)
+            callback = getattr(attr, "annotation_callback", None)
+            if callback is None:
+                continue
+            if getattr(type(self), callback.__name__, None) is callback:
+                callback = getattr(self, callback.__name__)
+            if callback not in annotations:
+                annotations.append(callback)
+        return annotations
+
+    def annotate_changelist_page(self, request, objects: list) -> list:
+        annotations = self.get_changelist_page_annotations(request)
+        if not annotations or not objects:
+            return objects
+
+        queryset = self.model._base_manager.filter(pk__in=[obj.pk for obj in objects])
+        existing_annotations = set(queryset.query.annotations)
+        for annotate in annotations:
+            queryset = annotate(queryset)
+        names = [name for name in queryset.query.annotations if name not in existing_annotations]
+
+        values_by_pk = {values.pop("pk"): values for values in queryset.values("pk", *names)}
+        for obj in objects:
+            for name, value in values_by_pk.get(obj.pk, {}).items():
+                setattr(obj, name, value)
+        return objects
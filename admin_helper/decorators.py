@@ -14,7 +14,8 @@ def requires_annotation(callback):
 def requires_fields(*fields):
     """
     Decorator to annotate admin or model methods with the database fields they require.
-    Allows suggest_queryset_optimizations to recursively introspect callables and prevent N+1 queries.
+    Allows suggest_queryset_optimizations and admin_helper.optimizer to recursively introspect callables and prevent
+    N+1 queries.
     """
 
     def decorator(func):
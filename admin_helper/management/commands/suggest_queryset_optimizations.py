@@ -74,6 +74,8 @@ class AdminQuerySetGenerator:
             "list": {"select": {}, "prefetch": {}, "annotations": set()},
             "detail": {"select": {}, "prefetch": {}, "annotations": set()},
         }
+        # Annotation callbacks in discovery order, as (callback, is_admin_method), for applying them at runtime
+        self.annotation_callbacks = {"list": [], "detail": []}
 
     def generate(self) -> str:
         self.discover_fields()
@@ -103,7 +105,7 @@ class AdminQuerySetGenerator:
             for field in fields or []:
                 self.process_field(field, "detail", source_name)
 
-    def traverse_path(self, path: str, view_type: str, source_attr: str):
+    def traverse_path(self, path: str, view_type: str, source_attr: str, inspect_str: bool = True):
         parts = path.split("__")
         current_model = self.model
         orm_path = []
@@ -142,7 +144,7 @@ class AdminQuerySetGenerator:
 
                 current_model = field.related_model
 
-                if i == len(parts) - 1:
+                if i == len(parts) - 1 and inspect_str:
                     self.inspect_dunder_str(current_model, current_path, view_type, source_attr)
 
             except FieldDoesNotExist:
@@ -219,14 +221,20 @@ class AdminQuerySetGenerator:
             self.warn(f"Callable '{name}'{location} lacks decorator metadata.")
             return
 
-        if has_annotation:
+        # Admins annotating the changelist page themselves (LargeTableChangelistAdminMixin) must not annotate the
+        # whole changelist queryset
+        page_annotated = view_type == "list" and getattr(self.admin_class, "annotates_changelist_page", False)
+        if has_annotation and not page_annotated:
             callback = getattr(callable_obj, "annotation_callback")
             callback_name = callback.__name__
-            if hasattr(self.admin_class, callback_name) and getattr(self.admin_class, callback_name) == callback:
+            is_admin_method = getattr(self.admin_class, callback_name, None) == callback
+            if is_admin_method:
                 callback_str = f"self.{callback_name}(qs)"
             else:
                 callback_str = f"{callback_name}(qs)"
             self.reqs[view_type]["annotations"].add((callback_str, source_attr))
+            if (callback, is_admin_method) not in self.annotation_callbacks[view_type]:
+                self.annotation_callbacks[view_type].append((callback, is_admin_method))
 
         if has_required:
             for req_field in getattr(callable_obj, "required_fields"):
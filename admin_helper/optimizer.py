@@ -0,0 +1,168 @@
+"""
+Runtime queryset optimization driven by the @requires_fields and @requires_annotation metadata.
+
+The same discovery as the suggest_queryset_optimizations command is run once per admin or serializer class, and the
+resulting select_related/prefetch_related/annotation plan is applied to the querysets automatically, so the plans
+don't go stale when list_display, fieldsets or the decorated methods change.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import cache
+from typing import Callable
+
+from django.contrib.admin.options import BaseModelAdmin, InlineModelAdmin
+from django.db import models
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from admin_helper.management.commands.suggest_queryset_optimizations import AdminQuerySetGenerator
+
+logger = logging.getLogger("admin_helper")
+
+
+@dataclass(frozen=True)
+class QuerySetPlan:
+    """Relations to select and prefetch and annotations to add for rendering a view without N+1 queries"""
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[str, ...] = ()
+    annotations: tuple[tuple[Callable, bool], ...] = ()
+
+    def __bool__(self):
+        return bool(self.select_related or self.prefetch_related or self.annotations)
+
+    def apply(self, queryset: models.QuerySet, owner=None) -> models.QuerySet:
+        """
+        Apply the plan to the queryset. Annotation callbacks defined on the admin or serializer class are called as
+        methods of `owner`. Prefetches already set up on the queryset, e.g. with a filtered Prefetch object, are kept.
+        """
+        for callback, is_method in self.annotations:
+            queryset = getattr(owner, callback.__name__)(queryset) if is_method else callback(queryset)
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        existing_prefetches = {
+            lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+            for lookup in queryset._prefetch_related_lookups
+        }
+        prefetches = [lookup for lookup in self.prefetch_related if lookup not in existing_prefetches]
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
+
+
+def _build_plan(generator: AdminQuerySetGenerator, view_type: str) -> QuerySetPlan:
+    requirements = generator.reqs[view_type]
+    return QuerySetPlan(
+        select_related=tuple(sorted(requirements["select"])),
+        prefetch_related=tuple(sorted(requirements["prefetch"])),
+        annotations=tuple(generator.annotation_callbacks[view_type]),
+    )
+
+
+def _create_generator(owner_class, model) -> AdminQuerySetGenerator:
+    return AdminQuerySetGenerator(
+        admin_class=owner_class,
+        model=model,
+        error_handler=lambda msg: logger.warning(f"Queryset optimizer: {msg}"),
+        warning_handler=lambda msg: logger.debug(f"Queryset optimizer: {msg}"),
+    )
+
+
+@cache
+def get_admin_queryset_plans(admin_class: type[BaseModelAdmin], model: type[models.Model]) -> dict[str, QuerySetPlan]:
+    """Return the changelist ("list") and change view ("detail") plans of the admin class, computed on first use"""
+    generator = _create_generator(admin_class, model)
+    generator.discover_fields()
+    return {view_type: _build_plan(generator, view_type) for view_type in ("list", "detail")}
+
+
+def _discover_serializer_fields(
+    generator: AdminQuerySetGenerator, serializer: serializers.BaseSerializer, prefix: str = ""
+):
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        source = f"{serializer.__class__.__name__}.{name}"
+        if isinstance(field, serializers.SerializerMethodField):
+            method = getattr(type(serializer), field.method_name, None)
+            if method is not None:
+                generator.process_callable_logic(method, prefix, "detail", source, attr_name=field.method_name)
+        elif field.source == "*":
+            if isinstance(field, serializers.BaseSerializer):
+                _discover_serializer_fields(generator, field, prefix)
+        else:
+            _discover_serializer_field_source(generator, field, prefix, source)
+
+
+def _discover_serializer_field_source(generator: AdminQuerySetGenerator, field, prefix: str, source: str):
+    path = "__".join(filter(None, [prefix, *field.source.split(".")]))
+    if isinstance(field, serializers.BaseSerializer):
+        generator.traverse_path(path, "detail", source, inspect_str=False)
+        child = field.child if isinstance(field, serializers.ListSerializer) else field
+        _discover_serializer_fields(generator, child, path)
+    elif isinstance(field, serializers.ManyRelatedField):
+        # Primary keys of to-many relations are still read from the related table
+        is_pk_only = isinstance(field.child_relation, serializers.PrimaryKeyRelatedField)
+        generator.traverse_path(path, "detail", source, inspect_str=not is_pk_only)
+    elif not isinstance(field, serializers.PrimaryKeyRelatedField) or "." in field.source:
+        # The primary key of a to-one relation is read from the foreign key column of the row itself
+        generator.traverse_path(path, "detail", source)
+
+
+@cache
+def get_serializer_queryset_plan(serializer_class: type[serializers.BaseSerializer]) -> QuerySetPlan:
+    """Return the plan for serializing instances with the serializer class, computed on first use"""
+    generator = _create_generator(serializer_class, serializer_class.Meta.model)
+    _discover_serializer_fields(generator, serializer_class())
+    return _build_plan(generator, "detail")
+
+
+class QuerySetOptimizerAdminMixin:
+    """
+    Applies the select_related/prefetch_related/annotation plan computed from list_display, readonly_fields, fields
+    and fieldsets and the metadata of the callables they refer to. Changelists use the list plan, change views and
+    inlines the detail plan, and other views (delete, history, autocomplete, ...) the unoptimized queryset.
+    """
+
+    def get_queryset_plan(self, request) -> QuerySetPlan | None:
+        plans = get_admin_queryset_plans(type(self), self.model)
+        if isinstance(self, InlineModelAdmin):
+            return plans["detail"]
+
+        resolver_match = getattr(request, "resolver_match", None)
+        if not resolver_match or not resolver_match.url_name:
+            return None
+        if resolver_match.url_name.endswith("_changelist"):
+            return plans["list"]
+        if resolver_match.url_name.endswith("_change"):
+            return plans["detail"]
+        return None
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        plan = self.get_queryset_plan(request)
+        return plan.apply(qs, self) if plan else qs
+
+
+class QuerySetOptimizerViewSetMixin:
+    """
+    Applies the select_related/prefetch_related/annotation plan computed from the fields of the viewset's serializer
+    class for reading actions. Prefetches set up by the viewset itself take precedence.
+    """
+
+    optimized_actions = ("list", "retrieve")
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action not in self.optimized_actions:
+            return qs
+
+        serializer_class = self.get_serializer_class()
+        if serializer_class is None or not hasattr(getattr(serializer_class, "Meta", None), "model"):
+            return qs
+        plan = get_serializer_queryset_plan(serializer_class)
+        return plan.apply(qs, serializer_class(context=self.get_serializer_context())) if plan else qs
@@ -0,0 +1,52 @@
+from typing import Callable
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def assert_constant_changelist_query_count(client, changelist_url: str, create_objects: Callable[[int], object]):
+    """
+    Test helper asserting that the number of queries of a changelist page doesn't depend on the number of rows on it.
+    The changelist is requested with one row and again after `create_objects(n)` has added more rows.
+    """
+
+    def count_queries():
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(changelist_url, follow=True)
+        assert response.status_code == 200
+        return len(response.context["cl"].result_list), len(context.captured_queries)
+
+    create_objects(1)
+    rows_before, queries_before = count_queries()
+    create_objects(4)
+    rows_after, queries_after = count_queries()
+
+    assert rows_after > rows_before, "The changelist page must show the created objects"
+    assert queries_after == queries_before, (
+        f"Changelist {changelist_url} made {queries_before} queries for {rows_before} rows "
+        f"but {queries_after} queries for {rows_after} rows"
+    )
+
+
+def assert_constant_api_list_query_count(client, list_url: str, create_objects: Callable[[int], object]):
+    """
+    Test helper asserting that the number of queries of an API list response doesn't depend on the number of rows in
+    it. The list is requested with one row and again after `create_objects(n)` has added more rows.
+    """
+
+    def count_queries():
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(list_url)
+        assert response.status_code == 200
+        return len(response.json()["results"]), len(context.captured_queries)
+
+    create_objects(1)
+    rows_before, queries_before = count_queries()
+    create_objects(4)
+    rows_after, queries_after = count_queries()
+
+    assert rows_after > rows_before, "The list must contain the created objects"
+    assert queries_after == queries_before, (
+        f"List {list_url} made {queries_before} queries for {rows_before} rows "
+        f"but {queries_after} queries for {rows_after} rows"
+    )
@@ -0,0 +1,71 @@
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from admin_helper.changelist import EstimatedCountPaginator
+from traffic_control.models import Owner
+from traffic_control.tests.factories import AdditionalSignRealFactory, OwnerFactory, TrafficSignRealFactory
+
+
+def _analyze(model):
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
+
+def _count_queries(queries):
+    return [query for query in queries if "COUNT(" in query["sql"].upper()]
+
+
+@pytest.mark.django_db
+@override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+def test__estimated_count_paginator__small_result_is_counted_exactly():
+    OwnerFactory.create_batch(3)
+
+    paginator = EstimatedCountPaginator(Owner.objects.order_by("pk"), 2)
+
+    with CaptureQueriesContext(connection) as context:
+        assert paginator.count == Owner.objects.count()
+    assert len(_count_queries(context.captured_queries)) == 1
+
+
+@pytest.mark.django_db
+@override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=0)
+def test__estimated_count_paginator__unfiltered_result_is_estimated_from_table_statistics():
+    OwnerFactory.create_batch(3)
+    _analyze(Owner)
+
+    paginator = EstimatedCountPaginator(Owner.objects.order_by("pk"), 2)
+
+    with CaptureQueriesContext(connection) as context:
+        assert paginator.count == Owner.objects.count()
+    assert not _count_queries(context.captured_queries)
+    assert "pg_class" in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+@override_settings(ADMIN_ESTIMATED_COUNT_THRESHOLD=0)
+def test__estimated_count_paginator__filtered_result_is_estimated_from_query_plan():
+    owners = OwnerFactory.create_batch(3)
+
+    paginator = EstimatedCountPaginator(Owner.objects.filter(pk=owners[0].pk).order_by("pk"), 2)
+
+    with CaptureQueriesContext(connection) as context:
+        assert paginator.count == 1
+    assert not _count_queries(context.captured_queries)
+    assert context.captured_queries[0]["sql"].startswith("EXPLAIN")
+
+
+@pytest.mark.django_db
+def test__large_table_changelist__annotations_are_computed_for_displayed_page(admin_client):
+    traffic_sign_with_additional_sign = TrafficSignRealFactory()
+    AdditionalSignRealFactory(parent=traffic_sign_with_additional_sign)
+    traffic_sign_without_additional_sign = TrafficSignRealFactory()
+
+    response = admin_client.get(reverse("admin:traffic_control_trafficsignreal_changelist"), follow=True)
+
+    assert response.status_code == 200
+    has_additional_signs = {obj.pk: obj._has_additional_signs for obj in response.context["cl"].result_list}
+    assert has_additional_signs[traffic_sign_with_additional_sign.pk] is True
+    assert has_additional_signs[traffic_sign_without_additional_sign.pk] is False
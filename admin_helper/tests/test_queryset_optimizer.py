@@ -0,0 +1,141 @@
+import pytest
+from django.db.models import Prefetch
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import serializers
+
+from admin_helper.decorators import requires_fields
+from admin_helper.optimizer import get_admin_queryset_plans, get_serializer_queryset_plan, QuerySetPlan
+from admin_helper.testing import assert_constant_api_list_query_count, assert_constant_changelist_query_count
+from admin_helper.tests.test_suggest_queryset_optimizations import (
+    AnnotationAdmin,
+    Book,
+    Chapter,
+    ChapterInline,
+    dummy_annotation,
+    PageAnnotationAdmin,
+    RelationAdmin,
+)
+from traffic_control.tests.factories import (
+    add_traffic_sign_real_operation,
+    get_api_client,
+    get_user,
+    TrafficSignPlanFactory,
+    TrafficSignRealFactory,
+)
+
+
+class ChapterSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Chapter
+        fields = ["id"]
+
+
+class BookSerializer(serializers.ModelSerializer):
+    author_name = serializers.CharField(source="author.name")
+    series = serializers.StringRelatedField()
+    chapter_set = ChapterSerializer(many=True)
+    profile_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Book
+        fields = ["id", "author_name", "publisher", "series", "tags", "chapter_set", "profile_name"]
+
+    @requires_fields("publisher__profile")
+    def get_profile_name(self, obj):
+        pass
+
+
+def test__admin_queryset_plans__relations_split_by_view():
+    plans = get_admin_queryset_plans(RelationAdmin, Book)
+
+    assert plans["list"] == QuerySetPlan(select_related=("author", "series"), prefetch_related=("tags",))
+    assert plans["detail"] == QuerySetPlan(
+        select_related=("publisher", "publisher__profile"),
+        prefetch_related=("chapter_set",),
+    )
+
+
+def test__admin_queryset_plans__annotations():
+    plans = get_admin_queryset_plans(AnnotationAdmin, Book)
+
+    assert plans["list"].annotations == ((dummy_annotation, False),)
+    assert plans["detail"].annotations == ((dummy_annotation, False),)
+
+
+def test__admin_queryset_plans__annotations_of_page_annotated_changelist_are_left_out():
+    plans = get_admin_queryset_plans(PageAnnotationAdmin, Book)
+
+    assert plans["list"].annotations == ()
+    assert plans["list"].select_related == ("author",)
+
+
+def test__admin_queryset_plans__inline():
+    plans = get_admin_queryset_plans(ChapterInline, Chapter)
+
+    assert plans["detail"].select_related == ("book", "book__author", "book__publisher", "book__publisher__profile")
+
+
+def test__serializer_queryset_plan():
+    plan = get_serializer_queryset_plan(BookSerializer)
+
+    # publisher is only serialized as a primary key, so it is selected only for the method field
+    assert plan.select_related == ("author", "publisher", "publisher__profile", "series")
+    assert plan.prefetch_related == ("chapter_set", "tags")
+
+
+def test__queryset_plan__apply_keeps_existing_prefetches():
+    plan = QuerySetPlan(select_related=("author",), prefetch_related=("chapter_set", "tags"))
+    prefetch = Prefetch("chapter_set", queryset=Chapter.objects.none())
+
+    qs = plan.apply(Book.objects.prefetch_related(prefetch))
+
+    assert qs._prefetch_related_lookups == (prefetch, "tags")
+    assert qs.query.select_related == {"author": {}}
+
+
+@pytest.mark.django_db
+def test__queryset_optimizer_admin__traffic_sign_plan_changelist_query_count_is_constant(admin_client):
+    assert_constant_changelist_query_count(
+        admin_client,
+        reverse("admin:traffic_control_trafficsignplan_changelist"),
+        TrafficSignPlanFactory.create_batch,
+    )
+
+
+@pytest.mark.django_db
+def test__queryset_optimizer_admin__traffic_sign_real_changelist_query_count_is_constant(admin_client):
+    assert_constant_changelist_query_count(
+        admin_client,
+        reverse("admin:traffic_control_trafficsignreal_changelist"),
+        lambda count: TrafficSignRealFactory.create_batch(count, traffic_sign_plan=TrafficSignPlanFactory()),
+    )
+
+
+@pytest.mark.django_db
+def test__queryset_optimizer_admin__change_view_is_annotated(admin_client):
+    traffic_sign_real = TrafficSignRealFactory()
+
+    response = admin_client.get(reverse("admin:traffic_control_trafficsignreal_change", args=[traffic_sign_real.pk]))
+
+    assert response.status_code == 200
+    assert response.context["original"]._has_additional_signs is False
+
+
+@pytest.mark.django_db
+def test__queryset_optimizer_viewset__traffic_sign_plan_list_query_count_is_constant():
+    assert_constant_api_list_query_count(
+        get_api_client(user=get_user()), reverse("v1:trafficsignplan-list"), TrafficSignPlanFactory.create_batch
+    )
+
+
+@override_settings(FAST_READ_SERIALIZERS_ENABLED=False)
+@pytest.mark.django_db
+def test__queryset_optimizer_viewset__traffic_sign_real_list_query_count_is_constant():
+    def create_traffic_signs(count):
+        for traffic_sign_real in TrafficSignRealFactory.create_batch(count, traffic_sign_plan=TrafficSignPlanFactory()):
+            add_traffic_sign_real_operation(traffic_sign_real)
+
+    assert_constant_api_list_query_count(
+        get_api_client(user=get_user()), reverse("v1:trafficsignreal-list"), create_traffic_signs
+    )
@@ -5,6 +5,7 @@ from django.contrib import admin
 from django.core.management import call_command, CommandError
 from django.db import models
 
+from admin_helper.changelist import LargeTableChangelistAdminMixin
 from admin_helper.decorators import requires_annotation, requires_fields
 from admin_helper.management.commands.suggest_queryset_optimizations import AdminQuerySetGenerator
 
@@ -125,6 +126,10 @@ class AnnotationAdmin(admin.ModelAdmin):
         pass
 
 
+class PageAnnotationAdmin(LargeTableChangelistAdminMixin, AnnotationAdmin):
+    """Tests annotations of admins that annotate the displayed changelist page only."""
+
+
 class ChapterInline(admin.TabularInline):
     """Tests an InlineModelAdmin."""
 
@@ -212,6 +217,17 @@ def test_annotations_split_by_view():
     assert_in_block(out, "change", "prefetch_related", ["chapter_set"])
 
 
+def test_annotations_of_page_annotated_changelist_are_left_out():
+    out = generate_code_for(PageAnnotationAdmin)
+
+    changelist_block = out.split("_changelist'):")[1].split("elif resolver_match")[0]
+    change_block = out.split("_change'):")[1].split("return qs")[0]
+
+    assert "dummy_annotation(qs)" not in changelist_block
+    assert_in_block(out, "changelist", "select_related", ["author"])
+    assert "dummy_annotation(qs)  # from readonly_fields" in change_block
+
+
 def test_inline_admin_generation():
     out = generate_code_for(ChapterInline, model=Chapter)
 
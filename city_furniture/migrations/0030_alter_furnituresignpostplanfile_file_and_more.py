@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-19 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('city_furniture', '0029_alter_cityfurnituredevicetype_icon_file'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='furnituresignpostplanfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='planfiles/furniture_signpost/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='furnituresignpostrealfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='realfiles/furniture_signpost/', verbose_name='File'),
+        ),
+    ]
@@ -324,7 +324,9 @@ class FurnitureSignpostRealOperation(OperationBase):
 
 
 class FurnitureSignpostPlanFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="planfiles/furniture_signpost/")
+    file = models.FileField(
+        _("File"), blank=False, null=False, db_index=True, upload_to="planfiles/furniture_signpost/"
+    )
     furniture_signpost_plan = models.ForeignKey(FurnitureSignpostPlan, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -334,7 +336,9 @@ class FurnitureSignpostPlanFile(AbstractFileModel):
 
 
 class FurnitureSignpostRealFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="realfiles/furniture_signpost/")
+    file = models.FileField(
+        _("File"), blank=False, null=False, db_index=True, upload_to="realfiles/furniture_signpost/"
+    )
     furniture_signpost_real = models.ForeignKey(FurnitureSignpostReal, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -16,6 +16,8 @@ from traffic_control.serializers.common import (
     EwktPointField,
     FileProxySerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
+    ReferenceRelatedField,
 )
 
 
@@ -28,6 +30,7 @@ class FurnitureSignpostPlanFileSerializer(FileProxySerializerMixin, serializers.
 class FurnitureSignpostPlanSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
@@ -61,7 +64,7 @@ class FurnitureSignpostRealFileSerializer(FileProxySerializerMixin, serializers.
 
 class FurnitureSignpostRealOperationSerializer(serializers.ModelSerializer):
     operation_type = serializers.StringRelatedField()
-    operation_type_id = serializers.PrimaryKeyRelatedField(
+    operation_type_id = ReferenceRelatedField(
         queryset=OperationType.objects.filter(furniture_signpost=True),
         source="operation_type",
     )
@@ -90,6 +93,7 @@ class FurnitureSignpostRealOperationSerializer(serializers.ModelSerializer):
 class FurnitureSignpostRealSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
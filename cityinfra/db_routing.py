@@ -0,0 +1,145 @@
+"""
+Database transactions and routing of requests.
+
+Requests changing data and admin requests run in a transaction of the primary database, as with ATOMIC_REQUESTS.
+Read requests, i.e. GET, HEAD and OPTIONS requests to the API, WFS, map and embed paths of
+DATABASE_READ_REQUEST_PATHS, run in autocommit mode, so that large lists and streamed WFS responses don't hold a
+transaction open for the whole response.
+
+When a read replica is configured (DATABASE_REPLICA_URL), ReadReplicaRouter routes the queries of read requests to
+it. For read-your-writes consistency a client that has written data reads from the primary for
+DATABASE_REPLICA_STICKY_SECONDS afterwards, and a read request that writes, e.g. to update the last use of an API
+token, reads from the primary after its first write. Queries outside requests, e.g. of management commands, always
+use the primary.
+"""
+
+import hashlib
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import FileResponse
+from django.utils import translation
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+STICKY_CACHE_KEY_PREFIX = "db-primary-sticky"
+
+
+@dataclass
+class RequestDatabaseState:
+    read_request: bool
+    use_primary: bool = False
+
+
+_request_state: ContextVar[Optional[RequestDatabaseState]] = ContextVar("request_database_state", default=None)
+
+
+def is_read_request(request) -> bool:
+    if request.method not in READ_METHODS:
+        return False
+    path = request.path_info
+    language = translation.get_language_from_path(path)
+    if language:
+        path = path[len(language) + 1 :]
+    return any(path.startswith(prefix) for prefix in settings.DATABASE_READ_REQUEST_PATHS)
+
+
+def _get_sticky_cache_key(request) -> Optional[str]:
+    """Return the cache key identifying the client by its credentials, or None for anonymous clients"""
+    credentials = request.headers.get("Authorization") or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not credentials:
+        return None
+    return f"{STICKY_CACHE_KEY_PREFIX}:{hashlib.sha256(credentials.encode()).hexdigest()}"
+
+
+def rollback_request_transaction() -> None:
+    """Mark the transaction of the current request to be rolled back, e.g. when the API returns an error response"""
+    state = _request_state.get()
+    if state is not None and not state.read_request and transaction.get_connection().in_atomic_block:
+        transaction.set_rollback(True)
+
+
+class ReadReplicaRouter:
+    """Routes the reads of read requests to the replica database alias DATABASE_REPLICA_ALIAS, if there is one"""
+
+    def db_for_read(self, model, **hints):
+        state = _request_state.get()
+        if state is None or not settings.DATABASE_REPLICA_ALIAS:
+            return None
+        if state.read_request and not state.use_primary:
+            return settings.DATABASE_REPLICA_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.use_primary = True
+        # Objects read from the replica are written to the primary
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, settings.DATABASE_REPLICA_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if settings.DATABASE_REPLICA_ALIAS and db == settings.DATABASE_REPLICA_ALIAS:
+            return False
+        return None
+
+
+class RequestDatabaseMiddleware:
+    """
+    Middleware running requests in a transaction or in autocommit mode and setting up their database routing, see
+    the module docstring. Replaces ATOMIC_REQUESTS, so it should be the last middleware to wrap only the view, like
+    ATOMIC_REQUESTS does.
+    """
+
+    def __init__(self, get_response=None):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        read_request = is_read_request(request)
+        state = RequestDatabaseState(read_request=read_request)
+        if read_request and settings.DATABASE_REPLICA_ALIAS:
+            cache_key = _get_sticky_cache_key(request)
+            state.use_primary = cache_key is not None and cache.get(cache_key) is not None
+
+        token = _request_state.set(state)
+        try:
+            if read_request:
+                response = self.get_response(request)
+            else:
+                with transaction.atomic(using=DEFAULT_DB_ALIAS):
+                    response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+
+        if settings.DATABASE_REPLICA_ALIAS and request.method not in READ_METHODS:
+            cache_key = _get_sticky_cache_key(request)
+            if cache_key is not None:
+                cache.set(cache_key, True, timeout=settings.DATABASE_REPLICA_STICKY_SECONDS)
+        if read_request and response.streaming and not isinstance(response, FileResponse):
+            # e.g. WFS responses query the database while they are being streamed
+            response.streaming_content = self._route_streaming_content(response.streaming_content, state)
+        return response
+
+    def process_exception(self, request, exception):
+        rollback_request_transaction()
+
+    @staticmethod
+    def _route_streaming_content(streaming_content: Iterable[bytes], state: RequestDatabaseState) -> Iterable[bytes]:
+        iterator = iter(streaming_content)
+        while True:
+            token = _request_state.set(state)
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _request_state.reset(token)
+            yield chunk
@@ -6,6 +6,8 @@ from rest_framework.response import Response
 from rest_framework.serializers import as_serializer_error
 from rest_framework.views import exception_handler
 
+from cityinfra.db_routing import rollback_request_transaction
+
 
 def cityinfra_exception_handler(exc, context):
     if isinstance(exc, DjangoValidationError):
@@ -26,4 +28,7 @@ def cityinfra_exception_handler(exc, context):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
+    if response is not None:
+        # DRF only rolls back transactions of ATOMIC_REQUESTS, which RequestDatabaseMiddleware replaces
+        rollback_request_transaction()
     return response
@@ -0,0 +1,329 @@
+"""
+Per endpoint request metrics rendered in Prometheus text format.
+
+MetricsMiddleware records, per resolved URL name, request method and response status class, the request latency
+histogram, SQL query count and time, rendered bytes and cache hits. The counters are kept in process memory and
+every METRICS_FLUSH_INTERVAL seconds a snapshot of them is written to the Django cache, from where the metrics view
+sums the snapshots of all worker processes. Requests slower than METRICS_SLOW_REQUEST_THRESHOLD are logged with
+their slowest SQL queries.
+"""
+
+import heapq
+import logging
+import os
+import socket
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.http import FileResponse
+
+logger = logging.getLogger("cityinfra.metrics")
+
+# Seconds, upper bounds of the request latency histogram buckets
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRICS_CACHE_KEY_PREFIX = "metrics"
+PROCESSES_CACHE_KEY = f"{METRICS_CACHE_KEY_PREFIX}:processes"
+# Seconds, snapshots of processes that have stopped flushing drop out of the metrics after this
+PROCESS_SNAPSHOT_TIMEOUT = 24 * 60 * 60
+SLOW_QUERY_LOG_COUNT = 5
+SLOW_QUERY_LOG_SQL_LENGTH = 500
+UNRESOLVED_VIEW_NAME = "<unresolved>"
+
+# (view name, request method, response status class)
+MetricsKey = Tuple[str, str, str]
+
+
+@dataclass
+class RequestMetrics:
+    """Measurements of a single request"""
+
+    query_count: int = 0
+    query_seconds: float = 0.0
+    cache_hits: int = 0
+    slowest_queries: List[Tuple[float, str]] = field(default_factory=list)
+
+    def add_query(self, sql: str, seconds: float) -> None:
+        self.query_count += 1
+        self.query_seconds += seconds
+        query = (seconds, sql[:SLOW_QUERY_LOG_SQL_LENGTH])
+        if len(self.slowest_queries) < SLOW_QUERY_LOG_COUNT:
+            heapq.heappush(self.slowest_queries, query)
+        elif seconds > self.slowest_queries[0][0]:
+            heapq.heapreplace(self.slowest_queries, query)
+
+
+@dataclass
+class EndpointMetrics:
+    """Accumulated measurements of an endpoint"""
+
+    requests: int = 0
+    latency_bucket_counts: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    latency_seconds: float = 0.0
+    queries: int = 0
+    query_seconds: float = 0.0
+    response_bytes: int = 0
+    cache_hits: int = 0
+
+    def add_request(self, seconds: float, response_bytes: int, request_metrics: RequestMetrics) -> None:
+        self.requests += 1
+        self.latency_seconds += seconds
+        for index, upper_bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= upper_bound:
+                self.latency_bucket_counts[index] += 1
+                break
+        self.queries += request_metrics.query_count
+        self.query_seconds += request_metrics.query_seconds
+        self.response_bytes += response_bytes
+        self.cache_hits += request_metrics.cache_hits
+
+    def merge(self, other: "EndpointMetrics") -> None:
+        self.requests += other.requests
+        self.latency_bucket_counts = [a + b for a, b in zip(self.latency_bucket_counts, other.latency_bucket_counts)]
+        self.latency_seconds += other.latency_seconds
+        self.queries += other.queries
+        self.query_seconds += other.query_seconds
+        self.response_bytes += other.response_bytes
+        self.cache_hits += other.cache_hits
+
+
+_current_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request_metrics", default=None)
+
+
+def record_cache_hit() -> None:
+    """Count a cache hit for the request being handled, if any"""
+    request_metrics = _current_request_metrics.get()
+    if request_metrics is not None:
+        request_metrics.cache_hits += 1
+
+
+class MetricsRegistry:
+    """Endpoint metrics of this process, periodically flushed to the Django cache"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[MetricsKey, EndpointMetrics] = {}
+        self._last_flush = time.monotonic()
+        self._pid = None
+        self._process_key = None
+
+    @property
+    def process_key(self) -> str:
+        # Resolved lazily and per pid, so that processes forked after import get a key of their own
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._process_key = f"{METRICS_CACHE_KEY_PREFIX}:process:{socket.gethostname()}:{self._pid}:{time.time()}"
+        return self._process_key
+
+    def add_request(
+        self, key: MetricsKey, seconds: float, response_bytes: int, request_metrics: RequestMetrics
+    ) -> None:
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = EndpointMetrics()
+            endpoint.add_request(seconds, response_bytes, request_metrics)
+            flush = time.monotonic() - self._last_flush >= settings.METRICS_FLUSH_INTERVAL
+            if flush:
+                self._last_flush = time.monotonic()
+                snapshot = self._snapshot()
+        if flush:
+            self._flush(snapshot)
+
+    def snapshot(self) -> Dict[MetricsKey, EndpointMetrics]:
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self) -> Dict[MetricsKey, EndpointMetrics]:
+        snapshot = {}
+        for key, endpoint in self._endpoints.items():
+            snapshot[key] = EndpointMetrics()
+            snapshot[key].merge(endpoint)
+        return snapshot
+
+    def flush(self) -> None:
+        self._flush(self.snapshot())
+
+    def _flush(self, snapshot: Dict[MetricsKey, EndpointMetrics]) -> None:
+        try:
+            cache.set(self.process_key, snapshot, timeout=PROCESS_SNAPSHOT_TIMEOUT)
+            process_keys = cache.get(PROCESSES_CACHE_KEY) or set()
+            if self.process_key not in process_keys:
+                # The process index is not updated atomically, a lost update is fixed by the next flush
+                cache.set(PROCESSES_CACHE_KEY, process_keys | {self.process_key}, timeout=None)
+        except Exception:
+            logger.exception("Flushing request metrics to the cache failed")
+
+    def collect(self) -> Dict[MetricsKey, EndpointMetrics]:
+        """Return the endpoint metrics of all processes that have flushed them to the cache"""
+        self.flush()
+        process_keys = cache.get(PROCESSES_CACHE_KEY) or set()
+        snapshots = cache.get_many(process_keys)
+        if len(snapshots) < len(process_keys):
+            cache.set(PROCESSES_CACHE_KEY, set(snapshots), timeout=None)
+
+        collected: Dict[MetricsKey, EndpointMetrics] = {}
+        for snapshot in snapshots.values():
+            for key, endpoint in snapshot.items():
+                collected.setdefault(key, EndpointMetrics()).merge(endpoint)
+        return collected
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints = {}
+
+
+registry = MetricsRegistry()
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items())
+
+
+def _format_value(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def render_metrics(endpoints: Dict[MetricsKey, EndpointMetrics]) -> str:
+    """Render the endpoint metrics in Prometheus text exposition format"""
+    counters = (
+        ("cityinfra_http_requests_total", "Handled requests.", "requests"),
+        ("cityinfra_db_queries_total", "SQL queries executed while handling requests.", "queries"),
+        ("cityinfra_db_query_duration_seconds_total", "Time spent in SQL queries.", "query_seconds"),
+        ("cityinfra_http_response_bytes_total", "Rendered response body bytes.", "response_bytes"),
+        ("cityinfra_cache_hits_total", "Cache hits while handling requests.", "cache_hits"),
+    )
+    items = sorted(endpoints.items())
+    lines = []
+    for name, help_text, attribute in counters:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for (view, method, status), endpoint in items:
+            value = getattr(endpoint, attribute)
+            lines.append(f"{name}{{{_labels(view=view, method=method, status=status)}}} {_format_value(value)}")
+
+    name = "cityinfra_http_request_duration_seconds"
+    lines.append(f"# HELP {name} Request latency.")
+    lines.append(f"# TYPE {name} histogram")
+    for (view, method, status), endpoint in items:
+        labels = _labels(view=view, method=method, status=status)
+        cumulative_count = 0
+        for upper_bound, count in zip(LATENCY_BUCKETS, endpoint.latency_bucket_counts):
+            cumulative_count += count
+            lines.append(f'{name}_bucket{{{labels},le="{upper_bound}"}} {cumulative_count}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {endpoint.requests}')
+        lines.append(f"{name}_sum{{{labels}}} {_format_value(endpoint.latency_seconds)}")
+        lines.append(f"{name}_count{{{labels}}} {endpoint.requests}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    Middleware that records request metrics of the resolved URL name, see the module docstring.
+
+    SQL queries are measured with a database execute wrapper, which stays installed until a streaming response has
+    been consumed, as e.g. WFS responses query the database while they are being streamed.
+    """
+
+    def __init__(self, get_response=None):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        request_metrics = RequestMetrics()
+        token = _current_request_metrics.set(request_metrics)
+
+        def execute_wrapper(execute, sql, params, many, context):
+            query_start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                request_metrics.add_query(sql, time.perf_counter() - query_start)
+
+        wrapped_connections = connections.all()
+        for connection in wrapped_connections:
+            connection.execute_wrappers.append(execute_wrapper)
+
+        finished = False
+
+        def finish(response, response_bytes: int) -> None:
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            for connection in wrapped_connections:
+                if execute_wrapper in connection.execute_wrappers:
+                    connection.execute_wrappers.remove(execute_wrapper)
+            self._record(request, response, request_metrics, time.perf_counter() - start, response_bytes)
+
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            finish(None, 0)
+            raise
+        finally:
+            _current_request_metrics.reset(token)
+
+        self._finish_after_response(response, finish)
+        return response
+
+    def _finish_after_response(self, response, finish) -> None:
+        if not response.streaming:
+            finish(response, len(response.content))
+        elif isinstance(response, FileResponse):
+            # Wrapping the content would disable the file wrapper of the WSGI server
+            finish(response, int(response.get("Content-Length") or 0))
+        else:
+            streamed_bytes = [0]
+            response.streaming_content = self._measure_streaming_content(
+                response.streaming_content, streamed_bytes, lambda: finish(response, streamed_bytes[0])
+            )
+            # A generator that is never started doesn't run its finally block, e.g. when the client disconnects
+            # before the first chunk, but the WSGI server always closes the response
+            response._resource_closers.append(lambda: finish(response, streamed_bytes[0]))
+
+    @staticmethod
+    def _measure_streaming_content(
+        streaming_content: Iterable[bytes], streamed_bytes: list[int], finish
+    ) -> Iterable[bytes]:
+        try:
+            for chunk in streaming_content:
+                streamed_bytes[0] += len(chunk)
+                yield chunk
+        finally:
+            finish()
+
+    @staticmethod
+    def _record(request, response, request_metrics: RequestMetrics, seconds: float, response_bytes: int) -> None:
+        resolver_match = getattr(request, "resolver_match", None)
+        view_name = (resolver_match.view_name or resolver_match.route) if resolver_match else UNRESOLVED_VIEW_NAME
+        if view_name == "metrics":
+            return
+        status = f"{response.status_code // 100}xx" if response is not None else "5xx"
+        registry.add_request((view_name, request.method, status), seconds, response_bytes, request_metrics)
+
+        if seconds >= settings.METRICS_SLOW_REQUEST_THRESHOLD:
+            slowest_queries = sorted(request_metrics.slowest_queries, reverse=True)
+            logger.warning(
+                "Slow request %s %s (%s) took %.3f s, %d SQL queries took %.3f s. Slowest queries:%s",
+                request.method,
+                request.path,
+                view_name,
+                seconds,
+                request_metrics.query_count,
+                request_metrics.query_seconds,
+                "".join(f"\n  {query_seconds:.3f} s: {sql}" for query_seconds, sql in slowest_queries),
+            )
@@ -0,0 +1,94 @@
+"""
+Warm up of the application before uWSGI forks its worker processes.
+
+With WSGI_PRELOAD set (see uwsgi/preload.ini), the application is loaded once in the uWSGI master process, and
+warm_up() builds the state that every worker would otherwise build on its first requests: URL configuration and the
+view modules it imports (WFS feature types, drf-spectacular, import-export resources), the OpenAPI schema, the
+ContentType cache, content schema validators and the reference data cache. Worker processes forked from the master
+share these objects copy-on-write.
+
+Connections must not be shared between processes, so database and cache connections opened during the warm up are
+closed before forking, and the workers open their own connections on their first requests.
+"""
+
+import gc
+import json
+import logging
+import time
+from typing import Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.db import connections
+from django.urls import get_resolver
+from django.utils import translation
+from drf_spectacular.generators import SchemaGenerator
+
+from traffic_control.models import TrafficControlDeviceType
+from traffic_control.utils.reference_data import get_reference_models, get_reference_table
+from traffic_control.validators import _get_content_schema_validator
+from traffic_control.views.wfs.cache import get_dependency_models
+from traffic_control.views.wfs.views import CityInfrastructureWFSView
+
+logger = logging.getLogger("cityinfra")
+
+# OpenAPI schema generated in the master process, in the default language
+_openapi_schema: Optional[dict] = None
+
+
+def get_preloaded_openapi_schema() -> Optional[dict]:
+    return _openapi_schema
+
+
+def warm_up() -> None:
+    start = time.perf_counter()
+    try:
+        _load_urlconf()
+        _build_openapi_schema()
+        _load_content_types()
+        _build_content_schema_validators()
+        _load_reference_data()
+    finally:
+        close_connections()
+
+    # Move the objects created so far to a permanent generation, so that the garbage collector of worker processes
+    # does not write to (and thereby copy) the memory pages shared with the master process
+    gc.collect()
+    gc.freeze()
+    logger.info("Application warmed up in %.2f s", time.perf_counter() - start)
+
+
+def close_connections() -> None:
+    """Close database and cache connections of the current process, so that forked processes do not share them"""
+    connections.close_all()
+    for cache in caches.all(initialized_only=True):
+        cache.close()
+
+
+def _load_urlconf() -> None:
+    # Resolving the URL patterns imports all views
+    get_resolver().url_patterns
+    get_dependency_models(CityInfrastructureWFSView.feature_types)
+
+
+def _build_openapi_schema() -> None:
+    global _openapi_schema
+    with translation.override(settings.LANGUAGE_CODE):
+        _openapi_schema = SchemaGenerator().get_schema(request=None, public=True)
+
+
+def _load_content_types() -> None:
+    ContentType.objects.get_for_models(*apps.get_models())
+
+
+def _build_content_schema_validators() -> None:
+    schemas = TrafficControlDeviceType.objects.exclude(content_schema=None).values_list("content_schema", flat=True)
+    for schema in schemas:
+        _get_content_schema_validator(json.dumps(schema, sort_keys=True))
+
+
+def _load_reference_data() -> None:
+    for model in get_reference_models():
+        get_reference_table(model)
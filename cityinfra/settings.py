@@ -53,6 +53,15 @@ env = environ.Env(
     # https://django-environ.readthedocs.io/en/latest/types.html#environ-env-db-url
     DATABASE_URL=(str, "postgis:///city-infrastructure-platform"),
     DATABASE_PASSWORD=(str, ""),  # Composes Django DATABASES["default"]["PASSWORD"]
+    # https://docs.djangoproject.com/en/5.2/ref/databases/#persistent-connections
+    DATABASE_CONN_MAX_AGE=(int, 60),  # Seconds, 0 closes database connections at the end of each request
+    DATABASE_REPLICA_URL=(str, ""),  # Read replica used by read requests, see cityinfra.db_routing
+    DATABASE_REPLICA_STICKY_SECONDS=(float, 10.0),  # Seconds a client reads from the primary after writing
+    # Paths of the API, WFS, map and embed views whose GET requests run without a transaction and may use the replica
+    DATABASE_READ_REQUEST_PATHS=(
+        list,
+        ["/v1/", "/wfs/", "/map-cells/", "/map-clusters/", "/map-config/", "/embed/", "/device-types/"],
+    ),
     # https://django-environ.readthedocs.io/en/latest/types.html#environ-env-cache-url
     CACHE_URL=(str, "locmemcache://"),
     # --- Email Configuration ---
@@ -101,6 +110,37 @@ env = environ.Env(
     ADDRESS_SEARCH_BASE_URL=(str, "https://api.hel.fi/servicemap/v2/search"),
     BASEMAP_SOURCE_URL=(str, "https://kartta.hel.fi/ws/geoserver/avoindata/gwc/service/wmts"),
     CITYINFRA_MAXIMUM_RESULTS_PER_PAGE=(int, 10000),
+    CITYINFRA_MAXIMUM_BATCH_OPERATIONS=(int, 1000),  # Most create/update/delete operations in one batch API request
+    MAP_CLUSTER_MAX_ZOOM=(int, 7),  # Highest map view zoom level whose clusters are computed on the server
+    ADMIN_ESTIMATED_COUNT_THRESHOLD=(int, 10000),  # Row estimate from which large admin changelists stop counting
+    EXPORT_JOB_ROW_THRESHOLD=(int, 5000),  # Admin exports of this many rows run as background export jobs
+    IMPORT_BULK_ROW_THRESHOLD=(int, 1000),  # Device imports of this many rows are written with bulk queries
+    # --- WFS response cache ---
+    # Requires a CACHE_URL shared by all worker processes, as data changes invalidate cached responses through it
+    WFS_RESPONSE_CACHE_ENABLED=(bool, False),
+    WFS_RESPONSE_CACHE_TIMEOUT=(int, 600),  # Seconds, GetFeature responses
+    WFS_SERVICE_RESPONSE_CACHE_TIMEOUT=(int, 3600),  # Seconds, GetCapabilities and DescribeFeatureType responses
+    WFS_RESPONSE_CACHE_MAX_SIZE=(int, 20 * 1024 * 1024),  # Bytes, larger responses are not cached
+    # --- Request metrics ---
+    METRICS_ENABLED=(bool, False),  # Record per endpoint request metrics, see cityinfra.metrics
+    METRICS_TOKEN=(str, ""),  # Bearer token required by the /metrics endpoint, the endpoint is disabled when empty
+    METRICS_FLUSH_INTERVAL=(int, 15),  # Seconds, how often worker processes publish their metrics to the cache
+    METRICS_SLOW_REQUEST_THRESHOLD=(float, 2.0),  # Seconds, slower requests are logged with their slowest queries
+    # --- Profiler ---
+    PROFILER_ENABLED=(bool, False),  # Allow superusers to profile requests, see command_tracker.middleware
+    PROFILER_RATE_LIMIT=(int, 10),  # Profiled requests per user per hour
+    # --- WSGI ---
+    WSGI_PRELOAD=(bool, False),  # Warm up the application before forking uWSGI workers, see uwsgi/preload.ini
+    # --- File proxy ---
+    FILE_PROXY_PERMISSION_CACHE_TIMEOUT=(int, 60),  # Seconds, cached view permission decisions per user and file
+    FILE_PROXY_REDIRECT_PUBLIC_FILES=(bool, False),  # Redirect public files to signed storage URLs when supported
+    FILE_PROXY_SIGNED_URL_EXPIRE=(int, 300),  # Seconds, lifetime of the signed storage URLs
+    # --- Reference data cache ---
+    # Seconds, how often processes check if device types, owners etc. cached in memory were changed by other processes
+    REFERENCE_DATA_CACHE_VERSION_CHECK_INTERVAL=(float, 5.0),
+    # --- Fast read serializers ---
+    # Serialize API list responses from QuerySet.values() rows when the serializer allows it
+    FAST_READ_SERIALIZERS_ENABLED=(bool, True),
     # --- Maintenance Mode ---
     # https://github.com/City-of-Helsinki/city-infrastructure-platform/tree/master/maintenance_mode
     MAINTENANCE_MODE_ADMIN_PATHS=(list, ["admin/jsi18n"]),
@@ -282,6 +322,7 @@ MAINTENANCE_MODE_WHITELIST = {
 }
 
 MIDDLEWARE = [
+    "cityinfra.metrics.MetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -293,8 +334,11 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "drf_custom_auth.middleware.DRFCustomAuthMiddleware",
+    "command_tracker.middleware.ProfilerMiddleware",
     "auditlog_custom.middleware.AuditlogMiddleware",
     "axes.middleware.AxesMiddleware",
+    # Last, to wrap only the views in transactions like ATOMIC_REQUESTS
+    "cityinfra.db_routing.RequestDatabaseMiddleware",
 ]
 
 ROOT_URLCONF = "cityinfra.urls"
@@ -324,11 +368,30 @@ WSGI_APPLICATION = "cityinfra.wsgi.application"
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
 DATABASES = {"default": env.db("DATABASE_URL")}
-DATABASES["default"]["ATOMIC_REQUESTS"] = True
+# Requests are run in transactions by cityinfra.db_routing.RequestDatabaseMiddleware instead of ATOMIC_REQUESTS, so
+# that read requests don't hold a transaction open
+DATABASES["default"]["ATOMIC_REQUESTS"] = False
 
 if env("DATABASE_PASSWORD"):
     DATABASES["default"]["PASSWORD"] = env("DATABASE_PASSWORD")
 
+DATABASE_REPLICA_ALIAS = None
+if env("DATABASE_REPLICA_URL"):
+    DATABASE_REPLICA_ALIAS = "replica"
+    DATABASES[DATABASE_REPLICA_ALIAS] = env.db("DATABASE_REPLICA_URL")
+    # Tests read the replica's data from the primary test database
+    DATABASES[DATABASE_REPLICA_ALIAS]["TEST"] = {"MIRROR": "default"}
+    if env("DATABASE_PASSWORD"):
+        DATABASES[DATABASE_REPLICA_ALIAS]["PASSWORD"] = env("DATABASE_PASSWORD")
+
+for database in DATABASES.values():
+    database["CONN_MAX_AGE"] = env.int("DATABASE_CONN_MAX_AGE")
+    database["CONN_HEALTH_CHECKS"] = database["CONN_MAX_AGE"] > 0
+
+DATABASE_ROUTERS = ["cityinfra.db_routing.ReadReplicaRouter"]
+DATABASE_READ_REQUEST_PATHS = env.list("DATABASE_READ_REQUEST_PATHS")
+DATABASE_REPLICA_STICKY_SECONDS = env.float("DATABASE_REPLICA_STICKY_SECONDS")
+
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
 # Forms - Transitional setting for Django 6.0 URLField default scheme change
@@ -408,6 +471,7 @@ STATICFILES_DIRS = [checkout_dir("map-view/build/static")]
 USE_X_FORWARDED_HOST = env("TRUST_X_FORWARDED_HOST")
 
 CITYINFRA_MAXIMUM_RESULTS_PER_PAGE = env("CITYINFRA_MAXIMUM_RESULTS_PER_PAGE")
+CITYINFRA_MAXIMUM_BATCH_OPERATIONS = env.int("CITYINFRA_MAXIMUM_BATCH_OPERATIONS")
 
 # Django REST Framework
 REST_FRAMEWORK = {
@@ -537,17 +601,58 @@ SRID_BOUNDARIES = {3879: (25487917.144, 6645439.071, 25514074.175, 6687278.623)}
 
 BASEMAP_SOURCE_URL = env.str("BASEMAP_SOURCE_URL")
 ADDRESS_SEARCH_BASE_URL = env.str("ADDRESS_SEARCH_BASE_URL")
+MAP_CLUSTER_MAX_ZOOM = env.int("MAP_CLUSTER_MAX_ZOOM")
+
+# Admin changelists of large tables show estimated result counts from this many rows on
+ADMIN_ESTIMATED_COUNT_THRESHOLD = env.int("ADMIN_ESTIMATED_COUNT_THRESHOLD")
 
 # Import / Export
 IMPORT_EXPORT_USE_TRANSACTIONS = True
 # Require view permission even to export template
 IMPORT_EXPORT_EXPORT_PERMISSION_CODE = "view"
+# Admin export actions of this many rows are run as background export jobs, see traffic_control.services.export_job
+EXPORT_JOB_ROW_THRESHOLD = env.int("EXPORT_JOB_ROW_THRESHOLD")
+# Device imports of this many rows are written in batches, see traffic_control.resources.common
+IMPORT_BULK_ROW_THRESHOLD = env.int("IMPORT_BULK_ROW_THRESHOLD")
 
 # WFS
 GISSERVER_USE_DB_RENDERING = False
+WFS_RESPONSE_CACHE_ENABLED = env.bool("WFS_RESPONSE_CACHE_ENABLED")
+WFS_RESPONSE_CACHE_TIMEOUT = env.int("WFS_RESPONSE_CACHE_TIMEOUT")
+WFS_SERVICE_RESPONSE_CACHE_TIMEOUT = env.int("WFS_SERVICE_RESPONSE_CACHE_TIMEOUT")
+WFS_RESPONSE_CACHE_MAX_SIZE = env.int("WFS_RESPONSE_CACHE_MAX_SIZE")
+
+# Request metrics, see cityinfra.metrics
+# Metrics of all worker processes are summed through the cache, so CACHE_URL should be shared by them
+METRICS_ENABLED = env.bool("METRICS_ENABLED")
+METRICS_TOKEN = env.str("METRICS_TOKEN")
+METRICS_FLUSH_INTERVAL = env.int("METRICS_FLUSH_INTERVAL")
+METRICS_SLOW_REQUEST_THRESHOLD = env.float("METRICS_SLOW_REQUEST_THRESHOLD")
+
+# On-demand request profiling of superusers, see command_tracker.middleware
+PROFILER_ENABLED = env.bool("PROFILER_ENABLED")
+PROFILER_RATE_LIMIT = env.int("PROFILER_RATE_LIMIT")
+
+# Application warm up in the uWSGI master process, see cityinfra.preload
+WSGI_PRELOAD = env.bool("WSGI_PRELOAD")
+
+# File proxy
+FILE_PROXY_PERMISSION_CACHE_TIMEOUT = env.int("FILE_PROXY_PERMISSION_CACHE_TIMEOUT")
+FILE_PROXY_REDIRECT_PUBLIC_FILES = env.bool("FILE_PROXY_REDIRECT_PUBLIC_FILES")
+FILE_PROXY_SIGNED_URL_EXPIRE = env.int("FILE_PROXY_SIGNED_URL_EXPIRE")
+
+# Reference data cached in each process, see traffic_control.utils.reference_data
+REFERENCE_DATA_CACHE_VERSION_CHECK_INTERVAL = env.float("REFERENCE_DATA_CACHE_VERSION_CHECK_INTERVAL")
+
+# List responses serialized from QuerySet.values() rows, see traffic_control.serializers.fast
+FAST_READ_SERIALIZERS_ENABLED = env.bool("FAST_READ_SERIALIZERS_ENABLED")
 
 # Virus scan
 CLAMAV_BASE_URL = env.str("CLAMAV_BASE_URL", "http://localhost:3030")
+CLAMAV_MAX_CONCURRENT_SCANS = env.int("CLAMAV_MAX_CONCURRENT_SCANS", 4)
+CLAMAV_CONNECT_TIMEOUT = env.float("CLAMAV_CONNECT_TIMEOUT", 5)  # Seconds
+CLAMAV_READ_TIMEOUT = env.float("CLAMAV_READ_TIMEOUT", 120)  # Seconds
+CLAMAV_RESULT_CACHE_TIMEOUT = env.int("CLAMAV_RESULT_CACHE_TIMEOUT", 24 * 60 * 60)  # Seconds, results per content hash
 
 # django-helusers environment banner
 HELUSERS_ENVIRONMENT = env.str("HELUSERS_ENVIRONMENT", "")
@@ -0,0 +1,88 @@
+"""
+Storage access helpers for serving stored files without reading them into the application server as a whole.
+
+Azure blob storage is accessed through the blob client directly: file properties are read without downloading the
+content and byte ranges are downloaded as a stream. Other storages (the local file system in development and tests)
+go through the generic Django storage API.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional
+
+from django.core.files.storage import Storage
+from django.utils.http import quote_etag
+from storages.backends.azure_storage import AzureStorage
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+@dataclass(frozen=True)
+class FileMetadata:
+    size: int
+    etag: str
+    last_modified: datetime
+
+
+def get_file_metadata(storage: Storage, name: str) -> FileMetadata:
+    """
+    Return size, ETag and modification time of a stored file.
+
+    Raises FileNotFoundError or azure's ResourceNotFoundError when the file does not exist in the storage.
+    """
+    if isinstance(storage, AzureStorage):
+        blob_client = storage.client.get_blob_client(storage._get_valid_path(name))
+        properties = blob_client.get_blob_properties(timeout=storage.timeout)
+        return FileMetadata(
+            size=properties.size,
+            etag=quote_etag(properties.etag),
+            last_modified=properties.last_modified,
+        )
+
+    size = storage.size(name)
+    last_modified = storage.get_modified_time(name)
+    digest = hashlib.sha256(f"{name}:{size}:{last_modified.timestamp()}".encode()).hexdigest()[:32]
+    return FileMetadata(size=size, etag=quote_etag(digest), last_modified=last_modified)
+
+
+def iter_file_range(
+    storage: Storage, name: str, start: int, length: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Stream `length` bytes of a stored file starting from byte `start`"""
+    if length <= 0:
+        return
+
+    if isinstance(storage, AzureStorage):
+        downloader = storage.client.download_blob(
+            storage._get_valid_path(name),
+            offset=start,
+            length=length,
+            timeout=storage.timeout,
+        )
+        yield from downloader.chunks()
+        return
+
+    with storage.open(name, "rb") as file:
+        file.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = file.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def get_signed_url(storage: Storage, name: str, expire: int) -> Optional[str]:
+    """
+    Return a URL to the file that is signed for `expire` seconds, or None if the storage can not sign URLs per file.
+
+    Only Azure storages configured with an account key or a token credential can sign blob specific SAS tokens. A
+    storage configured with a container wide SAS token is never used, as that token must not be exposed to users.
+    """
+    if not isinstance(storage, AzureStorage) or not (storage.account_key or storage.token_credential):
+        return None
+
+    url_private = getattr(storage, "url_private", storage.url)
+    return url_private(name, expire=expire)
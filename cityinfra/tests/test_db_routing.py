@@ -0,0 +1,105 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection, DEFAULT_DB_ALIAS, router
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from cityinfra.db_routing import is_read_request, RequestDatabaseMiddleware
+from traffic_control.models import Owner
+
+REPLICA = "replica"
+
+
+@pytest.fixture
+def replica(settings):
+    settings.DATABASE_REPLICA_ALIAS = REPLICA
+    cache.clear()
+    yield REPLICA
+    cache.clear()
+
+
+def run_request(request, view=None):
+    """Run the request through the middleware, returning what the view saw"""
+    seen = {}
+
+    def get_response(request):
+        seen["in_atomic_block"] = connection.in_atomic_block
+        seen["read_db"] = router.db_for_read(Owner)
+        if view:
+            view(seen)
+        return HttpResponse()
+
+    RequestDatabaseMiddleware(get_response)(request)
+    return seen
+
+
+@pytest.mark.parametrize(
+    "method,path,expected",
+    (
+        ("get", "/v1/traffic-sign-reals/", True),
+        ("head", "/wfs/", True),
+        ("get", "/fi/map-config/", True),
+        ("get", "/en/embed/traffic-sign-reals/ae1ca6a2-67bc-4c2c-8d2f-b6e2ee5b5cd4/", True),
+        ("post", "/v1/traffic-sign-reals/", False),
+        ("get", "/fi/admin/traffic_control/trafficsignreal/", False),
+    ),
+)
+def test__is_read_request(method, path, expected):
+    assert is_read_request(getattr(RequestFactory(), method)(path)) is expected
+
+
+@pytest.mark.django_db(transaction=True)
+def test__request_database_middleware__only_writes_are_atomic():
+    assert not run_request(RequestFactory().get("/v1/owners/"))["in_atomic_block"]
+    assert run_request(RequestFactory().post("/v1/owners/"))["in_atomic_block"]
+    assert run_request(RequestFactory().get("/fi/admin/"))["in_atomic_block"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test__request_database_middleware__exception_rolls_back_write():
+    request = RequestFactory().post("/v1/owners/")
+
+    def get_response(request):
+        Owner.objects.create(name_fi="Omistaja", name_en="Owner")
+        # Called by the request handler when the view raises
+        middleware.process_exception(request, Exception())
+        return HttpResponse(status=500)
+
+    middleware = RequestDatabaseMiddleware(get_response)
+    middleware(request)
+
+    assert not Owner.objects.exists()
+
+
+def test__read_replica_router__is_not_used_without_replica():
+    assert run_request(RequestFactory().get("/v1/owners/"))["read_db"] is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test__read_replica_router__routes_reads_of_read_requests(replica):
+    assert run_request(RequestFactory().get("/v1/owners/"))["read_db"] == REPLICA
+    assert run_request(RequestFactory().get("/fi/admin/"))["read_db"] == DEFAULT_DB_ALIAS
+    # Outside requests
+    assert router.db_for_read(Owner) is None
+
+
+def test__read_replica_router__reads_from_primary_after_write_in_same_request(replica):
+    def view(seen):
+        assert router.db_for_write(Owner) == DEFAULT_DB_ALIAS
+        seen["read_db_after_write"] = router.db_for_read(Owner)
+
+    seen = run_request(RequestFactory().get("/v1/owners/"), view)
+
+    assert seen["read_db"] == REPLICA
+    assert seen["read_db_after_write"] == DEFAULT_DB_ALIAS
+
+
+@pytest.mark.django_db(transaction=True)
+def test__read_replica_router__client_reads_from_primary_after_writing(replica):
+    writer = {"HTTP_AUTHORIZATION": "Token writer"}
+    reader = {"HTTP_AUTHORIZATION": "Token reader"}
+
+    run_request(RequestFactory().post("/v1/owners/", **writer))
+
+    assert run_request(RequestFactory().get("/v1/owners/", **writer))["read_db"] == DEFAULT_DB_ALIAS
+    assert run_request(RequestFactory().get("/v1/owners/", **reader))["read_db"] == REPLICA
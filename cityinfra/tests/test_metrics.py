@@ -0,0 +1,129 @@
+import logging
+
+import pytest
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from cityinfra.metrics import EndpointMetrics, MetricsMiddleware, registry, render_metrics, RequestMetrics
+from traffic_control.tests.factories import get_api_client, get_user, OwnerFactory
+
+METRICS_TOKEN = "metrics-token"
+
+
+@pytest.fixture
+def metrics(settings):
+    settings.METRICS_ENABLED = True
+    settings.METRICS_TOKEN = METRICS_TOKEN
+    settings.METRICS_FLUSH_INTERVAL = 0
+    registry.reset()
+    yield registry
+    registry.reset()
+
+
+def _get_metrics(client) -> str:
+    response = client.get(reverse("metrics"), HTTP_AUTHORIZATION=f"Bearer {METRICS_TOKEN}")
+    assert response.status_code == 200
+    return response.content.decode()
+
+
+@pytest.mark.django_db
+def test__metrics_middleware__records_endpoint_metrics(metrics):
+    OwnerFactory()
+    api_client = get_api_client(user=get_user())
+
+    response = api_client.get(reverse("v1:owner-list"))
+
+    assert response.status_code == 200
+    endpoint = metrics.snapshot()[("v1:owner-list", "GET", "2xx")]
+    assert endpoint.requests == 1
+    assert sum(endpoint.latency_bucket_counts) == 1
+    assert endpoint.queries > 0
+    assert endpoint.response_bytes == len(response.content)
+
+
+@pytest.mark.django_db
+def test__metrics_middleware__disabled(metrics, settings):
+    settings.METRICS_ENABLED = False
+
+    get_api_client(user=get_user()).get(reverse("v1:owner-list"))
+
+    assert metrics.snapshot() == {}
+
+
+@pytest.mark.django_db
+def test__metrics_middleware__logs_slow_requests(metrics, settings, caplog):
+    settings.METRICS_SLOW_REQUEST_THRESHOLD = 0
+
+    with caplog.at_level(logging.WARNING, logger="cityinfra.metrics"):
+        get_api_client(user=get_user()).get(reverse("v1:owner-list"))
+
+    assert "Slow request GET /v1/owners/ (v1:owner-list)" in caplog.text
+    assert 'FROM "traffic_control_owner"' in caplog.text
+
+
+@pytest.mark.django_db
+def test__metrics_middleware__unstarted_streaming_response_is_finished_on_close(metrics):
+    execute_wrappers = list(connection.execute_wrappers)
+    response = MetricsMiddleware(lambda request: StreamingHttpResponse(iter([b"chunk"])))(RequestFactory().get("/wfs/"))
+    assert len(connection.execute_wrappers) == len(execute_wrappers) + 1
+
+    # Closed by the WSGI server without iterating the content, e.g. when the client has disconnected
+    response.close()
+    response.close()
+
+    assert connection.execute_wrappers == execute_wrappers
+    endpoint = next(iter(metrics.snapshot().values()))
+    assert endpoint.requests == 1
+    assert endpoint.response_bytes == 0
+
+
+@pytest.mark.django_db
+def test__metrics_view__renders_prometheus_text(metrics, client):
+    get_api_client(user=get_user()).get(reverse("v1:owner-list"))
+
+    content = _get_metrics(client)
+
+    assert 'cityinfra_http_requests_total{view="v1:owner-list",method="GET",status="2xx"} 1' in content
+    assert (
+        'cityinfra_http_request_duration_seconds_bucket{view="v1:owner-list",method="GET",status="2xx",le="+Inf"} 1'
+        in content
+    )
+    assert 'view="metrics"' not in content
+
+
+@pytest.mark.parametrize("authorization", ["", "Bearer wrong-token", f"Token {METRICS_TOKEN}"])
+@pytest.mark.django_db
+def test__metrics_view__requires_token(metrics, client, authorization):
+    response = client.get(reverse("metrics"), HTTP_AUTHORIZATION=authorization)
+
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test__metrics_view__not_found_without_token(metrics, client, settings):
+    settings.METRICS_TOKEN = ""
+
+    response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer ")
+
+    assert response.status_code == 404
+
+
+def test__render_metrics__histogram_buckets_are_cumulative():
+    endpoint = EndpointMetrics()
+    endpoint.add_request(0.01, 10, RequestMetrics(query_count=2, query_seconds=0.005, cache_hits=1))
+    endpoint.add_request(0.2, 20, RequestMetrics())
+    endpoint.add_request(60, 30, RequestMetrics())
+
+    content = render_metrics({('view"name', "GET", "2xx"): endpoint})
+
+    labels = 'view="view\\"name",method="GET",status="2xx"'
+    assert f'cityinfra_http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in content
+    assert f'cityinfra_http_request_duration_seconds_bucket{{{labels},le="0.25"}} 2' in content
+    assert f'cityinfra_http_request_duration_seconds_bucket{{{labels},le="30.0"}} 2' in content
+    assert f'cityinfra_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in content
+    assert f"cityinfra_http_request_duration_seconds_count{{{labels}}} 3" in content
+    assert f"cityinfra_db_queries_total{{{labels}}} 2" in content
+    assert f"cityinfra_http_response_bytes_total{{{labels}}} 60" in content
+    assert f"cityinfra_cache_hits_total{{{labels}}} 1" in content
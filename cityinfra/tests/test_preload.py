@@ -0,0 +1,33 @@
+import gc
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+
+from cityinfra import preload
+
+
+@pytest.mark.django_db(transaction=True)
+def test__warm_up__preloads_openapi_schema_and_closes_connections(monkeypatch):
+    monkeypatch.setattr(preload, "_openapi_schema", None)
+
+    try:
+        preload.warm_up()
+    finally:
+        gc.unfreeze()
+
+    assert preload.get_preloaded_openapi_schema()["info"]["title"] == "City Infrastructure Platform REST API"
+    assert connection.connection is None
+
+
+@pytest.mark.parametrize("params, preloaded", (({}, True), ({"lang": "en"}, False)))
+@pytest.mark.django_db
+def test__openapi_schema_view__preloaded_schema(client, monkeypatch, params, preloaded):
+    cache.clear()
+    monkeypatch.setattr(preload, "_openapi_schema", {"openapi": "3.0.3", "info": {"title": "Preloaded"}, "paths": {}})
+
+    response = client.get(reverse("schema-yaml"), params)
+
+    assert response.status_code == 200
+    assert (b"title: Preloaded" in response.content) is preloaded
@@ -2,7 +2,7 @@ import os
 
 import pytest
 from django.urls import reverse
-from guardian.shortcuts import assign_perm
+from guardian.shortcuts import assign_perm, remove_perm
 
 from traffic_control.tests.factories import BarrierPlanFactory, BarrierPlanFileFactory, UserFactory
 
@@ -128,3 +128,89 @@ def test__file_proxy_view_file_row_but_not_in_storage(client):
 
     assert response.status_code == 500
     assert "is referenced in the database, but was not found in the storage" in response.content.decode()
+
+
+def _get_public_file_url(data=b"0123456789"):
+    barrier_plan = BarrierPlanFactory()
+    file = BarrierPlanFileFactory(barrier_plan=barrier_plan, is_public=True, file__data=data)
+    return reverse(
+        "planfiles_proxy",
+        kwargs={
+            "model_name": "barrier",
+            "file_id": file.file.name.split("/")[-1],
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "range_header, expected_content, expected_content_range",
+    (
+        ("bytes=2-5", b"2345", "bytes 2-5/10"),
+        ("bytes=7-", b"789", "bytes 7-9/10"),
+        ("bytes=-3", b"789", "bytes 7-9/10"),
+        ("bytes=8-100", b"89", "bytes 8-9/10"),
+    ),
+)
+@pytest.mark.django_db
+def test__file_proxy_view_range_request(client, range_header, expected_content, expected_content_range):
+    url = _get_public_file_url()
+
+    response = client.get(url, HTTP_RANGE=range_header)
+
+    assert response.status_code == 206
+    assert b"".join(response.streaming_content) == expected_content
+    assert response["Content-Range"] == expected_content_range
+    assert response["Content-Length"] == str(len(expected_content))
+    assert response["Accept-Ranges"] == "bytes"
+
+
+@pytest.mark.django_db
+def test__file_proxy_view_unsatisfiable_range(client):
+    url = _get_public_file_url()
+
+    response = client.get(url, HTTP_RANGE="bytes=20-30")
+
+    assert response.status_code == 416
+    assert response["Content-Range"] == "bytes */10"
+
+
+@pytest.mark.django_db
+def test__file_proxy_view_range_ignored_when_if_range_does_not_match(client):
+    url = _get_public_file_url()
+
+    response = client.get(url, HTTP_RANGE="bytes=2-5", HTTP_IF_RANGE='"outdated"')
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == b"0123456789"
+
+
+@pytest.mark.django_db
+def test__file_proxy_view_if_none_match_returns_not_modified(client):
+    url = _get_public_file_url()
+    etag = client.get(url)["ETag"]
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test__file_proxy_view_revoked_object_permission_is_not_cached(client):
+    user = UserFactory()
+    barrier_plan = BarrierPlanFactory()
+    file = BarrierPlanFileFactory(barrier_plan=barrier_plan, is_public=False, file__data=b"Barrier plan file data")
+    url = reverse(
+        "planfiles_proxy",
+        kwargs={
+            "model_name": "barrier",
+            "file_id": file.file.name.split("/")[-1],
+        },
+    )
+    assign_perm("traffic_control.view_barrierplanfile", user, file)
+    client.force_login(user)
+    assert client.get(url).status_code == 200
+
+    remove_perm("traffic_control.view_barrierplanfile", user, file)
+
+    assert client.get(url).status_code == 403
@@ -4,7 +4,7 @@ from django.contrib import admin
 from django.urls import include, path
 from django.views.decorators.cache import cache_page
 from django.views.i18n import set_language
-from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView, SpectacularYAMLAPIView
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 from rest_framework import routers
 from rest_framework_nested.routers import NestedSimpleRouter
 
@@ -15,7 +15,7 @@ from city_furniture.views import (
     furniture_signpost as furniture_signpost_views,
 )
 from cityinfra.admin.views import MyAccountView
-from cityinfra.views import FileProxyView, HealthCheckView
+from cityinfra.views import FileProxyView, HealthCheckView, MetricsView, OpenAPISchemaView
 from map import views as map_views
 from traffic_control.views import (
     additional_sign as additional_sign_views,
@@ -112,6 +112,7 @@ furniture_signpost_operations_router.register(
 urlpatterns = [
     path("healthz", HealthCheckView.as_view(), name="health-check"),
     path("readiness", HealthCheckView.as_view(), name="readiness-check"),
+    path("metrics", MetricsView.as_view(), name="metrics"),
     path("ha/", include("helusers.urls", namespace="helusers")),
     path("v1/", include((router.urls, "traffic_control"), namespace="v1")),
     path("v1/", include(barrier_operations_router.urls)),
@@ -129,10 +130,18 @@ urlpatterns = [
     ),
     path("auth/", include("social_django.urls", namespace="social")),
     path("wfs/", CityInfrastructureWFSView.as_view(), name="wfs-city-infrastructure"),
+    path("map-cells/", map_views.map_grid, name="map-grid"),
+    path("map-cells/<str:identifier>/<int:column>/<int:row>/", map_views.map_grid_cell, name="map-grid-cell"),
+    path("map-clusters/", map_views.map_clusters, name="map-clusters"),
+    path(
+        "map-clusters/<str:identifier>/<int:zoom>/<int:column>/<int:row>/",
+        map_views.map_cluster_cell,
+        name="map-cluster-cell",
+    ),
     path("i18n/", set_language, name="set_language"),
 ]
 
-schema_yaml_view = SpectacularYAMLAPIView.as_view()
+schema_yaml_view = OpenAPISchemaView.as_view()
 if not settings.DEBUG:
     schema_yaml_view = cache_page(60 * 10)(schema_yaml_view)
 
@@ -1,22 +1,43 @@
+import hmac
 import mimetypes
+import re
+from typing import Optional, Tuple
 
 from azure.core.exceptions import ResourceNotFoundError
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import storages
 from django.http import (
-    FileResponse,
+    Http404,
+    HttpResponse,
     HttpResponseBadRequest,
     HttpResponseForbidden,
+    HttpResponseRedirect,
     HttpResponseServerError,
     JsonResponse,
+    StreamingHttpResponse,
 )
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.utils.decorators import method_decorator
+from django.utils.http import http_date, parse_etags
+from django.utils.translation import get_language
 from django.views import View
 from django.views.decorators.cache import never_cache
+from drf_spectacular.views import SpectacularYAMLAPIView
+from guardian.models import GroupObjectPermission, UserObjectPermission
 from health_check.views import MainView
+from rest_framework.response import Response
 
+from cityinfra.metrics import record_cache_hit, registry, render_metrics
+from cityinfra.preload import get_preloaded_openapi_schema
+from cityinfra.storages.file_access import FileMetadata, get_file_metadata, get_signed_url, iter_file_range
 from traffic_control.file_registry import UPLOAD_PATH_TO_MODEL_MAP
+from traffic_control.utils.data_version import get_data_versions
+
+FILE_PERMISSION_CACHE_KEY_PREFIX = "file_proxy:permission"
+
+_SINGLE_BYTE_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
 
 
 class HealthCheckView(MainView):
@@ -35,7 +56,84 @@ class HealthCheckView(MainView):
         return JsonResponse(response, status=status_code)
 
 
+class OpenAPISchemaView(SpectacularYAMLAPIView):
+    """
+    OpenAPI schema in YAML. Serves the schema generated in the uWSGI master process when the application is
+    preloaded, see cityinfra.preload, and generates the schema otherwise.
+    """
+
+    def get(self, request, *args, **kwargs):
+        schema = get_preloaded_openapi_schema()
+        if schema is None or request.GET or get_language() != settings.LANGUAGE_CODE:
+            return super().get(request, *args, **kwargs)
+        return Response(schema, headers={"Content-Disposition": 'inline; filename="schema.yaml"'})
+
+
+class MetricsView(View):
+    """
+    Request metrics of all worker processes in Prometheus text format, see cityinfra.metrics.
+
+    Requires the METRICS_TOKEN as a bearer token, the view is not found when the token is not configured.
+    """
+
+    @method_decorator(never_cache)
+    def get(self, request, *args, **kwargs):
+        if not settings.METRICS_TOKEN:
+            raise Http404()
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode()):
+            response = HttpResponse(status=401)
+            response["WWW-Authenticate"] = "Bearer"
+            return response
+
+        return HttpResponse(render_metrics(registry.collect()), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def _parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Return the (first byte, last byte) of a single byte range request.
+
+    Raises ValueError for a range that can not be satisfied. Returns None for a header that is ignored, multiple
+    ranges included, in which case the whole file is returned.
+    """
+    match = _SINGLE_BYTE_RANGE_RE.match(range_header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range, the last N bytes of the file
+        suffix_length = int(last)
+        if suffix_length == 0 or size == 0:
+            raise ValueError(range_header)
+        return max(size - suffix_length, 0), size - 1
+
+    first = int(first)
+    last = min(int(last), size - 1) if last else size - 1
+    if first > last or first >= size:
+        raise ValueError(range_header)
+    return first, last
+
+
+def _if_range_matches(request, metadata: FileMetadata) -> bool:
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    # Only strong entity tags are accepted, the range must come from exactly the same content
+    return not if_range.startswith("W/") and metadata.etag in parse_etags(if_range)
+
+
 class FileProxyView(View):
+    """
+    Serve uploaded files after checking the permissions of the requesting user.
+
+    File properties are read from the storage without downloading the content, so conditional requests are answered
+    without touching the file. Single byte range requests are supported and only the requested bytes are streamed.
+    Public files can be redirected to short-lived signed storage URLs with FILE_PROXY_REDIRECT_PUBLIC_FILES, so that
+    their bytes bypass the application server entirely.
+    """
+
     @classmethod
     def get_storage(cls):
         return storages["default"]
@@ -50,27 +148,94 @@ class FileProxyView(View):
         if not model_class:
             return HttpResponseBadRequest("Invalid file path.")
         file_path = f"{upload_folder}/{model_name}/{file_id}"
-        file_obj = get_object_or_404(model_class, file=file_path)
+        file_obj = get_object_or_404(model_class.objects.only("id", "file", "is_public"), file=file_path)
 
         if not file_obj.is_public:
             user = request.user
             if not user or not user.is_authenticated:
                 return HttpResponseForbidden("You do not have permission to view this file.")
-
-            permission_name = f"{model_class._meta.app_label}." f"view_{model_class._meta.model_name}"
-            if not user.has_perm(permission_name) and not user.has_perm(permission_name, file_obj):
+            if not self.has_view_permission(user, file_obj):
                 return HttpResponseForbidden("You do not have permission to view this file.")
 
+        storage = self.get_storage()
         try:
-            # The storage might throw a *NotFoundError at some point later than open(file_path), so we just try the
-            # whole block
-            file_handle = self.get_storage().open(file_path)
-            content_type, _ = mimetypes.guess_type(file_path)
-            content_type = content_type or "application/octet-stream"
-            response = FileResponse(file_handle, content_type=content_type)
-            response["Content-Disposition"] = f'inline; filename="{file_id}"'
-            return response
+            if file_obj.is_public and settings.FILE_PROXY_REDIRECT_PUBLIC_FILES:
+                signed_url = get_signed_url(storage, file_path, settings.FILE_PROXY_SIGNED_URL_EXPIRE)
+                if signed_url:
+                    return HttpResponseRedirect(signed_url)
+
+            metadata = get_file_metadata(storage, file_path)
+            response = self.get_file_response(request, storage, file_path, metadata)
         except (ResourceNotFoundError, FileNotFoundError):
             return HttpResponseServerError(
                 f"File {file_path} is referenced in the database, but was not found in the storage"
             )
+
+        response["Content-Disposition"] = f'inline; filename="{file_id}"'
+        if not file_obj.is_public:
+            # Shared caches must not serve restricted files to other users
+            patch_cache_control(response, private=True)
+        return response
+
+    @staticmethod
+    def has_view_permission(user, file_obj) -> bool:
+        """
+        Check the table or object level view permission of the file, caching the decision per user and file.
+
+        Object permission changes made through guardian invalidate the decisions immediately, other changes (groups,
+        table level permissions) apply after FILE_PROXY_PERMISSION_CACHE_TIMEOUT at the latest.
+        """
+        model_class = type(file_obj)
+        permission_name = f"{model_class._meta.app_label}.view_{model_class._meta.model_name}"
+        versions = get_data_versions([UserObjectPermission._meta.db_table, GroupObjectPermission._meta.db_table])
+        cache_key = ":".join(
+            [
+                FILE_PERMISSION_CACHE_KEY_PREFIX,
+                str(user.pk),
+                model_class._meta.label_lower,
+                str(file_obj.pk),
+                *(str(version) for _, version in sorted(versions.items())),
+            ]
+        )
+        has_permission = cache.get(cache_key)
+        if has_permission is None:
+            has_permission = user.has_perm(permission_name) or user.has_perm(permission_name, file_obj)
+            cache.set(cache_key, has_permission, timeout=settings.FILE_PROXY_PERMISSION_CACHE_TIMEOUT)
+        else:
+            record_cache_hit()
+        return has_permission
+
+    @staticmethod
+    def get_file_response(request, storage, file_path: str, metadata: FileMetadata) -> HttpResponse:
+        last_modified = int(metadata.last_modified.timestamp())
+        response = get_conditional_response(request, etag=metadata.etag, last_modified=last_modified)
+        if response is None:
+            content_type, _ = mimetypes.guess_type(file_path)
+            content_type = content_type or "application/octet-stream"
+            first, last = 0, metadata.size - 1
+
+            try:
+                byte_range = _parse_range(request.headers.get("Range", ""), metadata.size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{metadata.size}"
+                return response
+
+            if byte_range is not None and _if_range_matches(request, metadata):
+                first, last = byte_range
+                response = StreamingHttpResponse(
+                    iter_file_range(storage, file_path, first, last - first + 1),
+                    status=206,
+                    content_type=content_type,
+                )
+                response["Content-Range"] = f"bytes {first}-{last}/{metadata.size}"
+            else:
+                response = StreamingHttpResponse(
+                    iter_file_range(storage, file_path, 0, metadata.size), content_type=content_type
+                )
+            response["Content-Length"] = str(last - first + 1)
+
+        response["Accept-Ranges"] = "bytes"
+        response["ETag"] = metadata.etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
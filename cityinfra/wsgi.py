@@ -1,6 +1,12 @@
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cityinfra.settings")
 application = get_wsgi_application()
+
+if settings.WSGI_PRELOAD:
+    from cityinfra.preload import warm_up
+
+    warm_up()
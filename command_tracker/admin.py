@@ -4,11 +4,14 @@ from django import forms
 from django.conf import settings
 from django.contrib import admin
 from django.core.management import get_commands, load_command_class
+from django.http import FileResponse, Http404
 from django.shortcuts import redirect, render
-from django.urls import path
+from django.urls import path, reverse
+from django.utils.html import format_html
+from django.utils.translation import gettext_lazy as _
 
 from command_tracker.management.trackable_command import TrackableCommand
-from command_tracker.models import TrackedManagementCommand
+from command_tracker.models import ProfileReport, TrackedManagementCommand
 
 
 class TrackedCommandForm(forms.ModelForm):
@@ -134,3 +137,82 @@ class TrackedManagementCommandAdmin(admin.ModelAdmin):
             app, command = object_id.split("-", 1)
             TrackedManagementCommand.objects.create(id=object_id, app=app, command=command)
         return redirect(f"admin:{self.model._meta.app_label}_{self.model._meta.model_name}_changelist")
+
+
+@admin.register(ProfileReport)
+class ProfileReportAdmin(admin.ModelAdmin):
+    """Profiles of requests and management commands, visible to superusers only."""
+
+    list_display = ("created_at", "source", "name", "duration", "query_count", "query_duration", "created_by")
+    list_filter = ("source",)
+    search_fields = ("name", "description")
+    ordering = ("-created_at",)
+    fields = (
+        "id",
+        "created_at",
+        "created_by",
+        "source",
+        "name",
+        "description",
+        "duration",
+        "query_count",
+        "query_duration",
+        "download",
+        "queries_display",
+        "summary_display",
+    )
+    readonly_fields = fields
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("created_by")
+
+    def has_module_permission(self, request):
+        return request.user.is_active and request.user.is_superuser
+
+    def has_view_permission(self, request, obj=None):
+        return request.user.is_active and request.user.is_superuser
+
+    def has_delete_permission(self, request, obj=None):
+        return request.user.is_active and request.user.is_superuser
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                "<uuid:pk>/download/",
+                self.admin_site.admin_view(self.download_view),
+                name="command_tracker_profilereport_download",
+            ),
+        ] + super().get_urls()
+
+    def download_view(self, request, pk):
+        if not self.has_view_permission(request):
+            raise Http404
+        report = self.get_queryset(request).filter(pk=pk).first()
+        if report is None or not report.file:
+            raise Http404
+        return FileResponse(report.file.open("rb"), as_attachment=True, filename=report.file.name.rsplit("/", 1)[-1])
+
+    @admin.display(description=_("Profile file"))
+    def download(self, obj: ProfileReport):
+        if not obj.file:
+            return "-"
+        return format_html(
+            '<a href="{}">{}</a>',
+            reverse("admin:command_tracker_profilereport_download", args=[obj.pk]),
+            _("Download"),
+        )
+
+    @admin.display(description=_("Queries"))
+    def queries_display(self, obj: ProfileReport):
+        lines = [f"{query['seconds']:.3f} s, {query['count']} x: {query['sql']}" for query in obj.queries]
+        return format_html("<pre>{}</pre>", "\n\n".join(lines))
+
+    @admin.display(description=_("Summary"))
+    def summary_display(self, obj: ProfileReport):
+        return format_html("<pre>{}</pre>", obj.summary)
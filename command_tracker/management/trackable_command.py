@@ -1,7 +1,12 @@
+import logging
+
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
-from command_tracker.models import TrackedManagementCommand
+from command_tracker.models import ProfileSource, TrackedManagementCommand
+from command_tracker.profiling import Profiler, profiler_lock
+
+logger = logging.getLogger("command_tracker")
 
 
 class TrackableCommand(BaseCommand):
@@ -9,8 +14,20 @@ class TrackableCommand(BaseCommand):
     Base class for commands that need their execution tracked.
 
     If the command is getting tracked and gets executed, it will update the tracker's latest_track_at field.
+
+    Trackable commands can be run with `--profile`, which stores a ProfileReport of the execution.
     """
 
+    def create_parser(self, prog_name, subcommand, **kwargs):
+        parser = super().create_parser(prog_name, subcommand, **kwargs)
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            default=False,
+            help="Profile the execution and store the profile as a profile report.",
+        )
+        return parser
+
     def execute(self, *args, **options):
         # Resolve the command ID from its location
         module_parts = self.__module__.split(".")
@@ -22,5 +39,27 @@ class TrackableCommand(BaseCommand):
         # Update the tracking timestamp
         TrackedManagementCommand.objects.filter(id=cmd_id).update(latest_executed_at=timezone.now())
 
-        # Execute as usual
-        return super().execute(*args, **options)
+        if not options.pop("profile", False):
+            # Execute as usual
+            return super().execute(*args, **options)
+
+        with profiler_lock:
+            profiler = Profiler()
+            try:
+                with profiler:
+                    return super().execute(*args, **options)
+            finally:
+                self._save_profile(profiler, cmd_id, args, options)
+
+    def _save_profile(self, profiler: Profiler, cmd_id: str, args, options) -> None:
+        arguments = [*map(str, args), *(f"{name}={value!r}" for name, value in sorted(options.items()))]
+        try:
+            report = profiler.save(ProfileSource.COMMAND, cmd_id, description=" ".join(arguments))
+        except Exception:
+            # Do not hide the outcome of the command itself
+            logger.exception("Saving the profile report of %s failed", cmd_id)
+            return
+        self.stderr.write(
+            f"Profile report {report.pk} saved: {report.duration:.2f} s, "
+            f"{report.query_count} SQL queries in {report.query_duration:.2f} s."
+        )
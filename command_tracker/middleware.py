@@ -0,0 +1,98 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse
+
+from command_tracker.models import ProfileSource
+from command_tracker.profiling import Profiler, profiler_lock
+
+logger = logging.getLogger("command_tracker")
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAMETER = "_profile"
+PROFILE_REPORT_HEADER = "X-Profile-Report"
+PROFILE_RATE_LIMIT_CACHE_KEY_PREFIX = "profiler:rate"
+PROFILE_RATE_LIMIT_PERIOD = 60 * 60  # Seconds
+
+
+class ProfilerMiddleware:
+    """
+    Middleware that profiles requests of superusers that ask for it, see command_tracker.profiling.
+
+    A request is profiled when it has the X-Profile header or the _profile query parameter, the sending user is an
+    active superuser and PROFILER_ENABLED is set. Each user can profile PROFILER_RATE_LIMIT requests per hour, and a
+    worker process profiles only one request at a time. The response of a profiled request gets an X-Profile-Report
+    header with the admin URL of the stored ProfileReport, or with the reason why the request was not profiled.
+
+    Streaming responses of profiled requests are rendered in full inside the profiler, so that e.g. WFS GetFeature
+    output rendering is included in the profile.
+    """
+
+    def __init__(self, get_response=None):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.PROFILER_ENABLED or not self._is_profile_requested(request):
+            return self.get_response(request)
+
+        user = request.user
+        if not (user.is_authenticated and user.is_active and user.is_superuser):
+            return self.get_response(request)
+
+        if not self._consume_rate_limit(user):
+            response = self.get_response(request)
+            response[PROFILE_REPORT_HEADER] = "rate-limited"
+            return response
+
+        if not profiler_lock.acquire(blocking=False):
+            response = self.get_response(request)
+            response[PROFILE_REPORT_HEADER] = "busy"
+            return response
+
+        try:
+            profiler = Profiler()
+            with profiler:
+                response = self.get_response(request)
+                if response.streaming:
+                    response.streaming_content = [b"".join(response.streaming_content)]
+            report = self._save_profile(request, profiler)
+        finally:
+            profiler_lock.release()
+
+        if report is not None:
+            response[PROFILE_REPORT_HEADER] = reverse("admin:command_tracker_profilereport_change", args=[report.pk])
+        return response
+
+    @staticmethod
+    def _is_profile_requested(request) -> bool:
+        return PROFILE_HEADER in request.headers or PROFILE_QUERY_PARAMETER in request.GET
+
+    @staticmethod
+    def _consume_rate_limit(user) -> bool:
+        period = int(time.time() // PROFILE_RATE_LIMIT_PERIOD)
+        cache_key = f"{PROFILE_RATE_LIMIT_CACHE_KEY_PREFIX}:{user.pk}:{period}"
+        cache.add(cache_key, 0, timeout=PROFILE_RATE_LIMIT_PERIOD)
+        try:
+            count = cache.incr(cache_key)
+        except ValueError:
+            # The key expired between add and incr
+            count = 1
+            cache.set(cache_key, count, timeout=PROFILE_RATE_LIMIT_PERIOD)
+        return count <= settings.PROFILER_RATE_LIMIT
+
+    @staticmethod
+    def _save_profile(request, profiler: Profiler):
+        resolver_match = request.resolver_match
+        name = (resolver_match.view_name or resolver_match.route) if resolver_match else request.path
+        try:
+            return profiler.save(
+                ProfileSource.REQUEST,
+                name,
+                description=f"{request.method} {request.get_full_path()}",
+                user=request.user,
+            )
+        except Exception:
+            logger.exception("Saving the profile report of %s %s failed", request.method, request.path)
+            return None
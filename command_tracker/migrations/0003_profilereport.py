@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-19 15:20
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('command_tracker', '0002_alter_trackedmanagementcommand_latest_tracked_at_squashed_0007_alter_trackedmanagementcommand_latest_executed_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileReport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('source', models.CharField(choices=[('REQUEST', 'Request'), ('COMMAND', 'Management command')], max_length=16, verbose_name='Source')),
+                ('name', models.CharField(help_text='Resolved URL name of the request or ID of the management command.', max_length=255, verbose_name='Name')),
+                ('description', models.TextField(blank=True, default='', help_text='Method and path of the request or arguments of the management command.', verbose_name='Description')),
+                ('duration', models.FloatField(help_text='Seconds.', verbose_name='Duration')),
+                ('query_count', models.IntegerField(default=0, verbose_name='Query count')),
+                ('query_duration', models.FloatField(default=0, help_text='Seconds.', verbose_name='Query duration')),
+                ('summary', models.TextField(blank=True, default='', verbose_name='Summary')),
+                ('queries', models.JSONField(blank=True, default=list, help_text='Slowest SQL queries.', verbose_name='Queries')),
+                ('file', models.FileField(blank=True, null=True, upload_to='profiles/', verbose_name='Profile file')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='profile_reports', to=settings.AUTH_USER_MODEL, verbose_name='Created by')),
+            ],
+            options={
+                'verbose_name': 'Profile report',
+                'verbose_name_plural': 'Profile reports',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
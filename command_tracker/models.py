@@ -1,3 +1,6 @@
+import uuid
+
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -35,3 +38,54 @@ class TrackedManagementCommand(models.Model):
 
     class Meta:
         ordering = ["app", "command"]
+
+
+class ProfileSource(models.TextChoices):
+    REQUEST = "REQUEST", _("Request")
+    COMMAND = "COMMAND", _("Management command")
+
+
+class ProfileReport(models.Model):
+    """
+    Profile of a single request or management command execution, see command_tracker.profiling.
+
+    The summary and the slowest SQL queries are stored for reading in the admin, and the full profile is stored as a
+    pstats file that can be downloaded and opened e.g. with `python -m pstats` or snakeviz.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("Created by"),
+        on_delete=models.SET_NULL,
+        related_name="profile_reports",
+        null=True,
+        blank=True,
+    )
+    source = models.CharField(_("Source"), max_length=16, choices=ProfileSource.choices)
+    name = models.CharField(
+        _("Name"),
+        max_length=255,
+        help_text=_("Resolved URL name of the request or ID of the management command."),
+    )
+    description = models.TextField(
+        _("Description"),
+        blank=True,
+        default="",
+        help_text=_("Method and path of the request or arguments of the management command."),
+    )
+    duration = models.FloatField(_("Duration"), help_text=_("Seconds."))
+    query_count = models.IntegerField(_("Query count"), default=0)
+    query_duration = models.FloatField(_("Query duration"), default=0, help_text=_("Seconds."))
+    summary = models.TextField(_("Summary"), blank=True, default="")
+    queries = models.JSONField(_("Queries"), default=list, blank=True, help_text=_("Slowest SQL queries."))
+    file = models.FileField(_("Profile file"), upload_to="profiles/", blank=True, null=True)
+
+    class Meta:
+        verbose_name = _("Profile report")
+        verbose_name_plural = _("Profile reports")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.name} {self.created_at:%Y-%m-%d %H:%M:%S} ({self.duration:.2f} s)"
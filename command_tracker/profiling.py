@@ -0,0 +1,111 @@
+"""
+On-demand profiling of requests and management commands.
+
+Profiles are recorded with the deterministic cProfile profiler together with the timings of the executed SQL queries,
+and stored as ProfileReport rows with the pstats file attached.
+"""
+
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+import time
+from typing import Dict, List
+
+from django.core.files.base import ContentFile
+from django.db import connections
+
+from command_tracker.models import ProfileReport, ProfileSource
+
+PROFILE_SUMMARY_FUNCTION_COUNT = 40
+PROFILE_QUERY_COUNT = 20
+PROFILE_QUERY_SQL_LENGTH = 2000
+
+# Only one profiler can be active in a process at a time
+profiler_lock = threading.Lock()
+
+
+class Profiler:
+    """
+    Context manager that profiles the code run inside it and times the SQL queries it executes.
+
+    The caller is responsible for holding `profiler_lock` when other threads may be profiling at the same time.
+    """
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+        self.duration = 0.0
+        # SQL -> [query count, seconds]
+        self._queries: Dict[str, List] = {}
+        self._connections = []
+        self._start = None
+
+    def __enter__(self) -> "Profiler":
+        self._connections = connections.all()
+        for connection in self._connections:
+            connection.execute_wrappers.append(self._execute_wrapper)
+        self._start = time.perf_counter()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.profile.disable()
+        self.duration = time.perf_counter() - self._start
+        for connection in self._connections:
+            if self._execute_wrapper in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self._execute_wrapper)
+
+    def _execute_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            query = self._queries.setdefault(sql, [0, 0.0])
+            query[0] += 1
+            query[1] += time.perf_counter() - start
+
+    @property
+    def query_count(self) -> int:
+        return sum(count for count, _ in self._queries.values())
+
+    @property
+    def query_duration(self) -> float:
+        return sum(seconds for _, seconds in self._queries.values())
+
+    def get_slowest_queries(self) -> List[dict]:
+        """Return the SQL queries that took the most time in total, identical SQL with different parameters combined"""
+        queries = sorted(self._queries.items(), key=lambda item: item[1][1], reverse=True)[:PROFILE_QUERY_COUNT]
+        return [
+            {"sql": sql[:PROFILE_QUERY_SQL_LENGTH], "count": count, "seconds": round(seconds, 6)}
+            for sql, (count, seconds) in queries
+        ]
+
+    def get_summary(self) -> str:
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_SUMMARY_FUNCTION_COUNT)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(PROFILE_SUMMARY_FUNCTION_COUNT)
+        return stream.getvalue()
+
+    def save(self, source: ProfileSource, name: str, description: str = "", user=None) -> ProfileReport:
+        report = ProfileReport(
+            created_by=user,
+            source=source,
+            name=name[:255],
+            description=description,
+            duration=self.duration,
+            query_count=self.query_count,
+            query_duration=self.query_duration,
+            summary=self.get_summary(),
+            queries=self.get_slowest_queries(),
+        )
+        # Same format as pstats.Stats.dump_stats() writes
+        content = marshal.dumps(pstats.Stats(self.profile).stats)
+        report.file.save(f"{_get_file_name(name)}.prof", ContentFile(content), save=False)
+        report.save()
+        return report
+
+
+def _get_file_name(name: str) -> str:
+    return "".join(character if character.isalnum() or character in "-_" else "_" for character in name)
@@ -0,0 +1,124 @@
+import pstats
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+
+from command_tracker.middleware import PROFILE_REPORT_HEADER
+from command_tracker.models import ProfileReport, ProfileSource
+from traffic_control.tests.factories import get_api_client, get_user, OwnerFactory
+
+
+@pytest.fixture(autouse=True)
+def profiler_settings(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.PROFILER_ENABLED = True
+    settings.PROFILER_RATE_LIMIT = 10
+    cache.clear()
+
+
+def _get_owners(api_client, **extra):
+    return api_client.get(reverse("v1:owner-list"), **extra)
+
+
+def _get_token_api_client(user):
+    # Token authentication is resolved already in the middleware, unlike force_authenticate
+    return get_api_client(user=user, use_token_auth=True)
+
+
+@pytest.mark.django_db
+def test__profiler_middleware__profiles_superuser_request():
+    OwnerFactory()
+    user = get_user(admin=True)
+
+    response = _get_owners(_get_token_api_client(user), HTTP_X_PROFILE="1")
+
+    assert response.status_code == 200
+    report = ProfileReport.objects.get()
+    assert response[PROFILE_REPORT_HEADER] == reverse("admin:command_tracker_profilereport_change", args=[report.pk])
+    assert report.source == ProfileSource.REQUEST
+    assert report.name == "v1:owner-list"
+    assert report.description == "GET /v1/owners/"
+    assert report.created_by == user
+    assert report.query_count > 0
+    assert any('FROM "traffic_control_owner"' in query["sql"] for query in report.queries)
+    assert "function calls" in report.summary
+    assert pstats.Stats(report.file.path).total_calls > 0
+
+
+@pytest.mark.parametrize("admin", [False, True])
+@pytest.mark.django_db
+def test__profiler_middleware__not_requested_or_not_superuser(admin):
+    api_client = _get_token_api_client(get_user(admin=admin))
+
+    response = _get_owners(api_client, **({} if admin else {"HTTP_X_PROFILE": "1"}))
+
+    assert response.status_code == 200
+    assert PROFILE_REPORT_HEADER not in response
+    assert not ProfileReport.objects.exists()
+
+
+@pytest.mark.django_db
+def test__profiler_middleware__disabled(settings):
+    settings.PROFILER_ENABLED = False
+
+    response = _get_owners(_get_token_api_client(get_user(admin=True)), HTTP_X_PROFILE="1")
+
+    assert PROFILE_REPORT_HEADER not in response
+    assert not ProfileReport.objects.exists()
+
+
+@pytest.mark.django_db
+def test__profiler_middleware__rate_limit(settings):
+    settings.PROFILER_RATE_LIMIT = 1
+    api_client = _get_token_api_client(get_user(admin=True))
+
+    _get_owners(api_client, HTTP_X_PROFILE="1")
+    response = _get_owners(api_client, HTTP_X_PROFILE="1")
+
+    assert response.status_code == 200
+    assert response[PROFILE_REPORT_HEADER] == "rate-limited"
+    assert ProfileReport.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test__profiler_middleware__query_parameter(client):
+    client.force_login(get_user(admin=True))
+
+    response = client.get(reverse("admin:index"), {"_profile": ""})
+
+    assert response.status_code == 200
+    assert ProfileReport.objects.get().name == "admin:index"
+
+
+@pytest.mark.django_db
+def test__trackable_command__profile():
+    call_command("run_export_jobs", profile=True)
+
+    report = ProfileReport.objects.get()
+    assert report.source == ProfileSource.COMMAND
+    assert report.name == "traffic_control-run_export_jobs"
+    assert "stale_after=60" in report.description
+    assert report.created_by is None
+    assert report.file
+
+
+@pytest.mark.django_db
+def test__trackable_command__not_profiled_by_default():
+    call_command("run_export_jobs")
+
+    assert not ProfileReport.objects.exists()
+
+
+@pytest.mark.django_db
+def test__profile_report_admin__download(admin_client):
+    _get_owners(_get_token_api_client(get_user(admin=True)), HTTP_X_PROFILE="1")
+    report = ProfileReport.objects.get()
+
+    change_response = admin_client.get(reverse("admin:command_tracker_profilereport_change", args=[report.pk]))
+    download_response = admin_client.get(reverse("admin:command_tracker_profilereport_download", args=[report.pk]))
+
+    assert change_response.status_code == 200
+    assert download_response.status_code == 200
+    assert download_response["Content-Disposition"].startswith("attachment")
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_reference_data():
+    # The reference data cache of the process outlives the database state of a test
+    from traffic_control.utils.reference_data import clear_reference_data_cache
+
+    clear_reference_data_cache()
+    yield
@@ -33,6 +33,12 @@ else
         UWSGI_ARGS="$UWSGI_ARGS --ini uwsgi/donotlog-health.ini"
     fi
 
+    if [[ "$UWSGI_PRELOAD" = "1" ]]
+    then
+        echo "Preloading the application in the uwsgi master process."
+        UWSGI_ARGS="$UWSGI_ARGS --ini uwsgi/preload.ini"
+    fi
+
     echo "Starting uwsgi-server at $(date)"
     uwsgi $UWSGI_ARGS
 fi
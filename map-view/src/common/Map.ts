@@ -21,11 +21,17 @@ import { Circle, Fill, Stroke, Style, Text } from "ol/style";
 import { Pixel } from "ol/pixel";
 import { MapBrowserEvent, Feature as OlFeature } from "ol";
 import { LineString, Point } from "ol/geom";
-import { buildWFSQuery, getDistanceBetweenFeatures } from "./functions";
+import {
+  buildClusterCellUrl,
+  buildGridCellUrl,
+  buildWFSQuery,
+  getDistanceBetweenFeatures,
+  getGridCellIdsForExtent,
+} from "./functions";
 import { FeatureLike } from "ol/Feature";
 import { Cluster } from "ol/source";
 import BaseObject from "ol/Object";
-import { Extent, getCenter } from "ol/extent";
+import { getCenter } from "ol/extent";
 import {
   getAddressMarkerStyle,
   getDiffLayerIdentifier,
@@ -37,10 +43,7 @@ import {
   isLayerClustered,
 } from "./MapUtils";
 import Static from "ol/source/ImageStatic";
-import { bboxPolygon, booleanIntersects, union, featureCollection } from "@turf/turf";
-import { Feature as TurfFeature, Polygon as TurfPolygon, MultiPolygon as TurfMultiPolygon, BBox } from "geojson";
 import { buildAddressSearchQuery } from "./AddressSearchUtils";
-type TurfPolygonFeature = TurfFeature<TurfPolygon | TurfMultiPolygon>;
 
 function debounce<T extends (...args: any[]) => void>(func: T, wait: number): (...args: Parameters<T>) => void {
   let timeout: ReturnType<typeof setTimeout> | null;
@@ -86,6 +89,22 @@ class Map {
    * Available clustered overlay layers
    */
   private clusteredOverlayLayers: { [identifier: string]: VectorLayer<VectorSource> } = {};
+  /**
+   * Layers showing the clusters computed on the server for clustered overlay layers at low zoom levels
+   */
+  private serverClusterLayers: { [identifier: string]: VectorLayer<VectorSource> } = {};
+  /**
+   * Server side clusters per layer and zoom level, as clusters of different zoom levels can not be shown together
+   */
+  private serverClusterSources: { [identifier: string]: { [zoom: number]: VectorSource } } = {};
+  /**
+   * Ids of the cluster cells whose clusters have already been fetched (or are being fetched) per layer and zoom level
+   */
+  private fetchedClusterCells: { [identifier: string]: { [zoom: number]: Set<string> } } = {};
+  /**
+   * Clustered layers filtered by a project, these are clustered in the browser as server side clusters are unfiltered
+   */
+  private readonly projectFilteredLayers: Set<string> = new Set();
   /**
    * Available non-clustered overlay layers
    */
@@ -140,16 +159,26 @@ class Map {
   private iconSizeOverride: IconSize | null = null;
 
   /**
-   * Stores bounding box polygons from areas from which data has already been fetched.
-   * This array might grow as the user explores the map, intersecting area will be merged.
+   * Ids of the grid cells whose features have already been fetched (or are being fetched) per layer.
+   * Only missing cells are requested after a move, so the cost of a fetch does not grow during the session.
+   */
+  private fetchedGridCells: { [identifier: string]: Set<string> } = {};
+
+  /**
+   * Maximum number of grid cell requests running at the same time per layer
    */
-  private fetchedAreaPolygons: { [identifier: string]: TurfFeature<TurfPolygon | TurfMultiPolygon>[] } = {};
+  private readonly maxConcurrentGridCellFetches = 6;
 
   /**
    * Debounce time before data fetch is initiated after move event
    */
   private readonly getFeaturesDebounceTime = 1000;
 
+  /**
+   * Resolutions of the map view zoom levels, these must match MAP_RESOLUTIONS of map/clusters.py
+   */
+  private readonly resolutions = [256, 128, 64, 32, 16, 8, 4, 2, 1, 0.5, 0.25, 0.125, 0.0625];
+
   /**
    * Initialize the map with given configurations
    *
@@ -168,13 +197,12 @@ class Map {
     this.selectedAddressFeatureLayer = Map.createSelectedAddressLayer();
     const planRealDiffVectorLayerGroup = this.createPlanRealDiffVectorLayerGroup(mapConfig);
 
-    const resolutions = [256, 128, 64, 32, 16, 8, 4, 2, 1, 0.5, 0.25, 0.125, 0.0625];
     const projection = this.getProjection();
     const view = new View({
       projection,
       center: this.getDefaulViewCenter(),
       zoom: 5,
-      resolutions,
+      resolutions: this.resolutions,
       extent: projection.getExtent(),
     });
 
@@ -216,6 +244,8 @@ class Map {
     this.setupMapClickHandlers(overlayConfig);
     // for fetching data on all layers after move or zoom
     this.map.on("moveend", debounce(this.updateVisibleLayers.bind(this), this.getFeaturesDebounceTime));
+    // already fetched clusters of the new zoom level are shown without waiting for the debounced fetch
+    this.map.on("moveend", this.showServerClustersOfCurrentZoom.bind(this));
   }
 
   /**
@@ -275,11 +305,26 @@ class Map {
     }
 
     this.map.on("singleclick", (event) => {
+      // Server side clusters contain no feature information, zoom in towards the features instead
+      const serverClusterLayers: BaseObject[] = Object.values(this.serverClusterLayers);
+      const serverCluster = this.map.forEachFeatureAtPixel(event.pixel, (feature) => feature, {
+        layerFilter: (layer) => serverClusterLayers.includes(layer),
+      });
+      if (serverCluster) {
+        this.map.getView().animate({
+          center: (serverCluster.getGeometry() as Point).getCoordinates(),
+          zoom: this.getCurrentZoom() + 2,
+          duration: 500,
+        });
+        return;
+      }
+
       const layers = {
         ...this.clusteredOverlayLayers,
         ...this.nonClusteredOverlayLayers,
       };
-      const visibleLayers = Object.values(layers).filter((layer) => layer.getVisible());
+      // Layers outside of their resolution range (clustered layers while server side clusters are shown) are skipped
+      const visibleLayers = Object.values(layers).filter((layer) => layer.isVisible(this.map.getView()));
 
       if (visibleLayers.length > 0) {
         Promise.all(visibleLayers.map((layer) => getFeaturesFromLayer(layer, event))).then((features) => {
@@ -546,6 +591,9 @@ class Map {
         this.getAndAddFeaturesFromBoundingBox(overlayIdentifier, true);
       }
       this.clusteredOverlayLayers[overlayIdentifier].setVisible(visible);
+      this.serverClusterLayers[overlayIdentifier]?.setVisible(
+        visible && !this.projectFilteredLayers.has(overlayIdentifier),
+      );
     } else {
       if (visible) {
         this.getAndAddFeaturesFromBoundingBox(overlayIdentifier, false);
@@ -557,7 +605,6 @@ class Map {
   getWfsUrl(overlayIdentifier: string, filterId?: string, filterValue?: string, ignoreBbox?: boolean) {
     const urlBuildResult = buildWFSQuery(
       overlayIdentifier,
-      ignoreBbox ? undefined : this.fetchedAreaPolygons[overlayIdentifier],
       filterId,
       filterValue,
       ignoreBbox ? undefined : this.getCurrentBoundingBox(),
@@ -570,44 +617,167 @@ class Map {
   }
 
   getAndAddFeaturesFromBoundingBox(overlayIdentifier: string, isClustered: boolean) {
-    const wfsUrl = this.getWfsUrl(overlayIdentifier);
-    if (!wfsUrl) {
+    if (isClustered && this.isServerClusteringActive(overlayIdentifier)) {
+      this.getAndAddServerClusters(overlayIdentifier);
+      return;
+    }
+
+    const { gridCellUrl, gridOrigin, layers } = this.mapConfig.overlayConfig;
+    const layerConfig = layers.find((l) => l.identifier === overlayIdentifier);
+    if (!layerConfig?.grid_cell_size || !gridCellUrl || !gridOrigin) {
+      return;
+    }
+
+    if (!this.fetchedGridCells[overlayIdentifier]) {
+      this.fetchedGridCells[overlayIdentifier] = new Set();
+    }
+    const fetchedCells = this.fetchedGridCells[overlayIdentifier];
+    const missingCells = getGridCellIdsForExtent(
+      this.getCurrentBoundingBox(),
+      gridOrigin,
+      layerConfig.grid_cell_size,
+    ).filter((cellId) => !fetchedCells.has(cellId));
+    if (missingCells.length === 0) {
       // nothing to fetch
       return;
     }
+    // Mark cells fetched right away so that overlapping moves do not request them again
+    missingCells.forEach((cellId) => fetchedCells.add(cellId));
+
+    this.ongoingFeatureFetches.add(overlayIdentifier);
+    this.ongoingFeatureFetchesCallback(this.ongoingFeatureFetches);
+
+    this.fetchCells(overlayIdentifier, missingCells, fetchedCells, (cellId) =>
+      buildGridCellUrl(gridCellUrl, overlayIdentifier, cellId),
+    )
+      .then((features) => this.handleFeaturesLoaded(features, overlayIdentifier, isClustered))
+      .finally(() => {
+        this.ongoingFeatureFetches.delete(overlayIdentifier);
+        this.ongoingFeatureFetchesCallback(this.ongoingFeatureFetches);
+      });
+  }
+
+  /**
+   * Fetch the server side clusters of the current zoom level inside the current bounding box
+   */
+  private getAndAddServerClusters(overlayIdentifier: string) {
+    const { clusterUrl, clusterCellSizes, gridOrigin } = this.mapConfig.overlayConfig;
+    const zoom = this.getCurrentZoom();
+    const cellSize = clusterCellSizes?.[zoom];
+    if (!clusterUrl || !cellSize || !gridOrigin) {
+      return;
+    }
+
+    const source = this.getServerClusterSource(overlayIdentifier, zoom);
+    this.serverClusterLayers[overlayIdentifier].setSource(source);
 
-    const tempSource = isClustered ? this.createClusterSource(wfsUrl) : this.createNonClusteredSource(wfsUrl);
-    const tempVectorSource = isClustered ? (tempSource as Cluster).getSource() : tempSource;
-    if (!tempVectorSource) {
+    if (!this.fetchedClusterCells[overlayIdentifier]) {
+      this.fetchedClusterCells[overlayIdentifier] = {};
+    }
+    if (!this.fetchedClusterCells[overlayIdentifier][zoom]) {
+      this.fetchedClusterCells[overlayIdentifier][zoom] = new Set();
+    }
+    const fetchedCells = this.fetchedClusterCells[overlayIdentifier][zoom];
+    const missingCells = getGridCellIdsForExtent(this.getCurrentBoundingBox(), gridOrigin, cellSize).filter(
+      (cellId) => !fetchedCells.has(cellId),
+    );
+    if (missingCells.length === 0) {
       return;
     }
+    missingCells.forEach((cellId) => fetchedCells.add(cellId));
 
     this.ongoingFeatureFetches.add(overlayIdentifier);
     this.ongoingFeatureFetchesCallback(this.ongoingFeatureFetches);
 
-    const tempLayer = this.createTemporaryFetchLayer(tempVectorSource);
-    this.map.addLayer(tempLayer);
+    this.fetchCells(overlayIdentifier, missingCells, fetchedCells, (cellId) =>
+      buildClusterCellUrl(clusterUrl, overlayIdentifier, zoom, cellId),
+    )
+      .then((features) => source.addFeatures(features))
+      .finally(() => {
+        this.ongoingFeatureFetches.delete(overlayIdentifier);
+        this.ongoingFeatureFetchesCallback(this.ongoingFeatureFetches);
+      });
+  }
 
-    tempVectorSource.once("featuresloadend", (featureEvent: any) => {
-      this.handleFeaturesLoaded(featureEvent.features, overlayIdentifier, isClustered);
-      this.map.removeLayer(tempLayer);
-      this.ongoingFeatureFetches.delete(overlayIdentifier);
-      this.ongoingFeatureFetchesCallback(this.ongoingFeatureFetches);
-    });
+  /**
+   * Fetch features of the given grid cells with a bounded number of concurrent requests.
+   * Cells that fail to load are removed from `fetchedCells`, so they are retried on the next move.
+   */
+  private async fetchCells(
+    overlayIdentifier: string,
+    cellIds: string[],
+    fetchedCells: Set<string>,
+    buildCellUrl: (cellId: string) => string,
+  ) {
+    const features: OlFeature[] = [];
+    const queue = [...cellIds];
+    const projection = this.map.getView().getProjection();
+
+    const worker = async () => {
+      while (queue.length > 0) {
+        const cellId = queue.shift() as string;
+        try {
+          const response = await fetch(buildCellUrl(cellId));
+          if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+          }
+          const cellFeatures = this.geojsonFormat.readFeatures(await response.json(), {
+            featureProjection: projection,
+          });
+          features.push(...(cellFeatures as OlFeature[]));
+        } catch (error) {
+          console.error(`Error fetching grid cell ${cellId} of layer '${overlayIdentifier}':`, error);
+          fetchedCells.delete(cellId);
+        }
+      }
+    };
+
+    const workerCount = Math.min(this.maxConcurrentGridCellFetches, queue.length);
+    await Promise.all(Array.from({ length: workerCount }, worker));
+    return features;
+  }
+
+  private getServerClusterSource(overlayIdentifier: string, zoom: number) {
+    if (!this.serverClusterSources[overlayIdentifier]) {
+      this.serverClusterSources[overlayIdentifier] = {};
+    }
+    if (!this.serverClusterSources[overlayIdentifier][zoom]) {
+      this.serverClusterSources[overlayIdentifier][zoom] = new VectorSource();
+    }
+    return this.serverClusterSources[overlayIdentifier][zoom];
   }
 
   /**
-   * Create a temporary invisible layer for fetching features
+   * Show the already fetched server side clusters of the current zoom level on all server cluster layers
    */
-  private createTemporaryFetchLayer(source: VectorSource): VectorLayer<VectorSource> {
-    return new VectorLayer({
-      source: source,
-      visible: true,
-      style: new Style({
-        fill: new Fill({ color: "rgba(0, 0, 0, 0)" }),
-        stroke: new Stroke({ color: "rgba(0, 0, 0, 0)" }),
-      }),
-    });
+  private showServerClustersOfCurrentZoom() {
+    const { clusterMaxZoom } = this.mapConfig.overlayConfig;
+    const zoom = this.getCurrentZoom();
+    if (clusterMaxZoom === undefined || zoom > clusterMaxZoom) {
+      return;
+    }
+    for (const [identifier, layer] of Object.entries(this.serverClusterLayers)) {
+      layer.setSource(this.getServerClusterSource(identifier, zoom));
+    }
+  }
+
+  private isServerClusteringActive(overlayIdentifier: string) {
+    const { clusterMaxZoom } = this.mapConfig.overlayConfig;
+    return (
+      clusterMaxZoom !== undefined &&
+      overlayIdentifier in this.serverClusterLayers &&
+      !this.projectFilteredLayers.has(overlayIdentifier) &&
+      this.getCurrentZoom() <= clusterMaxZoom
+    );
+  }
+
+  /**
+   * Cluster the layer in the browser on all zoom levels
+   */
+  private disableServerClustering(overlayIdentifier: string) {
+    this.projectFilteredLayers.add(overlayIdentifier);
+    this.clusteredOverlayLayers[overlayIdentifier]?.setMaxResolution(Infinity);
+    this.serverClusterLayers[overlayIdentifier]?.setVisible(false);
   }
 
   /**
@@ -633,7 +803,6 @@ class Map {
       this.setNewSourceWithFeatures(layer, features, isClustered);
     }
 
-    this.addFetchedArea(overlayIdentifier, this.getCurrentBoundingBox());
   }
 
   /**
@@ -666,100 +835,6 @@ class Map {
     layer.changed();
   }
 
-  /**
-   * Checks if two polygons intersect and attempts to merge them.
-   * @param mergedPolygon The polygon to merge with.
-   * @param existingPolygon The existing polygon to check for intersection.
-   * @returns An array containing the merged polygon if successful, otherwise returns the existing polygon.
-   */
-  attemptMerge(mergedPolygon: TurfPolygonFeature, existingPolygon: TurfPolygonFeature): TurfPolygonFeature[] {
-    // Check for invalid geometry before performing the union.
-    if (!mergedPolygon?.geometry || !existingPolygon?.geometry) {
-      console.error("Skipping union due to invalid input geometry.", mergedPolygon, existingPolygon);
-      return [existingPolygon]; // Return original to prevent data loss.
-    }
-
-    try {
-      const unionResult = union(featureCollection([mergedPolygon, existingPolygon]));
-      return unionResult ? [unionResult] : [existingPolygon];
-    } catch (e) {
-      console.error("Error during polygon union. Keeping the original polygon.", e);
-      return [existingPolygon];
-    }
-  }
-
-  /**
-   * Iterates through existing polygons and merges them with a new polygon if they intersect.
-   * @param newPolygon The new polygon to merge.
-   * @param existingPolygons The array of existing polygons.
-   * @returns An object containing the final merged polygon and the list of non-intersecting polygons.
-   */
-  mergeIntersectingPolygons(
-    newPolygon: TurfPolygonFeature,
-    existingPolygons: TurfPolygonFeature[],
-  ): { mergedPolygon: TurfPolygonFeature; nonIntersecting: TurfPolygonFeature[]; wasMerged: boolean } {
-    let mergedPolygon = newPolygon;
-    let wasMerged = false;
-    const nonIntersecting: TurfPolygonFeature[] = [];
-
-    for (const existingPolygon of existingPolygons) {
-      if (booleanIntersects(mergedPolygon, existingPolygon)) {
-        const unionResults = this.attemptMerge(mergedPolygon, existingPolygon);
-        mergedPolygon = unionResults[0];
-        wasMerged = true;
-      } else {
-        nonIntersecting.push(existingPolygon);
-      }
-    }
-
-    return { mergedPolygon, nonIntersecting, wasMerged };
-  }
-
-  /**
-   * Adds a new fetched area polygon to the cache, merging it with any intersecting polygons.
-   * @param layerIdentifier The identifier for the layer.
-   * @param fetchedBbox The bounding box of the newly fetched area.
-   */
-  addFetchedArea(layerIdentifier: string, fetchedBbox: Extent) {
-    // Use a guard clause for early return if there's no layer identifier
-    if (!layerIdentifier) {
-      console.error("No layer identifier provided.");
-      return;
-    }
-
-    // Initialize the array if it doesn't exist
-    this.fetchedAreaPolygons[layerIdentifier] = this.fetchedAreaPolygons[layerIdentifier] || [];
-
-    const newTurfPolygon = bboxPolygon(fetchedBbox as BBox);
-
-    const { mergedPolygon, nonIntersecting, wasMerged } = this.mergeIntersectingPolygons(
-      newTurfPolygon as TurfPolygonFeature,
-      this.fetchedAreaPolygons[layerIdentifier],
-    );
-
-    // Update the cache with the final merged polygon and the non-intersecting ones
-    this.fetchedAreaPolygons[layerIdentifier] = [...nonIntersecting, mergedPolygon];
-
-    this.logMergeStatus(layerIdentifier, wasMerged);
-  }
-
-  /**
-   * Logs the status of the polygon merge.
-   * @param layerIdentifier The identifier for the layer.
-   * @param wasMerged Indicates if a merge occurred.
-   */
-  private logMergeStatus(layerIdentifier: string, wasMerged: boolean) {
-    if (wasMerged) {
-      console.log(`Merged fetched polygons for layer '${layerIdentifier}'.`);
-    } else {
-      console.log(`Added new polygon to layer '${layerIdentifier}'.`);
-    }
-    console.log(
-      `Total polygons for '${layerIdentifier}': ${this.fetchedAreaPolygons[layerIdentifier].length}`,
-      this.fetchedAreaPolygons[layerIdentifier],
-    );
-  }
-
   /**
    * This is called from settings in LayerSwitcher to show or hide all difference layers
    * @param visible
@@ -807,8 +882,9 @@ class Map {
       // atleast for now everyhing is just loaded within the current bbox, not exclusion
       const layer_config = overlayConfig["layers"].find((l) => l.identifier === identifier);
       if (layer_config !== undefined && layer_config.filter_fields!.includes(filter_field)) {
+        this.disableServerClustering(identifier);
         const clusterSource = this.createClusterSource(
-          sourceUrl + `?${buildWFSQuery(identifier, undefined, filter_field, projectId, this.getCurrentBoundingBox())}`,
+          sourceUrl + `?${buildWFSQuery(identifier, filter_field, projectId, this.getCurrentBoundingBox())}`,
         );
         layer.setSource(clusterSource);
       }
@@ -882,7 +958,7 @@ class Map {
 
     // Clear all style caches and force re-render
     const allLayers = { ...this.clusteredOverlayLayers, ...this.nonClusteredOverlayLayers };
-    Object.values(allLayers).forEach((layer) => {
+    [...Object.values(allLayers), ...Object.values(this.serverClusterLayers)].forEach((layer) => {
       layer.changed();
     });
 
@@ -1062,7 +1138,9 @@ class Map {
 
   private createClusteredOverlayLayerGroup(mapConfig: MapConfig) {
     const { overlayConfig } = mapConfig;
-    const { layers } = overlayConfig;
+    const { layers, clusterMaxZoom } = overlayConfig;
+    // Resolution from which on the clusters are computed on the server instead of in the browser
+    const serverClusterResolution = clusterMaxZoom !== undefined ? this.resolutions[clusterMaxZoom] : undefined;
     // Fetch device layers
     const overlayLayers = layers
       .filter(({ clustered }) => clustered)
@@ -1091,22 +1169,6 @@ class Map {
           }
           return undefined;
         };
-        const getClusterStyle = (clusterFeature: FeatureLike): Style[] => {
-          const text = clusterFeature.get("features").length.toString();
-          return [
-            new Style({
-              image: new Circle({
-                radius: 10,
-                stroke: new Stroke({ color: "#fff" }),
-                fill: new Fill({ color: "#3399CC" }),
-              }),
-              text: new Text({
-                text: text,
-                fill: new Fill({ color: "#fff" }),
-              }),
-            }),
-          ];
-        };
         const getImageStyle = (clusterFeature: FeatureLike) => {
           const features = clusterFeature.get("features");
           if (!features || features.length === 0) {
@@ -1125,7 +1187,7 @@ class Map {
           const iconType = this.getCurrentIconType();
           if (size > 1) {
             // Cluster style
-            styleResult = getClusterStyle(clusterFeature);
+            styleResult = Map.createClusterStyle(size);
           } else {
             // Single feature style: getSinglePointStyle already includes the arrow.
             const feature = features[0];
@@ -1143,18 +1205,63 @@ class Map {
           },
           visible: false,
           opacity: identifier.includes("plan") ? 0.5 : 1, // 100% opacity for reals, 50% opacity for plans
+          maxResolution: serverClusterResolution,
         });
 
         this.clusteredOverlayLayers[identifier] = vectorLayer;
+        if (serverClusterResolution !== undefined) {
+          this.serverClusterLayers[identifier] = this.createServerClusterLayer(
+            identifier,
+            use_traffic_sign_icons,
+            serverClusterResolution,
+          );
+        }
         return vectorLayer;
       });
     return new LayerGroup({
-      layers: overlayLayers,
+      layers: [...overlayLayers, ...Object.values(this.serverClusterLayers)],
     });
   }
 
-  private createNonClusteredSource(wfsUrl: string) {
-    return this.createVectorSource(wfsUrl);
+  /**
+   * Create a layer for the server side clusters of a clustered layer, shown from `minResolution` on
+   */
+  private createServerClusterLayer(identifier: string, use_traffic_sign_icons: boolean, minResolution: number) {
+    const styleCache: { [count: number]: Style[] } = {};
+    return new VectorLayer({
+      style: (feature: FeatureLike) => {
+        const count: number = feature.get("cluster_count");
+        if (count === 1) {
+          const iconUrl = this.getCurrentIconUrl();
+          const iconScale = this.getCurrentIconScale();
+          const iconType = this.getCurrentIconType();
+          return getSinglePointStyle(feature, use_traffic_sign_icons, iconUrl, iconScale, iconType);
+        }
+        if (!styleCache[count]) {
+          styleCache[count] = Map.createClusterStyle(count);
+        }
+        return styleCache[count];
+      },
+      visible: false,
+      opacity: identifier.includes("plan") ? 0.5 : 1, // 100% opacity for reals, 50% opacity for plans
+      minResolution,
+    });
+  }
+
+  private static createClusterStyle(size: number): Style[] {
+    return [
+      new Style({
+        image: new Circle({
+          radius: 10,
+          stroke: new Stroke({ color: "#fff" }),
+          fill: new Fill({ color: "#3399CC" }),
+        }),
+        text: new Text({
+          text: size.toString(),
+          fill: new Fill({ color: "#fff" }),
+        }),
+      }),
+    ];
   }
 
   private createClusterSource(wfsUrl: string) {
@@ -1221,6 +1328,10 @@ class Map {
     return [25499052.02, 6675851.38];
   }
 
+  private getCurrentZoom() {
+    return Math.round(this.map.getView().getZoom() ?? 0);
+  }
+
   private getCurrentBoundingBox() {
     return this.map.getView().calculateExtent();
   }
@@ -15,12 +15,18 @@ export interface Layer {
   use_traffic_sign_icons: boolean;
   clustered: boolean;
   extra_feature_info: Record<string, ExtraFeatureInfo>;
+  grid_cell_size?: number;
 }
 
 export interface LayerConfig {
   name: string;
   layers: Layer[];
   sourceUrl: string;
+  gridCellUrl?: string;
+  gridOrigin?: number[];
+  clusterUrl?: string;
+  clusterMaxZoom?: number;
+  clusterCellSizes?: number[];
 }
 
 export interface OverviewConfig {
@@ -15,6 +15,7 @@ class LayerAdmin(admin.ModelAdmin):
         "filter_fields",
         "use_traffic_sign_icons",
         "clustered",
+        "grid_cell_size",
     )
     search_fields = ("identifier", "name_fi", "name_en", "name_sv")
     list_filter = ("is_basemap",)
@@ -0,0 +1,180 @@
+"""
+Server-side clustering of clustered map overlay layers.
+
+At low zoom levels the map view shows clusters instead of individual features. Rather than downloading every feature
+and clustering them in the browser, features are aggregated in the database: feature centroids are snapped to a
+square grid whose spacing matches the on-screen cluster distance of the zoom level, and each occupied grid square
+becomes one cluster with a feature count, the mean position of its features and the most common device type.
+
+Clusters are fetched in cells of the fixed map grid (see `map.grid`), where the cell size of a zoom level is a
+multiple of its cluster spacing so that every cluster belongs to exactly one cell. Computed cells are cached with
+the data versions of the layer's tables in the cache key (see `traffic_control.utils.data_version`).
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.contrib.gis.db.models import Collect
+from django.contrib.gis.db.models.functions import Centroid, SnapToGrid
+from django.contrib.gis.geos import Polygon
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count
+from gisserver.features import FeatureType
+
+from cityinfra.metrics import record_cache_hit
+from traffic_control.db_utils import Mode
+from traffic_control.utils.data_version import get_data_versions
+from traffic_control.views.wfs.cache import get_feature_type_dependencies
+from traffic_control.views.wfs.views import CityInfrastructureWFSView
+
+from .grid import get_cell_bounds, get_grid_origin, is_valid_cell
+
+MAP_CLUSTER_CACHE_KEY_PREFIX = "map:clusters"
+
+# Resolutions (meters per pixel) of the map view zoom levels, these must match the resolutions of map-view's Map.ts
+MAP_RESOLUTIONS = (256, 128, 64, 32, 16, 8, 4, 2, 1, 0.5, 0.25, 0.125, 0.0625)
+
+# Distance in pixels within which features are clustered together, same as the browser side clustering distance
+CLUSTER_DISTANCE_PX = 40
+
+# Cluster cell size as a multiple of the cluster spacing
+CLUSTER_CELL_FACTOR = 16
+
+
+def get_cluster_spacing(zoom: int) -> int:
+    """Return the spacing of the cluster grid in meters for given zoom level"""
+    return int(MAP_RESOLUTIONS[zoom] * CLUSTER_DISTANCE_PX)
+
+
+def get_cluster_cell_size(zoom: int) -> int:
+    return get_cluster_spacing(zoom) * CLUSTER_CELL_FACTOR
+
+
+def get_cluster_cell_sizes() -> List[int]:
+    """Return cluster cell sizes of the zoom levels that are clustered on the server, indexed by zoom level"""
+    return [get_cluster_cell_size(zoom) for zoom in range(settings.MAP_CLUSTER_MAX_ZOOM + 1)]
+
+
+def is_valid_cluster_cell(zoom: int, column: int, row: int) -> bool:
+    return 0 <= zoom <= settings.MAP_CLUSTER_MAX_ZOOM and is_valid_cell(get_cluster_cell_size(zoom), column, row)
+
+
+def get_clustered_feature_type(identifier: str) -> Optional[FeatureType]:
+    return next(
+        (feature_type for feature_type in CityInfrastructureWFSView.feature_types if feature_type.name == identifier),
+        None,
+    )
+
+
+def _get_device_type_field(feature_type: FeatureType):
+    try:
+        return feature_type.model._meta.get_field("device_type")
+    except FieldDoesNotExist:
+        return None
+
+
+def _get_device_types(device_type_field, device_type_ids) -> Dict:
+    device_type_ids = {device_type_id for device_type_id in device_type_ids if device_type_id is not None}
+    if device_type_field is None or not device_type_ids:
+        return {}
+    return (
+        device_type_field.related_model.objects.select_related("icon_file")
+        .only("code", "icon_file__file")
+        .in_bulk(device_type_ids)
+    )
+
+
+def _get_cluster_properties(count: int, device_type) -> dict:
+    return {
+        "cluster_count": count,
+        "device_type_code": device_type.code if device_type else None,
+        "device_type_icon": device_type.icon_name if device_type and device_type.icon_file else None,
+    }
+
+
+def get_cluster_cell(feature_type: FeatureType, zoom: int, column: int, row: int) -> dict:
+    """
+    Return clusters of given feature type whose cluster square lies in the given cell as a GeoJSON FeatureCollection.
+
+    Each cluster is a Point feature at the mean position of its features, with the number of features and the most
+    common device type of the cluster as properties.
+    """
+    spacing = get_cluster_spacing(zoom)
+    min_x, min_y, max_x, max_y = get_cell_bounds(get_cluster_cell_size(zoom), column, row)
+    origin_x, origin_y = get_grid_origin()
+    geometry_field_name = feature_type.geometry_field.name
+    device_type_field = _get_device_type_field(feature_type)
+
+    # Centroids of non-point geometries may lie outside of the geometry, so the spatial filter is widened by one
+    # cluster square. Clusters whose square lies outside of the cell are dropped below.
+    search_area = Polygon.from_bbox((min_x - spacing, min_y - spacing, max_x + spacing, max_y + spacing))
+    search_area.srid = settings.SRID
+
+    aggregates = {
+        "count": Count("pk"),
+        "center": Centroid(Collect(Centroid(geometry_field_name))),
+    }
+    if device_type_field is not None:
+        aggregates["device_type_id"] = Mode(device_type_field.attname)
+
+    # Snapping to a grid offset by half of the spacing puts every centroid to the center of the cluster square it
+    # lies in. The centers are never on a cell border, so each cluster belongs to exactly one cell.
+    clusters = (
+        feature_type.queryset.filter(**{f"{geometry_field_name}__intersects": search_area})
+        .order_by()
+        .annotate(
+            cluster_square=SnapToGrid(
+                Centroid(geometry_field_name),
+                spacing,
+                spacing,
+                origin_x + spacing / 2,
+                origin_y + spacing / 2,
+            )
+        )
+        .values("cluster_square")
+        .annotate(**aggregates)
+    )
+    clusters = [
+        cluster
+        for cluster in clusters
+        if min_x <= cluster["cluster_square"].x < max_x and min_y <= cluster["cluster_square"].y < max_y
+    ]
+    device_types = _get_device_types(device_type_field, (cluster.get("device_type_id") for cluster in clusters))
+
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [cluster["center"].x, cluster["center"].y]},
+                "properties": _get_cluster_properties(
+                    cluster["count"], device_types.get(cluster.get("device_type_id"))
+                ),
+            }
+            for cluster in clusters
+        ],
+    }
+
+
+def _get_cluster_cache_key(feature_type: FeatureType, zoom: int, column: int, row: int) -> str:
+    versions = sorted(get_data_versions(get_feature_type_dependencies(feature_type)).items())
+    digest = hashlib.sha256(json.dumps([settings.MAP_CLUSTER_MAX_ZOOM, versions]).encode()).hexdigest()
+    return f"{MAP_CLUSTER_CACHE_KEY_PREFIX}:{feature_type.name}:{zoom}:{column}:{row}:{digest}"
+
+
+def get_cached_cluster_cell(feature_type: FeatureType, zoom: int, column: int, row: int) -> dict:
+    """Return clusters of the cell from the cache when the WFS response cache is enabled, see get_cluster_cell"""
+    if not settings.WFS_RESPONSE_CACHE_ENABLED:
+        return get_cluster_cell(feature_type, zoom, column, row)
+
+    cache_key = _get_cluster_cache_key(feature_type, zoom, column, row)
+    clusters = cache.get(cache_key)
+    if clusters is None:
+        clusters = get_cluster_cell(feature_type, zoom, column, row)
+        cache.set(cache_key, clusters, timeout=settings.WFS_RESPONSE_CACHE_TIMEOUT)
+    else:
+        record_cache_hit()
+    return clusters
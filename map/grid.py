@@ -0,0 +1,42 @@
+"""
+Fixed EPSG:3879 grid used by the map view to fetch overlay features incrementally.
+
+The grid starts from the lower left corner of the configured SRID boundaries and is divided into square cells whose
+size is configured per layer. A cell is identified by its zero based column and row. Because the cells never move,
+the same cell always maps to the same bounding box query, which lets both the browser and the WFS response cache
+reuse earlier answers no matter how the user pans the map.
+"""
+
+from typing import Tuple
+
+from django.conf import settings
+
+BoundingBox = Tuple[float, float, float, float]
+
+
+def get_grid_extent() -> BoundingBox:
+    return settings.SRID_BOUNDARIES[settings.SRID]
+
+
+def get_grid_origin() -> Tuple[float, float]:
+    x0, y0, _, _ = get_grid_extent()
+    return x0, y0
+
+
+def get_grid_size(cell_size: int) -> Tuple[int, int]:
+    """Return the number of columns and rows needed to cover the grid extent with given cell size"""
+    x0, y0, x1, y1 = get_grid_extent()
+    return int(-((x0 - x1) // cell_size)), int(-((y0 - y1) // cell_size))
+
+
+def is_valid_cell(cell_size: int, column: int, row: int) -> bool:
+    columns, rows = get_grid_size(cell_size)
+    return 0 <= column < columns and 0 <= row < rows
+
+
+def get_cell_bounds(cell_size: int, column: int, row: int) -> BoundingBox:
+    """Return (min x, min y, max x, max y) of the given cell in EPSG:3879"""
+    origin_x, origin_y = get_grid_origin()
+    min_x = origin_x + column * cell_size
+    min_y = origin_y + row * cell_size
+    return min_x, min_y, min_x + cell_size, min_y + cell_size
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:12
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0014_alter_featuretypeeditmapping_edit_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='layer',
+            name='grid_cell_size',
+            field=models.PositiveIntegerField(default=1000, help_text="Side length in meters of the grid cells the map view fetches this layer's features in. Use smaller cells for dense layers.", validators=[django.core.validators.MinValueValidator(100)], verbose_name='Grid cell size'),
+        ),
+    ]
@@ -1,6 +1,7 @@
 import uuid
 
 from django.conf import settings
+from django.core.validators import MinValueValidator
 from django.db import models, NotSupportedError
 from django.utils.translation import gettext_lazy as _
 
@@ -18,6 +19,15 @@ class Layer(models.Model):
     filter_fields = models.CharField(_("Filter fields"), max_length=200, blank=True)
     use_traffic_sign_icons = models.BooleanField(_("Use Traffic Sign Icons"), default=False)
     clustered = models.BooleanField(_("Clustered"), default=True)
+    grid_cell_size = models.PositiveIntegerField(
+        _("Grid cell size"),
+        default=1000,
+        validators=[MinValueValidator(100)],
+        help_text=_(
+            "Side length in meters of the grid cells the map view fetches this layer's features in. "
+            "Use smaller cells for dense layers."
+        ),
+    )
     extra_feature_info = models.JSONField(
         _("Extra feature info"),
         null=True,
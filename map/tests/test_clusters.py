@@ -0,0 +1,140 @@
+import pytest
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from map.clusters import get_cluster_cell_size, get_cluster_spacing
+from map.grid import get_cell_bounds
+from map.models import Layer
+from traffic_control.tests.factories import (
+    get_api_client,
+    TrafficControlDeviceTypeFactory,
+    TrafficSignRealFactory,
+)
+
+ZOOM = 5
+SPACING = get_cluster_spacing(ZOOM)
+
+
+def _create_layer(identifier="trafficsignreal", clustered=True):
+    return Layer.objects.create(
+        identifier=identifier,
+        name_en=identifier,
+        name_fi=identifier,
+        name_sv=identifier,
+        is_basemap=False,
+        clustered=clustered,
+    )
+
+
+def _get_cluster_cell(identifier, zoom, column, row):
+    url = reverse(
+        "map-cluster-cell",
+        kwargs={"identifier": identifier, "zoom": zoom, "column": column, "row": row},
+    )
+    return get_api_client().get(url)
+
+
+def _point(x, y):
+    return Point(x, y, 0, srid=settings.SRID)
+
+
+def test__clusters__cell_size_is_multiple_of_spacing():
+    for zoom in range(settings.MAP_CLUSTER_MAX_ZOOM + 1):
+        assert get_cluster_cell_size(zoom) % get_cluster_spacing(zoom) == 0
+    assert get_cluster_spacing(0) == 256 * 40
+
+
+@pytest.mark.django_db
+def test__map_cluster_cell__aggregates_features_by_cluster_square():
+    _create_layer()
+    min_x, min_y, _, _ = get_cell_bounds(get_cluster_cell_size(ZOOM), 1, 1)
+    dominant_type = TrafficControlDeviceTypeFactory(code="A1")
+    other_type = TrafficControlDeviceTypeFactory(code="B2")
+    TrafficSignRealFactory(location=_point(min_x + 10, min_y + 10), device_type=dominant_type)
+    TrafficSignRealFactory(location=_point(min_x + 30, min_y + 30), device_type=dominant_type)
+    TrafficSignRealFactory(location=_point(min_x + 20, min_y + 20), device_type=other_type)
+    TrafficSignRealFactory(location=_point(min_x + SPACING + 10, min_y + 10), device_type=other_type)
+
+    response = _get_cluster_cell("trafficsignreal", ZOOM, 1, 1)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "no-cache" in response["Cache-Control"]
+    features = sorted(response.json()["features"], key=lambda feature: feature["geometry"]["coordinates"][0])
+    assert [feature["properties"]["cluster_count"] for feature in features] == [3, 1]
+    assert [feature["properties"]["device_type_code"] for feature in features] == ["A1", "B2"]
+    assert features[0]["geometry"]["coordinates"] == pytest.approx([min_x + 20, min_y + 20])
+    assert features[1]["geometry"]["coordinates"] == pytest.approx([min_x + SPACING + 10, min_y + 10])
+
+
+@pytest.mark.django_db
+def test__map_cluster_cell__excludes_clusters_of_neighbour_cells():
+    _create_layer()
+    cell_size = get_cluster_cell_size(ZOOM)
+    min_x, min_y, max_x, _ = get_cell_bounds(cell_size, 1, 1)
+    TrafficSignRealFactory(location=_point(max_x - 10, min_y + 10))
+    TrafficSignRealFactory(location=_point(max_x + 10, min_y + 10))
+
+    cell_features = _get_cluster_cell("trafficsignreal", ZOOM, 1, 1).json()["features"]
+    neighbour_features = _get_cluster_cell("trafficsignreal", ZOOM, 2, 1).json()["features"]
+
+    assert [feature["properties"]["cluster_count"] for feature in cell_features] == [1]
+    assert [feature["properties"]["cluster_count"] for feature in neighbour_features] == [1]
+    assert cell_features[0]["geometry"]["coordinates"][0] < max_x <= neighbour_features[0]["geometry"]["coordinates"][0]
+
+
+@pytest.mark.django_db
+def test__map_cluster_cell__query_count_does_not_depend_on_device_type_count():
+    _create_layer()
+    cell_size = get_cluster_cell_size(ZOOM)
+
+    def get_query_count(column, device_type_count):
+        min_x, min_y, _, _ = get_cell_bounds(cell_size, column, 1)
+        for index in range(device_type_count):
+            TrafficSignRealFactory(location=_point(min_x + index * SPACING + 10, min_y + 10))
+        with CaptureQueriesContext(connection) as queries:
+            features = _get_cluster_cell("trafficsignreal", ZOOM, column, 1).json()["features"]
+        assert len(features) == device_type_count
+        assert all(feature["properties"]["device_type_icon"] for feature in features)
+        return len(queries)
+
+    assert get_query_count(1, 1) == get_query_count(3, 3)
+
+
+@override_settings(WFS_RESPONSE_CACHE_ENABLED=True)
+@pytest.mark.django_db
+def test__map_cluster_cell__cache_is_invalidated_on_data_change():
+    cache.clear()
+    _create_layer()
+    min_x, min_y, _, _ = get_cell_bounds(get_cluster_cell_size(ZOOM), 1, 1)
+    TrafficSignRealFactory(location=_point(min_x + 10, min_y + 10))
+    _get_cluster_cell("trafficsignreal", ZOOM, 1, 1)
+
+    TrafficSignRealFactory(location=_point(min_x + 20, min_y + 20))
+    features = _get_cluster_cell("trafficsignreal", ZOOM, 1, 1).json()["features"]
+
+    assert [feature["properties"]["cluster_count"] for feature in features] == [2]
+    cache.clear()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "identifier, clustered, zoom, column, row",
+    (
+        ("unknown", True, ZOOM, 0, 0),
+        ("trafficsignreal", False, ZOOM, 0, 0),
+        ("trafficsignreal", True, ZOOM, 100000, 0),
+        ("trafficsignreal", True, 12, 0, 0),
+    ),
+)
+def test__map_cluster_cell__not_found(identifier, clustered, zoom, column, row):
+    _create_layer(clustered=clustered)
+
+    response = _get_cluster_cell(identifier, zoom, column, row)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
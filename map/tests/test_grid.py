@@ -0,0 +1,101 @@
+import json
+
+import pytest
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.urls import reverse
+from rest_framework import status
+
+from map.grid import get_cell_bounds, get_grid_origin, get_grid_size, is_valid_cell
+from map.models import Layer
+from traffic_control.tests.factories import get_api_client, TrafficSignRealFactory
+
+CELL_SIZE = 1000
+
+
+def _create_layer(identifier="trafficsignreal", grid_cell_size=CELL_SIZE):
+    return Layer.objects.create(
+        identifier=identifier,
+        name_en=identifier,
+        name_fi=identifier,
+        name_sv=identifier,
+        is_basemap=False,
+        grid_cell_size=grid_cell_size,
+    )
+
+
+def _get_cell_response(identifier, column, row):
+    url = reverse("map-grid-cell", kwargs={"identifier": identifier, "column": column, "row": row})
+    response = get_api_client().get(url)
+    content = b"".join(response.streaming_content) if response.streaming else response.content
+    return response, content
+
+
+def test__grid__cell_bounds():
+    origin_x, origin_y = get_grid_origin()
+
+    assert get_cell_bounds(CELL_SIZE, 0, 0) == (origin_x, origin_y, origin_x + CELL_SIZE, origin_y + CELL_SIZE)
+    assert get_cell_bounds(CELL_SIZE, 2, 3) == (
+        origin_x + 2 * CELL_SIZE,
+        origin_y + 3 * CELL_SIZE,
+        origin_x + 3 * CELL_SIZE,
+        origin_y + 4 * CELL_SIZE,
+    )
+
+
+def test__grid__size_covers_boundaries():
+    x0, y0, x1, y1 = settings.SRID_BOUNDARIES[settings.SRID]
+    columns, rows = get_grid_size(CELL_SIZE)
+
+    _, _, last_max_x, last_max_y = get_cell_bounds(CELL_SIZE, columns - 1, rows - 1)
+    assert last_max_x >= x1 and last_max_y >= y1
+    assert last_max_x - CELL_SIZE < x1 and last_max_y - CELL_SIZE < y1
+    assert is_valid_cell(CELL_SIZE, columns - 1, rows - 1)
+    assert not is_valid_cell(CELL_SIZE, columns, 0)
+    assert not is_valid_cell(CELL_SIZE, 0, rows)
+    assert not is_valid_cell(CELL_SIZE, -1, 0)
+
+
+@pytest.mark.django_db
+def test__map_grid_cell__returns_features_inside_cell():
+    _create_layer()
+    min_x, min_y, max_x, max_y = get_cell_bounds(CELL_SIZE, 5, 7)
+    inside = TrafficSignRealFactory(location=Point(min_x + 10, min_y + 10, 0, srid=settings.SRID))
+    TrafficSignRealFactory(location=Point(max_x + 10, min_y + 10, 0, srid=settings.SRID))
+
+    response, content = _get_cell_response("trafficsignreal", 5, 7)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "no-cache" in response["Cache-Control"]
+    features = json.loads(content)["features"]
+    assert [feature["id"] for feature in features] == [f"trafficsignreal.{inside.id}"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "identifier, column, row",
+    (
+        ("unknown", 0, 0),
+        ("trafficsignreal", 100000, 0),
+    ),
+)
+def test__map_grid_cell__not_found(identifier, column, row):
+    _create_layer()
+
+    response, _ = _get_cell_response(identifier, column, row)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test__map_grid__describes_layer_grids():
+    _create_layer(grid_cell_size=500)
+
+    response = get_api_client().get(reverse("map-grid"))
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    columns, rows = get_grid_size(500)
+    assert data["srid"] == settings.SRID
+    assert data["origin"] == list(get_grid_origin())
+    assert data["layers"] == {"trafficsignreal": {"cell_size": 500, "columns": columns, "rows": rows}}
@@ -6,6 +6,8 @@ from django.core.exceptions import ValidationError
 from django.test import override_settings, RequestFactory, TestCase
 from django.urls import reverse
 
+from map.clusters import get_cluster_cell_sizes
+from map.grid import get_grid_origin
 from map.models import FeatureTypeEditMapping, IconDrawingConfig, Layer
 from map.tests.factories import IconDrawingConfigFactory
 from map.views import map_config, map_view
@@ -146,6 +148,10 @@ class MapConfigTestCase(TestCase):
         self.assertEqual(response_data["overlayConfig"]["layers"][0]["name"], f"Overlay 1 {expect_language_code}")
         self.assertEqual(response_data["overlayConfig"]["layers"][1]["name"], f"Overlay 2 {expect_language_code}")
         self.assertEqual(response_data["overlayConfig"]["layers"][0]["extra_feature_info"], {})
+        self.assertEqual(response_data["overlayConfig"]["layers"][0]["grid_cell_size"], 1000)
+        self.assertEqual(response_data["overlayConfig"]["gridOrigin"], list(get_grid_origin()))
+        self.assertEqual(response_data["overlayConfig"]["clusterMaxZoom"], settings.MAP_CLUSTER_MAX_ZOOM)
+        self.assertEqual(response_data["overlayConfig"]["clusterCellSizes"], get_cluster_cell_sizes())
         self.assertEqual(
             response_data["overlayConfig"]["layers"][1]["extra_feature_info"]["testfield"],
             expected_testfield_info,
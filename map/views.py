@@ -1,15 +1,21 @@
 import logging
+from copy import copy
 
 from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse, QueryDict
 from django.shortcuts import render
 from django.urls import reverse
+from django.utils.cache import patch_cache_control
 from django.utils.translation import gettext as _
+from django.views.decorators.http import require_GET
 
 from traffic_control.services.azure import get_azure_storage_base_url
 from traffic_control.services.icon_draw_config import get_icon_draw_config_values
+from traffic_control.views.wfs.views import CityInfrastructureWFSView
 
+from .clusters import get_cached_cluster_cell, get_cluster_cell_sizes, get_clustered_feature_type, is_valid_cluster_cell
+from .grid import get_cell_bounds, get_grid_origin, get_grid_size, is_valid_cell
 from .models import FeatureTypeEditMapping, Layer
 
 logger = logging.getLogger("map")
@@ -45,6 +51,7 @@ def map_config(request):
                 "use_traffic_sign_icons": overlay.use_traffic_sign_icons,
                 "clustered": overlay.clustered,
                 "extra_feature_info": _get_extra_feature_info(language_code, overlay),
+                "grid_cell_size": overlay.grid_cell_size,
             }
         )
 
@@ -61,6 +68,11 @@ def map_config(request):
             "name": _("Overlays"),
             "layers": overlays,
             "sourceUrl": request.build_absolute_uri("/")[:-1] + reverse("wfs-city-infrastructure"),
+            "gridCellUrl": request.build_absolute_uri("/")[:-1] + reverse("map-grid"),
+            "gridOrigin": get_grid_origin(),
+            "clusterUrl": request.build_absolute_uri("/")[:-1] + reverse("map-clusters"),
+            "clusterMaxZoom": settings.MAP_CLUSTER_MAX_ZOOM,
+            "clusterCellSizes": get_cluster_cell_sizes(),
         },
         "overviewConfig": {
             "imageUrl": f"{request.build_absolute_uri(settings.STATIC_URL)}"
@@ -77,6 +89,81 @@ def map_config(request):
     return JsonResponse(config)
 
 
+@require_GET
+def map_grid(request):
+    """Describe the grid each overlay layer's features can be fetched in, see map_grid_cell"""
+    layers = {}
+    for identifier, cell_size in Layer.objects.filter(is_basemap=False).values_list("identifier", "grid_cell_size"):
+        columns, rows = get_grid_size(cell_size)
+        layers[identifier] = {"cell_size": cell_size, "columns": columns, "rows": rows}
+    return JsonResponse({"srid": settings.SRID, "origin": get_grid_origin(), "layers": layers})
+
+
+@require_GET
+def map_grid_cell(request, identifier: str, column: int, row: int):
+    """
+    Return features of an overlay layer inside a single grid cell as GeoJSON.
+
+    The cell is answered by the WFS endpoint with a bounding box query whose parameters only depend on the layer and
+    the cell, so every client fetching the cell shares the same WFS response cache entry and the browser can
+    revalidate it with the response's ETag.
+    """
+    layer = Layer.objects.filter(identifier=identifier, is_basemap=False).only("grid_cell_size").first()
+    if layer is None or not is_valid_cell(layer.grid_cell_size, column, row):
+        raise Http404
+
+    min_x, min_y, max_x, max_y = get_cell_bounds(layer.grid_cell_size, column, row)
+    wfs_parameters = QueryDict(mutable=True)
+    wfs_parameters.update(
+        {
+            "SERVICE": "WFS",
+            "VERSION": "2.0.0",
+            "REQUEST": "GetFeature",
+            "OUTPUTFORMAT": "geojson",
+            "TYPENAMES": identifier,
+            # EPSG:3879 bounding boxes are given in Y/X order, see SwapBoundingBoxMixin
+            "BBOX": f"{min_y},{min_x},{max_y},{max_x},urn:ogc:def:crs:EPSG::{settings.SRID}",
+        }
+    )
+    wfs_request = copy(request)
+    wfs_request.GET = wfs_parameters
+
+    response = CityInfrastructureWFSView.as_view()(wfs_request)
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+@require_GET
+def map_clusters(request):
+    """Describe the zoom levels whose clusters are computed on the server, see map_cluster_cell"""
+    return JsonResponse(
+        {
+            "srid": settings.SRID,
+            "origin": get_grid_origin(),
+            "max_zoom": settings.MAP_CLUSTER_MAX_ZOOM,
+            "cell_sizes": get_cluster_cell_sizes(),
+        }
+    )
+
+
+@require_GET
+def map_cluster_cell(request, identifier: str, zoom: int, column: int, row: int):
+    """
+    Return clusters of a clustered overlay layer inside a single grid cell of given zoom level as GeoJSON.
+
+    Zoom levels above MAP_CLUSTER_MAX_ZOOM are not clustered on the server, the features are fetched from
+    map_grid_cell instead.
+    """
+    is_clustered_layer = Layer.objects.filter(identifier=identifier, is_basemap=False, clustered=True).exists()
+    feature_type = get_clustered_feature_type(identifier) if is_clustered_layer else None
+    if feature_type is None or not is_valid_cluster_cell(zoom, column, row):
+        raise Http404
+
+    response = JsonResponse(get_cached_cluster_cell(feature_type, zoom, column, row))
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
 def _get_extra_feature_info(language_code: str, layer: Layer) -> dict:
     layer_extra_info = layer.extra_feature_info
     localized_extra_info = {}
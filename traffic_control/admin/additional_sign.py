@@ -11,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 from guardian.admin import GuardedModelAdmin
 from rangefilter.filters import DateRangeFilterBuilder
 
+from admin_helper.changelist import LargeTableChangelistAdminMixin
 from traffic_control.admin.admin_filters import as_dropdown, HeightFilter
 from traffic_control.admin.audit_log import AuditLogHistoryAdmin
 from traffic_control.admin.common import (
@@ -339,6 +340,7 @@ class AdditionalSignPlanAdmin(
 
 @admin.register(AdditionalSignReal)
 class AdditionalSignRealAdmin(
+    LargeTableChangelistAdminMixin,
     DeviceTypeSearchAdminMixin,
     DeviceComparisonAdminMixin,
     EnumChoiceValueDisplayAdminMixin,
@@ -9,6 +9,7 @@ from django.urls import NoReverseMatch, reverse
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
+from admin_helper.changelist import LargeTableChangelistAdminMixin
 from traffic_control.admin.admin_filters import CustomDateFieldListFilter
 
 __all__ = ("AuditLogHistoryAdmin",)
@@ -24,7 +25,7 @@ class AuditLogHistoryAdmin(admin.ModelAdmin):
         )
 
 
-class CustomLogEntryAdmin(LogEntryAdmin):
+class CustomLogEntryAdmin(LargeTableChangelistAdminMixin, LogEntryAdmin):
     list_filter = [
         *LogEntryAdmin.list_filter,
         ("timestamp", CustomDateFieldListFilter),
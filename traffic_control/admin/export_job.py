@@ -0,0 +1,74 @@
+from django.contrib import admin
+from django.http import FileResponse, Http404
+from django.urls import path, reverse
+from django.utils.html import format_html
+from django.utils.translation import gettext_lazy as _
+
+from traffic_control.models import ExportJob, ExportJobStatus
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    """Background admin exports. Users see and download only their own exports."""
+
+    list_display = ("created_at", "content_type", "file_format", "status", "row_count", "finished_at", "download")
+    list_filter = ("status",)
+    ordering = ("-created_at",)
+    fields = (
+        "id",
+        "created_by",
+        "created_at",
+        "started_at",
+        "finished_at",
+        "status",
+        "content_type",
+        "resource_class",
+        "file_format",
+        "row_count",
+        "download",
+        "error",
+    )
+    readonly_fields = fields
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).select_related("content_type", "created_by")
+        if not request.user.is_superuser:
+            queryset = queryset.filter(created_by=request.user)
+        return queryset
+
+    def has_module_permission(self, request):
+        return request.user.is_active and request.user.is_staff
+
+    def has_view_permission(self, request, obj=None):
+        return request.user.is_active and request.user.is_staff
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                "<uuid:pk>/download/",
+                self.admin_site.admin_view(self.download_view),
+                name="traffic_control_exportjob_download",
+            ),
+        ] + super().get_urls()
+
+    def download_view(self, request, pk):
+        job = self.get_queryset(request).filter(pk=pk, status=ExportJobStatus.FINISHED).first()
+        if job is None or not job.file:
+            raise Http404
+        return FileResponse(job.file.open("rb"), as_attachment=True, filename=job.file.name.rsplit("/", 1)[-1])
+
+    @admin.display(description=_("File"))
+    def download(self, obj: ExportJob):
+        if obj.status != ExportJobStatus.FINISHED or not obj.file:
+            return "-"
+        return format_html(
+            '<a href="{}">{}</a>',
+            reverse("admin:traffic_control_exportjob_download", args=[obj.pk]),
+            _("Download"),
+        )
@@ -22,8 +22,10 @@ class OperationalAreaAdmin(Geometry3DFieldAdminMixin, admin.GISModelAdmin):
         "area_type",
         "contractor",
         "status",
+        "is_active",
     ]
     list_filter = (
+        "is_active",
         "area_type",
         "contractor",
         "status",
@@ -1,15 +1,41 @@
 """Django admin configuration for StreetScan V2 import run log models."""
 import csv
-import io
+from collections.abc import Iterator
 
 from django.contrib import admin
-from django.http import Http404, HttpResponse
+from django.db.models import Count, F, Func, IntegerField, QuerySet, Window
+from django.db.models.functions import RowNumber
+from django.http import Http404, StreamingHttpResponse
 from django.template.loader import render_to_string
 from django.urls import path, reverse
 from django.utils.translation import gettext_lazy as _
 
 from traffic_control.mixins import UploadsFileProxyMixin
-from traffic_control.models.streetscan_import import StreetScanImportRevertFile, StreetScanImportRun
+from traffic_control.models.streetscan_import import (
+    StreetScanImportRevertFile,
+    StreetScanImportRun,
+    StreetScanImportRunDetail,
+)
+
+# Processed source_id list fields of StreetScanImportRun and the names of their annotated lengths
+_PROCESSED_SOURCE_ID_COUNT_ANNOTATIONS = {
+    "processed_mount_source_ids": "processed_mount_count",
+    "processed_sign_source_ids": "processed_sign_count",
+    "processed_signpost_source_ids": "processed_signpost_count",
+    "processed_additional_sign_source_ids": "processed_additional_sign_count",
+}
+# Large JSON fields that are not displayed as such
+_DEFERRED_FIELDS = ("orphan_mount_source_ids", *_PROCESSED_SOURCE_ID_COUNT_ANNOTATIONS)
+# Detail entries displayed per object type and level, the rest are available as CSV
+_MAX_DETAIL_ROWS_PER_LEVEL = 200
+_DETAILS_CSV_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """Pseudo file for csv.writer that returns the written line instead of buffering it."""
+
+    def write(self, value: str) -> str:
+        return value
 
 
 @admin.register(StreetScanImportRevertFile)
@@ -240,11 +266,35 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
         ]
         return custom_urls + super().get_urls()
 
-    def details_csv_view(self, request, pk: int) -> HttpResponse:
+    def get_queryset(self, request) -> QuerySet:
+        """Defer the large JSON fields and annotate the processed source_id counts.
+
+        Args:
+            request: The HTTP request.
+
+        Returns:
+            QuerySet: Run logs with ``processed_*_count`` annotations.
+        """
+        return (
+            super()
+            .get_queryset(request)
+            .defer(*_DEFERRED_FIELDS)
+            .annotate(
+                **{
+                    annotation: Func(F(field), function="jsonb_array_length", output_field=IntegerField())
+                    for field, annotation in _PROCESSED_SOURCE_ID_COUNT_ANNOTATIONS.items()
+                }
+            )
+        )
+
+    def details_csv_view(self, request, pk: int) -> StreamingHttpResponse:
         """Stream a CSV file of detail entries for a given object_type and level.
 
+        The entries are read from the database with a server-side cursor in
+        chunks, so the response is not built in memory.
+
         Query parameters:
-            object_type (str): e.g. ``"signs"``
+            object_type (str): e.g. ``"signs"``, or ``"unknown"`` for entries without one
             level (str): e.g. ``"warning"`` or ``"skip"``
 
         Args:
@@ -252,32 +302,46 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
             pk (int): Primary key of the StreetScanImportRun.
 
         Returns:
-            HttpResponse: CSV attachment response.
+            StreamingHttpResponse: CSV attachment response.
 
         Raises:
             Http404: If the run does not exist.
         """
-        try:
-            run = StreetScanImportRun.objects.get(pk=pk)
-        except StreetScanImportRun.DoesNotExist:
+        if not StreetScanImportRun.objects.filter(pk=pk).exists():
             raise Http404
 
         object_type = request.GET.get("object_type", "")
         level = request.GET.get("level", "")
-        details = run.details or []
-        filtered = [e for e in details if e.get("object_type") == object_type and e.get("level") == level]
-
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(["source_id", "phase", "reason"])
-        for e in filtered:
-            writer.writerow([e.get("source_id", ""), e.get("phase", ""), e.get("reason", "")])
+        entries = (
+            StreetScanImportRunDetail.objects.filter(
+                import_run_id=pk,
+                object_type="" if object_type == "unknown" else object_type,
+                level=level,
+            )
+            .order_by("id")
+            .values_list("source_id", "phase", "reason")
+        )
 
         filename = f"run_{pk}_{object_type}_{level}.csv"
-        response = HttpResponse(buf.getvalue(), content_type="text/csv; charset=utf-8")
+        response = StreamingHttpResponse(self._iter_csv(entries), content_type="text/csv; charset=utf-8")
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
         return response
 
+    @staticmethod
+    def _iter_csv(entries: QuerySet) -> Iterator[str]:
+        """Yield CSV lines of detail entries.
+
+        Args:
+            entries (QuerySet): ``(source_id, phase, reason)`` value tuples.
+
+        Yields:
+            str: CSV header line followed by one line per entry.
+        """
+        writer = csv.writer(_Echo())
+        yield writer.writerow(["source_id", "phase", "reason"])
+        for entry in entries.iterator(chunk_size=_DETAILS_CSV_CHUNK_SIZE):
+            yield writer.writerow(entry)
+
     # ------------------------------------------------------------------
     # List display helpers
     # ------------------------------------------------------------------
@@ -390,7 +454,7 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
         Returns:
             int: Count of processed mount source IDs.
         """
-        return len(obj.processed_mount_source_ids or [])
+        return getattr(obj, "processed_mount_count", None) or 0
 
     @admin.display(description=_("Processed sign source IDs (count)"))
     def processed_sign_source_ids_count(self, obj: StreetScanImportRun) -> int:
@@ -402,7 +466,7 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
         Returns:
             int: Count of processed sign source IDs.
         """
-        return len(obj.processed_sign_source_ids or [])
+        return getattr(obj, "processed_sign_count", None) or 0
 
     @admin.display(description=_("Processed signpost source IDs (count)"))
     def processed_signpost_source_ids_count(self, obj: StreetScanImportRun) -> int:
@@ -414,7 +478,7 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
         Returns:
             int: Count of processed signpost source IDs.
         """
-        return len(obj.processed_signpost_source_ids or [])
+        return getattr(obj, "processed_signpost_count", None) or 0
 
     @admin.display(description=_("Processed additional sign source IDs (count)"))
     def processed_additional_sign_source_ids_count(self, obj: StreetScanImportRun) -> int:
@@ -426,7 +490,7 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
         Returns:
             int: Count of processed additional sign source IDs.
         """
-        return len(obj.processed_additional_sign_source_ids or [])
+        return getattr(obj, "processed_additional_sign_count", None) or 0
 
     @admin.display(description=_("Phase durations"))
     def phase_durations_display(self, obj: StreetScanImportRun) -> str:
@@ -451,12 +515,14 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
 
     @admin.display(description=_("Event details"))
     def details_display(self, obj: StreetScanImportRun) -> str:
-        """Render the details list as HTML tables grouped by object type and level.
+        """Render the detail entries as HTML tables grouped by object type and level.
 
         Entries are categorised first by object type (in dependency order), then by
         level (warning → skip → error). Entries from old run records that carry no
-        ``object_type`` key are collected under an ``"unknown"`` bucket. Each
-        object-type section contains one table per level with a CSV download link.
+        object type are collected under an ``"unknown"`` bucket. Each object-type
+        section contains one table per level with a CSV download link. The totals
+        and the displayed entries are both queried in SQL, so the size of the run
+        does not affect the page.
 
         Args:
             obj (StreetScanImportRun): The run log instance.
@@ -464,9 +530,8 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
         Returns:
             str: Safe HTML of grouped event detail tables.
         """
-        details: list[dict] = obj.details or []
         base_csv_url = reverse("admin:traffic_control_streetscanimportrun_details_csv", args=[obj.pk])
-        grouped = self._group_details(details)
+        grouped = self._group_details(obj)
         context = self._build_details_context(grouped, base_csv_url)
         return render_to_string(
             "admin/traffic_control/streetscan_import/event_details.html",
@@ -474,47 +539,56 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
         )
 
     @staticmethod
-    def _group_details(details: list[dict]) -> dict[str, dict[str, list[dict]]]:
-        """Group detail entries by object_type then by level.
+    def _group_details(obj: StreetScanImportRun) -> dict[str, dict[str, dict]]:
+        """Group the detail entries of a run by object_type then by level.
 
         Args:
-            details (list[dict]): Raw details list from the run log.
+            obj (StreetScanImportRun): The run log instance.
 
         Returns:
-            dict[str, dict[str, list[dict]]]: Nested mapping
-                ``{object_type: {level: [entries]}}``.
+            dict[str, dict[str, dict]]: Nested mapping
+                ``{object_type: {level: {"total": int, "entries": [entries]}}}``
+                with at most ``_MAX_DETAIL_ROWS_PER_LEVEL`` entries per level.
         """
         object_type_order = ("mounts", "signs", "signposts", "additional-signs", "unknown")
         level_order = ("warning", "skip", "error")
 
-        grouped: dict[str, dict[str, list[dict]]] = {ot: {lv: [] for lv in level_order} for ot in object_type_order}
+        grouped: dict[str, dict[str, dict]] = {
+            ot: {lv: {"total": 0, "entries": []} for lv in level_order} for ot in object_type_order
+        }
 
-        for entry in details:
-            ot = entry.get("object_type") or "unknown"
-            if ot not in grouped:
-                grouped[ot] = {lv: [] for lv in level_order}
-            lv = entry.get("level", "")
-            if lv not in grouped[ot]:
-                grouped[ot][lv] = []
-            grouped[ot][lv].append(entry)
+        def bucket(object_type: str, level: str) -> dict:
+            levels = grouped.setdefault(object_type or "unknown", {})
+            return levels.setdefault(level, {"total": 0, "entries": []})
+
+        entries = obj.detail_entries.all()
+        for row in entries.values("object_type", "level").annotate(total=Count("id")).order_by():
+            bucket(row["object_type"], row["level"])["total"] = row["total"]
+
+        displayed_entries = (
+            entries.annotate(
+                row_number=Window(RowNumber(), partition_by=[F("object_type"), F("level")], order_by=F("id").asc())
+            )
+            .filter(row_number__lte=_MAX_DETAIL_ROWS_PER_LEVEL)
+            .order_by("id")
+            .values("object_type", "level", "source_id", "phase", "reason")
+        )
+        for entry in displayed_entries:
+            bucket(entry["object_type"], entry["level"])["entries"].append(entry)
 
         return grouped
 
     @staticmethod
-    def _build_details_context(grouped: dict[str, dict[str, list[dict]]], base_csv_url: str) -> dict:
+    def _build_details_context(grouped: dict[str, dict[str, dict]], base_csv_url: str) -> dict:
         """Build the template context for the event details display.
 
-        At most ``_MAX_ROWS_PER_LEVEL`` entries are included per level bucket to
-        avoid rendering multi-megabyte HTML pages for large imports.
-
         Args:
-            grouped (dict[str, dict[str, list[dict]]]): Output of ``_group_details``.
+            grouped (dict[str, dict[str, dict]]): Output of ``_group_details``.
             base_csv_url (str): Base URL for the CSV download endpoint.
 
         Returns:
             dict: Template context with a ``sections`` list.
         """
-        _MAX_ROWS_PER_LEVEL = 200
         level_order = ("warning", "skip", "error")
         level_colour = {"skip": "#ffffff", "warning": "#ffffff", "error": "#ffffff"}
         level_bg = {"skip": "#e9ecef", "warning": "#fff3cd", "error": "#f8d7da"}
@@ -525,24 +599,24 @@ class StreetScanImportRunAdmin(admin.ModelAdmin):
         for object_type, levels in grouped.items():
             level_contexts = []
             for level in level_order:
-                entries = levels.get(level, [])
-                if not entries:
+                group = levels.get(level)
+                if not group or not group["total"]:
                     continue
-                total = len(entries)
+                total = group["total"]
                 level_contexts.append(
                     {
                         "level": level,
                         "total": total,
                         "displayed_entries": [
                             {
-                                "source_id": e.get("source_id", ""),
-                                "phase": e.get("phase", ""),
-                                "reason": e.get("reason", ""),
+                                "source_id": e["source_id"],
+                                "phase": e["phase"],
+                                "reason": e["reason"],
                             }
-                            for e in entries[:_MAX_ROWS_PER_LEVEL]
+                            for e in group["entries"]
                         ],
-                        "truncated": total > _MAX_ROWS_PER_LEVEL,
-                        "max_rows": _MAX_ROWS_PER_LEVEL,
+                        "truncated": total > _MAX_DETAIL_ROWS_PER_LEVEL,
+                        "max_rows": _MAX_DETAIL_ROWS_PER_LEVEL,
                         "csv_url": f"{base_csv_url}?object_type={object_type}&level={level}",
                         "colour": level_colour.get(level, "#fff"),
                         "bg": level_bg.get(level, "#fff"),
@@ -11,7 +11,9 @@ from django.utils.translation import gettext_lazy as _
 from guardian.admin import GuardedModelAdmin
 from rangefilter.filters import DateRangeFilterBuilder
 
+from admin_helper.changelist import LargeTableChangelistAdminMixin
 from admin_helper.decorators import requires_annotation
+from admin_helper.optimizer import QuerySetOptimizerAdminMixin
 from traffic_control.admin.additional_sign import AdditionalSignPlanInline, AdditionalSignRealInline
 from traffic_control.admin.admin_filters import as_dropdown, HeightFilter
 from traffic_control.admin.audit_log import AuditLogHistoryAdmin
@@ -207,6 +209,7 @@ class TrafficSignPlanReplacementListFilter(PlanReplacementListFilterMixin, Simpl
 
 @admin.register(TrafficSignPlan)
 class TrafficSignPlanAdmin(
+    QuerySetOptimizerAdminMixin,
     DeviceTypeSearchAdminMixin,
     EnumChoiceValueDisplayAdminMixin,
     SoftDeleteAdminMixin,
@@ -343,36 +346,6 @@ class TrafficSignPlanAdmin(
     )
     initial_values = shared_initial_values
 
-    # Generated for TrafficSignPlanAdmin at 2026-02-19 11:32:18+00:00
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        resolver_match = getattr(request, "resolver_match", None)
-        if not resolver_match or not resolver_match.url_name:
-            return qs
-
-        if resolver_match.url_name.endswith("_changelist"):
-            qs = self.annotate_has_additional_signs(qs)  # from list_display (via has_additional_signs)
-            return qs.select_related(
-                "device_type",  # n:1 relation in list_display (via device_type_preview -> TrafficControlDeviceTypeIcon.__str__) # noqa: E501
-                "device_type__icon_file",  # n:1 relation chain in list_display (via device_type_preview -> TrafficControlDeviceTypeIcon.__str__) # noqa: E501
-                "plan",  # n:1 relation in list_display, list_display (via Plan.__str__) # noqa: E501
-                "replacement_to_new",  # 1:1 relation in list_display (via is_replaced_as_str) # noqa: E501
-            )
-        elif resolver_match.url_name.endswith("_change"):
-            return qs.select_related(
-                "created_by",  # n:1 relation in fieldsets, readonly_fields, readonly_fields (via User.__str__) # noqa: E501
-                "device_type",  # n:1 relation in fieldsets, readonly_fields (via device_type_preview -> TrafficControlDeviceTypeIcon.__str__) # noqa: E501
-                "device_type__icon_file",  # n:1 relation chain in readonly_fields (via device_type_preview -> TrafficControlDeviceTypeIcon.__str__) # noqa: E501
-                "mount_plan",  # n:1 relation in fieldsets, fieldsets (via MountPlan.__str__) # noqa: E501
-                "mount_plan__mount_type",  # n:1 relation chain in fieldsets (via MountPlan.__str__) # noqa: E501
-                "mount_type",  # n:1 relation in fieldsets, fieldsets (via MountType.__str__) # noqa: E501
-                "owner",  # n:1 relation in fieldsets, fieldsets (via Owner.__str__) # noqa: E501
-                "plan",  # n:1 relation in fieldsets, fieldsets (via Plan.__str__) # noqa: E501
-                "updated_by",  # n:1 relation in fieldsets, readonly_fields # noqa: E501
-            )
-
-        return qs
-
     def annotate_has_additional_signs(self, qs):
         return qs.annotate(
             _has_additional_signs=Exists(AdditionalSignReal.objects.filter(parent=OuterRef("pk"), is_active=True))
@@ -413,6 +386,8 @@ class TrafficSignRealOperationInline(TrafficControlOperationInlineBase):
 
 @admin.register(TrafficSignReal)
 class TrafficSignRealAdmin(
+    QuerySetOptimizerAdminMixin,
+    LargeTableChangelistAdminMixin,
     DeviceTypeSearchAdminMixin,
     DeviceComparisonAdminMixin,
     EnumChoiceValueDisplayAdminMixin,
@@ -611,44 +586,6 @@ class TrafficSignRealAdmin(
         "installation_status": InstallationStatus.IN_USE,
     }
 
-    # Generated for TrafficSignRealAdmin at 2026-02-18T11:28:04+00:00
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        resolver_match = getattr(request, "resolver_match", None)
-        if not resolver_match or not resolver_match.url_name:
-            return qs
-
-        if resolver_match.url_name.endswith("_changelist"):
-            qs = self.annotate_has_additional_signs(qs)  # from list_display (via has_additional_signs)
-            return qs.select_related(
-                "created_by",  # n:1 relation in list_display, list_display (via User.__str__) # noqa: E501
-                "device_type",  # n:1 relation in list_display (via device_type_preview -> TrafficControlDeviceTypeIcon.__str__) # noqa: E501
-                "device_type__icon_file",  # n:1 relation chain in list_display (via device_type_preview -> TrafficControlDeviceTypeIcon.__str__) # noqa: E501
-                "mount_real",  # n:1 relation in list_display, list_display (via MountReal.__str__ -> MountType.__str__) # noqa: E501
-                "mount_real__mount_type",  # n:1 relation chain in list_display (via MountReal.__str__ -> MountType.__str__) # noqa: E501
-                "mount_type",  # n:1 relation in list_display # noqa: E501
-                "owner",  # n:1 relation in list_display, list_display (via Owner.__str__) # noqa: E501
-                "traffic_sign_plan",  # n:1 relation in list_display, list_display (via TrafficSignPlan.__str__ -> TrafficControlDeviceType.__str__) # noqa: E501
-                "traffic_sign_plan__device_type",  # n:1 relation chain in list_display (via TrafficSignPlan.__str__ -> TrafficControlDeviceType.__str__) # noqa: E501
-                "updated_by",  # n:1 relation in list_display # noqa: E501
-            )
-        elif resolver_match.url_name.endswith("_change"):
-            qs = self.annotate_has_additional_signs(qs)  # from readonly_fields (via has_additional_signs)
-            return qs.select_related(
-                "created_by",  # n:1 relation in fieldsets, readonly_fields, readonly_fields (via User.__str__) # noqa: E501
-                "device_type",  # n:1 relation in fieldsets, readonly_fields (via device_type_preview -> TrafficControlDeviceTypeIcon.__str__) # noqa: E501
-                "device_type__icon_file",  # n:1 relation chain in readonly_fields (via device_type_preview -> TrafficControlDeviceTypeIcon.__str__) # noqa: E501
-                "mount_real",  # n:1 relation in fieldsets, fieldsets (via MountReal.__str__) # noqa: E501
-                "mount_real__mount_type",  # n:1 relation chain in fieldsets (via MountReal.__str__) # noqa: E501
-                "mount_type",  # n:1 relation in fieldsets, fieldsets (via MountType.__str__) # noqa: E501
-                "owner",  # n:1 relation in fieldsets, fieldsets (via Owner.__str__) # noqa: E501
-                "traffic_sign_plan",  # n:1 relation in fieldsets, fieldsets (via TrafficSignPlan.__str__) # noqa: E501
-                "traffic_sign_plan__device_type",  # n:1 relation chain in fieldsets (via TrafficSignPlan.__str__) # noqa: E501
-                "updated_by",  # n:1 relation in fieldsets, readonly_fields # noqa: E501
-            )
-
-        return qs
-
     def annotate_has_additional_signs(self, qs: QuerySet) -> QuerySet:
         return qs.annotate(
             _has_additional_signs=Exists(AdditionalSignReal.objects.filter(parent=OuterRef("pk"), is_active=True))
@@ -8,6 +8,7 @@ from django.db import transaction
 
 from traffic_control.geometry_utils import geometry_is_legit, get_3d_geometry
 from traffic_control.models.plan import Plan
+from traffic_control.utils.data_version import bump_data_version
 from users.utils import get_system_user
 
 
@@ -408,7 +409,11 @@ class PlanGeometryImporter:
                 "diary_number": result["diaari"],
                 "fields_changed": fields_changed,
             }
-            Plan.objects.filter(pk=result["plan_id"]).update(**update_fields, updated_by=get_system_user())
+            plans = Plan.objects.filter(pk=result["plan_id"])
+            plans.update(**update_fields, updated_by=get_system_user())
+            bump_data_version(Plan._meta.db_table)
+            if "location" in update_fields:
+                plans.update_derived_locations()
             return True
 
         # No changes needed, mark as skipped
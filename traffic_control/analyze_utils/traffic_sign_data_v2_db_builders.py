@@ -11,6 +11,7 @@ from traffic_control.models.common import TrafficControlDeviceType
 from traffic_control.models.mount import MountReal
 from traffic_control.models.signpost import SignpostReal
 from traffic_control.models.traffic_sign import TrafficSignReal
+from traffic_control.utils.reference_data import get_reference_objects
 
 from .traffic_sign_data_v2_constants import CSVHeadersV2
 
@@ -105,10 +106,8 @@ class DbBuilderMixin:
         Returns:
             dict[str, Any]: Dictionary mapping device type codes to device type IDs.
         """
-        code_to_id = {}
-        for dt in TrafficControlDeviceType.objects.all():
-            code_to_id[dt.code] = dt.id
-        return code_to_id
+        # Device types are read from the reference data cache instead of the database
+        return {dt.code: dt.id for dt in get_reference_objects(TrafficControlDeviceType)}
 
     @staticmethod
     def _build_mount_reals_by_source_id() -> set[str]:
@@ -19,7 +19,8 @@ from typing import Any
 from uuid import UUID
 
 from django.core.files import File
-from django.db.models import Exists, OuterRef
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
 
 from traffic_control.analyze_utils.traffic_sign_data_v2_code_transform import CodeTransformMixin
 from traffic_control.analyze_utils.traffic_sign_data_v2_constants import (
@@ -34,8 +35,14 @@ from traffic_control.geometry_utils import geometry_is_legit
 from traffic_control.models import AdditionalSignReal, MountReal, MountType, Owner, SignpostReal, TrafficSignReal
 from traffic_control.models.additional_sign import Color
 from traffic_control.models.mount import LocationSpecifier as MountLocationSpecifier
-from traffic_control.models.streetscan_import import StreetScanImportRevertFile, StreetScanImportRun
+from traffic_control.models.streetscan_import import (
+    StreetScanImportRevertFile,
+    StreetScanImportRun,
+    StreetScanImportRunDetail,
+)
 from traffic_control.models.traffic_sign import LocationSpecifier as SignLocationSpecifier
+from traffic_control.utils.data_version import bump_data_version
+from traffic_control.utils.reference_data import get_reference_object, get_reference_objects
 from users.models import User
 
 logger = logging.getLogger(__name__)
@@ -55,6 +62,17 @@ PHASE_ORDER: tuple[str, ...] = ("create", "update", "deactivate")
 # Mounts are never deactivated; the deactivate phase is silently skipped for them.
 _DEACTIVATABLE_OBJECT_TYPES: frozenset[str] = frozenset({"signs", "signposts", "additional-signs"})
 
+# Processed source_id lists of the run log. The lists only grow during a run, so they are saved only when grown.
+_PROCESSED_SOURCE_ID_FIELDS: tuple[str, ...] = (
+    "processed_mount_source_ids",
+    "processed_sign_source_ids",
+    "processed_signpost_source_ids",
+    "processed_additional_sign_source_ids",
+)
+
+# Number of orphan mounts deleted per transaction, and fetched per round trip when writing them to CSV.
+ORPHAN_MOUNT_CHUNK_SIZE: int = 1000
+
 # Suffix appended to geometry validation error messages during update phases.
 _ON_UPDATE_SUFFIX: str = " on update"
 
@@ -184,6 +202,10 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
 
         # --- Run log and revert file (populated during run()) ---
         self.run_log: StreetScanImportRun | None = None
+        # Number of summary["details"] entries already written as StreetScanImportRunDetail rows
+        self._saved_details_count: int = 0
+        # Lengths of the processed source_id lists at the previous run log save
+        self._saved_processed_counts: dict[str, int] = {}
         # Revert records are written to a NamedTemporaryFile one line at a time
         # (flushed immediately) so memory consumption is O(1) regardless of the
         # number of records. The file is attached as a StreetScanImportRevertFile
@@ -323,7 +345,7 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
             dict[str, MountType]: Mapping from description string to MountType instance.
         """
         result: dict[str, MountType] = {}
-        for mt in MountType.objects.all():
+        for mt in get_reference_objects(MountType):
             if mt.description_fi:
                 result[mt.description_fi] = mt
             if mt.description:
@@ -465,6 +487,9 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
         else:
             created = model_class.objects.bulk_create(generator, batch_size=self.batch_size)
             created_count = len(created)
+            if created_count:
+                # bulk_create doesn't send the post_save signals bumping the data version
+                bump_data_version(model_class._meta.db_table)
             for obj in created:
                 self._write_revert_record(
                     {
@@ -553,22 +578,20 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
             summary (dict[str, Any]): Mutable summary dict; ``orphans_deleted`` and
                 ``orphan_mount_source_ids`` are set and the run log is saved afterwards.
         """
-        orphan_ids: set[UUID] = self.get_orphan_mount_ids()
-        count: int = len(orphan_ids)
+        count: int = self.get_orphan_mounts().count()
         logger.info("[TrafficSignImporterV2] Orphan mounts found: %d", count)
 
-        orphan_source_ids: list[str] = list(
-            MountReal.objects.filter(id__in=orphan_ids).values_list("source_id", flat=True)
-        )
-
         if self.dry_run:
             logger.info("[TrafficSignImporterV2] DRY RUN — skipping orphan mount deletion")
             summary["orphans_deleted"] = 0
             summary["orphan_mount_source_ids"] = []
         else:
-            MountReal.objects.filter(id__in=orphan_ids).delete()
-            logger.info("[TrafficSignImporterV2] Deleted %d orphan mount(s)", count)
-            summary["orphans_deleted"] = count
+            orphan_source_ids: list[str] = []
+            deleted_count = self.delete_orphan_mounts(
+                on_chunk=lambda source_ids, _deleted_count: orphan_source_ids.extend(source_ids)
+            )
+            logger.info("[TrafficSignImporterV2] Deleted %d orphan mount(s)", deleted_count)
+            summary["orphans_deleted"] = deleted_count
             summary["orphan_mount_source_ids"] = orphan_source_ids
 
         self._save_run_log(summary)
@@ -585,7 +608,8 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
         if self.run_log is None:
             return
         self._apply_summary_to_run_log(self.run_log, summary)
-        self.run_log.save()
+        self.run_log.save(update_fields=self._get_run_log_update_fields(summary))
+        self._save_run_log_details(summary)
 
     def _create_run_log(self) -> StreetScanImportRun:
         """Create and persist the initial StreetScanImportRun row for this run.
@@ -604,9 +628,10 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
 
     @staticmethod
     def _apply_summary_to_run_log(run_log: StreetScanImportRun, summary: dict[str, Any]) -> None:
-        """Copy count and detail fields from summary into the run log model instance.
+        """Copy count fields from summary into the run log model instance.
 
-        Does not call save() — the caller is responsible for persisting.
+        Does not call save() — the caller is responsible for persisting. The
+        details entries themselves are saved by ``_save_run_log_details``.
 
         Args:
             run_log (StreetScanImportRun): Run log model instance to update.
@@ -626,16 +651,12 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
             "additional_signs_deactivated",
             "orphans_deleted",
             "orphan_mount_source_ids",
-            "processed_mount_source_ids",
-            "processed_sign_source_ids",
-            "processed_signpost_source_ids",
-            "processed_additional_sign_source_ids",
+            *_PROCESSED_SOURCE_ID_FIELDS,
         ):
             if field in summary:
                 setattr(run_log, field, summary[field])
 
         details: list[dict] = summary.get("details", [])
-        run_log.details = details
         run_log.skipped_count = sum(1 for e in details if e.get("level") == "skip")
         run_log.warning_count = sum(1 for e in details if e.get("level") == "warning")
         run_log.error_count = sum(1 for e in details if e.get("level") == "error")
@@ -649,6 +670,60 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
             }
         run_log.phase_durations = phase_durations
 
+    def _get_run_log_update_fields(self, summary: dict[str, Any]) -> list[str]:
+        """Return the run log fields to save.
+
+        The processed source_id lists are included only when they have grown
+        since the previous save, so that a large list is not rewritten after
+        every phase of other object types.
+
+        Args:
+            summary (dict[str, Any]): Current summary dict from the importer.
+
+        Returns:
+            list[str]: Field names for ``save(update_fields=...)``.
+        """
+        update_fields = [
+            field.name
+            for field in StreetScanImportRun._meta.concrete_fields
+            if not field.primary_key and field.name not in _PROCESSED_SOURCE_ID_FIELDS
+        ]
+        for field in _PROCESSED_SOURCE_ID_FIELDS:
+            count = len(summary.get(field, []))
+            if count != self._saved_processed_counts.get(field, 0):
+                update_fields.append(field)
+                self._saved_processed_counts[field] = count
+        return update_fields
+
+    def _save_run_log_details(self, summary: dict[str, Any]) -> None:
+        """Append the details entries added since the previous save as StreetScanImportRunDetail rows.
+
+        Entries are stamped with their object type and phase at the end of each
+        phase, before the run log is saved, so they are complete when written.
+
+        Args:
+            summary (dict[str, Any]): Current summary dict from the importer.
+        """
+        details: list[dict] = summary.get("details", [])
+        new_details = details[self._saved_details_count :]
+        if not new_details:
+            return
+        StreetScanImportRunDetail.objects.bulk_create(
+            (
+                StreetScanImportRunDetail(
+                    import_run=self.run_log,
+                    object_type=entry.get("object_type") or "",
+                    level=entry.get("level") or "",
+                    phase=entry.get("phase") or "",
+                    source_id=str(entry.get("source_id") or "")[:255],
+                    reason=str(entry.get("reason") or ""),
+                )
+                for entry in new_details
+            ),
+            batch_size=self.batch_size,
+        )
+        self._saved_details_count = len(details)
+
     def _finalise_run_log(self, summary: dict[str, Any]) -> None:
         """Perform the final run log save and attach the revert file if applicable.
 
@@ -663,7 +738,8 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
             return
         self._apply_summary_to_run_log(self.run_log, summary)
         self.run_log.completed_at = datetime.datetime.now(tz=datetime.timezone.utc)
-        self.run_log.save()
+        self.run_log.save(update_fields=self._get_run_log_update_fields(summary))
+        self._save_run_log_details(summary)
 
         if not self.dry_run:
             self._attach_revert_file()
@@ -912,8 +988,9 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
         Returns:
             int: Number of objects in the batch (same whether dry run or not).
         """
-        if not self.dry_run:
+        if not self.dry_run and batch:
             model_class.objects.bulk_update(batch, update_fields, batch_size=self.batch_size)
+            bump_data_version(model_class._meta.db_table)
         return len(batch)
 
     def _update_objects(
@@ -1858,6 +1935,7 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
             return len(objects_to_create)
 
         created = SignpostReal.objects.bulk_create(objects_to_create, batch_size=self.batch_size)
+        bump_data_version(SignpostReal._meta.db_table)
         for obj in created:
             newly_created[obj.source_id] = obj.pk
             self._write_revert_record(
@@ -2538,6 +2616,24 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
             object_type_name="AdditionalSignReal",
         )
 
+    @staticmethod
+    def get_orphan_mounts() -> QuerySet[MountReal]:
+        """Return MountReal records with source_name=SOURCE_NAME not referenced by any sign or signpost.
+
+        The references are excluded with one ``NOT EXISTS`` condition per referencing
+        model, which the database executes as anti-joins, so the referenced mount IDs
+        are never collected.
+
+        Returns:
+            QuerySet[MountReal]: Orphan mounts scoped to SOURCE_NAME.
+        """
+        return MountReal.objects.filter(
+            ~Exists(TrafficSignReal.objects.filter(source_name=SOURCE_NAME, mount_real=OuterRef("pk"))),
+            ~Exists(AdditionalSignReal.objects.filter(source_name=SOURCE_NAME, mount_real=OuterRef("pk"))),
+            ~Exists(SignpostReal.objects.filter(source_name=SOURCE_NAME, mount_real=OuterRef("pk"))),
+            source_name=SOURCE_NAME,
+        )
+
     @staticmethod
     def get_orphan_mount_ids() -> set[UUID]:
         """Return IDs of MountReal records with source_name=SOURCE_NAME not referenced by any sign or signpost.
@@ -2552,12 +2648,48 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
         Returns:
             set[UUID]: Set of orphan MountReal IDs scoped to SOURCE_NAME.
         """
-        referenced = (
-            Exists(TrafficSignReal.objects.filter(source_name=SOURCE_NAME, mount_real=OuterRef("pk")))
-            | Exists(AdditionalSignReal.objects.filter(source_name=SOURCE_NAME, mount_real=OuterRef("pk")))
-            | Exists(SignpostReal.objects.filter(source_name=SOURCE_NAME, mount_real=OuterRef("pk")))
-        )
-        return set(MountReal.objects.filter(source_name=SOURCE_NAME).exclude(referenced).values_list("id", flat=True))
+        return set(TrafficSignImporterV2.get_orphan_mounts().values_list("id", flat=True))
+
+    @staticmethod
+    def delete_orphan_mounts(
+        chunk_size: int = ORPHAN_MOUNT_CHUNK_SIZE,
+        on_chunk: Callable[[list[str], int], None] | None = None,
+    ) -> int:
+        """Hard-delete orphan mounts scoped to SOURCE_NAME in chunks, each in its own transaction.
+
+        Locks are held for one chunk at a time and an interrupted cleanup keeps the
+        chunks already committed. The mounts of a chunk are locked before the orphan
+        condition is checked again, so a mount referenced during the cleanup is skipped.
+
+        Args:
+            chunk_size (int): Maximum number of mounts deleted per transaction.
+            on_chunk (Callable[[list[str], int], None] | None): Called after each committed
+                chunk with the source_ids of its deleted mounts and the number of mounts
+                deleted so far.
+
+        Returns:
+            int: Number of deleted mounts.
+        """
+        deleted_count = 0
+        last_id: UUID | None = None
+        while True:
+            with transaction.atomic():
+                candidates = TrafficSignImporterV2.get_orphan_mounts().order_by("id")
+                if last_id is not None:
+                    candidates = candidates.filter(id__gt=last_id)
+                chunk_ids = list(candidates.select_for_update().values_list("id", flat=True)[:chunk_size])
+                if not chunk_ids:
+                    break
+                last_id = chunk_ids[-1]
+
+                orphans = TrafficSignImporterV2.get_orphan_mounts().filter(id__in=chunk_ids)
+                source_ids: list[str] = list(orphans.values_list("source_id", flat=True))
+                orphans.delete()
+            deleted_count += len(source_ids)
+            logger.info("[TrafficSignImporterV2] Deleted %d orphan mount(s) so far", deleted_count)
+            if on_chunk is not None:
+                on_chunk(source_ids, deleted_count)
+        return deleted_count
 
     @staticmethod
     def clean_orphan_mounts() -> None:
@@ -2570,30 +2702,31 @@ class TrafficSignImporterV2(CodeTransformMixin, DbBuilderMixin, DataLoadingMixin
         Returns:
             None
         """
-        MountReal.objects.filter(id__in=TrafficSignImporterV2.get_orphan_mount_ids()).delete()
+        TrafficSignImporterV2.delete_orphan_mounts()
 
     @staticmethod
     def write_orphan_mounts_to_csv(file_path: str) -> None:
         """Write orphan mount data to a CSV file.
 
+        The rows are streamed from a server-side cursor, so memory use does not grow
+        with the number of orphans.
+
         Args:
             file_path (str): The path to the output CSV file.
 
         Returns:
             None
         """
-        orphan_mount_ids = TrafficSignImporterV2.get_orphan_mount_ids()
-        mounts = MountReal.objects.filter(id__in=orphan_mount_ids).select_related("mount_type")
+        rows = TrafficSignImporterV2.get_orphan_mounts().values_list(
+            "location", "id", "mount_type_id", "source_id", "source_name"
+        )
         with open(file_path, "w", newline="") as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(["location", "dbid", "mount_type", "source_id", "source_name"])
-            for mount in mounts:
+            for location, mount_id, mount_type_id, source_id, source_name in rows.iterator(
+                chunk_size=ORPHAN_MOUNT_CHUNK_SIZE
+            ):
+                mount_type = get_reference_object(MountType, mount_type_id) if mount_type_id else None
                 writer.writerow(
-                    [
-                        str(mount.location),
-                        str(mount.id),
-                        str(mount.mount_type) if mount.mount_type else "",
-                        mount.source_id,
-                        mount.source_name,
-                    ]
+                    [str(location), str(mount_id), str(mount_type) if mount_type else "", source_id, source_name]
                 )
@@ -20,9 +20,15 @@ class TrafficControlConfig(AppConfig):
         from traffic_control.mixins.models import AbstractFileModel  # noqa: F401
 
         # Register audit log signals after all models are loaded
-        from traffic_control.signals import register_auditlog_signals
+        from traffic_control.signals import (
+            register_auditlog_signals,
+            register_data_version_signals,
+            register_reference_data_signals,
+        )
 
         register_auditlog_signals()
+        register_data_version_signals()
+        register_reference_data_signals()
 
         for model in apps.get_models():
             if not issubclass(model, AbstractFileModel) or model._meta.abstract:
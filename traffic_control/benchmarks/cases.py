@@ -0,0 +1,386 @@
+"""
+Benchmarks of the hot paths of the platform, run against a synthetic city, see synthetic_city.
+
+Each benchmark is run inside a transaction that is rolled back afterwards, so benchmarks that write data can be
+repeated and do not affect each other. Wall-clock time and the number of SQL queries are measured for every run.
+"""
+
+import json
+import statistics
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from traffic_control.analyze_utils.plan_to_real_mapping import find_and_update_plan_instances_to_reals
+from traffic_control.analyze_utils.traffic_sign_data_v2_import import (
+    OBJECT_TYPE_ORDER,
+    PHASE_ORDER,
+    TrafficSignImporterV2,
+)
+from traffic_control.benchmarks.synthetic_city import DEFAULT_OWNER_NAME, write_streetscan_csv_files
+from traffic_control.enums import DeviceTypeTargetModel
+from traffic_control.models import (
+    AdditionalSignPlan,
+    AdditionalSignReal,
+    MountPlan,
+    MountReal,
+    Owner,
+    Plan,
+    SignpostPlan,
+    SignpostReal,
+    TrafficControlDeviceType,
+    TrafficSignPlan,
+    TrafficSignReal,
+)
+from traffic_control.views.wfs.views import CityInfrastructureWFSView
+
+# v1 API basenames and admin changelist models that are benchmarked
+API_MODELS = (
+    Plan,
+    MountPlan,
+    MountReal,
+    TrafficSignPlan,
+    TrafficSignReal,
+    AdditionalSignPlan,
+    AdditionalSignReal,
+    SignpostPlan,
+    SignpostReal,
+)
+API_LIST_PAGE_SIZE = 1000
+# Large list page, listed with and without the fast read serializers
+API_LARGE_LIST_PAGE_SIZE = 5000
+WFS_FEATURE_COUNT = 1000
+WFS_OUTPUT_FORMATS = ("geojson", "gml")
+PLAN_BULK_INSERT_DEVICE_COUNT = 50
+IMPORTER_MOUNT_COUNT = 1000
+PLAN_TO_REAL_MAX_DISTANCE = 1.0
+
+
+class BenchmarkFailed(Exception):
+    pass
+
+
+@dataclass
+class BenchmarkContext:
+    """Clients and shared data of a benchmark run"""
+
+    directory: Path
+    seed: int
+    client: Client
+    api_client: APIClient
+    user: Any
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Benchmark:
+    """A timed function, optionally preceded by an untimed setup run in the same rolled back transaction"""
+
+    group: str
+    name: str
+    func: Callable[[BenchmarkContext, Any], Any]
+    setup: Optional[Callable[[BenchmarkContext], Any]] = None
+
+
+@dataclass
+class BenchmarkResult:
+    group: str
+    name: str
+    times: List[float]
+    queries: int
+
+    def to_dict(self) -> dict:
+        return {
+            "group": self.group,
+            "name": self.name,
+            "repeat": len(self.times),
+            "min": min(self.times),
+            "median": statistics.median(self.times),
+            "mean": statistics.mean(self.times),
+            "max": max(self.times),
+            "queries": self.queries,
+        }
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def create_context(directory: Path, seed: int) -> BenchmarkContext:
+    user, _ = get_user_model().objects.get_or_create(
+        username="benchmark", defaults={"is_staff": True, "is_superuser": True}
+    )
+    client = Client()
+    client.force_login(user)
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    return BenchmarkContext(directory=directory, seed=seed, client=client, api_client=api_client, user=user)
+
+
+def run_benchmark(benchmark: Benchmark, context: BenchmarkContext, repeat: int, warmup: int = 1) -> BenchmarkResult:
+    times = []
+    queries = 0
+    for run in range(warmup + repeat):
+        with transaction.atomic():
+            state = benchmark.setup(context) if benchmark.setup else None
+            counter = _QueryCounter()
+            start = time.perf_counter()
+            with connection.execute_wrapper(counter):
+                benchmark.func(context, state)
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        if run >= warmup:
+            times.append(elapsed)
+            queries = counter.count
+    return BenchmarkResult(group=benchmark.group, name=benchmark.name, times=times, queries=queries)
+
+
+def _get(client, url: str, params: Optional[dict] = None) -> None:
+    response = client.get(url, params or {})
+    if response.status_code >= 400:
+        raise BenchmarkFailed(f"GET {url} returned {response.status_code}")
+    # Streaming responses, e.g. WFS, are rendered while consumed
+    if response.streaming:
+        b"".join(response.streaming_content)
+
+
+def _api_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for model in API_MODELS:
+        basename = model._meta.model_name
+        benchmarks.append(
+            Benchmark(
+                "api",
+                f"{basename}-list",
+                lambda context, state, basename=basename: _get(
+                    context.api_client, reverse(f"v1:{basename}-list"), {"limit": API_LIST_PAGE_SIZE}
+                ),
+            )
+        )
+        benchmarks.append(
+            Benchmark(
+                "api",
+                f"{basename}-retrieve",
+                lambda context, state, basename=basename: _get(
+                    context.api_client, reverse(f"v1:{basename}-detail", args=[state])
+                ),
+                setup=lambda context, model=model: model.objects.order_by("pk").values_list("pk", flat=True).first(),
+            )
+        )
+    for name, enabled in (("fast", True), ("slow", False)):
+        benchmarks.append(
+            Benchmark(
+                "api",
+                f"trafficsignreal-list-{API_LARGE_LIST_PAGE_SIZE}-{name}",
+                lambda context, state, enabled=enabled: _get_large_list(context, enabled),
+            )
+        )
+    return benchmarks
+
+
+def _get_large_list(context: BenchmarkContext, fast_read_enabled: bool) -> None:
+    with override_settings(FAST_READ_SERIALIZERS_ENABLED=fast_read_enabled):
+        _get(context.api_client, reverse("v1:trafficsignreal-list"), {"limit": API_LARGE_LIST_PAGE_SIZE})
+
+
+def _wfs_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for feature_type in CityInfrastructureWFSView.feature_types:
+        for output_format in WFS_OUTPUT_FORMATS:
+            params = {
+                "SERVICE": "WFS",
+                "VERSION": "2.0.0",
+                "REQUEST": "GetFeature",
+                "TYPENAMES": feature_type.name,
+                "COUNT": WFS_FEATURE_COUNT,
+            }
+            if output_format != "gml":
+                params["OUTPUTFORMAT"] = output_format
+            benchmarks.append(
+                Benchmark(
+                    "wfs",
+                    f"{feature_type.name}-{output_format}",
+                    lambda context, state, params=params: _get(
+                        context.api_client, reverse("wfs-city-infrastructure"), params
+                    ),
+                )
+            )
+    return benchmarks
+
+
+def _admin_benchmarks() -> List[Benchmark]:
+    return [
+        Benchmark(
+            "admin",
+            f"{model._meta.model_name}-changelist",
+            lambda context, state, model=model: _get(
+                context.client, reverse(f"admin:{model._meta.app_label}_{model._meta.model_name}_changelist")
+            ),
+        )
+        for model in API_MODELS
+    ]
+
+
+def _plan_bulk_insert_payload(context: BenchmarkContext) -> str:
+    owner = str(Owner.objects.get(name_fi=DEFAULT_OWNER_NAME).pk)
+    device_types = {
+        target_model: str(TrafficControlDeviceType.objects.filter(target_model=target_model).first().pk)
+        for target_model in (DeviceTypeTargetModel.TRAFFIC_SIGN, DeviceTypeTargetModel.ADDITIONAL_SIGN)
+    }
+    plan_id = str(uuid.uuid4())
+    location = "SRID=3879;POINT Z (25496751.5 6673129.5 1.5)"
+    mount_plans, traffic_sign_plans, additional_sign_plans = [], [], []
+    for _ in range(PLAN_BULK_INSERT_DEVICE_COUNT):
+        mount_plan_id, traffic_sign_plan_id = str(uuid.uuid4()), str(uuid.uuid4())
+        mount_plans.append({"id": mount_plan_id, "owner": owner, "plan": plan_id, "location": location, "lifecycle": 3})
+        traffic_sign_plans.append(
+            {
+                "id": traffic_sign_plan_id,
+                "owner": owner,
+                "plan": plan_id,
+                "mount_plan": mount_plan_id,
+                "device_type": device_types[DeviceTypeTargetModel.TRAFFIC_SIGN],
+                "location": location,
+                "lifecycle": 3,
+            }
+        )
+        additional_sign_plans.append(
+            {
+                "id": str(uuid.uuid4()),
+                "owner": owner,
+                "plan": plan_id,
+                "mount_plan": mount_plan_id,
+                "parent": traffic_sign_plan_id,
+                "device_type": device_types[DeviceTypeTargetModel.ADDITIONAL_SIGN],
+                "location": location,
+                "missing_content": True,
+            }
+        )
+    return json.dumps(
+        {
+            "plan": {"id": plan_id, "name": "Benchmark plan", "decision_id": "BENCHMARK", "derive_location": True},
+            "mount_plans": mount_plans,
+            "traffic_sign_plans": traffic_sign_plans,
+            "additional_sign_plans": additional_sign_plans,
+        }
+    )
+
+
+def _post_plan_bulk_insert(context: BenchmarkContext, payload: str) -> None:
+    response = context.client.post(reverse("v1:plan-bulk-insert"), data=payload, content_type="application/json")
+    if response.status_code >= 400:
+        raise BenchmarkFailed(f"Plan bulk insert returned {response.status_code}: {response.content[:1000]!r}")
+
+
+def _importer_csv_files(context: BenchmarkContext) -> tuple[str, str]:
+    if "importer_csv_files" not in context.state:
+        context.state["importer_csv_files"] = write_streetscan_csv_files(
+            context.directory, IMPORTER_MOUNT_COUNT, seed=context.seed
+        )
+    return context.state["importer_csv_files"]
+
+
+def _run_importer(context: BenchmarkContext, phases: List[str], force_update: bool = False) -> None:
+    mount_file, sign_file = _importer_csv_files(context)
+    TrafficSignImporterV2(
+        mount_file=mount_file,
+        sign_file=sign_file,
+        object_types=list(OBJECT_TYPE_ORDER),
+        phases=phases,
+        force_update=force_update,
+        user=context.user,
+    ).run()
+
+
+def _importer_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for phase in PHASE_ORDER:
+        if phase == "create":
+            setup = None
+        else:
+            # Later phases run against the rows imported by the create phase
+            def setup(context):
+                _run_importer(context, ["create"])
+
+        benchmarks.append(
+            Benchmark(
+                "importer",
+                f"streetscan-v2-{phase}",
+                lambda context, state, phase=phase: _run_importer(context, [phase], force_update=True),
+                setup=setup,
+            )
+        )
+    return benchmarks
+
+
+def _plan_to_real_mapping_benchmarks() -> List[Benchmark]:
+    return [
+        Benchmark(
+            "plan_to_real_mapping",
+            real_model._meta.model_name,
+            lambda context, state, args=(real_model, plan_model, field_name): find_and_update_plan_instances_to_reals(
+                *args, max_distance=PLAN_TO_REAL_MAX_DISTANCE, do_db_update=False
+            ),
+        )
+        for real_model, plan_model, field_name in (
+            (MountReal, MountPlan, "mount_plan"),
+            (TrafficSignReal, TrafficSignPlan, "traffic_sign_plan"),
+            (AdditionalSignReal, AdditionalSignPlan, "additional_sign_plan"),
+        )
+    ]
+
+
+def get_benchmarks() -> List[Benchmark]:
+    return [
+        *_api_benchmarks(),
+        *_wfs_benchmarks(),
+        *_admin_benchmarks(),
+        Benchmark(
+            "api",
+            "plan-bulk-insert",
+            lambda context, payload: _post_plan_bulk_insert(context, payload),
+            setup=_plan_bulk_insert_payload,
+        ),
+        *_importer_benchmarks(),
+        *_plan_to_real_mapping_benchmarks(),
+    ]
+
+
+def compare_results(results: List[dict], baseline: List[dict], threshold: float) -> List[dict]:
+    """
+    Compare results to the results of a baseline run. Returns the comparison of every benchmark found in both, with
+    `regression` set when the median time grew by more than the threshold ratio or more queries were made.
+    """
+    baseline_by_key = {(result["group"], result["name"]): result for result in baseline}
+    comparisons = []
+    for result in results:
+        base = baseline_by_key.get((result["group"], result["name"]))
+        if base is None:
+            continue
+        ratio = result["median"] / base["median"] if base["median"] else 1.0
+        comparisons.append(
+            {
+                "group": result["group"],
+                "name": result["name"],
+                "median": result["median"],
+                "baseline_median": base["median"],
+                "ratio": ratio,
+                "queries": result["queries"],
+                "baseline_queries": base["queries"],
+                "regression": ratio > threshold or result["queries"] > base["queries"],
+            }
+        )
+    return comparisons
@@ -0,0 +1,414 @@
+"""
+Synthetic city dataset for the performance benchmarks.
+
+The dataset is generated from a random seed, primary keys included, so the same seed and size produce the same rows
+and benchmark results of different commits are comparable. Rows are written with bulk_create, so model save() side
+effects are applied explicitly where the benchmarked code relies on them (derived plan locations).
+"""
+
+import csv
+import random
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.db import models, transaction
+
+from traffic_control.analyze_utils.traffic_sign_data_v2_constants import CSVHeadersV2
+from traffic_control.enums import DeviceTypeTargetModel, Lifecycle
+from traffic_control.models import (
+    AdditionalSignPlan,
+    AdditionalSignReal,
+    MountPlan,
+    MountReal,
+    MountType,
+    Owner,
+    Plan,
+    SignpostPlan,
+    SignpostReal,
+    TrafficControlDeviceType,
+    TrafficSignPlan,
+    TrafficSignReal,
+)
+from traffic_control.models.traffic_sign import TrafficSignPlanReplacement
+
+SYNTHETIC_SOURCE_NAME = "synthetic-city"
+
+# Helsinki area in EPSG:3879
+AREA_MIN_X = 25490000
+AREA_MIN_Y = 6670000
+AREA_SIZE = 15000
+PLAN_SIZE = 300
+
+# Owners required by TrafficSignImporterV2
+DEFAULT_OWNER_NAME = "Helsingin kaupunki"
+PRIVATE_OWNER_NAME = "Yksityinen"
+
+MOUNT_TYPES = (
+    ("POLE", "Pole", "Pylväs"),
+    ("WALL", "Wall", "Seinä"),
+    ("PORTAL", "Portal", "Portaali"),
+)
+TRAFFIC_SIGN_CODES = ("A11", "B1", "B5", "C1", "C32", "C39", "D1", "E1")
+SIGNPOST_CODES = ("F1", "F5", "F24")
+ADDITIONAL_SIGN_CONTENT_SCHEMAS = {
+    "H4": None,
+    "H20.1": {"type": "object", "properties": {"num": {"type": "integer"}}, "required": ["num"]},
+    "H24": {"type": "object", "properties": {"text": {"type": "string"}}, "required": ["text"]},
+}
+
+# Rows per mount, plans cover the city in PLAN_SIZE squares
+TRAFFIC_SIGNS_PER_MOUNT = 1.5
+ADDITIONAL_SIGNS_PER_TRAFFIC_SIGN = 0.6
+SIGNPOSTS_PER_MOUNT = 0.15
+MOUNTS_PER_PLAN = 100
+DEVICE_PLANS_PER_PLAN = 20
+REPLACED_TRAFFIC_SIGN_PLAN_SHARE = 0.05
+REALIZED_PLAN_SHARE = 0.5
+
+
+@dataclass
+class SyntheticCity:
+    """Row counts of a generated synthetic city"""
+
+    seed: int
+    counts: Dict[str, int]
+
+
+class _Generator:
+    def __init__(self, seed: int, batch_size: int):
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        self.counts: Dict[str, int] = {}
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def point(self, near: Optional[Point] = None, distance: float = 0) -> Point:
+        if near is None:
+            x = AREA_MIN_X + self.random.uniform(0, AREA_SIZE)
+            y = AREA_MIN_Y + self.random.uniform(0, AREA_SIZE)
+        else:
+            x = near.x + self.random.uniform(-distance, distance)
+            y = near.y + self.random.uniform(-distance, distance)
+        return Point(round(x, 2), round(y, 2), round(self.random.uniform(0, 30), 2), srid=settings.SRID)
+
+    def bulk_create(self, model: type[models.Model], objects: List[models.Model]) -> List[models.Model]:
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.counts[model._meta.label] = self.counts.get(model._meta.label, 0) + len(objects)
+        return objects
+
+    def device_fields(self, owner: Owner, index: int, location: Point) -> dict:
+        return {
+            "id": self.uuid(),
+            "location": location,
+            "owner": owner,
+            "lifecycle": Lifecycle.ACTIVE,
+            "source_id": str(index),
+            "source_name": SYNTHETIC_SOURCE_NAME,
+        }
+
+
+def _get_or_create_reference_data() -> Tuple[List[Owner], List[MountType], Dict[str, List[TrafficControlDeviceType]]]:
+    owners = [
+        Owner.objects.get_or_create(name_fi=DEFAULT_OWNER_NAME, defaults={"name_en": "City of Helsinki"})[0],
+        Owner.objects.get_or_create(name_fi=PRIVATE_OWNER_NAME, defaults={"name_en": "Private"})[0],
+    ]
+    mount_types = [
+        MountType.objects.get_or_create(
+            code=code, defaults={"description": description, "description_fi": description_fi}
+        )[0]
+        for code, description, description_fi in MOUNT_TYPES
+    ]
+
+    def device_type(code: str, target_model: DeviceTypeTargetModel, content_schema=None) -> TrafficControlDeviceType:
+        return TrafficControlDeviceType.objects.get_or_create(
+            code=code,
+            defaults={"description": code, "target_model": target_model, "content_schema": content_schema},
+        )[0]
+
+    device_types = {
+        "traffic_sign": [device_type(code, DeviceTypeTargetModel.TRAFFIC_SIGN) for code in TRAFFIC_SIGN_CODES],
+        "signpost": [device_type(code, DeviceTypeTargetModel.SIGNPOST) for code in SIGNPOST_CODES],
+        "additional_sign": [
+            device_type(code, DeviceTypeTargetModel.ADDITIONAL_SIGN, schema)
+            for code, schema in ADDITIONAL_SIGN_CONTENT_SCHEMAS.items()
+        ],
+    }
+    return owners, mount_types, device_types
+
+
+def _additional_sign_content(generator: _Generator, device_type: TrafficControlDeviceType) -> Optional[dict]:
+    schema = device_type.content_schema
+    if schema is None:
+        return None
+    if "num" in schema["properties"]:
+        return {"num": generator.random.choice([15, 30, 60, 120])}
+    return {"text": generator.random.choice(["Huoltoajo sallittu", "Ma-Pe 8-16", "Pysäköintikiekko"])}
+
+
+def _plan_location(center_x: float, center_y: float) -> MultiPolygon:
+    half = PLAN_SIZE / 2
+    corners = [(-half, -half), (-half, half), (half, half), (half, -half), (-half, -half)]
+    ring = [(center_x + dx, center_y + dy, 0.0) for dx, dy in corners]
+    return MultiPolygon(Polygon(ring), srid=settings.SRID)
+
+
+def _create_plans(generator: _Generator, mount_count: int, owners, mount_types, device_types) -> List[models.Model]:
+    """Create plans with mount, traffic sign, additional sign and signpost plans, some of them replaced"""
+    plans = []
+    for index in range(max(1, mount_count // MOUNTS_PER_PLAN)):
+        center = generator.point()
+        plans.append(
+            Plan(
+                id=generator.uuid(),
+                name=f"Synthetic plan {index}",
+                decision_id=f"SYNTHETIC-{index}",
+                drawing_numbers=[f"{index}-1", f"{index}-2"],
+                location=_plan_location(center.x, center.y),
+                source_id=str(index),
+                source_name=SYNTHETIC_SOURCE_NAME,
+            )
+        )
+    generator.bulk_create(Plan, plans)
+
+    mount_plans, traffic_sign_plans, additional_sign_plans, signpost_plans = [], [], [], []
+    for plan in plans:
+        center = plan.location.centroid
+        for _ in range(DEVICE_PLANS_PER_PLAN // 4):
+            location = generator.point(near=center, distance=PLAN_SIZE / 2)
+            mount_plan = MountPlan(
+                plan=plan,
+                mount_type=generator.random.choice(mount_types),
+                **generator.device_fields(owners[0], len(mount_plans), location),
+            )
+            mount_plans.append(mount_plan)
+            traffic_sign_plan = TrafficSignPlan(
+                plan=plan,
+                mount_plan=mount_plan,
+                device_type=generator.random.choice(device_types["traffic_sign"]),
+                **generator.device_fields(owners[0], len(traffic_sign_plans), location),
+            )
+            traffic_sign_plans.append(traffic_sign_plan)
+            device_type = generator.random.choice(device_types["additional_sign"])
+            additional_sign_plans.append(
+                AdditionalSignPlan(
+                    plan=plan,
+                    mount_plan=mount_plan,
+                    parent=traffic_sign_plan,
+                    device_type=device_type,
+                    content_s=_additional_sign_content(generator, device_type),
+                    missing_content=device_type.content_schema is None,
+                    **generator.device_fields(owners[0], len(additional_sign_plans), location),
+                )
+            )
+            signpost_plans.append(
+                SignpostPlan(
+                    plan=plan,
+                    mount_plan=mount_plan,
+                    device_type=generator.random.choice(device_types["signpost"]),
+                    **generator.device_fields(owners[0], len(signpost_plans), location),
+                )
+            )
+    generator.bulk_create(MountPlan, mount_plans)
+    generator.bulk_create(TrafficSignPlan, traffic_sign_plans)
+    generator.bulk_create(AdditionalSignPlan, additional_sign_plans)
+    generator.bulk_create(SignpostPlan, signpost_plans)
+
+    replaced = generator.random.sample(
+        traffic_sign_plans, int(len(traffic_sign_plans) * REPLACED_TRAFFIC_SIGN_PLAN_SHARE)
+    )
+    new_plans = [
+        TrafficSignPlan(
+            plan=old.plan,
+            mount_plan=old.mount_plan,
+            device_type=generator.random.choice(device_types["traffic_sign"]),
+            **generator.device_fields(owners[0], len(traffic_sign_plans) + index, old.location),
+        )
+        for index, old in enumerate(replaced)
+    ]
+    generator.bulk_create(TrafficSignPlan, new_plans)
+    generator.bulk_create(
+        TrafficSignPlanReplacement,
+        [TrafficSignPlanReplacement(old=old, new=new) for old, new in zip(replaced, new_plans)],
+    )
+    Plan.objects.filter(pk__in=[plan.pk for plan in plans]).update_derived_locations()
+    return traffic_sign_plans
+
+
+def _create_reals(generator: _Generator, mount_count: int, owners, mount_types, device_types, traffic_sign_plans):
+    """Create mounts with traffic signs, additional signs and signposts, some of them at planned locations"""
+    realized_plans = generator.random.sample(traffic_sign_plans, int(len(traffic_sign_plans) * REALIZED_PLAN_SHARE))
+    mounts = []
+    for index in range(mount_count):
+        location = realized_plans[index].location if index < len(realized_plans) else generator.point()
+        mounts.append(
+            MountReal(
+                mount_type=generator.random.choice(mount_types),
+                **generator.device_fields(owners[0], index, generator.point(near=location, distance=0.5)),
+            )
+        )
+    generator.bulk_create(MountReal, mounts)
+
+    traffic_signs = []
+    for index in range(int(mount_count * TRAFFIC_SIGNS_PER_MOUNT)):
+        mount = mounts[index % mount_count]
+        traffic_sign_plan = realized_plans[index] if index < len(realized_plans) else None
+        device_type = traffic_sign_plan.device_type if traffic_sign_plan else None
+        traffic_signs.append(
+            TrafficSignReal(
+                mount_real=mount,
+                mount_type=mount.mount_type,
+                device_type=device_type or generator.random.choice(device_types["traffic_sign"]),
+                traffic_sign_plan=traffic_sign_plan if generator.random.random() < 0.5 else None,
+                **generator.device_fields(
+                    generator.random.choice(owners), index, generator.point(near=mount.location, distance=0.5)
+                ),
+            )
+        )
+    generator.bulk_create(TrafficSignReal, traffic_signs)
+
+    additional_signs = []
+    for index in range(int(len(traffic_signs) * ADDITIONAL_SIGNS_PER_TRAFFIC_SIGN)):
+        parent = traffic_signs[index]
+        device_type = generator.random.choice(device_types["additional_sign"])
+        additional_signs.append(
+            AdditionalSignReal(
+                parent=parent,
+                mount_real=parent.mount_real,
+                mount_type=parent.mount_type,
+                device_type=device_type,
+                content_s=_additional_sign_content(generator, device_type),
+                missing_content=device_type.content_schema is None,
+                **generator.device_fields(owners[0], index, generator.point(near=parent.location, distance=0.2)),
+            )
+        )
+    generator.bulk_create(AdditionalSignReal, additional_signs)
+
+    signposts = []
+    for index in range(int(mount_count * SIGNPOSTS_PER_MOUNT)):
+        mount = mounts[-(index + 1)]
+        signposts.append(
+            SignpostReal(
+                mount_real=mount,
+                device_type=generator.random.choice(device_types["signpost"]),
+                txt=f"Synthetic signpost {index}",
+                **generator.device_fields(owners[0], index, generator.point(near=mount.location, distance=0.5)),
+            )
+        )
+    generator.bulk_create(SignpostReal, signposts)
+
+
+def is_synthetic_city_generated() -> bool:
+    return MountReal.objects.filter(source_name=SYNTHETIC_SOURCE_NAME).exists()
+
+
+@transaction.atomic
+def generate_synthetic_city(mount_count: int = 20000, seed: int = 1, batch_size: int = 2000) -> SyntheticCity:
+    """
+    Generate a synthetic city of mount_count mounts with traffic signs, additional signs with content, signposts,
+    and plans with device plans and replacements. Returns the number of rows created per model.
+    """
+    generator = _Generator(seed, batch_size)
+    owners, mount_types, device_types = _get_or_create_reference_data()
+    traffic_sign_plans = _create_plans(generator, mount_count, owners, mount_types, device_types)
+    _create_reals(generator, mount_count, owners, mount_types, device_types, traffic_sign_plans)
+    return SyntheticCity(seed=seed, counts=generator.counts)
+
+
+STREETSCAN_MOUNT_CSV_HEADER = [
+    "OBJECTID",
+    CSVHeadersV2.id,
+    CSVHeadersV2.coord_x,
+    CSVHeadersV2.coord_y,
+    CSVHeadersV2.coord_z,
+    "stdx",
+    "stdy",
+    "stdz",
+    CSVHeadersV2.status,
+    CSVHeadersV2.mount_scanned_at,
+    CSVHeadersV2.attachment_url,
+]
+STREETSCAN_SIGN_CSV_HEADER = [
+    "OBJECTID",
+    CSVHeadersV2.id,
+    CSVHeadersV2.coord_x,
+    CSVHeadersV2.coord_y,
+    CSVHeadersV2.coord_z,
+    "stdx",
+    "stdy",
+    "stdz",
+    CSVHeadersV2.mount_id,
+    CSVHeadersV2.status,
+    CSVHeadersV2.code,
+    CSVHeadersV2.txt,
+    "teksti_suomeksi",
+    "teksti_ruotsiksi",
+    CSVHeadersV2.sign_mount_type,
+    CSVHeadersV2.number_code,
+    CSVHeadersV2.condition,
+    CSVHeadersV2.color,
+    CSVHeadersV2.direction,
+    CSVHeadersV2.parent_sign_id,
+    CSVHeadersV2.scanned_at,
+    CSVHeadersV2.height,
+    CSVHeadersV2.attachment_url,
+]
+STREETSCAN_SCANNED_AT = "2025/08/15 12:00:00+00"
+
+
+def write_streetscan_csv_files(directory: Path, mount_count: int, seed: int = 1) -> Tuple[str, str]:
+    """
+    Write StreetScan V2 mount and sign CSV files of a scan of mount_count mounts, each with a traffic sign and every
+    other one with an additional sign, for benchmarking TrafficSignImporterV2. Returns the (mount file, sign file).
+    """
+    generator = _Generator(seed, batch_size=0)
+    mount_rows, sign_rows = [], []
+    for index in range(mount_count):
+        location = generator.point()
+        mount_id = f"SM{index}"
+        coordinates = [str(location.x), str(location.y), str(location.z), "0.01", "0.01", "0.01"]
+        mount_rows.append(["1", mount_id, *coordinates, "New", STREETSCAN_SCANNED_AT, ""])
+        sign_id = f"SS{index}"
+        code = generator.random.choice(TRAFFIC_SIGN_CODES)
+        sign_rows.append(_streetscan_sign_row(sign_id, coordinates, mount_id, code, parent_sign_id=""))
+        if index % 2 == 0:
+            sign_rows.append(_streetscan_sign_row(f"SA{index}", coordinates, mount_id, "H4", parent_sign_id=sign_id))
+
+    mount_file = directory / "synthetic_mounts.csv"
+    sign_file = directory / "synthetic_signs.csv"
+    for path, header, rows in (
+        (mount_file, STREETSCAN_MOUNT_CSV_HEADER, mount_rows),
+        (sign_file, STREETSCAN_SIGN_CSV_HEADER, sign_rows),
+    ):
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+    return str(mount_file), str(sign_file)
+
+
+def _streetscan_sign_row(sign_id: str, coordinates: List[str], mount_id: str, code: str, parent_sign_id: str):
+    return [
+        "1",
+        sign_id,
+        *coordinates,
+        mount_id,
+        "New",
+        code,
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        "",
+        parent_sign_id,
+        STREETSCAN_SCANNED_AT,
+        "2.5",
+        "",
+    ]
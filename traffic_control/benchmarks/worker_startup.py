@@ -0,0 +1,89 @@
+"""
+Measurement of the startup of a web worker process, run in a fresh interpreter by the benchmark_worker_startup
+management command:
+
+    python -X importtime -m traffic_control.benchmarks.worker_startup lazy|preload
+
+In lazy mode the process loads the application itself, like uWSGI workers with lazy-apps. In preload mode the
+process loads and warms up the application like the uWSGI master, see cityinfra.preload, and forks a worker. The
+worker then handles the first requests, and its memory use is measured after them. Prints the measurements as JSON.
+
+Only the standard library may be imported at the module level, as the imports of the application are measured.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, Optional
+
+FIRST_REQUEST_PATHS = (
+    "/v1/trafficsignreals/?limit=10",
+    "/wfs/?SERVICE=WFS&VERSION=2.0.0&REQUEST=GetCapabilities",
+    "/openapi.yaml",
+)
+
+
+def read_memory() -> Dict[str, Optional[int]]:
+    """Return the resident and unique (private) memory of the current process in kilobytes, where available"""
+    memory = {"rss_kb": None, "uss_kb": None}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            values = {line.split(":")[0]: int(line.split()[1]) for line in f if line.rstrip().endswith("kB")}
+    except OSError:
+        return memory
+    memory["rss_kb"] = values.get("Rss")
+    memory["uss_kb"] = values.get("Private_Clean", 0) + values.get("Private_Dirty", 0)
+    return memory
+
+
+def handle_first_requests() -> Dict[str, float]:
+    from django.test import Client
+    from django.test.utils import setup_test_environment
+
+    # Allows the test client host name
+    setup_test_environment()
+    client = Client()
+    durations = {}
+    for path in FIRST_REQUEST_PATHS:
+        start = time.perf_counter()
+        response = client.get(path)
+        if response.streaming:
+            b"".join(response.streaming_content)
+        durations[path] = time.perf_counter() - start
+    return durations
+
+
+def measure_worker() -> dict:
+    return {"first_requests": handle_first_requests(), **read_memory()}
+
+
+def main(mode: str) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cityinfra.settings")
+    os.environ["WSGI_PRELOAD"] = "1" if mode == "preload" else "0"
+
+    start = time.perf_counter()
+    import cityinfra.wsgi  # noqa: F401
+
+    result = {"mode": mode, "load_seconds": time.perf_counter() - start, "loaded": read_memory()}
+
+    if mode == "lazy":
+        result["worker"] = measure_worker()
+    else:
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            with os.fdopen(write_fd, "w") as f:
+                json.dump(measure_worker(), f)
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            result["worker"] = json.load(f)
+        os.waitpid(pid, 0)
+
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
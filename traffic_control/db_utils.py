@@ -1,7 +1,15 @@
-from django.db.models import CharField, Func
+from django.db.models import Aggregate, CharField, Func
 
 
 class SplitPart(Func):
     function = "SPLIT_PART"
     arity = 3
     output_field = CharField()
+
+
+class Mode(Aggregate):
+    """Most frequent value of the expression in the group (PostgreSQL ordered-set aggregate)"""
+
+    function = "MODE"
+    name = "Mode"
+    template = "%(function)s() WITHIN GROUP (ORDER BY %(expressions)s)"
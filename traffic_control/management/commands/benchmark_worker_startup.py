@@ -0,0 +1,98 @@
+"""Management command to benchmark the startup time and memory use of web worker processes."""
+
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+from django.conf import settings
+from django.core.management.base import CommandError, CommandParser
+
+from command_tracker.management.trackable_command import TrackableCommand
+
+MODES = ("lazy", "preload")
+IMPORT_TIME_PREFIX = "import time:"
+
+
+class Command(TrackableCommand):
+    help = (
+        "Benchmark the startup of web worker processes with and without preloading the application in the uWSGI "
+        "master process: application load time, slowest imports, first request times and worker memory use."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--runs", type=int, default=3, help="Startups measured per mode. Default: 3.")
+        parser.add_argument(
+            "--top-imports", type=int, default=15, help="Slowest top level imports to report. Default: 15."
+        )
+        parser.add_argument("--output", type=str, help="Write the results as JSON to this file.")
+
+    def handle(self, *args, **options):
+        output = {mode: self._benchmark_mode(mode, options["runs"], options["top_imports"]) for mode in MODES}
+
+        for mode, result in output.items():
+            worker = result["worker"]
+            self.stdout.write(
+                f"{mode}: load {result['load_seconds']:.2f} s, "
+                f"first requests {sum(worker['first_requests'].values()):.2f} s, "
+                f"worker RSS {worker['rss_kb']} kB, worker unique memory {worker['uss_kb']} kB"
+            )
+        self.stdout.write("Slowest imports:")
+        for module, seconds in output["lazy"]["imports"].items():
+            self.stdout.write(f"  {module}: {seconds:.3f} s")
+
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(output, indent=2))
+            self.stdout.write(f"Results written to {options['output']}.")
+
+    def _benchmark_mode(self, mode: str, runs: int, top_imports: int) -> dict:
+        results = [self._run_worker(mode) for _ in range(runs)]
+        return {
+            "runs": runs,
+            "load_seconds": statistics.median(result["load_seconds"] for result in results),
+            "loaded": _median_memory([result["loaded"] for result in results]),
+            "worker": {
+                "first_requests": {
+                    path: statistics.median(result["worker"]["first_requests"][path] for result in results)
+                    for path in results[0]["worker"]["first_requests"]
+                },
+                **_median_memory([result["worker"] for result in results]),
+            },
+            "imports": _slowest_imports(results[-1]["import_times"], top_imports),
+        }
+
+    @staticmethod
+    def _run_worker(mode: str) -> dict:
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "traffic_control.benchmarks.worker_startup", mode],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+        )
+        if process.returncode != 0:
+            raise CommandError(f"Worker startup in {mode} mode failed:\n{process.stderr[-5000:]}")
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+        result["import_times"] = [line for line in process.stderr.splitlines() if line.startswith(IMPORT_TIME_PREFIX)]
+        return result
+
+
+def _median_memory(memories: List[dict]) -> dict:
+    return {
+        key: statistics.median(memory[key] for memory in memories) if memories[0][key] is not None else None
+        for key in ("rss_kb", "uss_kb")
+    }
+
+
+def _slowest_imports(import_times: List[str], count: int) -> dict:
+    """Return the cumulative import times in seconds of the slowest top level packages from -X importtime output"""
+    packages = {}
+    for line in import_times:
+        _self_time, cumulative_time, name = line[len(IMPORT_TIME_PREFIX) :].split("|")
+        # Nested imports are indented
+        if name.startswith("  ") or not cumulative_time.strip().isdigit():
+            continue
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(cumulative_time) / 1_000_000
+    return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)[:count])
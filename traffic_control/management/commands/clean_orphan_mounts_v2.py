@@ -1,17 +1,40 @@
 """Management command to clean orphan MountReal records from V2 StreetScan imports."""
+import argparse
 from typing import Any
-from uuid import UUID
 
 from auditlog.context import set_actor
 from django.core.management.base import CommandParser
-from django.db import transaction
 
 from command_tracker.management.trackable_command import TrackableCommand
-from traffic_control.analyze_utils.traffic_sign_data_v2_import import SOURCE_NAME, TrafficSignImporterV2
-from traffic_control.models import MountReal
+from traffic_control.analyze_utils.traffic_sign_data_v2_import import (
+    ORPHAN_MOUNT_CHUNK_SIZE,
+    SOURCE_NAME,
+    TrafficSignImporterV2,
+)
 from users.utils import get_system_user
 
 
+def positive_int(value: str) -> int:
+    """Parse a command-line argument as an integer of at least 1.
+
+    Args:
+        value (str): Argument value given on the command line.
+
+    Returns:
+        int: Parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer of at least 1.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 class Command(TrackableCommand):
     """Hard-delete orphan MountReal records scoped to the V2 StreetScan import source.
 
@@ -22,6 +45,9 @@ class Command(TrackableCommand):
     Use --dry-run to preview the mounts that would be deleted without making any
     database changes. Combine with --dry-run-detail to choose between a count summary
     (default) and a full list of UUIDs.
+
+    Mounts are deleted in chunks of --chunk-size, each committed separately, so the
+    cleanup can run against the full mount table without holding long locks.
     """
 
     help = (
@@ -55,6 +81,16 @@ class Command(TrackableCommand):
                 "'ids' prints each orphan mount UUID on a separate line."
             ),
         )
+        parser.add_argument(
+            "--chunk-size",
+            type=positive_int,
+            default=ORPHAN_MOUNT_CHUNK_SIZE,
+            dest="chunk_size",
+            help=(
+                f"Number of orphan mounts deleted per transaction (default {ORPHAN_MOUNT_CHUNK_SIZE}). "
+                "Progress is reported after each committed chunk."
+            ),
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Execute the orphan mount cleanup command.
@@ -72,7 +108,7 @@ class Command(TrackableCommand):
                 self._handle_dry_run(dry_run_detail)
                 return
 
-            self._handle_delete()
+            self._handle_delete(options["chunk_size"])
 
     def _handle_dry_run(self, detail: str) -> None:
         """Preview orphan mounts without making database changes.
@@ -80,38 +116,45 @@ class Command(TrackableCommand):
         Args:
             detail (str): Level of detail to display — 'count' or 'ids'.
         """
-        orphan_ids: set[UUID] = TrafficSignImporterV2.get_orphan_mount_ids()
+        count: int = TrafficSignImporterV2.get_orphan_mounts().count()
         self.stdout.write(self.style.WARNING("DRY RUN — no database changes will be made"))
 
         if detail == "ids":
-            self._print_orphan_ids(orphan_ids)
+            self._print_orphan_ids(count)
             return
 
-        self.stdout.write(f"Orphan mounts that would be deleted: {len(orphan_ids)}")
+        self.stdout.write(f"Orphan mounts that would be deleted: {count}")
 
-    def _print_orphan_ids(self, orphan_ids: set[UUID]) -> None:
-        """Print each orphan mount UUID to stdout.
+    def _print_orphan_ids(self, count: int) -> None:
+        """Print each orphan mount UUID to stdout, streamed from a server-side cursor.
 
         Args:
-            orphan_ids (set[UUID]): Set of orphan MountReal primary keys.
+            count (int): Number of orphan mounts.
         """
-        self.stdout.write(f"Orphan mounts that would be deleted ({len(orphan_ids)}):")
-        for mount_id in sorted(str(oid) for oid in orphan_ids):
+        self.stdout.write(f"Orphan mounts that would be deleted ({count}):")
+        orphan_ids = TrafficSignImporterV2.get_orphan_mounts().order_by("id").values_list("id", flat=True)
+        for mount_id in orphan_ids.iterator(chunk_size=ORPHAN_MOUNT_CHUNK_SIZE):
             self.stdout.write(f"  {mount_id}")
 
-    @transaction.atomic
-    def _handle_delete(self) -> None:
-        """Hard-delete all orphan mounts scoped to SOURCE_NAME and report the result.
+    def _handle_delete(self, chunk_size: int) -> None:
+        """Hard-delete all orphan mounts scoped to SOURCE_NAME in chunks and report the progress.
+
+        Args:
+            chunk_size (int): Maximum number of mounts deleted per transaction.
 
         Returns:
             None
         """
-        orphan_ids: set[UUID] = TrafficSignImporterV2.get_orphan_mount_ids()
-        count: int = len(orphan_ids)
+        count: int = TrafficSignImporterV2.get_orphan_mounts().count()
 
         if count == 0:
             self.stdout.write(self.style.SUCCESS("No orphan mounts found — nothing to delete."))
             return
 
-        MountReal.objects.filter(id__in=orphan_ids).delete()
-        self.stdout.write(self.style.SUCCESS(f"Deleted {count} orphan mount(s) with source_name='{SOURCE_NAME}'."))
+        def report_progress(source_ids: list[str], deleted_count: int) -> None:
+            self.stdout.write(f"Deleted {deleted_count}/{count} orphan mount(s)")
+
+        deleted_count = TrafficSignImporterV2.delete_orphan_mounts(chunk_size=chunk_size, on_chunk=report_progress)
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted_count} orphan mount(s) with source_name='{SOURCE_NAME}'.")
+        )
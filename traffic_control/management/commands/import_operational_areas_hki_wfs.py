@@ -1,59 +1,236 @@
+import hashlib
 from datetime import datetime
+from itertools import islice
 from urllib.request import urlretrieve
 
 from auditlog.context import set_actor
+from django.conf import settings
 from django.contrib.gis.gdal import DataSource
+from django.core.management.base import CommandError
+from django.db import transaction
 
 from command_tracker.management.trackable_command import TrackableCommand
+from traffic_control.geometry_utils import geometry_is_legit
 from traffic_control.models import OperationalArea
+from traffic_control.utils.data_version import bump_data_version
 from users.utils import get_system_user
 
 SOURCE_NAME = "urakkarajat_katu"
 WFS_SOURCE_URL = "https://kartta.hel.fi/ws/geoserver/avoindata/wfs"
 SOURCE_LAYER = "Vastuualue_rya_urakkarajat"
 DATE_FORMAT = "%Y-%m-%d"
+SOURCE_TASK = "KATU"
+# Number of features compared and upserted at a time by --bulk-sync
+BULK_SYNC_BATCH_SIZE = 500
+# Largest fraction of the active areas deactivated by one import without --force
+MAX_DEACTIVATED_FRACTION = 0.5
+# OperationalArea fields synced from the source features
+SYNCED_FIELDS = (
+    "name",
+    "name_short",
+    "area_type",
+    "contractor",
+    "start_date",
+    "end_date",
+    "updated_date",
+    "task",
+    "status",
+    "location",
+)
 
 
 def parse_date(date_str):
     return datetime.strptime(date_str, DATE_FORMAT).date()
 
 
+def get_area_values(feature):
+    """Return the values of the synced OperationalArea fields of a source feature"""
+    gdal_geometry = feature.geom
+    gdal_geometry.set_3d(True)
+    location = gdal_geometry.geos
+    if location.srid and location.srid != settings.SRID:
+        location.transform(settings.SRID)
+    return {
+        "name": feature["nimi"].value,
+        "name_short": feature["nimi_lyhyt"].value,
+        "area_type": feature["urakkamuoto"].value,
+        "contractor": feature["urakoitsija"].value,
+        "start_date": parse_date(feature["alku_pvm"].value),
+        "end_date": parse_date(feature["loppu_pvm"].value),
+        "updated_date": parse_date(feature["paivitetty_tietopalveluun"].value),
+        "task": feature["tehtavakokonaisuus"].value,
+        "status": feature["status"].value,
+        "location": location,
+    }
+
+
+def get_area_hash(values):
+    """Return a digest of the synced attribute values and the geometry of an area"""
+    digest = hashlib.sha256(repr(tuple(values[name] for name in SYNCED_FIELDS if name != "location")).encode())
+    digest.update(values["location"].wkb)
+    return digest.hexdigest()
+
+
 class Command(TrackableCommand):
     help = "Import operational areas from Helsinki WFS"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            help="Read the features from a local GeoJSON or GML file instead of the Helsinki WFS",
+        )
+        parser.add_argument(
+            "--bulk-sync",
+            action="store_true",
+            default=False,
+            help=(
+                "Upsert the areas in batches and skip unchanged areas, in one transaction. Bulk operations do not "
+                "write audit log entries for the changed areas."
+            ),
+        )
+        parser.add_argument(
+            "--max-deactivated-fraction",
+            type=float,
+            default=MAX_DEACTIVATED_FRACTION,
+            help=(
+                "Refuse to deactivate more than this fraction of the active areas "
+                f"(default: {MAX_DEACTIVATED_FRACTION})"
+            ),
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            default=False,
+            help="Deactivate the areas no longer in the source even if no features matched or too many would vanish",
+        )
+
     def handle(self, *args, **options):
+        self.force = options["force"]
+        self.max_deactivated_fraction = options["max_deactivated_fraction"]
         with set_actor(get_system_user()):
-            self.stdout.write("Importing operational areas from Helsinki WFS ...")
-            url = f"{WFS_SOURCE_URL}?service=wfs&version=2.0.0&request=GetFeature&typeNames={SOURCE_LAYER}"
-            filename, _ = urlretrieve(url)
-            ds = DataSource(filename)
-            created = 0
-            synced = 0
-            for feature in ds[0]:
-                if feature["tehtavakokonaisuus"].value == "KATU":
-                    gdal_geometry = feature.geom
-                    gdal_geometry.set_3d(True)
-                    start_date = parse_date(feature["alku_pvm"].value)
-                    end_date = parse_date(feature["loppu_pvm"].value)
-                    updated_date = parse_date(feature["paivitetty_tietopalveluun"].value)
-                    _, created_new = OperationalArea.objects.update_or_create(
-                        source_name=SOURCE_NAME,
-                        source_id=feature["id"].value,
-                        defaults={
-                            "name": feature["nimi"].value,
-                            "name_short": feature["nimi_lyhyt"].value,
-                            "area_type": feature["urakkamuoto"].value,
-                            "contractor": feature["urakoitsija"].value,
-                            "start_date": start_date,
-                            "end_date": end_date,
-                            "updated_date": updated_date,
-                            "task": feature["tehtavakokonaisuus"].value,
-                            "status": feature["status"].value,
-                            "location": gdal_geometry.geos,
-                        },
-                    )
-                    created += int(created_new)
-                    synced += 1
-            self.stdout.write(
-                f"{len(ds[0])} features found, {synced - created} synced from source ({created} newly created)."
+            if options["file"]:
+                self.stdout.write(f"Importing operational areas from {options['file']} ...")
+                filename = options["file"]
+            else:
+                self.stdout.write("Importing operational areas from Helsinki WFS ...")
+                url = f"{WFS_SOURCE_URL}?service=wfs&version=2.0.0&request=GetFeature&typeNames={SOURCE_LAYER}"
+                filename, _ = urlretrieve(url)
+            layer = DataSource(filename)[0]
+            features = (feature for feature in layer if feature["tehtavakokonaisuus"].value == SOURCE_TASK)
+            if options["bulk_sync"]:
+                self.bulk_sync(layer, features)
+            else:
+                self.sync(layer, features)
+
+    def check_deactivation(self, source_ids, deactivated_count):
+        """
+        Refuse to deactivate the areas when no source features matched or more than the allowed fraction of the active
+        areas would be deactivated, which most likely means the source returned incomplete data, unless forced
+        """
+        if self.force or not deactivated_count:
+            return
+        if not source_ids:
+            raise CommandError(
+                f"No features matched in the source, refusing to deactivate {deactivated_count} areas. "
+                "Use --force to deactivate them anyway."
+            )
+        active_count = OperationalArea.objects.filter(source_name=SOURCE_NAME, is_active=True).count()
+        if deactivated_count > active_count * self.max_deactivated_fraction:
+            raise CommandError(
+                f"Refusing to deactivate {deactivated_count} of {active_count} active areas, more than the allowed "
+                f"fraction {self.max_deactivated_fraction}. Use --force to deactivate them anyway."
+            )
+
+    def sync(self, layer, features):
+        """Create or update the areas one at a time"""
+        created = 0
+        synced = 0
+        source_ids = set()
+        for feature in features:
+            source_id = str(feature["id"].value)
+            _, created_new = OperationalArea.objects.update_or_create(
+                source_name=SOURCE_NAME,
+                source_id=source_id,
+                defaults={**get_area_values(feature), "is_active": True},
+            )
+            source_ids.add(source_id)
+            created += int(created_new)
+            synced += 1
+
+        vanished_areas = OperationalArea.objects.filter(source_name=SOURCE_NAME, is_active=True).exclude(
+            source_id__in=source_ids
+        )
+        self.check_deactivation(source_ids, vanished_areas.count())
+        deactivated = 0
+        for area in vanished_areas:
+            area.is_active = False
+            area.save(update_fields=["is_active"])
+            deactivated += 1
+
+        self.stdout.write(
+            f"{len(layer)} features found, {synced - created} synced from source ({created} newly created)."
+        )
+        self.stdout.write(f"{deactivated} areas no longer in source deactivated.")
+
+    @transaction.atomic
+    def bulk_sync(self, layer, features):
+        """
+        Upsert the changed areas in batches of BULK_SYNC_BATCH_SIZE features, comparing hashes of the synced values to
+        skip unchanged areas, and deactivate the areas no longer in the source
+        """
+        created = 0
+        updated = 0
+        unchanged = 0
+        source_ids = set()
+        while batch := list(islice(features, BULK_SYNC_BATCH_SIZE)):
+            values_by_source_id = {}
+            for feature in batch:
+                source_id = str(feature["id"].value)
+                # Areas with an illegal geometry are kept as they are, not deactivated
+                source_ids.add(source_id)
+                values = get_area_values(feature)
+                if not geometry_is_legit(values["location"]):
+                    self.stdout.write(self.style.WARNING(f"Skipping feature {source_id}, its geometry is not legal"))
+                    continue
+                values_by_source_id[source_id] = values
+
+            existing_rows = {
+                row["source_id"]: row
+                for row in OperationalArea.objects.filter(
+                    source_name=SOURCE_NAME, source_id__in=values_by_source_id.keys()
+                ).values("source_id", "is_active", *SYNCED_FIELDS)
+            }
+            changed_areas = []
+            for source_id, values in values_by_source_id.items():
+                row = existing_rows.get(source_id)
+                if row is not None and row["is_active"] and get_area_hash(row) == get_area_hash(values):
+                    unchanged += 1
+                    continue
+                if row is None:
+                    created += 1
+                else:
+                    updated += 1
+                changed_areas.append(
+                    OperationalArea(source_name=SOURCE_NAME, source_id=source_id, is_active=True, **values)
+                )
+            OperationalArea.objects.bulk_create(
+                changed_areas,
+                update_conflicts=True,
+                unique_fields=["source_name", "source_id"],
+                update_fields=[*SYNCED_FIELDS, "is_active"],
             )
+
+        vanished_areas = OperationalArea.objects.filter(source_name=SOURCE_NAME, is_active=True).exclude(
+            source_id__in=source_ids
+        )
+        self.check_deactivation(source_ids, vanished_areas.count())
+        deactivated = vanished_areas.update(is_active=False)
+        if created or updated or deactivated:
+            # Bulk operations don't send the signals bumping the data version of each saved row
+            bump_data_version(OperationalArea._meta.db_table)
+
+        self.stdout.write(
+            f"{len(layer)} features found, {updated} synced from source ({created} newly created), "
+            f"{unchanged} unchanged."
+        )
+        self.stdout.write(f"{deactivated} areas no longer in source deactivated.")
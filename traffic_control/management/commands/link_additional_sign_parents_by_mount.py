@@ -15,6 +15,7 @@ from traffic_control.models import (
     SignpostReal,
     TrafficSignReal,
 )
+from traffic_control.utils.data_version import bump_data_version
 from users.utils import get_system_user
 
 PARENT_FIELD = "parent"
@@ -337,6 +338,8 @@ class Command(TrackableCommand):
             fields=[PARENT_FIELD, SIGNPOST_FIELD, "updated_by"],
             batch_size=500,
         )
+        # bulk_update doesn't send the post_save signals bumping the data version
+        bump_data_version(AdditionalSignReal._meta.db_table)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -26,6 +26,7 @@ from traffic_control.models.traffic_sign import (
     TrafficSignReal,
     TrafficSignRealFile,
 )
+from traffic_control.utils.data_version import bump_data_version
 
 logger = logging.getLogger(__name__)
 
@@ -360,6 +361,7 @@ class Command(BaseMigrationCommand):
         count = affected.count()
         if count:
             affected.update(parent=None, signpost_plan=new_plan)
+            bump_data_version(AdditionalSignPlan._meta.db_table)
             self.stdout.write(f"    ↳ Re-parented {count} AdditionalSignPlan(s) → SignpostPlan {new_plan.id}")
 
     def _reparent_additional_sign_reals(self, ts_real: TrafficSignReal, new_real: SignpostReal) -> None:
@@ -376,4 +378,5 @@ class Command(BaseMigrationCommand):
         count = affected.count()
         if count:
             affected.update(parent=None, signpost_real=new_real)
+            bump_data_version(AdditionalSignReal._meta.db_table)
             self.stdout.write(f"    ↳ Re-parented {count} AdditionalSignReal(s) → SignpostReal {new_real.id}")
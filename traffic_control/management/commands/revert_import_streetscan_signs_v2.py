@@ -1,17 +1,22 @@
 import argparse
 import json
+import os
 from collections import defaultdict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Literal
+from typing import Iterator, Literal
 
 from auditlog.context import set_actor
 from django.apps import apps
-from django.core.management import CommandParser
-from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, CommandParser
+from django.db import connection, models, transaction
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from command_tracker.management.trackable_command import TrackableCommand
 from traffic_control.models import AdditionalSignReal, MountReal, SignpostReal, TrafficSignReal
+from traffic_control.utils.data_version import bump_data_version
 from users.models import User
 from users.utils import get_system_user
 
@@ -35,8 +40,61 @@ REVERT_PHASES = (
     (MountReal, "update"),
     (MountReal, "create"),
 )
+ORPHAN_PHASE = "orphans"
 model_class_map = {model.__name__: model for model, _ in REVERT_PHASES}
 
+# Foreign keys cleared before the objects they point to are deleted by reverted create operations
+DEPENDENT_RELATIONS = {
+    MountReal: ((AdditionalSignReal, "mount_real"), (SignpostReal, "mount_real"), (TrafficSignReal, "mount_real")),
+    SignpostReal: ((AdditionalSignReal, "signpost_real"), (SignpostReal, "parent")),
+    TrafficSignReal: ((AdditionalSignReal, "parent"),),
+}
+ORPHAN_MODELS = (AdditionalSignReal, SignpostReal, TrafficSignReal)
+# Fields of the revert records set to the reverting user and time instead of their old values
+AUDIT_FIELD_NAMES = ("updated_by", "updated_by_id", "updated_at")
+
+# Temporary tables of the database session, holding the revert file and the objects orphaned by the revert
+ACTION_TABLE = "streetscan_revert_action"
+ORPHAN_TABLE = "streetscan_revert_orphan"
+
+
+@dataclass
+class RevertCheckpoint:
+    """Progress of a revert, saved after each committed phase so that an interrupted revert can be resumed"""
+
+    file_path: str
+    ids: list[str]
+    model_names: list[str]
+    timestamp: datetime
+    completed_phases: list[str] = field(default_factory=list)
+    orphaned_pks: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> "RevertCheckpoint":
+        with open(path, "rt") as file:
+            data = json.load(file)
+        data["timestamp"] = parse_datetime(data["timestamp"])
+        return cls(**data)
+
+    def save(self, path: str) -> None:
+        # Written to a temporary file first, so that an interruption can't leave a partially written checkpoint
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wt") as file:
+            json.dump({**asdict(self), "timestamp": self.timestamp.isoformat()}, file)
+        os.replace(tmp_path, path)
+
+
+def to_db_text(model_field: models.Field, value) -> str | None:
+    """Convert a value of a revert record to the text representation of its database value"""
+    if value is None:
+        return None
+    try:
+        value = model_field.get_prep_value(model_field.to_python(value))
+    except (TypeError, ValueError, ValidationError):
+        # Kept as is, only an error if the action is reverted
+        return str(value)
+    return None if value is None else str(value)
+
 
 class SplitStringsAction(argparse.Action):
     """Argparse Action to transform a "foo,bar,baz" argument into ["foo", "bar", "baz"]."""
@@ -80,11 +138,24 @@ class Command(TrackableCommand):
             dest="model_names",
             action=SplitStringsAction,
         )
+        parser.add_argument(
+            "--resume",
+            help="Resume an interrupted revert from its checkpoint file, skipping the phases it has completed",
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--checkpoint-file",
+            help="Checkpoint file of the revert progress. Default: the revert file name with .checkpoint.json suffix",
+            default=None,
+            metavar="FILE",
+        )
         parser.epilog = (
             "Note: When running a partial revert, the revert operation may bring more models or objects to the "
             "the operation. For example if a mount created by an import operation is removed, all objects that had "
             "their mount set to that object will be reverted as well. These side-effect reversals cascade to any "
-            "dependent objects."
+            "dependent objects. Each phase of the revert is committed separately and recorded in the checkpoint "
+            "file, which is removed when the revert is complete."
         )
 
     def handle(
@@ -94,9 +165,21 @@ class Command(TrackableCommand):
         file_path: str,
         ids: list[str],
         model_names: list[str],
+        resume: bool,
+        checkpoint_file: str | None,
         **_kwargs: dict,
     ) -> None:
-        timestamp = timezone.now()
+        file_path = str(file_path)
+        checkpoint_file = checkpoint_file or f"{file_path}.checkpoint.json"
+        if dry_run and resume:
+            raise CommandError("--resume can't be used with --dry-run")
+        if resume:
+            checkpoint = self.load_checkpoint(checkpoint_file, file_path=file_path, ids=ids, model_names=model_names)
+        else:
+            checkpoint = RevertCheckpoint(
+                file_path=file_path, ids=ids, model_names=model_names, timestamp=timezone.now()
+            )
+
         user = get_system_user()
         if dry_run:
             self.stdout.write("Running in --dry-run mode, all operations will be reverted at the end of the process")
@@ -104,217 +187,351 @@ class Command(TrackableCommand):
         self.stdout.write(f"Models to revert: {', '.join(model_names)}")
         self.stdout.write(f"Object IDs to revert: {', '.join(ids) if ids else 'all'}")
 
-        # [MODEL][ACTION_TYPE] -> [...ACTIONS]
-        actions_by_model_and_action_type: dict[type[ModelAffectedByImport], dict[str, list]] = defaultdict(
-            lambda: defaultdict(list)
-        )
-        # [MODEL][PK] -> UPDATE_ACTION
-        update_by_model_and_pk: dict[type[ModelAffectedByImport], dict[str, dict[str, str]]] = defaultdict(
-            lambda: defaultdict(dict)
+        revert_models = [apps.get_model("traffic_control", model_name) for model_name in model_names]
+        self.create_temporary_tables()
+        try:
+            self.fields_by_model_and_action_type = self.load_revert_file(file_path)
+            self.load_orphaned_pks(checkpoint.orphaned_pks)
+            with set_actor(user):
+                if dry_run:
+                    with transaction.atomic():
+                        self.run_phases(revert_models, checkpoint, user, checkpoint_file=None)
+                        self.stdout.write("Running in --dry-run mode, cancelling transaction.")
+                        transaction.set_rollback(True)
+                else:
+                    self.run_phases(revert_models, checkpoint, user, checkpoint_file=checkpoint_file)
+                    if os.path.exists(checkpoint_file):
+                        os.remove(checkpoint_file)
+        finally:
+            self.drop_temporary_tables()
+
+    def load_checkpoint(self, checkpoint_file: str, **arguments) -> RevertCheckpoint:
+        try:
+            checkpoint = RevertCheckpoint.load(checkpoint_file)
+        except FileNotFoundError:
+            raise CommandError(f"Checkpoint file {checkpoint_file} does not exist, unable to resume")
+        if {name: getattr(checkpoint, name) for name in arguments} != arguments:
+            raise CommandError(f"Checkpoint file {checkpoint_file} was saved by a revert with different arguments")
+        self.stdout.write(
+            f"Resuming the revert started at {checkpoint.timestamp}, completed phases: "
+            f"{', '.join(checkpoint.completed_phases) or 'none'}"
         )
+        return checkpoint
 
-        with open(file_path, "rt") as file:
-            for line in file:
-                if line:
-                    row = json.loads(line)
-                    action_type = row["action"]
-                    model = model_class_map.get(row["object_type"])
-                    actions_by_model_and_action_type[model][action_type].append(row)
-                    if action_type == "update":
-                        pk = row["db_id"]
-                        update_by_model_and_pk[model][pk] = row
-
-        revert_models = [apps.get_model("traffic_control", model_name) for model_name in model_names]
-        orphaned_pks_per_model: dict[type[ModelAffectedByImport], set[str]] = {
-            AdditionalSignReal: set(),
-            SignpostReal: set(),
-            TrafficSignReal: set(),
-        }
-        with set_actor(user), transaction.atomic():
-            # Phase A: Revert direct actions and collect orphaned objects
-            for model, action_type in REVERT_PHASES:
-                if model not in revert_models:
-                    continue
-                actions = actions_by_model_and_action_type[model][action_type]
-                actions.reverse()
-                self.stdout.write(f"Reverting {len(actions)} {action_type} operations for {model.__name__}...")
-                new_orphaned_pks_per_model = self.reverse_actions(
+    def run_phases(
+        self,
+        revert_models: list[type[ModelAffectedByImport]],
+        checkpoint: RevertCheckpoint,
+        user: User,
+        checkpoint_file: str | None,
+    ) -> None:
+        # Phase A: Revert direct actions and collect orphaned objects
+        for model, action_type in REVERT_PHASES:
+            phase = f"{model.__name__}:{action_type}"
+            if model not in revert_models:
+                continue
+            if phase in checkpoint.completed_phases:
+                self.stdout.write(f"Skipping {action_type} operations for {model.__name__}, already reverted")
+                continue
+            with transaction.atomic():
+                self.reverse_actions(
                     model=model,
                     action_type=action_type,
-                    actions=actions,
-                    limit_to_pks=ids,
+                    limit_to_pks=checkpoint.ids,
                     user=user,
-                    timestamp=timestamp,
+                    timestamp=checkpoint.timestamp,
                 )
-                for key, values in new_orphaned_pks_per_model.items():
-                    orphaned_pks_per_model[key].update(values)
-
-            # Phase B: Process objects orphaned by reverted actions
-            self.revert_updates_on_orphaned_objects(
-                orphaned_pks_per_model=orphaned_pks_per_model,
-                update_by_model_and_pk=update_by_model_and_pk,
-                user=user,
-                timestamp=timestamp,
+            self.save_checkpoint(checkpoint, phase, checkpoint_file)
+
+        # Phase B: Process objects orphaned by reverted actions
+        if ORPHAN_PHASE not in checkpoint.completed_phases:
+            with transaction.atomic():
+                self.revert_updates_on_orphaned_objects(user=user, timestamp=checkpoint.timestamp)
+            self.save_checkpoint(checkpoint, ORPHAN_PHASE, checkpoint_file)
+
+    def save_checkpoint(self, checkpoint: RevertCheckpoint, phase: str, checkpoint_file: str | None) -> None:
+        checkpoint.completed_phases.append(phase)
+        if checkpoint_file is None:
+            return
+        orphaned_pks = defaultdict(list)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT object_type, db_id FROM {ORPHAN_TABLE}")
+            for object_type, db_id in cursor.fetchall():
+                orphaned_pks[object_type].append(db_id)
+        checkpoint.orphaned_pks = dict(orphaned_pks)
+        checkpoint.save(checkpoint_file)
+
+    @staticmethod
+    def create_temporary_tables() -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {ACTION_TABLE}, {ORPHAN_TABLE}")
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {ACTION_TABLE} ("
+                "seq integer PRIMARY KEY, object_type text NOT NULL, action text NOT NULL, db_id text NOT NULL, "
+                "old jsonb NOT NULL)"
+            )
+            cursor.execute(f"CREATE INDEX ON {ACTION_TABLE} (object_type, action, db_id)")
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {ORPHAN_TABLE} ("
+                "object_type text NOT NULL, db_id text NOT NULL, PRIMARY KEY (object_type, db_id))"
+            )
+
+    @staticmethod
+    def drop_temporary_tables() -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {ACTION_TABLE}, {ORPHAN_TABLE}")
+
+    def load_revert_file(
+        self, file_path: str
+    ) -> dict[tuple[type[ModelAffectedByImport], str], dict[str, models.Field]]:
+        """Stream the revert file into the action table in chunks, with the old values converted to database values.
+
+        Returns: The fields with old values in the records, per model and action type."""
+        fields_by_model_and_action_type = defaultdict(dict)
+        rows = []
+        with open(file_path, "rt") as file:
+            for seq, line in enumerate(file):
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                model = model_class_map.get(row["object_type"])
+                if model is None:
+                    continue
+                fields = fields_by_model_and_action_type[(model, row["action"])]
+                old = {}
+                for name, value in row.get("old", {}).items():
+                    if name in AUDIT_FIELD_NAMES:
+                        continue
+                    if name not in fields:
+                        fields[name] = model._meta.get_field(name)
+                    old[name] = to_db_text(fields[name], value)
+                rows.append((seq, row["object_type"], row["action"], row["db_id"], json.dumps(old)))
+                if len(rows) >= BATCH_SIZE:
+                    self.insert_rows(ACTION_TABLE, ("seq", "object_type", "action", "db_id", "old"), rows)
+                    rows = []
+        self.insert_rows(ACTION_TABLE, ("seq", "object_type", "action", "db_id", "old"), rows)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {ACTION_TABLE}")
+        return fields_by_model_and_action_type
+
+    def load_orphaned_pks(self, orphaned_pks: dict[str, list[str]]) -> None:
+        rows = [(object_type, db_id) for object_type, db_ids in orphaned_pks.items() for db_id in db_ids]
+        for start in range(0, len(rows), BATCH_SIZE):
+            self.insert_rows(ORPHAN_TABLE, ("object_type", "db_id"), rows[start : start + BATCH_SIZE])
+
+    @staticmethod
+    def insert_rows(table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+        if not rows:
+            return
+        placeholder = f"({', '.join(['%s'] * len(columns))})"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([placeholder] * len(rows))}",
+                [value for row in rows for value in row],
             )
 
-            if dry_run:
-                self.stdout.write("Running in --dry-run mode, cancelling transaction.")
-                transaction.set_rollback(True)
+    @staticmethod
+    def get_action_filter(
+        model: type[ModelAffectedByImport], action_type: str, limit_to_pks: list[str]
+    ) -> tuple[str, list]:
+        """Return the WHERE condition and its parameters selecting actions of the action table aliased as `staged`"""
+        sql = "staged.object_type = %s AND staged.action = %s"
+        params = [model.__name__, action_type]
+        if limit_to_pks:
+            sql += " AND staged.db_id = ANY(%s)"
+            params.append(list(limit_to_pks))
+        return sql, params
+
+    @staticmethod
+    def get_pk_cast(model: type[ModelAffectedByImport], value_sql: str) -> str:
+        return f"CAST({value_sql} AS {model._meta.pk.db_type(connection)})"
 
     def reverse_actions(
         self,
         *,
-        model: ModelAffectedByImport,
+        model: type[ModelAffectedByImport],
         action_type: ActionType,
-        actions: list[dict],
         limit_to_pks: list[str],
         user: User,
         timestamp: datetime,
-    ) -> dict[type[ModelAffectedByImport], set[str]]:
-        """Revert a set of actions on a model
-
-        Returns: A map of primary key of orphaned object per model (in the case of "create" operations."""
-        if len(actions) == 0:
-            return {}
+    ) -> None:
+        """Revert a set of actions on a model. Objects orphaned by reverted "create" operations are added to the
+        orphan table."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT count(*) FROM {ACTION_TABLE} WHERE object_type = %s AND action = %s",
+                [model.__name__, action_type],
+            )
+            action_count = cursor.fetchone()[0]
+        self.stdout.write(f"Reverting {action_count} {action_type} operations for {model.__name__}...")
+        if action_count == 0:
+            return
 
         if action_type == "create":
-            if limit_to_pks:
-                pks = {action["db_id"] for action in actions if action["db_id"] in limit_to_pks}
-            else:
-                pks = {action["db_id"] for action in actions}
-            orphaned_pks_by_model = Command.detach_dependent_objects(model=model, pks=pks)
-            deleted_qs = model.objects.filter(pk__in=pks)
-            deleted_pks = {str(pk) for pk in deleted_qs.values_list("pk", flat=True)}
-            deleted_qs.delete()
-            missing_pks = pks - deleted_pks
-            for pk in missing_pks:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"{model.__name__} {pk} does not exist, unable to revert {action_type} operation"
-                    )
-                )
-            return orphaned_pks_by_model
-
-        entries = []
-        if action_type in ["update", "deactivate"]:
-            for action in actions:
-                pk = action["db_id"]
-                if limit_to_pks and pk not in limit_to_pks:
-                    continue
-                try:
-                    entry = model.objects.get(pk=pk)
-                    self.revert_update(entry=entry, row=action, timestamp=timestamp, user=user)
-                    entries.append(entry)
-                except model.DoesNotExist:
-                    pk = action["db_id"]
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"{model.__name__} {pk} does not exist, unable to revert {action_type} operation"
-                        )
-                    )
-                    continue
-        fields = set(actions[0]["old"]) | {"updated_by", "updated_at"}
-        model.objects.bulk_update(entries, fields, BATCH_SIZE)
-        return {}
-
-    @staticmethod
-    def revert_update(*, entry: ModelAffectedByImport, row: dict, timestamp: datetime, user: User) -> None:
-        """Restores previous field values and updates audit metadata."""
-        for field, value in row["old"].items():
-            setattr(entry, field, value)
-        entry.updated_by = user
-        entry.updated_at = timestamp
-
-    @staticmethod
-    def detach_dependent_objects(
-        *, model: ModelAffectedByImport, pks: set[str]
-    ) -> dict[type[ModelAffectedByImport], set[str]]:
-        """Clear assignments to the given items in the model before deletion.
-
-        Returns: Sets of dependent objects by model that need to have their update operations reverted."""
-        additional_sign_pks = set()
-        signpost_pks = set()
-        traffic_sign_pks = set()
-
-        if model == MountReal:
-            additional_qs = AdditionalSignReal.objects.filter(mount_real__pk__in=pks)
-            signpost_qs = SignpostReal.objects.filter(mount_real__pk__in=pks)
-            traffic_qs = TrafficSignReal.objects.filter(mount_real__pk__in=pks)
-
-            additional_sign_pks = set(additional_qs.values_list("pk", flat=True))
-            signpost_pks = set(signpost_qs.values_list("pk", flat=True))
-            traffic_sign_pks = set(traffic_qs.values_list("pk", flat=True))
-
-            additional_qs.update(mount_real=None)
-            signpost_qs.update(mount_real=None)
-            traffic_qs.update(mount_real=None)
-
-        elif model == SignpostReal:
-            additional_qs = AdditionalSignReal.objects.filter(signpost_real__pk__in=pks)
-            signpost_qs = SignpostReal.objects.filter(parent__pk__in=pks)
-
-            additional_sign_pks = set(additional_qs.values_list("pk", flat=True))
-            signpost_pks = set(signpost_qs.values_list("pk", flat=True))
-
-            additional_qs.update(signpost_real=None)
-            signpost_qs.update(parent=None)
-
-        elif model == TrafficSignReal:
-            additional_qs = AdditionalSignReal.objects.filter(parent__pk__in=pks)
-
-            additional_sign_pks = set(additional_qs.values_list("pk", flat=True))
+            self.detach_dependent_objects(model=model, limit_to_pks=limit_to_pks)
+            for pks in self.iter_action_pk_chunks(model, action_type, limit_to_pks):
+                deleted_qs = model.objects.filter(pk__in=pks)
+                deleted_pks = {str(pk) for pk in deleted_qs.values_list("pk", flat=True)}
+                deleted_qs.delete()
+                self.write_missing_object_warnings(model, action_type, [pk for pk in pks if pk not in deleted_pks])
+            return
+
+        with connection.cursor() as cursor:
+            where, params = self.get_action_filter(model, action_type, limit_to_pks)
+            table = connection.ops.quote_name(model._meta.db_table)
+            pk_column = connection.ops.quote_name(model._meta.pk.column)
+            cursor.execute(
+                f"SELECT staged.db_id FROM {ACTION_TABLE} AS staged WHERE {where} AND NOT EXISTS ("
+                f"SELECT 1 FROM {table} AS target WHERE target.{pk_column} = {self.get_pk_cast(model, 'staged.db_id')}"
+                ") ORDER BY staged.seq DESC",
+                params,
+            )
+            missing_pks = [db_id for (db_id,) in cursor.fetchall()]
+        self.write_missing_object_warnings(model, action_type, missing_pks)
+        self.revert_updates(
+            model=model, action_type=action_type, limit_to_pks=limit_to_pks, user=user, timestamp=timestamp
+        )
 
-            additional_qs.update(parent=None)
+    def write_missing_object_warnings(self, model: type[ModelAffectedByImport], action_type: str, pks: list[str]):
+        for pk in pks:
+            self.stdout.write(
+                self.style.WARNING(f"{model.__name__} {pk} does not exist, unable to revert {action_type} operation")
+            )
 
-        return {
-            AdditionalSignReal: {str(pk) for pk in additional_sign_pks},
-            SignpostReal: {str(pk) for pk in signpost_pks},
-            TrafficSignReal: {str(pk) for pk in traffic_sign_pks},
-        }
+    def iter_action_pk_chunks(
+        self, model: type[ModelAffectedByImport], action_type: str, limit_to_pks: list[str]
+    ) -> Iterator[list[str]]:
+        """Yield the object primary keys of the actions in chunks of BATCH_SIZE, latest actions first"""
+        where, params = self.get_action_filter(model, action_type, limit_to_pks)
+        last_seq = None
+        while True:
+            with connection.cursor() as cursor:
+                seq_condition = "" if last_seq is None else f" AND staged.seq < {int(last_seq)}"
+                cursor.execute(
+                    f"SELECT staged.seq, staged.db_id FROM {ACTION_TABLE} AS staged WHERE {where}{seq_condition} "
+                    "ORDER BY staged.seq DESC LIMIT %s",
+                    [*params, BATCH_SIZE],
+                )
+                rows = cursor.fetchall()
+            if not rows:
+                return
+            last_seq = rows[-1][0]
+            yield [db_id for _seq, db_id in rows]
 
-    def revert_updates_on_orphaned_objects(
+    def revert_updates(
         self,
-        orphaned_pks_per_model: dict[type[ModelAffectedByImport], set[str]],
-        update_by_model_and_pk: dict[type[ModelAffectedByImport], dict[str, dict[str, str]]],
+        *,
+        model: type[ModelAffectedByImport],
+        action_type: str,
         user: User,
         timestamp: datetime,
+        limit_to_pks: list[str] = (),
+        orphans_only: bool = False,
     ) -> None:
+        """Restore the old field values of the actions with one UPDATE ... FROM statement and update the audit
+        metadata. The latest action of an object is reverted if it has several."""
+        quote_name = connection.ops.quote_name
+        assignments = []
+        params = []
+        for name, model_field in self.fields_by_model_and_action_type[(model, action_type)].items():
+            column = quote_name(model_field.column)
+            assignments.append(
+                f"{column} = CASE WHEN staged.old ? %s "
+                f"THEN CAST(staged.old ->> %s AS {model_field.db_type(connection)}) ELSE target.{column} END"
+            )
+            params += [name, name]
+        for name, value in (("updated_by", user.pk), ("updated_at", timestamp)):
+            assignments.append(f"{quote_name(model._meta.get_field(name).column)} = %s")
+            params.append(value)
+
+        where, where_params = self.get_action_filter(model, action_type, limit_to_pks)
+        params += where_params
+        sql = (
+            f"UPDATE {quote_name(model._meta.db_table)} AS target SET {', '.join(assignments)} "
+            f"FROM (SELECT DISTINCT ON (staged.db_id) staged.db_id, staged.old FROM {ACTION_TABLE} AS staged "
+            f"WHERE {where} ORDER BY staged.db_id, staged.seq DESC) AS staged "
+            f"WHERE target.{quote_name(model._meta.pk.column)} = {self.get_pk_cast(model, 'staged.db_id')}"
+        )
+        if orphans_only:
+            # Skip anything we have already updated during this revert operation
+            sql += (
+                f" AND staged.db_id IN (SELECT db_id FROM {ORPHAN_TABLE} WHERE object_type = %s)"
+                f" AND target.{quote_name(model._meta.get_field('updated_at').column)} < %s"
+            )
+            params += [model.__name__, timestamp]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            updated_count = cursor.rowcount
+        if updated_count:
+            # Raw updates don't send the signals bumping the data versions of saved objects
+            bump_data_version(model._meta.db_table)
+
+    @staticmethod
+    def detach_dependent_objects(*, model: type[ModelAffectedByImport], limit_to_pks: list[str]) -> None:
+        """Clear assignments to the objects created by the actions before deletion, adding the dependent objects that
+        need to have their update operations reverted to the orphan table."""
+        quote_name = connection.ops.quote_name
+        where, params = Command.get_action_filter(model, "create", limit_to_pks)
+        for dependent_model, fk_name in DEPENDENT_RELATIONS.get(model, ()):
+            fk_column = quote_name(dependent_model._meta.get_field(fk_name).column)
+            pk_column = quote_name(dependent_model._meta.pk.column)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"WITH detached AS ("
+                    f"UPDATE {quote_name(dependent_model._meta.db_table)} SET {fk_column} = NULL "
+                    f"WHERE {fk_column} IN ("
+                    f"SELECT {Command.get_pk_cast(model, 'staged.db_id')} FROM {ACTION_TABLE} AS staged WHERE {where}"
+                    f") RETURNING {pk_column}), "
+                    f"orphaned AS (INSERT INTO {ORPHAN_TABLE} (object_type, db_id) "
+                    f"SELECT %s, CAST({pk_column} AS text) FROM detached ON CONFLICT DO NOTHING) "
+                    "SELECT count(*) FROM detached",
+                    [*params, dependent_model.__name__],
+                )
+                detached_count = cursor.fetchone()[0]
+            if detached_count:
+                bump_data_version(dependent_model._meta.db_table)
+
+    def revert_updates_on_orphaned_objects(self, user: User, timestamp: datetime) -> None:
         """Handles the final updates for secondary objects affected by reverted creates."""
-        for model, pks in orphaned_pks_per_model.items():
-            # We need to force a last update for secondary objects that have been affected by reverted create (left
-            # operator of intersection) and have an available update operation to be reverted (right operator of
-            # intersection)
-            revertible_orphaned_pks = pks & set(update_by_model_and_pk[model])
-            non_revertible_orphaned_pks = pks - revertible_orphaned_pks
+        for model in ORPHAN_MODELS:
+            table = connection.ops.quote_name(model._meta.db_table)
+            pk_column = connection.ops.quote_name(model._meta.pk.column)
+            updated_at_column = connection.ops.quote_name(model._meta.get_field("updated_at").column)
+            with connection.cursor() as cursor:
+                # Objects affected by a reverted create without an update operation to be reverted
+                cursor.execute(
+                    f"SELECT orphan.db_id FROM {ORPHAN_TABLE} AS orphan WHERE orphan.object_type = %s AND NOT EXISTS ("
+                    f"SELECT 1 FROM {ACTION_TABLE} AS staged WHERE staged.object_type = orphan.object_type "
+                    "AND staged.action = 'update' AND staged.db_id = orphan.db_id)",
+                    [model.__name__],
+                )
+                non_revertible_orphaned_pks = sorted(db_id for (db_id,) in cursor.fetchall())
+                cursor.execute(
+                    f"SELECT count(*) FROM {table} AS target WHERE target.{updated_at_column} < %s "
+                    f"AND target.{pk_column} IN (SELECT {self.get_pk_cast(model, 'orphan.db_id')} "
+                    f"FROM {ORPHAN_TABLE} AS orphan WHERE orphan.object_type = %s AND EXISTS ("
+                    f"SELECT 1 FROM {ACTION_TABLE} AS staged WHERE staged.object_type = orphan.object_type "
+                    "AND staged.action = 'update' AND staged.db_id = orphan.db_id))",
+                    [timestamp, model.__name__],
+                )
+                revertible_count = cursor.fetchone()[0]
 
             if non_revertible_orphaned_pks:
-                sorted_pks = ", ".join(sorted(non_revertible_orphaned_pks))
+                sorted_pks = ", ".join(non_revertible_orphaned_pks)
                 self.stdout.write(
                     f"{len(non_revertible_orphaned_pks)} secondary {model.__name__} objects orphaned by reverted "
                     f"CREATE operations do not have pending UPDATE operations and cannot be reverted: "
                     f"{sorted_pks}"
                 )
 
-            entries = model.objects.filter(
-                pk__in=revertible_orphaned_pks,
-                updated_at__lt=timestamp,  # Skip anything we have already updated during this revert operation
-            )
-            if len(entries) == 0:
+            if revertible_count == 0:
                 self.stdout.write(
                     f"No secondary {model.__name__} objects orphaned by reverted CREATE operations have pending "
                     "UPDATE operations to be reverted."
                 )
                 continue
             self.stdout.write(
-                f"{len(entries)} secondary {model.__name__} objects orphaned by reverted CREATE operations have "
+                f"{revertible_count} secondary {model.__name__} objects orphaned by reverted CREATE operations have "
                 "pending UPDATE operations to be reverted."
             )
-
-            for entry in entries:
-                row = update_by_model_and_pk[model][str(entry.pk)]
-                self.revert_update(entry=entry, row=row, timestamp=timestamp, user=user)
-            fields = set(update_by_model_and_pk[model][list(revertible_orphaned_pks)[0]]["old"]) | {
-                "updated_by",
-                "updated_at",
-            }
-            model.objects.bulk_update(entries, fields, BATCH_SIZE)
+            self.revert_updates(model=model, action_type="update", user=user, timestamp=timestamp, orphans_only=True)
@@ -0,0 +1,131 @@
+"""Management command to run the performance benchmarks against a synthetic city."""
+
+import json
+import platform
+import subprocess
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import CommandError, CommandParser
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from command_tracker.management.trackable_command import TrackableCommand
+from traffic_control.benchmarks.cases import compare_results, create_context, get_benchmarks, run_benchmark
+from traffic_control.benchmarks.synthetic_city import generate_synthetic_city, is_synthetic_city_generated
+
+
+class Command(TrackableCommand):
+    help = (
+        "Run the performance benchmarks of API, WFS, admin and import hot paths against a synthetic city in a "
+        "separate test database, and write the timings and SQL query counts as JSON."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--mounts", type=int, default=20000, help="Mounts in the synthetic city. Default: 20000.")
+        parser.add_argument("--seed", type=int, default=1, help="Random seed of the synthetic city. Default: 1.")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs of each benchmark. Default: 5.")
+        parser.add_argument(
+            "--case",
+            dest="cases",
+            action="append",
+            default=[],
+            metavar="TEXT",
+            help="Run only benchmarks whose group/name contains TEXT. Can be given multiple times.",
+        )
+        parser.add_argument("--output", type=str, help="Write the results as JSON to this file.")
+        parser.add_argument("--compare", type=str, metavar="FILE", help="Compare to the results in a JSON file.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=1.2,
+            help="Median time ratio to the compared results that is reported as a regression. Default: 1.2.",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            default=False,
+            help="Keep the test database and the synthetic city in it for the next run.",
+        )
+
+    def handle(self, *args, **options):
+        benchmarks = [
+            benchmark
+            for benchmark in get_benchmarks()
+            if not options["cases"] or any(case in f"{benchmark.group}/{benchmark.name}" for case in options["cases"])
+        ]
+        if not benchmarks:
+            raise CommandError("No benchmarks match the given cases.")
+
+        setup_test_environment(debug=False)
+        old_database_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"])
+        try:
+            with tempfile.TemporaryDirectory() as directory, override_settings(MEDIA_ROOT=directory):
+                output = self._run(benchmarks, Path(directory), options)
+        finally:
+            connection.creation.destroy_test_db(old_database_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(output, indent=2))
+            self.stdout.write(f"Results written to {options['output']}.")
+        if options["compare"]:
+            self._compare(output["results"], options["compare"], options["threshold"])
+
+    def _run(self, benchmarks, directory: Path, options) -> dict:
+        if is_synthetic_city_generated():
+            self.stdout.write("Using the synthetic city of the kept test database.")
+        else:
+            self.stdout.write(f"Generating a synthetic city of {options['mounts']} mounts...")
+            city = generate_synthetic_city(mount_count=options["mounts"], seed=options["seed"])
+            self.stdout.write(", ".join(f"{name}: {count}" for name, count in city.counts.items()))
+
+        context = create_context(directory, options["seed"])
+        results = []
+        for benchmark in benchmarks:
+            result = run_benchmark(benchmark, context, repeat=options["repeat"]).to_dict()
+            results.append(result)
+            self.stdout.write(
+                f"{result['group']}/{result['name']}: median {result['median'] * 1000:.1f} ms, "
+                f"{result['queries']} queries"
+            )
+
+        return {
+            "metadata": {
+                "created_at": timezone.now().isoformat(),
+                "version": settings.VERSION,
+                "git_commit": _get_git_commit(),
+                "python": platform.python_version(),
+                "database": f"{connection.vendor} {connection.pg_version if connection.vendor == 'postgresql' else ''}",
+                "mounts": options["mounts"],
+                "seed": options["seed"],
+                "repeat": options["repeat"],
+            },
+            "results": results,
+        }
+
+    def _compare(self, results, baseline_file: str, threshold: float) -> None:
+        baseline = json.loads(Path(baseline_file).read_text())["results"]
+        comparisons = compare_results(results, baseline, threshold)
+        for comparison in comparisons:
+            self.stdout.write(
+                f"{'REGRESSION ' if comparison['regression'] else ''}{comparison['group']}/{comparison['name']}: "
+                f"{comparison['ratio']:.2f}x median, "
+                f"{comparison['baseline_queries']} -> {comparison['queries']} queries"
+            )
+        regressions = [comparison for comparison in comparisons if comparison["regression"]]
+        if regressions:
+            raise CommandError(f"{len(regressions)} benchmarks regressed compared to {baseline_file}.")
+
+
+def _get_git_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=settings.BASE_DIR
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return result.stdout.strip()
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from command_tracker.management.trackable_command import TrackableCommand
+from traffic_control.models import ExportJob, ExportJobStatus
+from traffic_control.services.export_job import export_job_run
+
+
+class Command(TrackableCommand):
+    help = (
+        "Run pending admin export jobs, and jobs that were interrupted while running, "
+        "e.g. because the web worker running them was restarted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale-after",
+            dest="stale_after",
+            type=int,
+            default=60,
+            metavar="MINUTES",
+            help="Rerun jobs that have been running for longer than MINUTES. Default: 60.",
+        )
+
+    def handle(self, *args, **options):
+        stale_started_at = timezone.now() - timedelta(minutes=options["stale_after"])
+        jobs = ExportJob.objects.filter(
+            Q(status=ExportJobStatus.PENDING) | Q(status=ExportJobStatus.RUNNING, started_at__lt=stale_started_at)
+        ).order_by("created_at")
+
+        for job in jobs:
+            if not export_job_run(job):
+                continue
+            job.refresh_from_db()
+            self.stdout.write(f"Export job {job.pk}: {job.status}, {job.row_count} rows.")
@@ -1,45 +1,65 @@
+import time
+
 from auditlog.context import set_actor
 
 from command_tracker.management.trackable_command import TrackableCommand
-from traffic_control.mixins.models import ValidityPeriodModel
 from traffic_control.models import Plan
 from users.utils import get_system_user
 
 
 class Command(TrackableCommand):
-    help = "Update validity_period_start of plan instances to their plan's decision_date"
+    help = (
+        "Update validity_period_start of plan instances to their plan's decision_date. "
+        "Plans are processed in batches in primary key order, each batch in its own transaction, "
+        "so an interrupted run can be resumed with --start-after."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=int,
+            default=500,
+            help="Number of plans processed per batch and transaction. Default: 500.",
+        )
+        parser.add_argument(
+            "--start-after",
+            dest="start_after",
+            type=str,
+            default=None,
+            metavar="PLAN_ID",
+            help="Resume an interrupted run: only process plans whose id is greater than PLAN_ID.",
+        )
 
     def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        plans = Plan.objects.order_by("pk")
+        if options["start_after"]:
+            plans = plans.filter(pk__gt=options["start_after"])
+        total_count = plans.count()
+
         user = get_system_user()
         with set_actor(user):
             updated_count = 0
+            processed_count = 0
+            started_at = time.monotonic()
+            last_plan_id = None
+
+            while True:
+                batch = plans if last_plan_id is None else plans.filter(pk__gt=last_plan_id)
+                plan_ids = list(batch.values_list("pk", flat=True)[:batch_size])
+                if not plan_ids:
+                    break
+
+                updated_count += Plan.update_device_validity_periods(plan_ids, updated_by=user)
+                processed_count += len(plan_ids)
+                last_plan_id = plan_ids[-1]
 
-            def update_instances(plan, related_name):
-                nonlocal updated_count
-                for instance in getattr(plan, related_name).all():
-                    if (
-                        isinstance(instance, ValidityPeriodModel)
-                        and instance.validity_period_start != plan.decision_date
-                    ):
-                        instance.validity_period_start = plan.decision_date
-                        instance.updated_by = user
-                        instance.save(update_fields=["validity_period_start", "updated_by"])
-                        updated_count += 1
-
-            related_names = [
-                "barrier_plans",
-                "mount_plans",
-                "road_marking_plans",
-                "signpost_plans",
-                "traffic_light_plans",
-                "traffic_sign_plans",
-                "additional_sign_plans",
-                "furniture_signpost_plans",
-            ]
-
-            for plan in Plan.objects.all():
-                print("Updating plan instances with plan id:", plan.id)
-                for related_name in related_names:
-                    update_instances(plan, related_name)
+                elapsed = time.monotonic() - started_at
+                self.stdout.write(
+                    f"Processed {processed_count}/{total_count} plans, updated {updated_count} plan instances "
+                    f"({processed_count / elapsed if elapsed else processed_count:.1f} plans/s). "
+                    f"Last plan id: {last_plan_id}"
+                )
 
             self.stdout.write(self.style.SUCCESS(f"Updated {updated_count} plan instances."))
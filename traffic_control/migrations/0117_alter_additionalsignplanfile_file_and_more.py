@@ -0,0 +1,88 @@
+# Generated by Django 5.2.8 on 2026-10-19 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('traffic_control', '0116_linkadditionalsignparentsruninfo'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='additionalsignplanfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='planfiles/additional_sign/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='additionalsignrealfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='realfiles/additional_sign/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='barrierplanfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='planfiles/barrier/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='barrierrealfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='realfiles/barrier/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='mountplanfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='planfiles/mount/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='mountrealfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='realfiles/mount/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='roadmarkingplanfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='planfiles/road_marking/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='roadmarkingrealfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='realfiles/road_marking/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='signpostplanfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='planfiles/signpost/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='signpostrealfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='realfiles/signpost/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='trafficlightplanfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='planfiles/traffic_light/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='trafficlightrealfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='realfiles/traffic_light/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='trafficsignplanfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='planfiles/traffic_sign/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='trafficsignrealfile',
+            name='file',
+            field=models.FileField(db_index=True, upload_to='realfiles/traffic_sign/', verbose_name='File'),
+        ),
+        migrations.AlterField(
+            model_name='streetscanimportrevertfile',
+            name='file',
+            field=models.FileField(db_index=True, help_text='JSONL file containing pre-update snapshots and created-object IDs for this run.', upload_to='management_commands/streetscan_revert/', verbose_name='File'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:40
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('traffic_control', '0117_alter_additionalsignplanfile_file_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Started at')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished at')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('FINISHED', 'Finished'), ('FAILED', 'Failed')], default='PENDING', max_length=16, verbose_name='Status')),
+                ('resource_class', models.CharField(help_text='Dotted path of the import-export resource class used for the export.', max_length=255, verbose_name='Resource class')),
+                ('file_format', models.CharField(help_text='Extension of the export file.', max_length=8, verbose_name='File format')),
+                ('query', models.BinaryField(editable=False, help_text='Pickled query of the exported queryset.', verbose_name='Query')),
+                ('file', models.FileField(blank=True, null=True, upload_to='exports/', verbose_name='File')),
+                ('row_count', models.IntegerField(default=0, verbose_name='Row count')),
+                ('error', models.TextField(blank=True, default='', verbose_name='Error')),
+                ('content_type', models.ForeignKey(help_text='Model of the exported objects.', on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype', verbose_name='Content type')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='export_jobs', to=settings.AUTH_USER_MODEL, verbose_name='Created by')),
+            ],
+            options={
+                'verbose_name': 'Export job',
+                'verbose_name_plural': 'Export jobs',
+                'db_table': 'export_job',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.8 on 2026-10-19 14:05
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+from django.db.models import F, Func, Value
+
+SIMPLIFIED_LOCATION_FIELDS = {
+    "location_simplified_1m": 1,
+    "location_simplified_5m": 5,
+    "location_simplified_25m": 25,
+}
+
+
+def geometry(function, *expressions):
+    return Func(*expressions, function=function, output_field=django.contrib.gis.db.models.fields.GeometryField())
+
+
+def update_derived_locations(apps, schema_editor):
+    plan_model = apps.get_model("traffic_control", "Plan")
+    db_alias = schema_editor.connection.alias
+
+    convex_hull = geometry("ST_CollectionExtract", geometry("ST_ConvexHull", F("location")), Value(3))
+    values = {"convex_hull_location": geometry("ST_Force3DZ", geometry("ST_Force2D", convex_hull))}
+    for field_name, tolerance in SIMPLIFIED_LOCATION_FIELDS.items():
+        simplified = geometry("ST_SimplifyPreserveTopology", F("location"), Value(float(tolerance)))
+        values[field_name] = geometry("ST_Force3DZ", geometry("ST_Multi", simplified))
+    plan_model.objects.using(db_alias).update(**values)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("traffic_control", "0118_exportjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="plan",
+            name="convex_hull_location",
+            field=django.contrib.gis.db.models.fields.PolygonField(
+                blank=True, dim=3, editable=False, null=True, srid=3879, verbose_name="Convex hull of location"
+            ),
+        ),
+        migrations.AddField(
+            model_name="plan",
+            name="location_simplified_1m",
+            field=django.contrib.gis.db.models.fields.MultiPolygonField(
+                blank=True,
+                dim=3,
+                editable=False,
+                null=True,
+                srid=3879,
+                verbose_name="Location simplified with 1 m tolerance",
+            ),
+        ),
+        migrations.AddField(
+            model_name="plan",
+            name="location_simplified_5m",
+            field=django.contrib.gis.db.models.fields.MultiPolygonField(
+                blank=True,
+                dim=3,
+                editable=False,
+                null=True,
+                srid=3879,
+                verbose_name="Location simplified with 5 m tolerance",
+            ),
+        ),
+        migrations.AddField(
+            model_name="plan",
+            name="location_simplified_25m",
+            field=django.contrib.gis.db.models.fields.MultiPolygonField(
+                blank=True,
+                dim=3,
+                editable=False,
+                null=True,
+                srid=3879,
+                verbose_name="Location simplified with 25 m tolerance",
+            ),
+        ),
+        migrations.RunPython(update_derived_locations, migrations.RunPython.noop),
+    ]
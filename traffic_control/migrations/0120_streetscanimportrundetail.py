@@ -0,0 +1,117 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 5000
+
+
+def details_to_rows(apps, schema_editor):
+    run_model = apps.get_model("traffic_control", "StreetScanImportRun")
+    detail_model = apps.get_model("traffic_control", "StreetScanImportRunDetail")
+    db_alias = schema_editor.connection.alias
+
+    for run in run_model.objects.using(db_alias).only("id", "details").iterator(chunk_size=10):
+        detail_model.objects.using(db_alias).bulk_create(
+            (
+                detail_model(
+                    import_run_id=run.id,
+                    object_type=entry.get("object_type") or "",
+                    level=entry.get("level") or "",
+                    phase=entry.get("phase") or "",
+                    source_id=str(entry.get("source_id") or "")[:255],
+                    reason=str(entry.get("reason") or ""),
+                )
+                for entry in run.details or []
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+
+def rows_to_details(apps, schema_editor):
+    run_model = apps.get_model("traffic_control", "StreetScanImportRun")
+    detail_model = apps.get_model("traffic_control", "StreetScanImportRunDetail")
+    db_alias = schema_editor.connection.alias
+
+    for run in run_model.objects.using(db_alias).only("id").iterator(chunk_size=10):
+        entries = detail_model.objects.using(db_alias).filter(import_run_id=run.id).order_by("id")
+        run.details = [
+            {
+                "level": entry.level,
+                "source_id": entry.source_id,
+                "reason": entry.reason,
+                **({"object_type": entry.object_type} if entry.object_type else {}),
+                **({"phase": entry.phase} if entry.phase else {}),
+            }
+            for entry in entries.iterator(chunk_size=BATCH_SIZE)
+        ]
+        run.save(update_fields=["details"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("traffic_control", "0119_plan_derived_locations"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StreetScanImportRunDetail",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "object_type",
+                    models.CharField(
+                        blank=True,
+                        help_text="Object type of the row, e.g. 'signs'. Empty for entries of old runs without one.",
+                        max_length=32,
+                        verbose_name="Object type",
+                    ),
+                ),
+                (
+                    "level",
+                    models.CharField(
+                        help_text="Level of the entry: 'skip', 'warning' or 'error'.",
+                        max_length=16,
+                        verbose_name="Level",
+                    ),
+                ),
+                (
+                    "phase",
+                    models.CharField(
+                        blank=True,
+                        help_text="Import phase of the entry, e.g. 'create'.",
+                        max_length=16,
+                        verbose_name="Phase",
+                    ),
+                ),
+                ("source_id", models.CharField(blank=True, max_length=255, verbose_name="Source ID")),
+                ("reason", models.TextField(blank=True, verbose_name="Reason")),
+                (
+                    "import_run",
+                    models.ForeignKey(
+                        help_text="The import run this entry belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="detail_entries",
+                        to="traffic_control.streetscanimportrun",
+                        verbose_name="Import run",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "StreetScan import run detail",
+                "verbose_name_plural": "StreetScan import run details",
+                "db_table": "streetscan_import_run_detail",
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["import_run", "object_type", "level", "phase"], name="streetscan_detail_run_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(details_to_rows, rows_to_details),
+        migrations.RemoveField(
+            model_name="streetscanimportrun",
+            name="details",
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-19 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("traffic_control", "0120_streetscanimportrundetail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="operationalarea",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Inactive areas have been removed from their source and do not grant permissions.",
+                verbose_name="Active",
+            ),
+        ),
+    ]
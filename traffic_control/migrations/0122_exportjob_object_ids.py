@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-19 20:10
+
+from django.db import migrations, models
+
+
+def fail_pending_export_jobs(apps, schema_editor):
+    """Pending jobs stored their queryset as a pickled query, which is dropped"""
+    export_job_model = apps.get_model("traffic_control", "ExportJob")
+    db_alias = schema_editor.connection.alias
+    export_job_model.objects.using(db_alias).filter(status="PENDING").update(
+        status="FAILED",
+        error="The export job was created by an earlier version of the application. Please export again.",
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("traffic_control", "0121_operationalarea_is_active"),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_pending_export_jobs, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="exportjob",
+            name="query",
+        ),
+        migrations.AddField(
+            model_name="exportjob",
+            name="object_ids",
+            field=models.JSONField(
+                default=list,
+                editable=False,
+                help_text="Primary keys of the exported objects.",
+                verbose_name="Object ids",
+            ),
+        ),
+        migrations.AddField(
+            model_name="exportjob",
+            name="ordering",
+            field=models.JSONField(
+                default=list,
+                editable=False,
+                help_text="Field names the exported objects are ordered by.",
+                verbose_name="Ordering",
+            ),
+        ),
+    ]
@@ -61,16 +61,18 @@ class SoftDeleteMixin(mixins.DestroyModelMixin):
     """
 
     def destroy(self, request, *args, **kwargs):
-        user = request.user
+        instance = self.get_object()
+        self.perform_destroy(instance)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def perform_destroy(self, instance):
+        user = self.request.user
         with set_actor(user):
-            instance = self.get_object()
             if is_softdeletable_model(instance):
                 instance.soft_delete(user)
-                return Response(status=status.HTTP_204_NO_CONTENT)
             else:
                 logger.warning("Model %s does not support soft delete, doing full delete", instance.__class__.__name__)
                 super().perform_destroy(instance)
-                return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class AuditLoggingMixin(UserCreateMixin, UserUpdateMixin, SoftDeleteMixin):
@@ -199,6 +199,10 @@ class UpdatePlanLocationMixin:
             *args: Positional arguments forwarded to the parent save().
             **kwargs: Keyword arguments forwarded to the parent save().
         """
+        if kwargs.get("update_fields") is not None and not kwargs["update_fields"]:
+            # Nothing is saved, so the plan of the saved row does not change
+            super().save(*args, **kwargs)
+            return
         if self._state.adding:
             old_plan = None
         else:
@@ -22,6 +22,7 @@ from traffic_control.models.common import (
     TrafficControlDeviceType,
     TrafficControlDeviceTypeIcon,
 )
+from traffic_control.models.export_job import ExportJob, ExportJobStatus
 from traffic_control.models.link_additional_sign_parents_run_info import LinkAdditionalSignParentsRunInfo
 from traffic_control.models.mount import (
     MountPlan,
@@ -61,7 +62,11 @@ from traffic_control.models.signpost_migration import (
     SignpostMigrationRealRecord,
     SignpostMigrationRun,
 )
-from traffic_control.models.streetscan_import import StreetScanImportRevertFile, StreetScanImportRun
+from traffic_control.models.streetscan_import import (
+    StreetScanImportRevertFile,
+    StreetScanImportRun,
+    StreetScanImportRunDetail,
+)
 from traffic_control.models.ticket_machine_migration import (
     TicketMachineMigrationPlanRecord,
     TicketMachineMigrationRealRecord,
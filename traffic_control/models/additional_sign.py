@@ -239,8 +239,12 @@ class AbstractAdditionalSign(
             raise ValidationError(validation_errors)
 
     def save(self, *args, **kwargs):
-        if self.device_type and not self.device_type.validate_relation(DeviceTypeTargetModel.ADDITIONAL_SIGN):
-            raise ValidationError(f'Device type "{self.device_type}" is not allowed for additional signs')
+        # Imported here to avoid circular imports while the models are being loaded
+        from traffic_control.utils.reference_data import get_related_reference_object
+
+        device_type = get_related_reference_object(self, "device_type")
+        if device_type and not device_type.validate_relation(DeviceTypeTargetModel.ADDITIONAL_SIGN):
+            raise ValidationError(f'Device type "{device_type}" is not allowed for additional signs')
 
         super().save(*args, **kwargs)
 
@@ -471,7 +475,7 @@ class AdditionalSignRealOperation(OperationBase):
 
 
 class AdditionalSignPlanFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="planfiles/additional_sign/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="planfiles/additional_sign/")
     additional_sign_plan = models.ForeignKey(AdditionalSignPlan, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -481,7 +485,7 @@ class AdditionalSignPlanFile(AbstractFileModel):
 
 
 class AdditionalSignRealFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="realfiles/additional_sign/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="realfiles/additional_sign/")
     additional_sign_real = models.ForeignKey(AdditionalSignReal, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
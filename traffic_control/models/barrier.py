@@ -148,8 +148,12 @@ class AbstractBarrier(
         return f"{self.id} {self.device_type}"
 
     def save(self, *args, **kwargs):
-        if self.device_type and not self.device_type.validate_relation(DeviceTypeTargetModel.BARRIER):
-            raise ValidationError(f'Device type "{self.device_type}" is not allowed for barriers')
+        # Imported here to avoid circular imports while the models are being loaded
+        from traffic_control.utils.reference_data import get_related_reference_object
+
+        device_type = get_related_reference_object(self, "device_type")
+        if device_type and not device_type.validate_relation(DeviceTypeTargetModel.BARRIER):
+            raise ValidationError(f'Device type "{device_type}" is not allowed for barriers')
 
         super().save(*args, **kwargs)
 
@@ -251,7 +255,7 @@ class BarrierRealOperation(OperationBase):
 
 
 class BarrierPlanFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="planfiles/barrier/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="planfiles/barrier/")
     barrier_plan = models.ForeignKey(BarrierPlan, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -261,7 +265,7 @@ class BarrierPlanFile(AbstractFileModel):
 
 
 class BarrierRealFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="realfiles/barrier/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="realfiles/barrier/")
     barrier_real = models.ForeignKey(BarrierReal, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
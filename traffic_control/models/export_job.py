@@ -0,0 +1,75 @@
+import uuid
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ExportJobStatus(models.TextChoices):
+    PENDING = "PENDING", _("Pending")
+    RUNNING = "RUNNING", _("Running")
+    FINISHED = "FINISHED", _("Finished")
+    FAILED = "FAILED", _("Failed")
+
+
+class ExportJob(models.Model):
+    """Admin export that is run outside the request and written to file storage in chunks.
+
+    The exported queryset is stored as the primary keys of the selected objects and the field names it was ordered
+    by, so the job exports exactly the rows that were selected in the admin when the job was created, and pending
+    jobs survive upgrades of Django.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("Created by"),
+        on_delete=models.CASCADE,
+        related_name="export_jobs",
+    )
+    created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
+    started_at = models.DateTimeField(_("Started at"), null=True, blank=True)
+    finished_at = models.DateTimeField(_("Finished at"), null=True, blank=True)
+    status = models.CharField(
+        _("Status"),
+        max_length=16,
+        choices=ExportJobStatus.choices,
+        default=ExportJobStatus.PENDING,
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        verbose_name=_("Content type"),
+        on_delete=models.CASCADE,
+        help_text=_("Model of the exported objects."),
+    )
+    resource_class = models.CharField(
+        _("Resource class"),
+        max_length=255,
+        help_text=_("Dotted path of the import-export resource class used for the export."),
+    )
+    file_format = models.CharField(_("File format"), max_length=8, help_text=_("Extension of the export file."))
+    object_ids = models.JSONField(
+        _("Object ids"),
+        default=list,
+        editable=False,
+        help_text=_("Primary keys of the exported objects."),
+    )
+    ordering = models.JSONField(
+        _("Ordering"),
+        default=list,
+        editable=False,
+        help_text=_("Field names the exported objects are ordered by."),
+    )
+    file = models.FileField(_("File"), upload_to="exports/", blank=True, null=True)
+    row_count = models.IntegerField(_("Row count"), default=0)
+    error = models.TextField(_("Error"), blank=True, default="")
+
+    class Meta:
+        db_table = "export_job"
+        verbose_name = _("Export job")
+        verbose_name_plural = _("Export jobs")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.content_type.name} export {self.created_at:%Y-%m-%d %H:%M} ({self.status})"
@@ -329,7 +329,7 @@ class MountRealOperation(OperationBase):
 
 
 class MountPlanFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="planfiles/mount/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="planfiles/mount/")
     mount_plan = models.ForeignKey(MountPlan, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -339,7 +339,7 @@ class MountPlanFile(AbstractFileModel):
 
 
 class MountRealFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="realfiles/mount/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="realfiles/mount/")
     mount_real = models.ForeignKey(MountReal, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -53,6 +53,11 @@ class OperationalArea(BoundaryCheckedLocationMixin, SourceControlModel):
     task = models.CharField(_("Task"), max_length=256, blank=True)
     status = models.CharField(_("Status"), max_length=256, blank=True)
     location = models.MultiPolygonField(_("Location (3D)"), dim=3, srid=settings.SRID)
+    is_active = models.BooleanField(
+        _("Active"),
+        default=True,
+        help_text=_("Inactive areas have been removed from their source and do not grant permissions."),
+    )
 
     class Meta:
         verbose_name = _("Operational area")
@@ -6,19 +6,105 @@ from auditlog.registry import auditlog
 from django.conf import settings
 from django.contrib.gis.db import models
 from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.contrib.postgres.expressions import ArraySubquery
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import RegexValidator
 from django.db import transaction
+from django.db.models import Count, F, Func, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from admin_helper.decorators import requires_fields
-from traffic_control.geometry_utils import get_3d_geometry
 from traffic_control.mixins.models import (
     BoundaryCheckedLocationMixin,
     SoftDeleteModel,
     SourceControlModel,
     UserControlModel,
+    ValidityPeriodModel,
 )
+from traffic_control.models.utils import SoftDeleteQuerySet
+
+# Reverse relations of Plan to the device plans of the plan
+PLAN_DEVICE_PLAN_RELATIONS = (
+    "barrier_plans",
+    "mount_plans",
+    "road_marking_plans",
+    "signpost_plans",
+    "traffic_light_plans",
+    "traffic_sign_plans",
+    "additional_sign_plans",
+    "furniture_signpost_plans",
+)
+
+
+# Tolerances in meters of the simplified plan locations, by the name of the field they are stored in
+PLAN_SIMPLIFIED_LOCATION_FIELDS = {
+    "location_simplified_1m": 1,
+    "location_simplified_5m": 5,
+    "location_simplified_25m": 25,
+}
+# Fields derived from the location of a plan by PlanQuerySet.update_derived_locations()
+PLAN_DERIVED_LOCATION_FIELDS = ("convex_hull_location", *PLAN_SIMPLIFIED_LOCATION_FIELDS)
+
+
+def get_device_plan_ids_annotation(relation: str) -> str:
+    """Name of the device plan id array annotated by PlanQuerySet.with_device_plan_ids(), e.g. `mount_plan_ids`"""
+    return f"{relation.removesuffix('s')}_ids"
+
+
+def get_device_plan_count_annotation(relation: str) -> str:
+    """Name of the device plan count annotated by PlanQuerySet.with_device_plan_counts(), e.g. `mount_plan_count`"""
+    return f"{relation.removesuffix('s')}_count"
+
+
+class PlanQuerySet(SoftDeleteQuerySet):
+    def with_device_plan_ids(self):
+        """
+        Annotate the ids of the device plans of each relation in PLAN_DEVICE_PLAN_RELATIONS as arrays, so that they
+        are fetched with the plans in one query without instantiating the device plans.
+        """
+        return self.annotate(
+            **{
+                get_device_plan_ids_annotation(relation): ArraySubquery(self._get_device_plans(relation).values("pk"))
+                for relation in PLAN_DEVICE_PLAN_RELATIONS
+            }
+        )
+
+    def with_device_plan_counts(self):
+        """Annotate the number of device plans of each relation in PLAN_DEVICE_PLAN_RELATIONS"""
+        annotations = {}
+        for relation in PLAN_DEVICE_PLAN_RELATIONS:
+            device_plans = self._get_device_plans(relation)
+            plan_field = self.model._meta.get_field(relation).field.name
+            count = device_plans.order_by().values(plan_field).annotate(count=Count("pk")).values("count")
+            annotations[get_device_plan_count_annotation(relation)] = Coalesce(Subquery(count), 0)
+        return self.annotate(**annotations)
+
+    def update_derived_locations(self) -> int:
+        """
+        Compute the convex hull and the simplified versions of the location of the plans in the database.
+        The convex hull is 3D with z coordinates set to 0, like the locations derived from device plans.
+        """
+        # Imported here to avoid circular imports while the models are being loaded
+        from traffic_control.utils.data_version import bump_data_version
+
+        def geometry(function, *expressions):
+            return Func(*expressions, function=function, output_field=models.GeometryField(srid=settings.SRID))
+
+        # Extracting the polygon turns the hulls of degenerate locations into empty polygons
+        convex_hull = geometry("ST_CollectionExtract", geometry("ST_ConvexHull", F("location")), Value(3))
+        values = {"convex_hull_location": geometry("ST_Force3DZ", geometry("ST_Force2D", convex_hull))}
+        for field_name, tolerance in PLAN_SIMPLIFIED_LOCATION_FIELDS.items():
+            simplified = geometry("ST_SimplifyPreserveTopology", F("location"), Value(float(tolerance)))
+            values[field_name] = geometry("ST_Force3DZ", geometry("ST_Multi", simplified))
+        updated_count = self.update(**values)
+        if updated_count:
+            bump_data_version(self.model._meta.db_table)
+        return updated_count
+
+    def _get_device_plans(self, relation: str):
+        related_field = self.model._meta.get_field(relation)
+        return related_field.related_model._default_manager.filter(**{related_field.field.name: OuterRef("pk")})
 
 
 class Plan(BoundaryCheckedLocationMixin, SourceControlModel, SoftDeleteModel, UserControlModel):
@@ -70,6 +156,19 @@ class Plan(BoundaryCheckedLocationMixin, SourceControlModel, SoftDeleteModel, Us
         default=False,
     )
     location = models.MultiPolygonField(_("Location (3D)"), dim=3, srid=settings.SRID, null=True, blank=True)
+    # Derived from location on save, WFS and API responses are served from these instead of location
+    convex_hull_location = models.PolygonField(
+        _("Convex hull of location"), dim=3, srid=settings.SRID, null=True, blank=True, editable=False
+    )
+    location_simplified_1m = models.MultiPolygonField(
+        _("Location simplified with 1 m tolerance"), dim=3, srid=settings.SRID, null=True, blank=True, editable=False
+    )
+    location_simplified_5m = models.MultiPolygonField(
+        _("Location simplified with 5 m tolerance"), dim=3, srid=settings.SRID, null=True, blank=True, editable=False
+    )
+    location_simplified_25m = models.MultiPolygonField(
+        _("Location simplified with 25 m tolerance"), dim=3, srid=settings.SRID, null=True, blank=True, editable=False
+    )
 
     decision_date = models.DateField(
         _("Decision date"),
@@ -86,6 +185,8 @@ class Plan(BoundaryCheckedLocationMixin, SourceControlModel, SoftDeleteModel, Us
         help_text=_("URL to decision web page"),
     )
 
+    objects = PlanQuerySet.as_manager()
+
     class Meta:
         db_table = "plan"
         verbose_name = _("Plan")
@@ -107,12 +208,6 @@ class Plan(BoundaryCheckedLocationMixin, SourceControlModel, SoftDeleteModel, Us
     def __str__(self):
         return f"{self.decision_id} {self.name}"
 
-    @property
-    def convex_hull_location(self):
-        """This always forces 3d geometry.
-        In WFS CustomGeoJsonRenderer checks if this property exists for an instance."""
-        return get_3d_geometry(self.location.convex_hull, 0.0)
-
     def save(self, *args, **kwargs):
         # Make drawing numbers a unique sorted list
         self.drawing_numbers = sorted(set(self.drawing_numbers or []))
@@ -130,39 +225,82 @@ class Plan(BoundaryCheckedLocationMixin, SourceControlModel, SoftDeleteModel, Us
 
         super().save(*args, **kwargs)
 
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "location" in update_fields:
+            self._update_derived_locations()
+
         decision_date_changed = not is_creating and original_decision_date != self.decision_date
         if decision_date_changed:
             self._update_related_device_validity_periods()
 
-    @transaction.atomic
+    def _update_derived_locations(self):
+        Plan.objects.filter(pk=self.pk).update_derived_locations()
+        # Defer the derived fields, so that the values computed by the database are loaded when they are accessed
+        for field_name in PLAN_DERIVED_LOCATION_FIELDS:
+            self.__dict__.pop(field_name, None)
+
     def _update_related_device_validity_periods(self):
         """
         Update the validity_period_start of all related device plans
         to match this plan's decision_date.
         """
-        related_devices = self._get_related_device_plans()
-        for device in related_devices:
-            # This assumes device models have a 'validity_period_start' field
-            if hasattr(device, "validity_period_start"):
-                device.validity_period_start = self.decision_date
-                device.save(update_fields=["validity_period_start"])
-
-    def _get_related_device_plans(self):
+        Plan.update_device_validity_periods([self.pk])
+
+    @classmethod
+    def _get_validity_period_device_plan_models(cls):
+        """Device plan models that have a validity period and a `plan` foreign key to Plan"""
+        return [
+            relation.related_model
+            for relation in cls._meta.related_objects
+            if relation.field.name == "plan" and issubclass(relation.related_model, ValidityPeriodModel)
+        ]
+
+    @classmethod
+    @transaction.atomic
+    def update_device_validity_periods(cls, plan_ids, updated_by=None) -> int:
         """
-        Get a list of all device plan objects related to this plan instance.
+        Set validity_period_start of the device plans of given plans to the decision_date of their plan.
+
+        Only device plans whose validity period start differs from the decision date are touched: they are updated
+        with one UPDATE per device plan table and their audit log entries are created in bulk. Returns the number of
+        updated device plans.
         """
-        return list(
-            chain(
-                self.barrier_plans.all(),
-                self.mount_plans.all(),
-                self.road_marking_plans.all(),
-                self.signpost_plans.all(),
-                self.traffic_light_plans.all(),
-                self.traffic_sign_plans.all(),
-                self.additional_sign_plans.all(),
-                self.furniture_signpost_plans.all(),
+        # Imported here to avoid circular imports while the models are being loaded
+        from traffic_control.signal_utils import bulk_create_log_entries
+        from traffic_control.utils.data_version import bump_data_version
+
+        plan_decision_date = Subquery(cls.objects.filter(pk=OuterRef("plan_id")).values("decision_date")[:1])
+        updated_count = 0
+        for model in cls._get_validity_period_device_plan_models():
+            # Rows with NULL on either side are not excluded by the query, the exact comparison is done below
+            candidates = (
+                model.objects.filter(plan_id__in=plan_ids)
+                .exclude(validity_period_start=models.F("plan__decision_date"))
+                .annotate(plan_decision_date=models.F("plan__decision_date"))
+                .select_related("device_type")
             )
-        )
+            devices = [device for device in candidates if device.validity_period_start != device.plan_decision_date]
+            if not devices:
+                continue
+
+            values = {"validity_period_start": plan_decision_date}
+            if updated_by is not None:
+                values["updated_by"] = updated_by
+            model.objects.filter(pk__in=[device.pk for device in devices]).update(**values)
+
+            bulk_create_log_entries(
+                (device, cls._get_validity_period_changes(device, updated_by)) for device in devices
+            )
+            bump_data_version(model._meta.db_table)
+            updated_count += len(devices)
+        return updated_count
+
+    @staticmethod
+    def _get_validity_period_changes(device, updated_by) -> dict:
+        changes = {"validity_period_start": [str(device.validity_period_start), str(device.plan_decision_date)]}
+        if updated_by is not None and device.updated_by_id != updated_by.pk:
+            changes["updated_by"] = [str(device.updated_by_id), str(updated_by.pk)]
+        return changes
 
     def _get_related_locations(self) -> List[Point]:
         """
@@ -203,7 +341,7 @@ class Plan(BoundaryCheckedLocationMixin, SourceControlModel, SoftDeleteModel, Us
         self.save(update_fields=["location"])
 
 
-auditlog.register(Plan)
+auditlog.register(Plan, exclude_fields=list(PLAN_DERIVED_LOCATION_FIELDS))
 
 
 class PlanGeometryImportLog(models.Model):
@@ -188,14 +188,14 @@ class AbstractRoadMarking(
         return f"{self.id} {self.device_type} {self.value}"
 
     def save(self, *args, **kwargs):
-        if self.device_type and not self.device_type.validate_relation(DeviceTypeTargetModel.ROAD_MARKING):
-            raise ValidationError(f'Device type "{self.device_type}" is not allowed for road markings')
-
-        if (
-            self.device_type
-            and self.device_type.type == TrafficControlDeviceTypeType.TRANSVERSE
-            and self.road_name == ""
-        ):
+        # Imported here to avoid circular imports while the models are being loaded
+        from traffic_control.utils.reference_data import get_related_reference_object
+
+        device_type = get_related_reference_object(self, "device_type")
+        if device_type and not device_type.validate_relation(DeviceTypeTargetModel.ROAD_MARKING):
+            raise ValidationError(f'Device type "{device_type}" is not allowed for road markings')
+
+        if device_type and device_type.type == TrafficControlDeviceTypeType.TRANSVERSE and self.road_name == "":
             raise ValidationError(
                 f'Road name is required for "{TrafficControlDeviceTypeType.TRANSVERSE.value}" road marking'
             )
@@ -326,7 +326,7 @@ class RoadMarkingRealOperation(OperationBase):
 
 
 class RoadMarkingPlanFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="planfiles/road_marking/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="planfiles/road_marking/")
     road_marking_plan = models.ForeignKey(RoadMarkingPlan, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -336,7 +336,7 @@ class RoadMarkingPlanFile(AbstractFileModel):
 
 
 class RoadMarkingRealFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="realfiles/road_marking/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="realfiles/road_marking/")
     road_marking_real = models.ForeignKey(RoadMarkingReal, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
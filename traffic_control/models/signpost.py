@@ -213,8 +213,12 @@ class AbstractSignpost(
         return f"{self.id} {self.device_type} {self.txt}"
 
     def save(self, *args, **kwargs):
-        if self.device_type and not self.device_type.validate_relation(DeviceTypeTargetModel.SIGNPOST):
-            raise ValidationError(f'Device type "{self.device_type}" is not allowed for signposts')
+        # Imported here to avoid circular imports while the models are being loaded
+        from traffic_control.utils.reference_data import get_related_reference_object
+
+        device_type = get_related_reference_object(self, "device_type")
+        if device_type and not device_type.validate_relation(DeviceTypeTargetModel.SIGNPOST):
+            raise ValidationError(f'Device type "{device_type}" is not allowed for signposts')
 
         super().save(*args, **kwargs)
 
@@ -412,7 +416,7 @@ class SignpostRealOperation(OperationBase):
 
 
 class SignpostPlanFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="planfiles/signpost/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="planfiles/signpost/")
     signpost_plan = models.ForeignKey(SignpostPlan, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -422,7 +426,7 @@ class SignpostPlanFile(AbstractFileModel):
 
 
 class SignpostRealFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="realfiles/signpost/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="realfiles/signpost/")
     signpost_real = models.ForeignKey(SignpostReal, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
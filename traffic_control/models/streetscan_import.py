@@ -9,9 +9,10 @@ from traffic_control.mixins.models import AbstractFileModel
 class StreetScanImportRun(models.Model):
     """Tracks a single execution of the import_streetscan_signs_v2 management command.
 
-    Each live or dry-run invocation writes one row here, recording counts,
-    skip/warning/error details, and the revert data file attachment.
-    The revert file (if any) is stored as a related StreetScanImportRevertFile record.
+    Each live or dry-run invocation writes one row here, recording counts
+    and the revert data file attachment. Skip/warning/error details are stored
+    as related StreetScanImportRunDetail records, and the revert file (if any)
+    as a related StreetScanImportRevertFile record.
     """
 
     id = models.BigAutoField(primary_key=True)
@@ -109,15 +110,8 @@ class StreetScanImportRun(models.Model):
     )
 
     # --- Detailed event log ---
-
-    details = models.JSONField(
-        _("Details"),
-        default=list,
-        help_text=_(
-            "Full list of per-row skip, warning and error entries. "
-            "Each entry has at minimum: level ('skip'/'warning'/'error'), source_id, reason."
-        ),
-    )
+    # Stored as related StreetScanImportRunDetail rows (see below).
+    # Access via: run.detail_entries.all()
 
     # --- Processed source_id sets (used for resume logic) ---
 
@@ -161,6 +155,63 @@ class StreetScanImportRun(models.Model):
         return f"StreetScanImportRun #{self.pk} — {self.started_at:%Y-%m-%d %H:%M}{dry}"
 
 
+class StreetScanImportRunDetail(models.Model):
+    """A single skip, warning or error entry of a StreetScanImportRun.
+
+    Entries are only appended, in batches at the end of each import phase,
+    and are indexed for listing the entries of a run by object type, level
+    and phase in the admin.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    import_run = models.ForeignKey(
+        StreetScanImportRun,
+        verbose_name=_("Import run"),
+        on_delete=models.CASCADE,
+        related_name="detail_entries",
+        help_text=_("The import run this entry belongs to."),
+    )
+    object_type = models.CharField(
+        _("Object type"),
+        max_length=32,
+        blank=True,
+        help_text=_("Object type of the row, e.g. 'signs'. Empty for entries of old runs without one."),
+    )
+    level = models.CharField(
+        _("Level"),
+        max_length=16,
+        help_text=_("Level of the entry: 'skip', 'warning' or 'error'."),
+    )
+    phase = models.CharField(
+        _("Phase"),
+        max_length=16,
+        blank=True,
+        help_text=_("Import phase of the entry, e.g. 'create'."),
+    )
+    source_id = models.CharField(_("Source ID"), max_length=255, blank=True)
+    reason = models.TextField(_("Reason"), blank=True)
+
+    class Meta:
+        db_table = "streetscan_import_run_detail"
+        verbose_name = _("StreetScan import run detail")
+        verbose_name_plural = _("StreetScan import run details")
+        ordering = ["id"]
+        indexes = [
+            models.Index(
+                fields=["import_run", "object_type", "level", "phase"],
+                name="streetscan_detail_run_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Return a human-readable representation of this entry.
+
+        Returns:
+            str: String with level, source id and reason.
+        """
+        return f"{self.level} {self.source_id}: {self.reason}"
+
+
 class StreetScanImportRevertFile(AbstractFileModel):
     """Stores the JSONL revert data file for a single StreetScanImportRun.
 
@@ -174,6 +225,7 @@ class StreetScanImportRevertFile(AbstractFileModel):
         _("File"),
         blank=False,
         null=False,
+        db_index=True,
         upload_to="management_commands/streetscan_revert/",
         help_text=_("JSONL file containing pre-update snapshots and created-object IDs for this run."),
     )
@@ -184,8 +184,12 @@ class AbstractTrafficLight(
         return f"{self.id} {self.type} {self.device_type}"
 
     def save(self, *args, **kwargs):
-        if self.device_type and not self.device_type.validate_relation(DeviceTypeTargetModel.TRAFFIC_LIGHT):
-            raise ValidationError(f'Device type "{self.device_type}" is not allowed for traffic lights')
+        # Imported here to avoid circular imports while the models are being loaded
+        from traffic_control.utils.reference_data import get_related_reference_object
+
+        device_type = get_related_reference_object(self, "device_type")
+        if device_type and not device_type.validate_relation(DeviceTypeTargetModel.TRAFFIC_LIGHT):
+            raise ValidationError(f'Device type "{device_type}" is not allowed for traffic lights')
 
         super().save(*args, **kwargs)
 
@@ -303,7 +307,7 @@ class TrafficLightRealOperation(OperationBase):
 
 
 class TrafficLightPlanFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="planfiles/traffic_light/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="planfiles/traffic_light/")
     traffic_light_plan = models.ForeignKey(TrafficLightPlan, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -316,7 +320,7 @@ class TrafficLightPlanFile(AbstractFileModel):
 
 
 class TrafficLightRealFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="realfiles/traffic_light/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="realfiles/traffic_light/")
     traffic_light_real = models.ForeignKey(TrafficLightReal, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -203,12 +203,16 @@ class AbstractTrafficSign(
         return self.additional_signs.active().exists()
 
     def save(self, *args, **kwargs):
+        # Imported here to avoid circular imports while the models are being loaded
+        from traffic_control.utils.reference_data import get_related_reference_object
+
+        device_type = get_related_reference_object(self, "device_type")
         if (
-            self.device_type
-            and self.device_type.target_model
-            and self.device_type.target_model not in AbstractTrafficSign.ALLOWED_TARGET_MODELS
+            device_type
+            and device_type.target_model
+            and device_type.target_model not in AbstractTrafficSign.ALLOWED_TARGET_MODELS
         ):
-            raise ValidationError(f'Device type "{self.device_type}" is not allowed for traffic signs')
+            raise ValidationError(f'Device type "{device_type}" is not allowed for traffic signs')
 
         super().save(*args, **kwargs)
 
@@ -418,7 +422,7 @@ class TrafficSignRealOperation(OperationBase):
 
 
 class TrafficSignPlanFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="planfiles/traffic_sign/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="planfiles/traffic_sign/")
     traffic_sign_plan = models.ForeignKey(TrafficSignPlan, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
@@ -428,7 +432,7 @@ class TrafficSignPlanFile(AbstractFileModel):
 
 
 class TrafficSignRealFile(AbstractFileModel):
-    file = models.FileField(_("File"), blank=False, null=False, upload_to="realfiles/traffic_sign/")
+    file = models.FileField(_("File"), blank=False, null=False, db_index=True, upload_to="realfiles/traffic_sign/")
     traffic_sign_real = models.ForeignKey(TrafficSignReal, on_delete=models.CASCADE, related_name="files")
 
     class Meta:
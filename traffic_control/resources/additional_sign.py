@@ -4,7 +4,7 @@ from uuid import UUID
 
 from django.utils.translation import gettext as _
 from import_export.fields import Field
-from import_export.widgets import ForeignKeyWidget, Widget
+from import_export.widgets import Widget
 from tablib import Dataset
 
 from traffic_control.models import (
@@ -21,6 +21,7 @@ from traffic_control.models.common import TrafficControlDeviceType
 from traffic_control.models.traffic_sign import TrafficSignPlan, TrafficSignReal
 from traffic_control.resources.common import (
     GenericDeviceBaseResource,
+    PreloadedForeignKeyWidget,
     ReplacementField,
     ReplacementWidget,
     SOURCE_NAME_ID_FIELDS,
@@ -137,17 +138,17 @@ class AbstractAdditionalSignResource(GenericDeviceBaseResource):
     owner__name_fi = Field(
         attribute="owner",
         column_name="owner__name_fi",
-        widget=ForeignKeyWidget(Owner, "name_fi"),
+        widget=PreloadedForeignKeyWidget(Owner, "name_fi"),
     )
     device_type__code = Field(
         attribute="device_type",
         column_name="device_type__code",
-        widget=ForeignKeyWidget(TrafficControlDeviceType, "code"),
+        widget=PreloadedForeignKeyWidget(TrafficControlDeviceType, "code"),
     )
     mount_type__code = Field(
         attribute="mount_type",
         column_name="mount_type__code",
-        widget=ForeignKeyWidget(MountType, "code"),
+        widget=PreloadedForeignKeyWidget(MountType, "code"),
     )
     # `content_s` column is destructured to several columns in after_export() and built back in before_import()
     content_s = Field(
@@ -283,59 +284,58 @@ class AbstractAdditionalSignResource(GenericDeviceBaseResource):
 
         else:
             content_rows = data["content_s"]
-            # Collect all content_s properties names from every row.
+            # Collect the values of every content_s property in a single pass over the rows.
             # Use dict to retain properties order as they appear in data.
-            content_properties = {}
-            for row in content_rows:
-                for key in row:
-                    content_properties[key] = None
+            columns = {}
+            for row_index, row in enumerate(content_rows):
+                for property, value in self._get_content_s_columns(row).items():
+                    if property not in columns:
+                        columns[property] = [None] * len(content_rows)
+                    columns[property][row_index] = value
 
-            for property in content_properties:
-                values = self._get_values_for_property(property, content_rows)
+            for property, values in columns.items():
+                data.append_col(values, header=property)
 
-                # Convert arrays and objects to JSON strings
-                values = self._structured_values_to_string(values)
+        del data["content_s"]
 
-                data.append_col(values, header=f"content_s.{property}")
+    def get_export_job_headers(self):
+        return [header for header in super().get_export_job_headers() if header != "content_s"]
 
-        del data["content_s"]
+    def iter_export_job_rows(self, queryset):
+        content_s_index = super().get_export_job_headers().index("content_s")
+        for values, extra_columns in super().iter_export_job_rows(queryset):
+            content_s = values.pop(content_s_index)
+            yield values, {**extra_columns, **self._get_content_s_columns(content_s)}
 
-    @staticmethod
-    def _get_values_for_property(property, content_rows):
-        values = []
-        for row in content_rows:
-            if isinstance(row, str):
-                values.append(None)
-            else:
-                values.append(row.get(property))
-        return values
+    @classmethod
+    def _get_content_s_columns(cls, content_s) -> dict:
+        """Return `content_s.<property name>` columns of a row, arrays and objects converted to JSON strings"""
+        if not isinstance(content_s, dict):
+            return {}
+        return {f"content_s.{key}": cls._structured_value_to_string(value) for key, value in content_s.items()}
 
     @staticmethod
-    def _structured_values_to_string(values: list):
-        out_values = []
-        for value in values:
-            if type(value) in [list, dict]:
-                out_values.append(json.dumps(value))
-            else:
-                out_values.append(value)
-        return out_values
+    def _structured_value_to_string(value):
+        if type(value) in [list, dict]:
+            return json.dumps(value)
+        return value
 
 
 class AdditionalSignPlanResource(AbstractAdditionalSignResource):
     parent__id = Field(
         attribute="parent",
         column_name="parent__id",
-        widget=ForeignKeyWidget(TrafficSignPlan, "id"),
+        widget=PreloadedForeignKeyWidget(TrafficSignPlan, "id"),
     )
     mount_plan__id = Field(
         attribute="mount_plan",
         column_name="mount_plan__id",
-        widget=ForeignKeyWidget(MountPlan, "id"),
+        widget=PreloadedForeignKeyWidget(MountPlan, "id"),
     )
     plan__decision_id = Field(
         attribute="plan",
         column_name="plan__decision_id",
-        widget=ForeignKeyWidget(Plan, "decision_id"),
+        widget=PreloadedForeignKeyWidget(Plan, "decision_id"),
     )
     replaces = ReplacementField(
         attribute="replacement_to_old",
@@ -366,17 +366,17 @@ class AdditionalSignRealResource(AbstractAdditionalSignResource):
     parent__id = Field(
         attribute="parent",
         column_name="parent__id",
-        widget=ForeignKeyWidget(TrafficSignReal, "id"),
+        widget=PreloadedForeignKeyWidget(TrafficSignReal, "id"),
     )
     additional_sign_plan__id = Field(
         attribute="additional_sign_plan",
         column_name="additional_sign_plan__id",
-        widget=ForeignKeyWidget(AdditionalSignPlan, "id"),
+        widget=PreloadedForeignKeyWidget(AdditionalSignPlan, "id"),
     )
     mount_real__id = Field(
         attribute="mount_real",
         column_name="mount_real__id",
-        widget=ForeignKeyWidget(MountReal, "id"),
+        widget=PreloadedForeignKeyWidget(MountReal, "id"),
     )
 
     class Meta(AbstractAdditionalSignResource.Meta):
@@ -1,6 +1,5 @@
 from django.utils.translation import gettext as _
 from import_export.fields import Field
-from import_export.widgets import ForeignKeyWidget
 
 from traffic_control.models import (
     BarrierPlan,
@@ -12,6 +11,7 @@ from traffic_control.models import (
 )
 from traffic_control.resources.common import (
     GenericDeviceBaseResource,
+    PreloadedForeignKeyWidget,
     ReplacementField,
     ReplacementWidget,
     SOURCE_NAME_ID_FIELDS,
@@ -23,12 +23,12 @@ class AbstractBarrierResource(GenericDeviceBaseResource):
     owner__name_fi = Field(
         attribute="owner",
         column_name="owner__name_fi",
-        widget=ForeignKeyWidget(Owner, "name_fi"),
+        widget=PreloadedForeignKeyWidget(Owner, "name_fi"),
     )
     device_type__code = Field(
         attribute="device_type",
         column_name="device_type__code",
-        widget=ForeignKeyWidget(TrafficControlDeviceType, "code"),
+        widget=PreloadedForeignKeyWidget(TrafficControlDeviceType, "code"),
     )
 
     class Meta(GenericDeviceBaseResource.Meta):
@@ -58,7 +58,7 @@ class BarrierPlanResource(AbstractBarrierResource):
     plan__decision_id = Field(
         attribute="plan",
         column_name="plan__decision_id",
-        widget=ForeignKeyWidget(Plan, "decision_id"),
+        widget=PreloadedForeignKeyWidget(Plan, "decision_id"),
     )
     replaces = ReplacementField(
         attribute="replacement_to_old",
@@ -85,7 +85,7 @@ class BarrierRealResource(AbstractBarrierResource):
     barrier_plan__id = Field(
         attribute="barrier_plan",
         column_name="barrier_plan__id",
-        widget=ForeignKeyWidget(BarrierPlan, "id"),
+        widget=PreloadedForeignKeyWidget(BarrierPlan, "id"),
     )
 
     class Meta(AbstractBarrierResource.Meta):
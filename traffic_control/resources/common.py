@@ -1,23 +1,36 @@
-from typing import Dict, List, Optional, OrderedDict, Set
+from collections import defaultdict
+from copy import copy, deepcopy
+from typing import Dict, Iterable, Iterator, List, Optional, OrderedDict, Set, Tuple
 from uuid import UUID, uuid4
 
+from auditlog.diff import model_instance_diff
+from auditlog.models import LogEntry
+from auditlog.registry import auditlog
+from django.conf import settings
 from django.contrib import messages
 from django.core.exceptions import ValidationError
 from django.http import HttpResponse
-from django.urls import path
+from django.urls import path, reverse
 from django.utils.encoding import force_str
+from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from enumfields import EnumField, EnumIntegerField
 from import_export import fields, widgets
 from import_export.admin import ImportExportActionModelAdmin
 from import_export.formats import base_formats
+from import_export.instance_loaders import ModelInstanceLoader
 from import_export.resources import ModelResource
 from tablib import Dataset
 
+from traffic_control.mixins.models import ReplaceableDevicePlanMixin, REPLACEMENT_TO_OLD, UpdatePlanLocationMixin
 from traffic_control.models import ResponsibleEntity
 from traffic_control.models.utils import SoftDeleteQuerySet
+from traffic_control.services.export_job import export_job_create, export_job_start
 from traffic_control.services.virus_scan import add_virus_scan_errors_to_auditlog
+from traffic_control.signal_utils import bulk_create_log_entries
 from traffic_control.utils import get_file_upload_obstacles
+from traffic_control.utils.data_version import bump_data_version
+from traffic_control.utils.reference_data import get_reference_objects, is_reference_model
 from users.models import User
 from users.utils import get_system_user
 
@@ -89,6 +102,63 @@ class ResourceUUIDField(fields.Field):
         return value
 
 
+class PreloadedForeignKeyWidget(widgets.ForeignKeyWidget):
+    """
+    ForeignKeyWidget that resolves values from the related objects preloaded for the whole import dataset with
+    preload(), instead of querying the related object of every row. Values that were not preloaded, e.g. objects
+    created earlier in the same import, are queried as usual.
+    """
+
+    def __init__(self, model, field="pk", *args, **kwargs):
+        super().__init__(model, field, *args, **kwargs)
+        self.preloaded_objects = None
+
+    def preload(self, values: Iterable) -> list:
+        """
+        Load the related objects referenced by `values` with one query and return them. Objects of reference models
+        are taken from the reference data cache without a query.
+        """
+        keys = {key for key in map(self._get_key, values) if key is not None}
+        queryset = self.get_queryset(None, None)
+        if is_reference_model(queryset.model) and not queryset.query.where:
+            objects = [
+                obj for obj in get_reference_objects(queryset.model) if self._get_key(getattr(obj, self.field)) in keys
+            ]
+        else:
+            objects = list(queryset.filter(**{f"{self.field}__in": keys}))
+        self.preloaded_objects = {}
+        ambiguous_keys = set()
+        for obj in objects:
+            key = self._get_key(getattr(obj, self.field))
+            if key in self.preloaded_objects:
+                ambiguous_keys.add(key)
+            self.preloaded_objects[key] = obj
+        # Leave values matching several objects to the query, so that they are reported like before
+        for key in ambiguous_keys:
+            del self.preloaded_objects[key]
+        return objects
+
+    def remember(self, obj) -> None:
+        """Make `obj` resolvable without a query, e.g. because it is not saved to the database yet"""
+        if self.preloaded_objects is not None:
+            self.preloaded_objects[self._get_key(getattr(obj, self.field))] = obj
+
+    def clean(self, value, row=None, **kwargs):
+        key = self._get_key(value) if self.preloaded_objects else None
+        if key is not None and key in self.preloaded_objects:
+            return self.preloaded_objects[key]
+        return super().clean(value, row, **kwargs)
+
+    def _get_key(self, value):
+        if value in [None, ""]:
+            return None
+        lookup_field = self.model._meta.pk if self.field == "pk" else self.model._meta.get_field(self.field)
+        try:
+            return lookup_field.to_python(value)
+        except ValidationError:
+            return None
+
+
 class ReplacementWidget(widgets.ForeignKeyWidget):
     def render(self, value, obj=None):
         val = super().render(value, obj)
@@ -107,12 +177,27 @@ class ReplacementField(fields.Field):
     ):
         self.replace_method = replace_method
         self.unreplace_method = unreplace_method
+        self.preloaded_objects = {}
         super().__init__(**kwargs)
 
+    def preload(self, model, values: Iterable) -> None:
+        """Load the device plans referenced in the column of the whole import dataset with one query"""
+        ids = set()
+        for value in values:
+            try:
+                ids.add(model._meta.pk.to_python(value) if value else None)
+            except ValidationError:
+                pass
+        ids.discard(None)
+        self.preloaded_objects = model.objects.in_bulk(ids)
+
     def save(self, obj, data, is_m2m=False, **kwargs):
         if not self.readonly:
             replaces_id = data.get("replaces")
-            newer_replaced = obj._meta.model.objects.get(pk=replaces_id) if replaces_id else None
+            newer_replaced = self._get_replaced(obj._meta.model, replaces_id) if replaces_id else None
+            if newer_replaced is None and obj._state.adding:
+                # New device plan does not replace anything yet
+                return
             if obj.replaces == newer_replaced:
                 # No change
                 return
@@ -121,18 +206,124 @@ class ReplacementField(fields.Field):
             else:
                 self.unreplace_method(obj)
 
+    def _get_replaced(self, model, replaces_id):
+        try:
+            replaced = self.preloaded_objects.get(model._meta.pk.to_python(replaces_id))
+        except ValidationError:
+            replaced = None
+        return replaced or model.objects.get(pk=replaces_id)
+
+
+class DeviceInstanceLoader(ModelInstanceLoader):
+    """
+    Instance loader that loads the existing instances of the whole import dataset with one query, together with
+    their imported foreign keys and replacements, instead of querying them row by row. The resource preloads
+    the related objects referenced by the dataset at the same time.
+    """
+
+    def __init__(self, resource, dataset=None):
+        super().__init__(resource, dataset)
+        self.pk_field = None
+        self.instances = {}
+
+        if dataset is None:
+            return
+        resource.preload_related_objects(dataset)
+
+        import_id_fields = resource.get_import_id_fields()
+        if len(import_id_fields) != 1 or resource.fields[import_id_fields[0]].column_name not in dataset.headers:
+            return
+        self.pk_field = resource.fields[import_id_fields[0]]
+
+        keys = set()
+        for value in dataset[self.pk_field.column_name]:
+            try:
+                keys.add(self.pk_field.clean({self.pk_field.column_name: value}))
+            except ValueError:
+                pass
+        keys.discard(None)
+        queryset = self.get_queryset().filter(**{f"{self.pk_field.attribute}__in": keys})
+        self.instances = {getattr(obj, self.pk_field.attribute): obj for obj in self._select_related(queryset)}
+
+    def get_instance(self, row):
+        if self.pk_field is None:
+            return super().get_instance(row)
+        try:
+            key = self.pk_field.clean(row)
+        except ValueError:
+            return super().get_instance(row)
+        return self.instances.get(key)
+
+    def _select_related(self, queryset):
+        model = self.resource._meta.model
+        related_fields = set()
+        for field in self.resource.get_import_fields():
+            name = (field.attribute or "").split("__")[0]
+            model_field = next((f for f in model._meta.concrete_fields if f.name == name), None)
+            if model_field is not None and model_field.many_to_one:
+                related_fields.add(name)
+        if issubclass(model, ReplaceableDevicePlanMixin):
+            related_fields.add(f"{REPLACEMENT_TO_OLD}__old")
+        return queryset.select_related(*sorted(related_fields))
+
 
 class GenericDeviceBaseResource(EnumFieldResourceMixin, ModelResource):
     id = ResourceUUIDField(attribute="id", column_name="id", default=None, widget=UUIDWidget())
 
+    # Export jobs stream the rows to a file instead of building a Dataset, so resources whose after_export()
+    # needs the whole dataset can not be exported with them.
+    supports_export_job = True
+
     def get_queryset(self):
         return self._meta.model.objects.active()
 
+    def get_export_job_headers(self) -> List[str]:
+        """Return the headers of the row values yielded by iter_export_job_rows()"""
+        return self.get_export_headers()
+
+    def iter_export_job_rows(self, queryset) -> Iterator[Tuple[list, Dict[str, object]]]:
+        """
+        Yield the exported rows of `queryset` one at a time as (values, extra columns) pairs. Values follow
+        get_export_job_headers() and extra columns map the names of columns that depend on the row data to values.
+        """
+        self.before_export(queryset)
+        queryset = self.filter_export(queryset)
+        for obj in self.iter_queryset(queryset):
+            yield self.export_resource(obj), {}
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._known_related_pks = defaultdict(set)
+        self._bulk_originals = {}
+        self._bulk_saved = []
+
+    def before_import(self, dataset, using_transactions, dry_run, **kwargs):
+        super().before_import(dataset, using_transactions, dry_run, **kwargs)
+        if len(dataset) >= settings.IMPORT_BULK_ROW_THRESHOLD:
+            # Options are shared by all instances of the resource class
+            self._meta = copy(self._meta)
+            self._meta.use_bulk = True
+
+    def preload_related_objects(self, dataset: Dataset) -> None:
+        """Load the related objects referenced by the columns of `dataset` once for the whole import"""
+        for field in self.get_import_fields():
+            if field.column_name not in dataset.headers:
+                continue
+            if isinstance(field.widget, PreloadedForeignKeyWidget):
+                for obj in field.widget.preload(dataset[field.column_name]):
+                    self._known_related_pks[field.widget.model].add(obj.pk)
+            elif isinstance(field, ReplacementField) and not field.readonly:
+                field.preload(self._meta.model, dataset[field.column_name])
+
     def after_import_instance(self, instance, new, row_number=None, **kwargs):
         """Set created_by and updated_by users"""
+        if self._meta.use_bulk and not new:
+            self._bulk_originals[instance.pk] = deepcopy(instance)
+
         user = kwargs.pop("user", None)
         if user is None:
             user = get_system_user()
+        self._known_related_pks[type(user)].add(user.pk)
 
         instance.updated_by = user
         if new:
@@ -140,9 +331,82 @@ class GenericDeviceBaseResource(EnumFieldResourceMixin, ModelResource):
 
         super().after_import_instance(instance, new, row_number=None, **kwargs)
 
+    def validate_instance(self, instance, import_validation_errors=None, validate_unique=True):
+        """Validate like ModelResource, but skip the existence query of foreign keys to preloaded objects"""
+        if not self._meta.clean_model_instances:
+            return super().validate_instance(instance, import_validation_errors, validate_unique)
+
+        errors = dict(import_validation_errors or {})
+        exclude = set(errors)
+        for field in instance._meta.concrete_fields:
+            if field.many_to_one and getattr(instance, field.attname) in self._known_related_pks[field.related_model]:
+                exclude.add(field.name)
+        try:
+            instance.full_clean(exclude=exclude, validate_unique=validate_unique)
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+
+    def before_save_instance(self, instance, using_transactions, dry_run):
+        super().before_save_instance(instance, using_transactions, dry_run)
+        if self._meta.use_bulk:
+            # Saving no fields runs the checks and derived values of the model's save() without writing anything
+            instance.save(update_fields=[])
+            if not instance._state.adding:
+                for field in instance._meta.concrete_fields:
+                    if getattr(field, "auto_now", False):
+                        field.pre_save(instance, add=False)
+
+    def after_save_instance(self, instance, using_transactions, dry_run):
+        super().after_save_instance(instance, using_transactions, dry_run)
+        if self._meta.use_bulk:
+            self._bulk_saved.append(instance)
+            # Rows may refer to objects created by earlier rows, which are not in the database yet
+            self._known_related_pks[type(instance)].add(instance.pk)
+            for field in self.get_import_fields():
+                if isinstance(field.widget, PreloadedForeignKeyWidget) and field.widget.model is type(instance):
+                    field.widget.remember(instance)
+
+    def get_bulk_update_fields(self):
+        # save() derives values also for fields that are not imported
+        return [field.name for field in self._meta.model._meta.concrete_fields if not field.primary_key]
+
+    def after_import(self, dataset, result, using_transactions, dry_run, **kwargs):
+        super().after_import(dataset, result, using_transactions, dry_run, **kwargs)
+        if self._meta.use_bulk and not dry_run and not result.has_errors() and not result.has_validation_errors():
+            self._after_bulk_import()
+
+    def _after_bulk_import(self):
+        """Do what saving the instances one by one would have done: audit log, data version and plan locations"""
+        model = self._meta.model
+        if auditlog.contains(model):
+            created = [obj for obj in self._bulk_saved if obj.pk not in self._bulk_originals]
+            bulk_create_log_entries(
+                ((obj, model_instance_diff(None, obj)) for obj in created),
+                action=LogEntry.Action.CREATE,
+            )
+            updated = [obj for obj in self._bulk_saved if obj.pk in self._bulk_originals]
+            changes = ((obj, model_instance_diff(self._bulk_originals[obj.pk], obj)) for obj in updated)
+            bulk_create_log_entries((obj, obj_changes) for obj, obj_changes in changes if obj_changes)
+
+        bump_data_version(model._meta.db_table)
+
+        if issubclass(model, UpdatePlanLocationMixin):
+            plan_ids = set()
+            for obj in self._bulk_saved:
+                original = self._bulk_originals.get(obj.pk)
+                if original is None or original.plan_id != obj.plan_id:
+                    plan_ids.update([obj.plan_id, original.plan_id if original else None])
+            plan_ids.discard(None)
+            plan_model = model._meta.get_field("plan").related_model
+            for plan in plan_model.objects.filter(pk__in=plan_ids, derive_location=True):
+                plan.derive_location_from_related_plans()
+
     class Meta:
         skip_unchanged = True
         report_skipped = True
+        instance_loader_class = DeviceInstanceLoader
         exclude = (
             "is_active",
             "deleted_at",
@@ -231,6 +495,8 @@ class ParentChildReplacementPlanToRealExportMixin:
     Any UUID references to existing real devices are retained.
     """
 
+    supports_export_job = False
+
     def after_export(self, queryset: SoftDeleteQuerySet, data: Dataset, *args, **kwargs):
         super().after_export(queryset, data, *args, **kwargs)
         self._replace_ids_with_replaceable_values(queryset, data)
@@ -410,6 +676,40 @@ class CustomImportExportActionModelAdmin(ImportExportActionModelAdmin):
         )
         return response
 
+    def pick_export_resource_class(self, **kwargs):
+        """Return export resource class to be used for exporting"""
+        return self.get_export_resource_classes()[0]
+
+    def export_admin_action(self, request, queryset):
+        """
+        Export selections of at least EXPORT_JOB_ROW_THRESHOLD rows in a background export job instead of in the
+        request. The user is notified with a download link when the export file is ready.
+        """
+        export_format = request.POST.get("file_format")
+        if export_format and self.has_export_permission(request):
+            file_format = self.get_export_formats()[int(export_format)]()
+            resource_class = self.pick_export_resource_class(request=request)
+            if (
+                getattr(resource_class, "supports_export_job", False)
+                and queryset.count() >= settings.EXPORT_JOB_ROW_THRESHOLD
+            ):
+                job = export_job_create(request.user, queryset, resource_class, file_format.get_extension())
+                export_job_start(job)
+                self.message_user(
+                    request,
+                    format_html(
+                        _(
+                            "The export was started in the background. You will be notified by email when it is "
+                            'ready, and it can be downloaded from <a href="{}">export jobs</a>.'
+                        ),
+                        reverse("admin:traffic_control_exportjob_changelist"),
+                    ),
+                    messages.SUCCESS,
+                )
+                return None
+
+        return super().export_admin_action(request, queryset)
+
     def get_urls(self):
         urls = super().get_urls()
         my_urls = [
@@ -1,6 +1,5 @@
 from django.utils.translation import gettext as _
 from import_export.fields import Field
-from import_export.widgets import ForeignKeyWidget
 
 from traffic_control.models import (
     MountPlan,
@@ -13,6 +12,7 @@ from traffic_control.models import (
 )
 from traffic_control.resources.common import (
     GenericDeviceBaseResource,
+    PreloadedForeignKeyWidget,
     ReplacementField,
     ReplacementWidget,
     SOURCE_NAME_ID_FIELDS,
@@ -24,17 +24,17 @@ class AbstractMountResource(GenericDeviceBaseResource):
     owner__name_fi = Field(
         attribute="owner",
         column_name="owner__name_fi",
-        widget=ForeignKeyWidget(Owner, "name_fi"),
+        widget=PreloadedForeignKeyWidget(Owner, "name_fi"),
     )
     mount_type__code = Field(
         attribute="mount_type",
         column_name="mount_type__code",
-        widget=ForeignKeyWidget(MountType, "code"),
+        widget=PreloadedForeignKeyWidget(MountType, "code"),
     )
     portal_type__id = Field(
         attribute="portal_type",
         column_name="portal_type__id",
-        widget=ForeignKeyWidget(PortalType, "id"),
+        widget=PreloadedForeignKeyWidget(PortalType, "id"),
     )
     base = Field(attribute="base", column_name="base", default="")
 
@@ -60,7 +60,7 @@ class MountPlanResource(AbstractMountResource):
     plan__decision_id = Field(
         attribute="plan",
         column_name="plan__decision_id",
-        widget=ForeignKeyWidget(Plan, "decision_id"),
+        widget=PreloadedForeignKeyWidget(Plan, "decision_id"),
     )
     replaces = ReplacementField(
         attribute="replacement_to_old",
@@ -87,7 +87,7 @@ class MountRealResource(AbstractMountResource):
     mount_plan__id = Field(
         attribute="mount_plan",
         column_name="mount_plan__id",
-        widget=ForeignKeyWidget(MountPlan, "id"),
+        widget=PreloadedForeignKeyWidget(MountPlan, "id"),
     )
 
     class Meta(AbstractMountResource.Meta):
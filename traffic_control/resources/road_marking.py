@@ -1,6 +1,5 @@
 from django.utils.translation import gettext as _
 from import_export.fields import Field
-from import_export.widgets import ForeignKeyWidget
 
 from traffic_control.models import (
     Owner,
@@ -14,6 +13,7 @@ from traffic_control.models import (
 )
 from traffic_control.resources.common import (
     GenericDeviceBaseResource,
+    PreloadedForeignKeyWidget,
     ReplacementField,
     ReplacementWidget,
     SOURCE_NAME_ID_FIELDS,
@@ -25,12 +25,12 @@ class AbstractRoadMarkingResource(GenericDeviceBaseResource):
     owner__name_fi = Field(
         attribute="owner",
         column_name="owner__name_fi",
-        widget=ForeignKeyWidget(Owner, "name_fi"),
+        widget=PreloadedForeignKeyWidget(Owner, "name_fi"),
     )
     device_type__code = Field(
         attribute="device_type",
         column_name="device_type__code",
-        widget=ForeignKeyWidget(TrafficControlDeviceType, "code"),
+        widget=PreloadedForeignKeyWidget(TrafficControlDeviceType, "code"),
     )
 
     class Meta(GenericDeviceBaseResource.Meta):
@@ -68,12 +68,12 @@ class RoadMarkingPlanResource(AbstractRoadMarkingResource):
     traffic_sign_plan__id = Field(
         attribute="traffic_sign_plan",
         column_name="traffic_sign_plan__id",
-        widget=ForeignKeyWidget(TrafficSignPlan, "id"),
+        widget=PreloadedForeignKeyWidget(TrafficSignPlan, "id"),
     )
     plan__decision_id = Field(
         attribute="plan",
         column_name="plan__decision_id",
-        widget=ForeignKeyWidget(Plan, "decision_id"),
+        widget=PreloadedForeignKeyWidget(Plan, "decision_id"),
     )
     replaces = ReplacementField(
         attribute="replacement_to_old",
@@ -103,12 +103,12 @@ class RoadMarkingRealResource(AbstractRoadMarkingResource):
     road_marking_plan__id = Field(
         attribute="road_marking_plan",
         column_name="road_marking_plan__id",
-        widget=ForeignKeyWidget(RoadMarkingPlan, "id"),
+        widget=PreloadedForeignKeyWidget(RoadMarkingPlan, "id"),
     )
     traffic_sign_real__id = Field(
         attribute="traffic_sign_real",
         column_name="traffic_sign_real__id",
-        widget=ForeignKeyWidget(TrafficSignReal, "id"),
+        widget=PreloadedForeignKeyWidget(TrafficSignReal, "id"),
     )
 
     class Meta(AbstractRoadMarkingResource.Meta):
@@ -1,6 +1,5 @@
 from django.utils.translation import gettext as _
 from import_export.fields import Field
-from import_export.widgets import ForeignKeyWidget
 
 from traffic_control.models import (
     MountPlan,
@@ -17,6 +16,7 @@ from traffic_control.resources.common import (
     GenericDeviceBaseResource,
     ParentChildReplacementImportMixin,
     ParentChildReplacementPlanToRealExportMixin,
+    PreloadedForeignKeyWidget,
     ReplacementField,
     ReplacementWidget,
     SOURCE_NAME_ID_FIELDS,
@@ -31,17 +31,17 @@ class AbstractSignpostResource(
     owner__name_fi = Field(
         attribute="owner",
         column_name="owner__name_fi",
-        widget=ForeignKeyWidget(Owner, "name_fi"),
+        widget=PreloadedForeignKeyWidget(Owner, "name_fi"),
     )
     device_type__code = Field(
         attribute="device_type",
         column_name="device_type__code",
-        widget=ForeignKeyWidget(TrafficControlDeviceType, "code"),
+        widget=PreloadedForeignKeyWidget(TrafficControlDeviceType, "code"),
     )
     mount_type__code = Field(
         attribute="mount_type",
         column_name="mount_type__code",
-        widget=ForeignKeyWidget(MountType, "code"),
+        widget=PreloadedForeignKeyWidget(MountType, "code"),
     )
 
     class Meta(
@@ -79,17 +79,17 @@ class SignpostPlanResource(AbstractSignpostResource):
     parent__id = Field(
         attribute="parent",
         column_name="parent__id",
-        widget=ForeignKeyWidget(SignpostPlan, "id"),
+        widget=PreloadedForeignKeyWidget(SignpostPlan, "id"),
     )
     mount_plan__id = Field(
         attribute="mount_plan",
         column_name="mount_plan__id",
-        widget=ForeignKeyWidget(MountPlan, "id"),
+        widget=PreloadedForeignKeyWidget(MountPlan, "id"),
     )
     plan__decision_id = Field(
         attribute="plan",
         column_name="plan__decision_id",
-        widget=ForeignKeyWidget(Plan, "decision_id"),
+        widget=PreloadedForeignKeyWidget(Plan, "decision_id"),
     )
     replaces = ReplacementField(
         attribute="replacement_to_old",
@@ -119,17 +119,17 @@ class SignpostRealResource(AbstractSignpostResource):
     parent__id = Field(
         attribute="parent",
         column_name="parent__id",
-        widget=ForeignKeyWidget(SignpostReal, "id"),
+        widget=PreloadedForeignKeyWidget(SignpostReal, "id"),
     )
     signpost_plan__id = Field(
         attribute="signpost_plan",
         column_name="signpost_plan__id",
-        widget=ForeignKeyWidget(SignpostPlan, "id"),
+        widget=PreloadedForeignKeyWidget(SignpostPlan, "id"),
     )
     mount_real__id = Field(
         attribute="mount_real",
         column_name="mount_real__id",
-        widget=ForeignKeyWidget(MountReal, "id"),
+        widget=PreloadedForeignKeyWidget(MountReal, "id"),
     )
 
     class Meta(AbstractSignpostResource.Meta):
@@ -1,6 +1,5 @@
 from django.utils.translation import gettext as _
 from import_export.fields import Field
-from import_export.widgets import ForeignKeyWidget
 
 from traffic_control.models import (
     MountPlan,
@@ -15,6 +14,7 @@ from traffic_control.models import (
 from traffic_control.models.traffic_sign import TrafficSignPlanReplacement
 from traffic_control.resources.common import (
     GenericDeviceBaseResource,
+    PreloadedForeignKeyWidget,
     ReplacementField,
     ReplacementWidget,
     SOURCE_NAME_ID_FIELDS,
@@ -26,17 +26,17 @@ class AbstractTrafficSignResource(GenericDeviceBaseResource):
     owner__name_fi = Field(
         attribute="owner",
         column_name="owner__name_fi",
-        widget=ForeignKeyWidget(Owner, "name_fi"),
+        widget=PreloadedForeignKeyWidget(Owner, "name_fi"),
     )
     device_type__code = Field(
         attribute="device_type",
         column_name="device_type__code",
-        widget=ForeignKeyWidget(TrafficControlDeviceType, "code"),
+        widget=PreloadedForeignKeyWidget(TrafficControlDeviceType, "code"),
     )
     mount_type__code = Field(
         attribute="mount_type",
         column_name="mount_type__code",
-        widget=ForeignKeyWidget(MountType, "code"),
+        widget=PreloadedForeignKeyWidget(MountType, "code"),
     )
 
     class Meta(GenericDeviceBaseResource.Meta):
@@ -68,12 +68,12 @@ class TrafficSignPlanResource(AbstractTrafficSignResource):
     mount_plan__id = Field(
         attribute="mount_plan",
         column_name="mount_plan__id",
-        widget=ForeignKeyWidget(MountPlan, "id"),
+        widget=PreloadedForeignKeyWidget(MountPlan, "id"),
     )
     plan__decision_id = Field(
         attribute="plan",
         column_name="plan__decision_id",
-        widget=ForeignKeyWidget(Plan, "decision_id"),
+        widget=PreloadedForeignKeyWidget(Plan, "decision_id"),
     )
     replaces = ReplacementField(
         attribute="replacement_to_old",
@@ -103,12 +103,12 @@ class TrafficSignRealResource(AbstractTrafficSignResource):
     traffic_sign_plan__id = Field(
         attribute="traffic_sign_plan",
         column_name="traffic_sign_plan__id",
-        widget=ForeignKeyWidget(TrafficSignPlan, "id"),
+        widget=PreloadedForeignKeyWidget(TrafficSignPlan, "id"),
     )
     mount_real__id = Field(
         attribute="mount_real",
         column_name="mount_real__id",
-        widget=ForeignKeyWidget(MountReal, "id"),
+        widget=PreloadedForeignKeyWidget(MountReal, "id"),
     )
 
     class Meta(AbstractTrafficSignResource.Meta):
@@ -40,6 +40,20 @@ geo_format_parameter = OpenApiParameter(
     description="Determine whether the location should be in EWKT (default) or GeoJSON format.",
 )
 
+sparse_fields_parameter = OpenApiParameter(
+    name="fields",
+    type=str,
+    required=False,
+    description="Comma separated names of the fields to return. All fields are returned by default.",
+)
+
+omit_fields_parameter = OpenApiParameter(
+    name="omit",
+    type=str,
+    required=False,
+    description="Comma separated names of the fields to leave out of the response.",
+)
+
 
 file_uuid_parameter = OpenApiParameter(
     name="file_pk",
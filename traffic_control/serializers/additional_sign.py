@@ -17,6 +17,8 @@ from traffic_control.serializers.common import (
     EwktPointField,
     FileProxySerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
+    ReferenceRelatedField,
     ReplaceableDeviceInputSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
     StructuredContentValidator,
@@ -34,11 +36,12 @@ class AdditionalSignPlanInputSerializer(
     AdditionalSignParentValidationMixin,
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceInputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.ADDITIONAL_SIGN),
         allow_null=True,
         required=False,
@@ -69,11 +72,12 @@ class AdditionalSignPlanGeoJSONInputSerializer(AdditionalSignPlanInputSerializer
 class AdditionalSignPlanOutputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.ADDITIONAL_SIGN),
         allow_null=True,
         required=False,
@@ -103,7 +107,7 @@ class AdditionalSignRealFileSerializer(FileProxySerializerMixin, serializers.Mod
 
 class AdditionalSignRealOperationSerializer(serializers.ModelSerializer):
     operation_type = serializers.StringRelatedField()
-    operation_type_id = serializers.PrimaryKeyRelatedField(
+    operation_type_id = ReferenceRelatedField(
         queryset=OperationType.objects.filter(additional_sign=True),
         source="operation_type",
     )
@@ -129,11 +133,12 @@ class AdditionalSignRealSerializer(
     AdditionalSignParentValidationMixin,
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
     files = AdditionalSignRealFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.ADDITIONAL_SIGN),
         allow_null=True,
         required=False,
@@ -16,6 +16,8 @@ from traffic_control.serializers.common import (
     EwktGeometryField,
     FileProxySerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
+    ReferenceRelatedField,
     ReplaceableDeviceInputSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
 )
@@ -31,11 +33,12 @@ class BarrierPlanFileSerializer(FileProxySerializerMixin, serializers.ModelSeria
 class BarrierPlanInputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceInputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktGeometryField()
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.BARRIER),
         allow_null=True,
         required=False,
@@ -65,12 +68,13 @@ class BarrierPlanGeoJSONInputSerializer(BarrierPlanInputSerializer):
 class BarrierPlanOutputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktGeometryField()
     files = BarrierPlanFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.BARRIER),
         allow_null=True,
         required=False,
@@ -99,7 +103,7 @@ class BarrierRealFileSerializer(FileProxySerializerMixin, serializers.ModelSeria
 
 class BarrierRealOperationSerializer(serializers.ModelSerializer):
     operation_type = serializers.StringRelatedField()
-    operation_type_id = serializers.PrimaryKeyRelatedField(
+    operation_type_id = ReferenceRelatedField(
         queryset=OperationType.objects.filter(barrier=True),
         source="operation_type",
     )
@@ -124,11 +128,12 @@ class BarrierRealOperationSerializer(serializers.ModelSerializer):
 class BarrierRealSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktGeometryField()
     files = BarrierRealFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.BARRIER),
         allow_null=True,
         required=False,
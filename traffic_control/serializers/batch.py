@@ -0,0 +1,66 @@
+from collections import Counter
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+BATCH_ACTION_CREATE = "create"
+BATCH_ACTION_UPDATE = "update"
+BATCH_ACTION_DELETE = "delete"
+
+# HTTP methods whose permissions the batch operations require, same as the single object endpoints
+BATCH_ACTION_METHODS = {
+    BATCH_ACTION_CREATE: "POST",
+    BATCH_ACTION_UPDATE: "PATCH",
+    BATCH_ACTION_DELETE: "DELETE",
+}
+
+
+class BatchOperationSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=list(BATCH_ACTION_METHODS))
+    id = serializers.CharField(
+        required=False,
+        help_text="ID of the object to update or delete",
+    )
+    data = serializers.DictField(
+        required=False,
+        default=dict,
+        help_text="Fields of the object to create, or the fields to update (as in PATCH)",
+    )
+
+    def validate(self, attrs):
+        if attrs["action"] != BATCH_ACTION_CREATE and not attrs.get("id"):
+            raise serializers.ValidationError({"id": [_("This field is required for update and delete operations.")]})
+        if attrs["action"] == BATCH_ACTION_CREATE and attrs.get("id"):
+            raise serializers.ValidationError({"id": [_("The ID of created objects can't be given.")]})
+        return attrs
+
+
+class BatchInputSerializer(serializers.Serializer):
+    operations = BatchOperationSerializer(many=True, allow_empty=False)
+
+    def validate_operations(self, operations):
+        max_operations = settings.CITYINFRA_MAXIMUM_BATCH_OPERATIONS
+        if len(operations) > max_operations:
+            raise serializers.ValidationError(
+                _("A batch may contain at most %(max_operations)d operations.") % {"max_operations": max_operations}
+            )
+
+        id_counts = Counter(operation["id"] for operation in operations if operation["action"] != BATCH_ACTION_CREATE)
+        duplicate_ids = sorted(object_id for object_id, count in id_counts.items() if count > 1)
+        if duplicate_ids:
+            raise serializers.ValidationError(
+                _("Objects can be updated or deleted only once in a batch: %(ids)s") % {"ids": ", ".join(duplicate_ids)}
+            )
+        return operations
+
+
+class BatchResultSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=list(BATCH_ACTION_METHODS))
+    id = serializers.CharField()
+    status = serializers.IntegerField(help_text="HTTP status code of the operation as a single object request")
+    data = serializers.DictField(required=False, help_text="The created or updated object")
+
+
+class BatchResponseSerializer(serializers.Serializer):
+    results = BatchResultSerializer(many=True, help_text="Results in the order of the operations")
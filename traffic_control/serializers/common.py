@@ -9,11 +9,14 @@ from enumfields.drf import EnumSupportSerializerMixin
 from rest_framework import serializers
 from rest_framework_gis.fields import GeometryField
 
+from admin_helper.decorators import requires_fields
 from traffic_control.constants import TICKET_MACHINE_CODES
 from traffic_control.enums import DeviceTypeTargetModel
 from traffic_control.geometry_utils import geometry_is_legit
+from traffic_control.mixins.models import REPLACEMENT_TO_NEW, REPLACEMENT_TO_OLD
 from traffic_control.models import OperationalArea, Owner, TrafficControlDeviceType
 from traffic_control.schema import IconsType, TrafficSignType
+from traffic_control.utils.reference_data import get_reference_queryset_object, is_reference_model
 from traffic_control.validators import validate_structured_content
 
 
@@ -130,6 +133,107 @@ class CachedRelatedField(serializers.PrimaryKeyRelatedField):
         return super().to_internal_value(data)
 
 
+class PreResolvedRelatedField(serializers.PrimaryKeyRelatedField):
+    """A PrimaryKeyRelatedField that looks the PK up from instances fetched beforehand.
+
+    Used when validating many objects at once, so that the related objects of all
+    of them are fetched with one query per field instead of one query per object.
+    PKs missing from the fetched instances fall back to the normal queryset lookup,
+    which produces the usual error for non-existing objects.
+
+    Args:
+        instances_by_pk: The already-fetched model instances by their PK as a string.
+        **kwargs: Additional keyword arguments forwarded to ``PrimaryKeyRelatedField``.
+    """
+
+    def __init__(self, instances_by_pk: dict[str, object], **kwargs) -> None:
+        self._instances_by_pk = instances_by_pk
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data: object) -> object:
+        """Return the fetched instance with the PK; fall back to the queryset lookup otherwise.
+
+        Args:
+            data: The raw PK value from the incoming request data.
+
+        Returns:
+            The model instance with the PK.
+        """
+        instance = self._instances_by_pk.get(str(data))
+        if instance is not None:
+            return instance
+        return super().to_internal_value(data)
+
+
+class ReferenceRelatedField(serializers.PrimaryKeyRelatedField):
+    """A PrimaryKeyRelatedField that looks objects of reference models up from the reference data cache.
+
+    Relations to other models, and PKs not found in the cache, are looked up from
+    the queryset as usual.
+    """
+
+    def to_internal_value(self, data: object) -> object:
+        """Return the cached object with the PK if the queryset includes it; fall back to the queryset lookup.
+
+        Args:
+            data: The raw PK value from the incoming request data.
+
+        Returns:
+            The model instance with the PK.
+        """
+        queryset = self.get_queryset()
+        if self.pk_field is not None or isinstance(data, bool) or not is_reference_model(queryset.model):
+            return super().to_internal_value(data)
+
+        try:
+            pk = queryset.model._meta.pk.to_python(data)
+        except (TypeError, ValidationError):
+            return super().to_internal_value(data)
+        instance = get_reference_queryset_object(queryset, pk)
+        if instance is not None:
+            return instance
+        return super().to_internal_value(data)
+
+
+class ReferenceDataSerializerMixin:
+    """Mixin for model serializers that resolves the generated relation fields with ``ReferenceRelatedField``."""
+
+    serializer_related_field = ReferenceRelatedField
+
+
+def pre_resolve_related_fields(serializers_and_data: list[tuple[serializers.Serializer, dict]]) -> None:
+    """Replace the PK related fields of the serializers with fields using instances fetched in one query per field.
+
+    Args:
+        serializers_and_data: Serializers of the same class with the data each of them is going to validate.
+    """
+    if not serializers_and_data:
+        return
+
+    first_serializer = serializers_and_data[0][0]
+    for field_name, field in list(first_serializer.fields.items()):
+        if field.read_only or type(field) not in (serializers.PrimaryKeyRelatedField, ReferenceRelatedField):
+            continue
+
+        queryset = field.get_queryset()
+        if is_reference_model(queryset.model):
+            # Already resolved without queries
+            continue
+        pk_field = queryset.model._meta.pk
+        pks = set()
+        for _serializer, data in serializers_and_data:
+            try:
+                pks.add(pk_field.to_python(data[field_name]))
+            except (KeyError, TypeError, ValidationError):
+                continue
+        pks.discard(None)
+        instances_by_pk = {str(pk): instance for pk, instance in queryset.in_bulk(pks).items()} if pks else {}
+
+        for serializer, _data in serializers_and_data:
+            original_field = serializer.fields[field_name]
+            serializer.fields[field_name] = PreResolvedRelatedField(instances_by_pk, **original_field._kwargs)
+
+
 @extend_schema_serializer(description="")
 class FileProxySerializerMixin:
     """Mixin for file serializers that rewrites the ``file`` URL and caches the parent FK.
@@ -312,16 +416,19 @@ class ReplaceableDeviceOutputSerializerMixin(metaclass=serializers.SerializerMet
     replaced_by = serializers.SerializerMethodField()
     is_replaced = serializers.SerializerMethodField()
 
+    @requires_fields(REPLACEMENT_TO_OLD)
     def get_replaces(self, obj) -> Optional[UUID]:
         """ID of the device plan that this device plan has replaced"""
         replaces = obj.replaces
         return replaces.id if replaces else None
 
+    @requires_fields(REPLACEMENT_TO_NEW)
     def get_replaced_by(self, obj) -> Optional[UUID]:
         """ID of the device plan that has replaced this device plan"""
         replaced_by = obj.replaced_by
         return replaced_by.id if replaced_by else None
 
+    @requires_fields(REPLACEMENT_TO_NEW)
     def get_is_replaced(self, obj) -> bool:
         """Whether this device plan has been replaced by another device plan"""
         return obj.is_replaced
@@ -0,0 +1,275 @@
+"""
+Fast read path for list responses, building the rows from QuerySet.values() instead of model instances.
+
+A serializer class is compiled once into a FastReadPlan: a values() lookup and a converter for every field. The
+converter is the to_representation() of the serializer field itself, so the output equals the output of the
+serializer. Compilation only succeeds when the representation of every field depends on its column value alone:
+fields whose get_attribute() or to_representation() is not one of the known implementations below, fields with
+source="*", SerializerMethodFields, and serializers overriding to_representation() with unknown hooks are not
+supported, and such serializers keep using the regular serializer.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from functools import cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Prefetch
+from enumfields.drf import EnumField
+from rest_framework import relations, serializers
+from rest_framework_gis.fields import GeometryField
+
+from traffic_control.serializers.common import FileProxySerializerMixin, HideFromAnonUserSerializerMixin
+from traffic_control.utils.reference_data import get_reference_object, is_reference_model
+
+logger = logging.getLogger("traffic_control")
+
+PK_LOOKUP = "pk"
+
+# Implementations of to_representation() that depend only on the value they are given
+_VALUE_ONLY_REPRESENTATIONS = frozenset(
+    field_class.to_representation
+    for field_class in (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.ChoiceField,
+        serializers.DateField,
+        serializers.DateTimeField,
+        serializers.DecimalField,
+        serializers.FloatField,
+        serializers.IntegerField,
+        serializers.JSONField,
+        serializers.ReadOnlyField,
+        serializers.TimeField,
+        serializers.UUIDField,
+        EnumField,
+        GeometryField,
+    )
+)
+
+# Serializer classes whose to_representation() is understood by the fast read path
+_HIDE_FROM_ANON_FIELDS = ("created_by", "updated_by", "deleted_by")
+_SUPPORTED_SERIALIZER_REPRESENTATIONS = (
+    serializers.Field,
+    serializers.BaseSerializer,
+    serializers.Serializer,
+    HideFromAnonUserSerializerMixin,
+    FileProxySerializerMixin,
+)
+
+
+class UnsupportedSerializer(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class FastReadColumn:
+    name: str
+    field_class: type
+    lookup: Optional[str]
+    convert: Optional[Callable[[Any], Any]] = None
+    nested: Optional["FastReadNested"] = None
+
+
+@dataclass(frozen=True)
+class FastReadNested:
+    """Rows of a reverse foreign key relation, e.g. files or operations of a device"""
+
+    relation_name: str
+    related_model: type[models.Model]
+    fk_name: str
+    plan: "FastReadPlan"
+
+    def get_queryset(self, parent_queryset: models.QuerySet) -> models.QuerySet:
+        # Use the queryset of the viewset's prefetch, e.g. files filtered by permissions, if there is one
+        for lookup in parent_queryset._prefetch_related_lookups:
+            if isinstance(lookup, Prefetch) and lookup.prefetch_to == self.relation_name:
+                if lookup.queryset is not None:
+                    return lookup.queryset
+        return self.related_model._default_manager.all()
+
+    def fetch(self, parent_pks: List[Any], parent_queryset: models.QuerySet, context: dict) -> Dict[Any, List[dict]]:
+        rows_by_parent = defaultdict(list)
+        if not parent_pks:
+            return rows_by_parent
+        queryset = self.get_queryset(parent_queryset).filter(**{f"{self.fk_name}__in": parent_pks})
+        lookups = self.plan.get_lookups()
+        raw_rows = list(queryset.prefetch_related(None).values(*dict.fromkeys([self.fk_name, *lookups])))
+        for raw_row, row in zip(raw_rows, self.plan.serialize(raw_rows, queryset, context)):
+            rows_by_parent[raw_row[self.fk_name]].append(row)
+        return rows_by_parent
+
+
+@dataclass(frozen=True)
+class FastReadPlan:
+    columns: Tuple[FastReadColumn, ...]
+    hide_from_anon: bool = False
+    file_proxy: bool = False
+
+    def select(self, serializer: serializers.Serializer) -> Optional["FastReadPlan"]:
+        """
+        Return the plan for the fields of given serializer instance, e.g. fields trimmed with sparse fieldsets, or
+        None if the instance has fields the plan does not know
+        """
+        columns_by_name = {column.name: column for column in self.columns}
+        columns = []
+        for field in serializer._readable_fields:
+            column = columns_by_name.get(field.field_name)
+            if column is None or type(field) is not column.field_class:
+                return None
+            columns.append(column)
+        return replace(self, columns=tuple(columns))
+
+    def get_lookups(self) -> List[str]:
+        return list(dict.fromkeys([PK_LOOKUP, *(column.lookup for column in self.columns if column.lookup)]))
+
+    def get_values_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
+        return queryset.prefetch_related(None).values(*self.get_lookups())
+
+    def serialize(self, raw_rows: List[dict], queryset: models.QuerySet, context: dict) -> List[dict]:
+        """Convert rows of get_values_queryset(queryset) to the representation of the serializer"""
+        parent_pks = [raw_row[PK_LOOKUP] for raw_row in raw_rows]
+        nested_rows = {
+            column.name: column.nested.fetch(parent_pks, queryset, context)
+            for column in self.columns
+            if column.nested is not None
+        }
+        request = context.get("request")
+        hidden_fields = (
+            _HIDE_FROM_ANON_FIELDS
+            if self.hide_from_anon and request is not None and not request.user.is_authenticated
+            else ()
+        )
+        file_url_prefix = f"{request.scheme}://{request.get_host()}/uploads/" if self.file_proxy else None
+
+        rows = []
+        for raw_row in raw_rows:
+            row = {}
+            for column in self.columns:
+                if column.nested is not None:
+                    row[column.name] = nested_rows[column.name].get(raw_row[PK_LOOKUP], [])
+                    continue
+                value = raw_row[column.lookup]
+                row[column.name] = column.convert(value) if column.convert is not None and value is not None else value
+            for name in hidden_fields:
+                row.pop(name, None)
+            if file_url_prefix is not None and "file" in row:
+                row["file"] = f"{file_url_prefix}{raw_row['file']}"
+            rows.append(row)
+        return rows
+
+
+def _get_source_fields(model: type[models.Model], source_attrs: Iterable[str]) -> List[models.Field]:
+    """Return the model fields of the source path, requiring forward relations between them"""
+    fields = []
+    for attr in source_attrs:
+        if fields:
+            if not (fields[-1].many_to_one or fields[-1].one_to_one) or not fields[-1].concrete:
+                raise UnsupportedSerializer(f"{attr} is not behind a forward relation")
+            model = fields[-1].related_model
+        try:
+            fields.append(model._meta.get_field(attr))
+        except FieldDoesNotExist:
+            raise UnsupportedSerializer(f"{attr} is not a field of {model.__name__}")
+    return fields
+
+
+def _is_value_only_field(field: serializers.Field) -> bool:
+    field_class = type(field)
+    if field_class.get_attribute is not serializers.Field.get_attribute:
+        return False
+    if isinstance(field, serializers.ListField):
+        return field_class.to_representation is serializers.ListField.to_representation and _is_value_only_field(
+            field.child
+        )
+    return field_class.to_representation in _VALUE_ONLY_REPRESENTATIONS
+
+
+def _is_primary_key_field(field: serializers.Field) -> bool:
+    field_class = type(field)
+    return (
+        isinstance(field, serializers.PrimaryKeyRelatedField)
+        and field_class.get_attribute is relations.RelatedField.get_attribute
+        and field_class.to_representation is serializers.PrimaryKeyRelatedField.to_representation
+        and field_class.use_pk_only_optimization is serializers.PrimaryKeyRelatedField.use_pk_only_optimization
+    )
+
+
+def _compile_nested(model: type[models.Model], field: serializers.ListSerializer) -> FastReadColumn:
+    if len(field.source_attrs) != 1:
+        raise UnsupportedSerializer(f"Nested serializer {field.field_name} is not a direct relation")
+    try:
+        relation = model._meta.get_field(field.source)
+    except FieldDoesNotExist:
+        raise UnsupportedSerializer(f"{field.source} is not a relation of {model.__name__}")
+    if not relation.one_to_many or relation.concrete:
+        raise UnsupportedSerializer(f"{field.source} is not a reverse foreign key")
+    nested = FastReadNested(
+        relation_name=field.source,
+        related_model=relation.related_model,
+        fk_name=relation.field.name,
+        plan=_compile(field.child),
+    )
+    return FastReadColumn(name=field.field_name, field_class=type(field), lookup=None, nested=nested)
+
+
+def _compile_field(model: type[models.Model], field: serializers.Field, file_proxy: bool) -> FastReadColumn:
+    if isinstance(field, serializers.ListSerializer):
+        return _compile_nested(model, field)
+    if field.source == "*" or isinstance(field, serializers.BaseSerializer):
+        raise UnsupportedSerializer(f"{field.field_name} is not read from a single column")
+
+    lookup = "__".join(field.source_attrs)
+    source_fields = _get_source_fields(model, field.source_attrs)
+    last_field = source_fields[-1]
+
+    if file_proxy and field.field_name == "file":
+        # The URL is built from the file name by the FileProxySerializerMixin hook
+        return FastReadColumn(name=field.field_name, field_class=type(field), lookup=lookup)
+    if _is_primary_key_field(field) and last_field.concrete and (last_field.many_to_one or last_field.one_to_one):
+        convert = field.pk_field.to_representation if field.pk_field is not None else None
+        return FastReadColumn(name=field.field_name, field_class=type(field), lookup=lookup, convert=convert)
+    if type(field) is serializers.StringRelatedField and last_field.concrete and last_field.many_to_one:
+        related_model = last_field.related_model
+        if not is_reference_model(related_model):
+            raise UnsupportedSerializer(f"{field.field_name} is a string of a non-reference model")
+
+        def convert(pk, related_model=related_model):
+            return str(get_reference_object(related_model, pk) or related_model._default_manager.get(pk=pk))
+
+        return FastReadColumn(name=field.field_name, field_class=type(field), lookup=lookup, convert=convert)
+    if _is_value_only_field(field) and last_field.concrete and not last_field.is_relation:
+        return FastReadColumn(
+            name=field.field_name, field_class=type(field), lookup=lookup, convert=field.to_representation
+        )
+    raise UnsupportedSerializer(f"{field.field_name} ({type(field).__name__}) is not supported")
+
+
+def _compile(serializer: serializers.Serializer) -> FastReadPlan:
+    serializer_class = type(serializer)
+    for klass in serializer_class.__mro__:
+        if "to_representation" in vars(klass) and klass not in _SUPPORTED_SERIALIZER_REPRESENTATIONS:
+            raise UnsupportedSerializer(f"{klass.__name__} overrides to_representation()")
+    model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    if model is None:
+        raise UnsupportedSerializer(f"{serializer_class.__name__} is not a model serializer")
+
+    file_proxy = issubclass(serializer_class, FileProxySerializerMixin)
+    return FastReadPlan(
+        columns=tuple(_compile_field(model, field, file_proxy) for field in serializer._readable_fields),
+        hide_from_anon=issubclass(serializer_class, HideFromAnonUserSerializerMixin),
+        file_proxy=file_proxy,
+    )
+
+
+@cache
+def get_fast_read_plan(serializer_class: type[serializers.Serializer]) -> Optional[FastReadPlan]:
+    """Return the fast read plan of the serializer class, or None if the class is not supported"""
+    try:
+        return _compile(serializer_class())
+    except UnsupportedSerializer as error:
+        logger.debug(f"Fast read path is not used for {serializer_class.__name__}: {error}")
+        return None
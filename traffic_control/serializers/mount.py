@@ -18,6 +18,8 @@ from traffic_control.serializers.common import (
     EwktGeometryField,
     FileProxySerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
+    ReferenceRelatedField,
     ReplaceableDeviceInputSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
 )
@@ -45,6 +47,7 @@ class MountPlanFileSerializer(FileProxySerializerMixin, serializers.ModelSeriali
 class MountPlanInputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceInputSerializerMixin,
     serializers.ModelSerializer,
 ):
@@ -74,6 +77,7 @@ class MountPlanGeoJSONInputSerializer(MountPlanInputSerializer):
 class MountPlanOutputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
     serializers.ModelSerializer,
 ):
@@ -103,7 +107,7 @@ class MountRealFileSerializer(FileProxySerializerMixin, serializers.ModelSeriali
 
 class MountRealOperationSerializer(serializers.ModelSerializer):
     operation_type = serializers.StringRelatedField()
-    operation_type_id = serializers.PrimaryKeyRelatedField(
+    operation_type_id = ReferenceRelatedField(
         queryset=OperationType.objects.filter(mount=True),
         source="operation_type",
     )
@@ -133,6 +137,7 @@ class OrderedTrafficSignsField(serializers.PrimaryKeyRelatedField):
 class MountRealSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktGeometryField()
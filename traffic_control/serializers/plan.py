@@ -2,71 +2,66 @@ from rest_framework import serializers
 from rest_framework_gis.fields import GeometryField
 
 from traffic_control.models import Plan
+from traffic_control.models.plan import (
+    get_device_plan_count_annotation,
+    get_device_plan_ids_annotation,
+    PLAN_DERIVED_LOCATION_FIELDS,
+    PLAN_DEVICE_PLAN_RELATIONS,
+)
 from traffic_control.serializers.common import EwktGeometryField, HideFromAnonUserSerializerMixin
 
 
+class DevicePlanIdsField(serializers.ListField):
+    """
+    Ids of the device plans of a plan relation. The ids are read from the annotation of
+    PlanQuerySet.with_device_plan_ids() when the plan has it, and queried otherwise.
+    """
+
+    child = serializers.UUIDField()
+
+    def __init__(self, relation, **kwargs):
+        self.relation = relation
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, plan):
+        ids = getattr(plan, get_device_plan_ids_annotation(self.relation), None)
+        if ids is None:
+            ids = getattr(plan, self.relation).values_list("pk", flat=True)
+        return super().to_representation(ids)
+
+
 class PlanRelationSerializer(serializers.ModelSerializer):
-    barrier_plan_ids = serializers.PrimaryKeyRelatedField(
-        source="barrier_plans",
-        many=True,
-        required=False,
-        read_only=True,
-    )
-    mount_plan_ids = serializers.PrimaryKeyRelatedField(
-        source="mount_plans",
-        many=True,
-        required=False,
-        read_only=True,
-    )
-    road_marking_plan_ids = serializers.PrimaryKeyRelatedField(
-        source="road_marking_plans",
-        many=True,
-        required=False,
-        read_only=True,
-    )
-    signpost_plan_ids = serializers.PrimaryKeyRelatedField(
-        source="signpost_plans",
-        many=True,
-        required=False,
-        read_only=True,
-    )
-    traffic_light_plan_ids = serializers.PrimaryKeyRelatedField(
-        source="traffic_light_plans",
-        many=True,
-        required=False,
-        read_only=True,
-    )
-    traffic_sign_plan_ids = serializers.PrimaryKeyRelatedField(
-        source="traffic_sign_plans",
-        many=True,
-        required=False,
-        read_only=True,
-    )
-    additional_sign_plan_ids = serializers.PrimaryKeyRelatedField(
-        source="additional_sign_plans",
-        many=True,
-        required=False,
-        read_only=True,
-    )
-    furniture_signpost_plan_ids = serializers.PrimaryKeyRelatedField(
-        source="furniture_signpost_plans",
-        many=True,
-        required=False,
-        read_only=True,
-    )
+    barrier_plan_ids = DevicePlanIdsField("barrier_plans")
+    mount_plan_ids = DevicePlanIdsField("mount_plans")
+    road_marking_plan_ids = DevicePlanIdsField("road_marking_plans")
+    signpost_plan_ids = DevicePlanIdsField("signpost_plans")
+    traffic_light_plan_ids = DevicePlanIdsField("traffic_light_plans")
+    traffic_sign_plan_ids = DevicePlanIdsField("traffic_sign_plans")
+    additional_sign_plan_ids = DevicePlanIdsField("additional_sign_plans")
+    furniture_signpost_plan_ids = DevicePlanIdsField("furniture_signpost_plans")
 
     class Meta:
         model = Plan
-        fields = (
-            "barrier_plan_ids",
-            "mount_plan_ids",
-            "road_marking_plan_ids",
-            "signpost_plan_ids",
-            "traffic_light_plan_ids",
-            "traffic_sign_plan_ids",
-            "additional_sign_plan_ids",
-            "furniture_signpost_plan_ids",
-        )
+        fields = tuple(get_device_plan_ids_annotation(relation) for relation in PLAN_DEVICE_PLAN_RELATIONS)
+
+
+class PlanRelationCountSerializer(serializers.ModelSerializer):
+    """Numbers of the device plans of a plan, annotated by PlanQuerySet.with_device_plan_counts()"""
+
+    barrier_plan_count = serializers.IntegerField(read_only=True)
+    mount_plan_count = serializers.IntegerField(read_only=True)
+    road_marking_plan_count = serializers.IntegerField(read_only=True)
+    signpost_plan_count = serializers.IntegerField(read_only=True)
+    traffic_light_plan_count = serializers.IntegerField(read_only=True)
+    traffic_sign_plan_count = serializers.IntegerField(read_only=True)
+    additional_sign_plan_count = serializers.IntegerField(read_only=True)
+    furniture_signpost_plan_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Plan
+        fields = tuple(get_device_plan_count_annotation(relation) for relation in PLAN_DEVICE_PLAN_RELATIONS)
 
 
 class PlanSerializer(HideFromAnonUserSerializerMixin, serializers.ModelSerializer):
@@ -81,8 +76,24 @@ class PlanSerializer(HideFromAnonUserSerializerMixin, serializers.ModelSerialize
             "deleted_by",
             "deleted_at",
         )
-        exclude = ("is_active", "deleted_at", "deleted_by")
+        exclude = ("is_active", "deleted_at", "deleted_by", *PLAN_DERIVED_LOCATION_FIELDS)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # Location may be read from one of its precomputed simplified versions, see PlanViewSet
+        location_field_name = self.context.get("plan_location_field")
+        if location_field_name:
+            fields["location"].source = location_field_name
+        return fields
 
 
 class PlanGeoJSONSerializer(PlanSerializer):
     location = GeometryField()
+
+
+class PlanSummarySerializer(PlanSerializer):
+    linked_objects = PlanRelationCountSerializer(source="*", read_only=True)
+
+
+class PlanSummaryGeoJSONSerializer(PlanSummarySerializer):
+    location = GeometryField()
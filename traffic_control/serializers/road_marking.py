@@ -16,6 +16,8 @@ from traffic_control.serializers.common import (
     EwktGeometryField,
     FileProxySerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
+    ReferenceRelatedField,
     ReplaceableDeviceInputSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
 )
@@ -31,11 +33,12 @@ class RoadMarkingPlanFileSerializer(FileProxySerializerMixin, serializers.ModelS
 class RoadMarkingPlanInputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceInputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktGeometryField()
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.ROAD_MARKING),
         allow_null=True,
         required=False,
@@ -65,12 +68,13 @@ class RoadMarkingPlanGeoJSONInputSerializer(RoadMarkingPlanInputSerializer):
 class RoadMarkingPlanOutputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktGeometryField()
     files = RoadMarkingPlanFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.ROAD_MARKING),
         allow_null=True,
         required=False,
@@ -99,7 +103,7 @@ class RoadMarkingRealFileSerializer(FileProxySerializerMixin, serializers.ModelS
 
 class RoadMarkingRealOperationSerializer(serializers.ModelSerializer):
     operation_type = serializers.StringRelatedField()
-    operation_type_id = serializers.PrimaryKeyRelatedField(
+    operation_type_id = ReferenceRelatedField(
         queryset=OperationType.objects.filter(road_marking=True),
         source="operation_type",
     )
@@ -124,11 +128,12 @@ class RoadMarkingRealOperationSerializer(serializers.ModelSerializer):
 class RoadMarkingRealSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktGeometryField()
     files = RoadMarkingRealFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.ROAD_MARKING),
         allow_null=True,
         required=False,
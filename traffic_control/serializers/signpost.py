@@ -16,6 +16,8 @@ from traffic_control.serializers.common import (
     EwktPointField,
     FileProxySerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
+    ReferenceRelatedField,
     ReplaceableDeviceInputSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
 )
@@ -31,11 +33,12 @@ class SignpostPlanFileSerializer(FileProxySerializerMixin, serializers.ModelSeri
 class SignpostPlanInputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceInputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.SIGNPOST),
         allow_null=True,
         required=False,
@@ -65,12 +68,13 @@ class SignpostPlanGeoJSONInputSerializer(SignpostPlanInputSerializer):
 class SignpostPlanOutputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
     files = SignpostPlanFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.SIGNPOST),
         allow_null=True,
         required=False,
@@ -99,7 +103,7 @@ class SignpostRealFileSerializer(FileProxySerializerMixin, serializers.ModelSeri
 
 class SignpostRealOperationSerializer(serializers.ModelSerializer):
     operation_type = serializers.StringRelatedField()
-    operation_type_id = serializers.PrimaryKeyRelatedField(
+    operation_type_id = ReferenceRelatedField(
         queryset=OperationType.objects.filter(signpost=True),
         source="operation_type",
     )
@@ -124,11 +128,12 @@ class SignpostRealOperationSerializer(serializers.ModelSerializer):
 class SignpostRealSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
     files = SignpostRealFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.SIGNPOST),
         allow_null=True,
         required=False,
@@ -16,6 +16,8 @@ from traffic_control.serializers.common import (
     EwktPointField,
     FileProxySerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
+    ReferenceRelatedField,
     ReplaceableDeviceInputSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
 )
@@ -31,11 +33,12 @@ class TrafficLightPlanFileSerializer(FileProxySerializerMixin, serializers.Model
 class TrafficLightPlanInputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceInputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.TRAFFIC_LIGHT),
         allow_null=True,
         required=False,
@@ -65,12 +68,13 @@ class TrafficLightPlanGeoJSONInputSerializer(TrafficLightPlanInputSerializer):
 class TrafficLightPlanOutputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
     files = TrafficLightPlanFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.TRAFFIC_LIGHT),
         allow_null=True,
         required=False,
@@ -99,7 +103,7 @@ class TrafficLightRealFileSerializer(FileProxySerializerMixin, serializers.Model
 
 class TrafficLightRealOperationSerializer(serializers.ModelSerializer):
     operation_type = serializers.StringRelatedField()
-    operation_type_id = serializers.PrimaryKeyRelatedField(
+    operation_type_id = ReferenceRelatedField(
         queryset=OperationType.objects.filter(traffic_light=True),
         source="operation_type",
     )
@@ -124,11 +128,12 @@ class TrafficLightRealOperationSerializer(serializers.ModelSerializer):
 class TrafficLightRealSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
     files = TrafficLightRealFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.TRAFFIC_LIGHT),
         allow_null=True,
         required=False,
@@ -17,6 +17,8 @@ from traffic_control.serializers.common import (
     EwktPolygonField,
     FileProxySerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
+    ReferenceRelatedField,
     ReplaceableDeviceInputSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
 )
@@ -32,12 +34,13 @@ class TrafficSignPlanFileSerializer(FileProxySerializerMixin, serializers.ModelS
 class TrafficSignPlanInputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceInputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
     affect_area = EwktPolygonField(required=False)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.TRAFFIC_SIGN),
         allow_null=True,
         required=False,
@@ -67,13 +70,14 @@ class TrafficSignPlanGeoJSONInputSerializer(TrafficSignPlanInputSerializer):
 class TrafficSignPlanOutputSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     ReplaceableDeviceOutputSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
     affect_area = EwktPolygonField(required=False)
     files = TrafficSignPlanFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.TRAFFIC_SIGN),
         allow_null=True,
         required=False,
@@ -102,7 +106,7 @@ class TrafficSignRealFileSerializer(FileProxySerializerMixin, serializers.ModelS
 
 class TrafficSignRealOperationSerializer(serializers.ModelSerializer):
     operation_type = serializers.StringRelatedField()
-    operation_type_id = serializers.PrimaryKeyRelatedField(
+    operation_type_id = ReferenceRelatedField(
         queryset=OperationType.objects.filter(traffic_sign=True),
         source="operation_type",
     )
@@ -127,11 +131,12 @@ class TrafficSignRealOperationSerializer(serializers.ModelSerializer):
 class TrafficSignRealSerializer(
     EnumSupportSerializerMixin,
     HideFromAnonUserSerializerMixin,
+    ReferenceDataSerializerMixin,
     serializers.ModelSerializer,
 ):
     location = EwktPointField()
     files = TrafficSignRealFileSerializer(many=True, read_only=True)
-    device_type = serializers.PrimaryKeyRelatedField(
+    device_type = ReferenceRelatedField(
         queryset=TrafficControlDeviceType.objects.for_target_model(DeviceTypeTargetModel.TRAFFIC_SIGN),
         allow_null=True,
         required=False,
@@ -9,6 +9,7 @@ from django.utils import timezone
 
 from traffic_control.enums import Lifecycle
 from traffic_control.mixins.models import SoftDeleteModel
+from traffic_control.utils.data_version import bump_data_version
 from users.models import User
 
 
@@ -149,7 +150,8 @@ def device_plan_replace(
     if hasattr(old, "validity_period_end"):
         old.validity_period_end = new.validity_period_start - timedelta(days=1) if new.validity_period_start else None
         old.save(update_fields=["validity_period_end"])
-    real_model.objects.filter(**{plan_relation_name: old}).update(**{plan_relation_name: new})
+    if real_model.objects.filter(**{plan_relation_name: old}).update(**{plan_relation_name: new}):
+        bump_data_version(real_model._meta.db_table)
 
 
 @transaction.atomic
@@ -191,11 +193,11 @@ def device_plan_soft_delete(
     :param user: The user who is performing the soft delete operation.
     """
     replaced = instance.replaces
+    updated_count = real_model.objects.filter(**{plan_relation_name: instance}).update(**{plan_relation_name: replaced})
+    if updated_count:
+        bump_data_version(real_model._meta.db_table)
     if replaced:
-        real_model.objects.filter(**{plan_relation_name: instance}).update(**{plan_relation_name: replaced})
         unreplace_method(instance)
-    else:
-        real_model.objects.filter(**{plan_relation_name: instance}).update(**{plan_relation_name: None})
     instance.soft_delete(user)
 
 
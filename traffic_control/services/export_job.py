@@ -0,0 +1,181 @@
+import csv
+import io
+import json
+import logging
+import tempfile
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Type
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.files import File
+from django.db import connections, transaction
+from django.db.models import QuerySet
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from import_export.resources import ModelResource
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from traffic_control.models import ExportJob, ExportJobStatus
+from traffic_control.services.email import send_email
+
+logger = logging.getLogger(__name__)
+
+
+def export_job_create(user, queryset: QuerySet, resource_class: Type[ModelResource], file_format: str) -> ExportJob:
+    """Create a pending export job of `queryset` exported with `resource_class` to a `file_format` file"""
+    return ExportJob.objects.create(
+        created_by=user,
+        content_type=ContentType.objects.get_for_model(queryset.model),
+        resource_class=f"{resource_class.__module__}.{resource_class.__name__}",
+        file_format=file_format,
+        object_ids=[str(pk) for pk in queryset.values_list("pk", flat=True)],
+        # Expressions can't be stored, the default ordering of the model is used for them
+        ordering=[field_name for field_name in queryset.query.order_by if isinstance(field_name, str)],
+    )
+
+
+def export_job_start(job: ExportJob) -> None:
+    """Run `job` in a background thread once the current transaction has been committed"""
+
+    def run():
+        try:
+            export_job_run(ExportJob.objects.get(pk=job.pk))
+        finally:
+            connections.close_all()
+
+    transaction.on_commit(lambda: threading.Thread(target=run, name=f"export-job-{job.pk}", daemon=True).start())
+
+
+def export_job_run(job: ExportJob) -> bool:
+    """
+    Export the queryset of `job` to a file in file storage and notify the user who created the job.
+
+    Rows are streamed from the database in chunks and buffered in a temporary file, so memory use does not depend
+    on the size of the export. Returns False if the job was already claimed by another runner.
+    """
+    claimed = ExportJob.objects.filter(pk=job.pk, status=job.status, started_at=job.started_at).update(
+        status=ExportJobStatus.RUNNING,
+        started_at=timezone.now(),
+    )
+    if not claimed:
+        return False
+    job.refresh_from_db()
+
+    try:
+        resource = import_string(job.resource_class)()
+        queryset = _get_export_job_queryset(job)
+
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as rows_file:
+            extra_headers, row_count = _buffer_rows(resource.iter_export_job_rows(queryset), rows_file)
+            rows_file.seek(0)
+            headers = resource.get_export_job_headers() + extra_headers
+            rows = _read_buffered_rows(rows_file, extra_headers)
+
+            with tempfile.TemporaryFile() as export_file:
+                EXPORT_JOB_WRITERS[job.file_format](headers, rows, export_file)
+                export_file.seek(0)
+                job.file.save(_get_file_name(job), File(export_file), save=False)
+    except Exception as e:
+        logger.exception(f"Export job {job.pk} failed")
+        job.status = ExportJobStatus.FAILED
+        job.error = str(e)
+    else:
+        job.status = ExportJobStatus.FINISHED
+        job.row_count = row_count
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "error", "row_count", "file", "finished_at"])
+    _notify_user(job)
+    return True
+
+
+def get_export_job_download_url(job: ExportJob) -> str:
+    return settings.BASE_URL.rstrip("/") + reverse("admin:traffic_control_exportjob_download", args=[job.pk])
+
+
+def _get_export_job_queryset(job: ExportJob) -> QuerySet:
+    """Rebuild the exported queryset of `job` from the stored primary keys and ordering"""
+    queryset = job.content_type.model_class()._default_manager.filter(pk__in=job.object_ids)
+    if job.ordering:
+        queryset = queryset.order_by(*job.ordering)
+    return queryset
+
+
+def _buffer_rows(rows: Iterable[Tuple[list, Dict[str, object]]], rows_file) -> Tuple[List[str], int]:
+    """
+    Write rows to `rows_file` as JSON lines in a single pass.
+    Return headers of the extra columns in the order they appear in the rows, and the number of rows.
+    """
+    extra_headers = {}
+    row_count = 0
+    for values, extra_columns in rows:
+        for header in extra_columns:
+            extra_headers.setdefault(header, None)
+        rows_file.write(json.dumps([values, extra_columns], default=str))
+        rows_file.write("\n")
+        row_count += 1
+    return list(extra_headers), row_count
+
+
+def _read_buffered_rows(rows_file, extra_headers: List[str]) -> Iterator[list]:
+    for line in rows_file:
+        values, extra_columns = json.loads(line)
+        yield values + [extra_columns.get(header) for header in extra_headers]
+
+
+def _write_csv(headers: List[str], rows: Iterable[list], export_file) -> None:
+    text_file = io.TextIOWrapper(export_file, encoding="utf-8", newline="")
+    writer = csv.writer(text_file)
+    writer.writerow(headers)
+    writer.writerows(rows)
+    text_file.flush()
+    text_file.detach()
+
+
+def _write_xlsx(headers: List[str], rows: Iterable[list], export_file) -> None:
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    bold = Font(bold=True)
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.font = bold
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(export_file)
+
+
+EXPORT_JOB_WRITERS: Dict[str, Callable[[List[str], Iterable[list], object], None]] = {
+    "csv": _write_csv,
+    "xlsx": _write_xlsx,
+}
+
+
+def _get_file_name(job: ExportJob) -> str:
+    return f"{job.content_type.model_class().__name__}-{job.created_at:%Y-%m-%d}.{job.file_format}"
+
+
+def _notify_user(job: ExportJob) -> None:
+    if not job.created_by.email:
+        return
+
+    if job.status == ExportJobStatus.FINISHED:
+        subject = f"Export of {job.content_type.name} is ready"
+        message = (
+            f"Your export of {job.row_count} {job.content_type.name} rows is ready.\n\n"
+            f"Download it from {get_export_job_download_url(job)}"
+        )
+    else:
+        subject = f"Export of {job.content_type.name} failed"
+        message = f"Your export of {job.content_type.name} rows failed. Please try again or contact the administrators."
+
+    try:
+        send_email(subject=subject, message=message, recipient_list=[job.created_by.email])
+    except Exception:
+        logger.exception(f"Sending notification of export job {job.pk} failed")
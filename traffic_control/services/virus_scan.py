@@ -1,9 +1,25 @@
-from typing import List, TypedDict
+import hashlib
+import io
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, TypedDict
 
 import requests
 from auditlog.models import LogEntry
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.base import ContentFile
+from requests.adapters import HTTPAdapter
+
+VIRUS_SCAN_CACHE_KEY_PREFIX = "virus_scan:sha256"
+_CHUNK_SIZE = 64 * 1024
+
+_session_lock = threading.Lock()
+_session: Optional[requests.Session] = None
 
 
 class VirusScanError(TypedDict):
@@ -16,9 +32,56 @@ class VirusScanResponse(TypedDict):
     errors: List[VirusScanError]
 
 
+class _ScanResult(TypedDict):
+    status_code: int
+    is_infected: bool
+    viruses: List[str]
+
+
 def clam_av_scan(files, api_version="v1") -> VirusScanResponse:
-    response = requests.post(get_clam_av_scan_url(api_version), files=files)
-    return _handle_clam_av_response(response)
+    """
+    Scan (field name, file) pairs with ClamAV.
+
+    Files are identified by the SHA-256 hash of their content. Results of already scanned contents are read from
+    the cache and every distinct content left is scanned once, at most CLAMAV_MAX_CONCURRENT_SCANS files at a time.
+    The returned status code is the first non-200 status code of the scan requests, or 200.
+    """
+    files = [(field_name, _to_file(field_name, file)) for field_name, file in files]
+    content_hashes = [_get_content_hash(file) for _, file in files]
+
+    results: Dict[str, _ScanResult] = {}
+    cached_results = cache.get_many([_get_cache_key(content_hash) for content_hash in content_hashes])
+    for content_hash in content_hashes:
+        cached_result = cached_results.get(_get_cache_key(content_hash))
+        if cached_result is not None:
+            is_infected, viruses = cached_result
+            results[content_hash] = _ScanResult(status_code=200, is_infected=is_infected, viruses=viruses)
+
+    files_to_scan = {}
+    for content_hash, (field_name, file) in zip(content_hashes, files):
+        if content_hash not in results:
+            files_to_scan.setdefault(content_hash, (field_name, file))
+
+    if files_to_scan:
+        url = get_clam_av_scan_url(api_version)
+        max_workers = min(settings.CLAMAV_MAX_CONCURRENT_SCANS, len(files_to_scan))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            scanned = executor.map(lambda item: _scan_file(url, *item), files_to_scan.values())
+            for content_hash, result in zip(files_to_scan.keys(), scanned):
+                results[content_hash] = result
+                if result["status_code"] == 200:
+                    cache.set(
+                        _get_cache_key(content_hash),
+                        (result["is_infected"], result["viruses"]),
+                        timeout=settings.CLAMAV_RESULT_CACHE_TIMEOUT,
+                    )
+
+    for _, file in files_to_scan.values():
+        file.seek(0)
+
+    return _build_scan_response(
+        [(file, results[content_hash]) for (_, file), content_hash in zip(files, content_hashes)]
+    )
 
 
 def get_clam_av_scan_url(api_version: str) -> str:
@@ -37,25 +100,124 @@ def add_virus_scan_errors_to_auditlog(errors, user, model, object_id):
         )
 
 
-def _handle_clam_av_response(response) -> VirusScanResponse:
-    status_code = response.status_code
-    if status_code != 200:
-        return VirusScanResponse(
-            status_code=status_code,
-            errors=[VirusScanError(detail="Status code not 200", viruses=["ClamAV response not OK"])],
+def get_error_details_message(errors):
+    return ", ".join(map(lambda x: x["detail"], errors))
+
+
+def _get_session() -> requests.Session:
+    """Return the HTTP session shared by all scans, so connections to ClamAV are pooled and reused"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=settings.CLAMAV_MAX_CONCURRENT_SCANS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _to_file(field_name: str, value) -> File:
+    if isinstance(value, File):
+        return value
+    if isinstance(value, str):
+        value = value.encode()
+    if isinstance(value, bytes):
+        return ContentFile(value, name=field_name)
+    return File(value, name=getattr(value, "name", None) or field_name)
+
+
+def _get_file_name(file: File) -> str:
+    return os.path.basename(str(file.name)) if file.name else "file"
+
+
+def _get_content_hash(file: File) -> str:
+    content_hash = hashlib.sha256()
+    for chunk in file.chunks(_CHUNK_SIZE):
+        content_hash.update(chunk)
+    file.seek(0)
+    return content_hash.hexdigest()
+
+
+def _get_cache_key(content_hash: str) -> str:
+    return f"{VIRUS_SCAN_CACHE_KEY_PREFIX}:{content_hash}"
+
+
+class _MultipartFileStream:
+    """
+    Multipart/form-data body of a single file that is read from the file while sending.
+
+    The length of the body is known up front, so the request is sent with a Content-Length header instead of
+    buffering the file into memory or falling back to chunked transfer encoding.
+    """
+
+    def __init__(self, field_name: str, file: File):
+        self.boundary = uuid.uuid4().hex
+        file_name = _get_file_name(file).replace('"', "")
+        head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{file_name}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{self.boundary}--\r\n".encode()
+        file.seek(0)
+        self._parts = [io.BytesIO(head), file, io.BytesIO(tail)]
+        self._length = len(head) + file.size + len(tail)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and (size < 0 or size > 0):
+            chunk = self._parts[0].read(size if size >= 0 else -1)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size >= 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+
+def _scan_file(url: str, field_name: str, file: File) -> _ScanResult:
+    body = _MultipartFileStream(field_name, file)
+    try:
+        response = _get_session().post(
+            url,
+            data=body,
+            headers={"Content-Type": body.content_type},
+            timeout=(settings.CLAMAV_CONNECT_TIMEOUT, settings.CLAMAV_READ_TIMEOUT),
         )
+    except requests.RequestException:
+        return _ScanResult(status_code=503, is_infected=False, viruses=[])
 
-    errors = _get_errors_from_response_json(response.json())
-    return VirusScanResponse(status_code=status_code, errors=errors)
+    if response.status_code != 200:
+        return _ScanResult(status_code=response.status_code, is_infected=False, viruses=[])
+    return _get_result_from_response_json(response.json())
 
 
-def _get_errors_from_response_json(json_response) -> List[VirusScanError]:
-    errors = []
-    for result_d in json_response["data"]["result"]:
-        if result_d["is_infected"]:
-            errors.append(VirusScanError(detail=f"{result_d['name']} is infected", viruses=result_d["viruses"]))
-    return errors
+def _get_result_from_response_json(json_response) -> _ScanResult:
+    infected_results = [result_d for result_d in json_response["data"]["result"] if result_d["is_infected"]]
+    viruses = [virus for result_d in infected_results for virus in result_d["viruses"]]
+    return _ScanResult(status_code=200, is_infected=bool(infected_results), viruses=viruses)
 
 
-def get_error_details_message(errors):
-    return ", ".join(map(lambda x: x["detail"], errors))
+def _build_scan_response(scanned_files) -> VirusScanResponse:
+    failed_status_codes = [result["status_code"] for _, result in scanned_files if result["status_code"] != 200]
+    if failed_status_codes:
+        return VirusScanResponse(
+            status_code=failed_status_codes[0],
+            errors=[VirusScanError(detail="Status code not 200", viruses=["ClamAV response not OK"])],
+        )
+
+    errors = [
+        VirusScanError(detail=f"{_get_file_name(file)} is infected", viruses=result["viruses"])
+        for file, result in scanned_files
+        if result["is_infected"]
+    ]
+    return VirusScanResponse(status_code=200, errors=errors)
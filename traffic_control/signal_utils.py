@@ -1,12 +1,16 @@
 import logging
 import os
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import cairosvg
+from auditlog.cid import get_cid
+from auditlog.context import auditlog_disabled
 from auditlog.models import LogEntry
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.files.base import ContentFile
 from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils.encoding import smart_str
 
 logger = logging.getLogger("django")
 
@@ -98,6 +102,48 @@ def _create_parent_log_entry(parent, message, action=None):
         logger.error("Failed to create log entry for %s: %s", parent, e, exc_info=True)
 
 
+def bulk_create_log_entries(
+    changes_by_instance: Iterable[tuple[Any, dict]],
+    action: int = LogEntry.Action.UPDATE,
+    batch_size: int = 1000,
+) -> int:
+    """Create audit log entries for instances that were created or updated in bulk.
+
+    Bulk creates and queryset updates bypass the save signals auditlog logs changes with, so the caller passes the
+    changes of every instance in the format of auditlog's own diffs: ``{field_name: [old_value, new_value]}`` with
+    the values as strings. LogEntry pre_save receivers are run for each entry so that the actor and remote address of
+    the active auditlog context (``set_actor``, AuditlogMiddleware) are filled in like for entries saved one by one.
+
+    Args:
+        changes_by_instance (Iterable[tuple[Any, dict]]): Pairs of created or updated instance and its changes.
+        action (int): LogEntry action of the entries.
+        batch_size (int): Number of log entries per INSERT.
+
+    Returns:
+        int: Number of created log entries.
+    """
+    if auditlog_disabled.get():
+        return 0
+
+    cid = get_cid()
+    using = LogEntry.objects.db
+    entries = []
+    for instance, changes in changes_by_instance:
+        entry = LogEntry(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_pk=smart_str(instance.pk),
+            object_id=instance.pk if isinstance(instance.pk, int) else None,
+            object_repr=smart_str(instance),
+            action=action,
+            changes=changes,
+            cid=cid,
+        )
+        pre_save.send(sender=LogEntry, instance=entry, raw=False, using=using, update_fields=None)
+        entries.append(entry)
+
+    return len(LogEntry.objects.bulk_create(entries, batch_size=batch_size))
+
+
 def _extend_model_from_db(model: type, loaded_attr: str, source_id_attr: str) -> None:
     """Patch model.from_db to cache a FK id on every loaded instance.
 
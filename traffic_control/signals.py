@@ -156,3 +156,41 @@ def register_auditlog_signals():
 
 # NOTE: Do NOT call register_auditlog_signals() here at module level!
 # It will be called from apps.py ready() method after all models are loaded.
+
+
+def register_data_version_signals():
+    """
+    Bump data versions of the tables the WFS feature types read from whenever their rows are saved or deleted, which
+    invalidates the cached WFS responses depending on them. Bulk writes bump the versions explicitly. Object permission
+    tables are versioned for the cached file permission decisions of FileProxyView. Called during app initialization in
+    apps.py ready() method.
+    """
+    from guardian.models import GroupObjectPermission, UserObjectPermission
+
+    from traffic_control.utils.data_version import bump_data_version_on_change
+    from traffic_control.views.wfs.cache import get_dependency_models
+    from traffic_control.views.wfs.views import CityInfrastructureWFSView
+
+    versioned_models = get_dependency_models(CityInfrastructureWFSView.feature_types) + [
+        UserObjectPermission,
+        GroupObjectPermission,
+    ]
+    for model in versioned_models:
+        post_save.connect(bump_data_version_on_change, sender=model, dispatch_uid=f"data_version_save_{model}")
+        post_delete.connect(bump_data_version_on_change, sender=model, dispatch_uid=f"data_version_delete_{model}")
+
+
+def register_reference_data_signals():
+    """
+    Version the reference tables held in the process-wide reference data cache, and drop the cached copy of the
+    current process as soon as the table changes. Called during app initialization in apps.py ready() method.
+    """
+    from traffic_control.utils.data_version import bump_data_version_on_change
+    from traffic_control.utils.reference_data import clear_reference_data_on_change, get_reference_models
+
+    for model in get_reference_models():
+        # Same dispatch_uid as in register_data_version_signals, which may have connected the model already
+        post_save.connect(bump_data_version_on_change, sender=model, dispatch_uid=f"data_version_save_{model}")
+        post_delete.connect(bump_data_version_on_change, sender=model, dispatch_uid=f"data_version_delete_{model}")
+        post_save.connect(clear_reference_data_on_change, sender=model, dispatch_uid=f"reference_data_save_{model}")
+        post_delete.connect(clear_reference_data_on_change, sender=model, dispatch_uid=f"reference_data_delete_{model}")
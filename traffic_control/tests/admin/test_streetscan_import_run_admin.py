@@ -0,0 +1,100 @@
+"""Tests for StreetScanImportRunAdmin detail display and CSV download views."""
+import csv
+from io import StringIO
+
+import pytest
+from django.urls import reverse
+
+from traffic_control.admin.streetscan_import import StreetScanImportRunAdmin
+from traffic_control.models import StreetScanImportRun, StreetScanImportRunDetail
+
+
+@pytest.fixture
+def import_run(db):
+    """Create a StreetScanImportRun with detail entries of two object types and an old entry without one."""
+    run = StreetScanImportRun.objects.create(
+        mount_file="/tmp/mounts.csv",
+        sign_file="/tmp/signs.csv",
+        processed_mount_source_ids=["M1", "M2", "M3"],
+        processed_sign_source_ids=["S1"],
+    )
+    StreetScanImportRunDetail.objects.bulk_create(
+        [
+            StreetScanImportRunDetail(
+                import_run=run, object_type="signs", level="skip", phase="create", source_id=f"S{i}", reason="Bad"
+            )
+            for i in range(205)
+        ]
+        + [
+            StreetScanImportRunDetail(
+                import_run=run, object_type="mounts", level="warning", phase="update", source_id="M9", reason="Late"
+            ),
+            StreetScanImportRunDetail(import_run=run, level="error", source_id="X1", reason="Old entry"),
+        ]
+    )
+    return run
+
+
+@pytest.mark.django_db
+def test__streetscan_import_run_admin__group_details(import_run):
+    grouped = StreetScanImportRunAdmin._group_details(import_run)
+
+    assert {
+        (object_type, level): (group["total"], len(group["entries"]))
+        for object_type, levels in grouped.items()
+        for level, group in levels.items()
+        if group["total"]
+    } == {
+        ("signs", "skip"): (205, 200),
+        ("mounts", "warning"): (1, 1),
+        ("unknown", "error"): (1, 1),
+    }
+
+
+@pytest.mark.django_db
+def test__streetscan_import_run_admin__change_view(admin_client, import_run):
+    response = admin_client.get(reverse("admin:traffic_control_streetscanimportrun_change", args=[import_run.pk]))
+
+    assert response.status_code == 200
+    assert response.context["original"].processed_mount_count == 3
+    assert "Old entry" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test__streetscan_import_run_admin__changelist(admin_client, import_run):
+    response = admin_client.get(reverse("admin:traffic_control_streetscanimportrun_changelist"))
+
+    assert response.status_code == 200
+    assert response.context["cl"].result_list[0].get_deferred_fields() >= {
+        "orphan_mount_source_ids",
+        "processed_mount_source_ids",
+    }
+
+
+@pytest.mark.parametrize(
+    "object_type, level, expected_rows",
+    (
+        ("signs", "skip", 205),
+        ("mounts", "warning", 1),
+        ("unknown", "error", 1),
+        ("mounts", "error", 0),
+    ),
+)
+@pytest.mark.django_db
+def test__streetscan_import_run_admin__details_csv(admin_client, import_run, object_type, level, expected_rows):
+    response = admin_client.get(
+        reverse("admin:traffic_control_streetscanimportrun_details_csv", args=[import_run.pk]),
+        {"object_type": object_type, "level": level},
+    )
+
+    assert response.status_code == 200
+    rows = list(csv.reader(StringIO(b"".join(response.streaming_content).decode("utf-8"))))
+    assert rows[0] == ["source_id", "phase", "reason"]
+    assert len(rows) == expected_rows + 1
+
+
+@pytest.mark.django_db
+def test__streetscan_import_run_admin__details_csv_run_not_found(admin_client):
+    response = admin_client.get(reverse("admin:traffic_control_streetscanimportrun_details_csv", args=[1234]))
+
+    assert response.status_code == 404
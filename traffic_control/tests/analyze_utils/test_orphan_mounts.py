@@ -238,3 +238,31 @@ def test_write_orphan_mounts_csv_excludes_referenced_mount(tmp_path: Path) -> No
 
     assert str(orphan.id) in written_ids
     assert str(referenced.id) not in written_ids
+
+
+# ---------------------------------------------------------------------------
+# delete_orphan_mounts
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db
+def test_delete_orphan_mounts_deletes_in_chunks() -> None:
+    """Orphans are deleted chunk by chunk, reporting each chunk, and referenced mounts are kept.
+
+    With chunk_size=1 every orphan is deleted in its own transaction.
+    """
+    orphans = [MountRealFactory(source_name=SOURCE_NAME) for _ in range(3)]
+    referenced = MountRealFactory(source_name=SOURCE_NAME)
+    TrafficSignRealFactory(source_name=SOURCE_NAME, mount_real=referenced)
+    chunks: list[tuple[list[str], int]] = []
+
+    deleted_count = TrafficSignImporterV2.delete_orphan_mounts(
+        chunk_size=1, on_chunk=lambda source_ids, count: chunks.append((source_ids, count))
+    )
+
+    assert deleted_count == 3
+    assert [count for _source_ids, count in chunks] == [1, 2, 3]
+    assert sorted(source_id for source_ids, _count in chunks for source_id in source_ids) == sorted(
+        orphan.source_id for orphan in orphans
+    )
+    assert list(MountReal.objects.filter(source_name=SOURCE_NAME)) == [referenced]
@@ -9,7 +9,9 @@ from traffic_control.analyze_utils.plan_geometry_importer import (
     PlanGeometryImporter,
 )
 from traffic_control.geometry_utils import get_3d_geometry
+from traffic_control.models import Plan
 from traffic_control.tests.factories import get_user, PlanFactory
+from traffic_control.utils.data_version import get_data_version
 
 
 @pytest.fixture
@@ -319,6 +321,24 @@ class TestPlanGeometryImporter:
         assert test_plan.location is not None
         assert test_plan.derive_location is False
 
+    def test_update_plans_bumps_plan_data_version(self, valid_csv_file, test_plan):
+        """Test that updating the plans invalidates the cached WFS responses reading them.
+
+        Args:
+            valid_csv_file: Valid CSV file fixture.
+            test_plan: Test plan fixture.
+        """
+        test_plan.location = None
+        test_plan.save()
+        version = get_data_version(Plan._meta.db_table)
+
+        importer = PlanGeometryImporter(valid_csv_file)
+        importer.parse_csv()
+        importer.validate_and_process_rows()
+        importer.update_plans(dry_run=False)
+
+        assert get_data_version(Plan._meta.db_table) != version
+
     def test_update_plans_merges_drawing_numbers(self, valid_csv_file, test_plan):
         """Test that drawing numbers are merged with partial matches replaced.
 
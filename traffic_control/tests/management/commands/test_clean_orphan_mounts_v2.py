@@ -3,6 +3,7 @@ from io import StringIO
 
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
 
 from traffic_control.analyze_utils.traffic_sign_data_v2_import import SOURCE_NAME
 from traffic_control.models import MountReal
@@ -203,3 +204,39 @@ def test_dry_run_ids_detail_prints_each_mount_id() -> None:
     stdout, _ = _call_command(dry_run=True, dry_run_detail="ids")
 
     assert str(mount.id) in stdout
+
+
+@pytest.mark.django_db
+def test_delete_reports_progress_per_chunk() -> None:
+    """With --chunk-size the deletion progress is reported after each committed chunk.
+
+    Returns:
+        None
+    """
+    for _ in range(3):
+        MountRealFactory(source_name=SOURCE_NAME)
+
+    stdout, _ = _call_command(chunk_size=2)
+
+    assert "Deleted 2/3 orphan mount(s)" in stdout
+    assert "Deleted 3/3 orphan mount(s)" in stdout
+    assert not MountReal.objects.filter(source_name=SOURCE_NAME).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("chunk_size", ("0", "-1", "abc"))
+def test_invalid_chunk_size_is_rejected(chunk_size: str) -> None:
+    """A --chunk-size that is not a positive integer is rejected before deleting anything.
+
+    Args:
+        chunk_size (str): Invalid --chunk-size value.
+
+    Returns:
+        None
+    """
+    mount = MountRealFactory(source_name=SOURCE_NAME)
+
+    with pytest.raises(CommandError, match="--chunk-size"):
+        call_command(CMD, f"--chunk-size={chunk_size}", stdout=StringIO(), stderr=StringIO())
+
+    assert MountReal.objects.filter(id=mount.id).exists()
@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
 
 from traffic_control.models import OperationalArea
 from traffic_control.tests.factories import OperationalAreaFactory
@@ -94,3 +95,101 @@ def test_importer_created_operational_areas():
     assert "3 features found" in out.getvalue(), "The command lists the total count of features returned by the request"
     assert "1 synced from source" in out.getvalue(), "The command indicates the total count of features affected"
     assert "1 newly created" in out.getvalue(), "The command indicates the total count of new features recorded"
+
+
+def call_import(features, **options):
+    patch_url = patch(
+        "traffic_control.management.commands.import_operational_areas_hki_wfs.urlretrieve",
+        return_value=("dummy-file", {}),
+    )
+    patch_ds = patch(
+        "traffic_control.management.commands.import_operational_areas_hki_wfs.DataSource",
+        new=create_mock_data_source(features),
+    )
+    out = StringIO()
+    with patch_url as mock_urlretrieve, patch_ds:
+        call_command("import_operational_areas_hki_wfs", stdout=out, **options)
+    return out.getvalue(), mock_urlretrieve
+
+
+@pytest.mark.django_db
+def test_importer_bulk_sync_creates_and_updates_operational_areas():
+    oa_0 = OperationalAreaFactory(name="feature 0", source_id=0, source_name="urakkarajat_katu")
+
+    out, _ = call_import([MOCK_FEATURE_0, MOCK_FEATURE_1, MOCK_FEATURE_2], bulk_sync=True)
+
+    assert OperationalArea.objects.count() == 2
+    imported_feature = OperationalArea.objects.get(name="feature 1")
+    assert imported_feature.source_id == "1"
+    assert imported_feature.start_date == date(2020, 1, 1)
+    assert imported_feature.task == "KATU"
+    assert imported_feature.is_active
+    assert imported_feature.location.hasz
+    oa_0.refresh_from_db()
+    assert oa_0.name == "feature 0 (updated)"
+    assert "3 features found, 1 synced from source (1 newly created), 0 unchanged." in out
+
+
+@pytest.mark.django_db
+def test_importer_bulk_sync_skips_unchanged_operational_areas():
+    call_import([MOCK_FEATURE_0, MOCK_FEATURE_1], bulk_sync=True)
+
+    with patch.object(OperationalArea.objects, "bulk_create", wraps=OperationalArea.objects.bulk_create) as bulk_create:
+        out, _ = call_import([MOCK_FEATURE_0, MOCK_FEATURE_1], bulk_sync=True)
+
+    assert "2 features found, 0 synced from source (0 newly created), 2 unchanged." in out
+    assert bulk_create.call_args.args[0] == [], "Unchanged areas are not written"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("bulk_sync", (False, True))
+def test_importer_deactivates_operational_areas_no_longer_in_source(bulk_sync):
+    call_import([MOCK_FEATURE_0, MOCK_FEATURE_1], bulk_sync=bulk_sync)
+    other_source_area = OperationalAreaFactory(name="other", source_id=1, source_name="other source")
+
+    out, _ = call_import([MOCK_FEATURE_1], bulk_sync=bulk_sync)
+
+    assert not OperationalArea.objects.get(source_name="urakkarajat_katu", source_id="0").is_active
+    assert OperationalArea.objects.get(source_name="urakkarajat_katu", source_id="1").is_active
+    assert OperationalArea.objects.get(id=other_source_area.id).is_active
+    assert "1 areas no longer in source deactivated." in out
+
+    call_import([MOCK_FEATURE_0, MOCK_FEATURE_1], bulk_sync=bulk_sync)
+
+    assert OperationalArea.objects.get(source_name="urakkarajat_katu", source_id="0").is_active
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("bulk_sync", (False, True))
+def test_importer_refuses_to_deactivate_when_no_source_features_match(bulk_sync):
+    call_import([MOCK_FEATURE_0, MOCK_FEATURE_1], bulk_sync=bulk_sync)
+
+    with pytest.raises(CommandError, match="No features matched"):
+        call_import([MOCK_FEATURE_2], bulk_sync=bulk_sync)
+
+    assert OperationalArea.objects.filter(source_name="urakkarajat_katu", is_active=True).count() == 2
+
+    out, _ = call_import([], bulk_sync=bulk_sync, force=True)
+
+    assert not OperationalArea.objects.filter(source_name="urakkarajat_katu", is_active=True).exists()
+    assert "2 areas no longer in source deactivated." in out
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("bulk_sync", (False, True))
+def test_importer_refuses_to_deactivate_more_than_allowed_fraction(bulk_sync):
+    call_import([MOCK_FEATURE_0, MOCK_FEATURE_1], bulk_sync=bulk_sync)
+
+    with pytest.raises(CommandError, match="Refusing to deactivate 1 of 2 active areas"):
+        call_import([MOCK_FEATURE_1], bulk_sync=bulk_sync, max_deactivated_fraction=0.25)
+
+    assert OperationalArea.objects.get(source_name="urakkarajat_katu", source_id="0").is_active
+
+
+@pytest.mark.django_db
+def test_importer_reads_local_file():
+    out, mock_urlretrieve = call_import([MOCK_FEATURE_1], file="areas.geojson", bulk_sync=True)
+
+    mock_urlretrieve.assert_not_called()
+    assert "Importing operational areas from areas.geojson" in out
+    assert OperationalArea.objects.filter(source_id="1").exists()
@@ -8,7 +8,7 @@ from django.core.management import call_command
 
 from traffic_control.analyze_utils.traffic_sign_data_v2_import import SOURCE_NAME
 from traffic_control.models import MountReal
-from traffic_control.models.streetscan_import import StreetScanImportRun
+from traffic_control.models.streetscan_import import StreetScanImportRun, StreetScanImportRunDetail
 from traffic_control.tests.factories import MountRealFactory, TrafficSignRealFactory
 
 # ---------------------------------------------------------------------------
@@ -228,6 +228,28 @@ def test_dry_run_log_row_marked_as_dry_run(tmp_path: Path) -> None:
     assert run.dry_run is True
 
 
+@pytest.mark.django_db
+def test_run_log_details_are_written_as_rows(tmp_path: Path) -> None:
+    """Skip entries of the run are stored as StreetScanImportRunDetail rows.
+
+    Args:
+        tmp_path (Path): Pytest tmp_path fixture.
+    """
+    mount_file = _write_csv(
+        tmp_path,
+        _MOUNT_CSV_HEADER,
+        [["1", "BADGEOM", "not-a-number", "6673000", "10", "0", "0", "0", "", "2025/08/15 12:00:00+00", ""]],
+    )
+    sign_file = _write_csv(tmp_path, _SIGN_CSV_HEADER, [])
+
+    _call(mount_file, sign_file)
+
+    run = StreetScanImportRun.objects.get(mount_file=mount_file, sign_file=sign_file)
+    detail = StreetScanImportRunDetail.objects.get(import_run=run)
+    assert (detail.object_type, detail.level, detail.phase, detail.source_id) == ("mounts", "skip", "create", "BADGEOM")
+    assert run.skipped_count == 1
+
+
 # ===========================================================================
 # --clean-orphans phase
 # ===========================================================================
@@ -8,7 +8,7 @@ from django.core.management import call_command
 
 from traffic_control.constants import TICKET_MACHINE_CODES
 from traffic_control.enums import DeviceTypeTargetModel
-from traffic_control.models import LinkAdditionalSignParentsRunInfo
+from traffic_control.models import AdditionalSignReal, LinkAdditionalSignParentsRunInfo
 from traffic_control.tests.factories import (
     AdditionalSignRealFactory,
     MountRealFactory,
@@ -17,6 +17,7 @@ from traffic_control.tests.factories import (
     TrafficSignRealFactory,
 )
 from traffic_control.tests.utils import MIN_X, MIN_Y
+from traffic_control.utils.data_version import get_data_version
 
 
 @pytest.fixture
@@ -155,6 +156,31 @@ class TestLinkAdditionalSignParentsByMountCommand:
         assert run_info.linked_records[0]["additional_sign_real_id"] == str(ads.id)
         assert run_info.linked_records[0]["traffic_sign_real_id"] == str(traffic_sign.id)
 
+    def test_command_bumps_additional_sign_data_version(self, additional_sign_device_type, traffic_sign_device_type):
+        """Test that linking bumps the data version of the bulk updated additional signs.
+
+        Args:
+            additional_sign_device_type: Additional sign device type fixture
+            traffic_sign_device_type: Traffic sign device type fixture
+        """
+        mount = MountRealFactory()
+        TrafficSignRealFactory(
+            device_type=traffic_sign_device_type,
+            mount_real=mount,
+            location=Point(MIN_X + 10.0, MIN_Y + 10.0, 2.0, srid=settings.SRID),
+        )
+        AdditionalSignRealFactory(
+            device_type=additional_sign_device_type,
+            mount_real=mount,
+            parent=None,
+            location=Point(MIN_X + 10.0, MIN_Y + 10.0, 1.0, srid=settings.SRID),
+        )
+        version = get_data_version(AdditionalSignReal._meta.db_table)
+
+        call_command("link_additional_sign_parents_by_mount", stdout=StringIO())
+
+        assert get_data_version(AdditionalSignReal._meta.db_table) != version
+
     def test_command_excludes_ticket_machines(self, ticket_machine_device_type, traffic_sign_device_type):
         """Test that ticket machines are excluded from processing.
 
@@ -1,9 +1,11 @@
 import json
+import os
 from datetime import datetime, timezone
 
 import pytest
-from django.core.management import call_command
+from django.core.management import call_command, CommandError
 
+from traffic_control.management.commands import revert_import_streetscan_signs_v2 as revert_command
 from traffic_control.models import (
     AdditionalSignReal,
     MountReal,
@@ -17,6 +19,7 @@ from traffic_control.tests.factories import (
     TrafficSignRealFactory,
     UserFactory,
 )
+from traffic_control.utils.data_version import get_data_versions
 
 # Test Constants
 UUID_1 = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
@@ -461,3 +464,118 @@ def test_dry_run(tmp_path, user, base_time_created, base_time_updated):
     assert signpost.updated_at == base_time_updated
     assert traffic_sign.updated_at == base_time_updated
     assert additional_sign.updated_at == base_time_updated
+
+
+@pytest.mark.django_db
+def test_deletes_are_chunked(tmp_path, monkeypatch, user):
+    """Reverted create operations are deleted in chunks of BATCH_SIZE objects."""
+    monkeypatch.setattr(revert_command, "BATCH_SIZE", 2)
+    for uuid in (UUID_1, UUID_2, UUID_3):
+        MountRealFactory(id=uuid, created_by=user, updated_by=user)
+
+    file_path = write_jsonl(
+        tmp_path, [{"action": "create", "object_type": "MountReal", "db_id": uuid} for uuid in (UUID_1, UUID_2, UUID_3)]
+    )
+
+    call_command("revert_import_streetscan_signs_v2", file_path=file_path)
+
+    assert not MountReal.objects.filter(id__in=[UUID_1, UUID_2, UUID_3]).exists()
+
+
+@pytest.mark.django_db
+def test_interrupted_revert_is_resumed_from_checkpoint(
+    tmp_path, monkeypatch, user, base_time_created, base_time_updated
+):
+    """An interrupted revert leaves a checkpoint of the committed phases, and resuming it completes the revert
+    without repeating those phases."""
+    mount = MountRealFactory(id=UUID_1, created_by=user, updated_by=user)
+    signpost = SignpostRealFactory(id=UUID_2, created_by=user, updated_by=user, condition=1, mount_real=mount)
+    traffic_sign = TrafficSignRealFactory(id=UUID_3, created_by=user, updated_by=user, condition=1)
+
+    MountReal.objects.filter(id=UUID_1).update(updated_at=base_time_updated, created_at=base_time_created)
+    SignpostReal.objects.filter(id=UUID_2).update(updated_at=base_time_updated, created_at=base_time_created)
+    TrafficSignReal.objects.filter(id=UUID_3).update(updated_at=base_time_updated, created_at=base_time_created)
+
+    file_path = write_jsonl(
+        tmp_path,
+        [
+            {"action": "create", "object_type": "MountReal", "db_id": UUID_1},
+            {"action": "update", "object_type": "SignpostReal", "db_id": UUID_2, "old": {"condition": 5}},
+            {"action": "update", "object_type": "TrafficSignReal", "db_id": UUID_3, "old": {"condition": 5}},
+        ],
+    )
+    checkpoint_path = f"{file_path}.checkpoint.json"
+
+    def interrupt(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as patch:
+        patch.setattr(revert_command.Command, "revert_updates_on_orphaned_objects", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            call_command("revert_import_streetscan_signs_v2", file_path=file_path, ids=[UUID_1, UUID_3])
+
+    with open(checkpoint_path) as file:
+        checkpoint = json.load(file)
+    assert "MountReal:create" in checkpoint["completed_phases"]
+    assert "orphans" not in checkpoint["completed_phases"]
+    assert checkpoint["orphaned_pks"] == {"SignpostReal": [UUID_2]}
+    assert not MountReal.objects.filter(id=UUID_1).exists()
+    traffic_sign.refresh_from_db()
+    assert traffic_sign.condition == 5
+    # Changes made after the interruption are not overwritten by the phases already completed
+    TrafficSignReal.objects.filter(id=UUID_3).update(condition=2)
+
+    call_command("revert_import_streetscan_signs_v2", file_path=file_path, ids=[UUID_1, UUID_3], resume=True)
+
+    signpost.refresh_from_db()
+    traffic_sign.refresh_from_db()
+    assert signpost.mount_real is None
+    assert signpost.condition == 5
+    assert traffic_sign.condition == 2
+    assert not os.path.exists(checkpoint_path)
+
+
+@pytest.mark.django_db
+def test_resume_requires_checkpoint_of_same_arguments(tmp_path):
+    file_path = write_jsonl(tmp_path, [{"action": "create", "object_type": "MountReal", "db_id": UUID_1}])
+
+    with pytest.raises(CommandError, match="does not exist"):
+        call_command("revert_import_streetscan_signs_v2", file_path=file_path, resume=True)
+
+    with open(f"{file_path}.checkpoint.json", "wt") as file:
+        json.dump(
+            {
+                "file_path": str(file_path),
+                "ids": [UUID_2],
+                "model_names": ["MountReal"],
+                "timestamp": "2022-02-02T00:00:00+00:00",
+            },
+            file,
+        )
+    with pytest.raises(CommandError, match="different arguments"):
+        call_command("revert_import_streetscan_signs_v2", file_path=file_path, resume=True)
+
+
+@pytest.mark.django_db
+def test_raw_updates_bump_data_versions(tmp_path, user):
+    """Objects changed with raw SQL bump the data versions of their tables, invalidating the cached WFS responses."""
+    mount = MountRealFactory(id=UUID_1, created_by=user, updated_by=user)
+    SignpostRealFactory(id=UUID_2, created_by=user, updated_by=user, mount_real=mount)
+    TrafficSignRealFactory(id=UUID_3, created_by=user, updated_by=user, condition=1)
+    file_path = write_jsonl(
+        tmp_path,
+        [
+            {"action": "create", "object_type": "MountReal", "db_id": UUID_1},
+            {"action": "update", "object_type": "TrafficSignReal", "db_id": UUID_3, "old": {"condition": 5}},
+        ],
+    )
+    tables = [SignpostReal._meta.db_table, TrafficSignReal._meta.db_table, AdditionalSignReal._meta.db_table]
+    versions = get_data_versions(tables)
+
+    call_command("revert_import_streetscan_signs_v2", file_path=file_path)
+
+    new_versions = get_data_versions(tables)
+    # Detached from the deleted mount
+    assert new_versions[SignpostReal._meta.db_table] != versions[SignpostReal._meta.db_table]
+    assert new_versions[TrafficSignReal._meta.db_table] != versions[TrafficSignReal._meta.db_table]
+    assert new_versions[AdditionalSignReal._meta.db_table] == versions[AdditionalSignReal._meta.db_table]
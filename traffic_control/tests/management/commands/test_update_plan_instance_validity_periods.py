@@ -44,3 +44,25 @@ def test_update_plan_instance_validity_periods(factory_cls):
 
     instance.refresh_from_db()
     assert instance.validity_period_start == plan.decision_date
+
+
+@pytest.mark.django_db
+def test_update_plan_instance_validity_periods_in_batches_resumed_after_plan():
+    date_start = datetime.date(2024, 1, 1)
+    date_decision = datetime.date(2024, 6, 1)
+    instances = sorted(
+        [TrafficSignPlanFactory(validity_period_start=date_start) for _ in range(3)], key=lambda i: i.plan_id
+    )
+    for instance in instances:
+        instance.plan.decision_date = date_decision
+        instance.plan.save(update_fields=["decision_date"])
+    # Make the validity periods out of sync without going through save()
+    type(instances[0]).objects.update(validity_period_start=date_start)
+
+    call_command("update_plan_instance_validity_periods", batch_size=1, start_after=str(instances[0].plan_id))
+
+    for instance in instances:
+        instance.refresh_from_db()
+    assert instances[0].validity_period_start == date_start
+    assert instances[1].validity_period_start == date_decision
+    assert instances[2].validity_period_start == date_decision
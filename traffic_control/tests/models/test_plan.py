@@ -1,10 +1,14 @@
 from datetime import date
 
 import pytest
+from auditlog.context import set_actor
+from auditlog.models import LogEntry
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.gis.geos import MultiPolygon, Point, Polygon
 
 from city_furniture.tests.factories import FurnitureSignpostPlanFactory
+from traffic_control.models.plan import PLAN_DERIVED_LOCATION_FIELDS, PLAN_SIMPLIFIED_LOCATION_FIELDS
 from traffic_control.tests.factories import (
     AdditionalSignPlanFactory,
     BarrierPlanFactory,
@@ -17,6 +21,7 @@ from traffic_control.tests.factories import (
     TrafficSignPlanFactory,
 )
 from traffic_control.tests.utils import MIN_X, MIN_Y
+from users.utils import get_system_user
 
 test_point_outside_area = Point(MIN_X + 21.0, MIN_Y + 20.0, 0.0, srid=settings.SRID)
 test_multipolygon = MultiPolygon(
@@ -339,3 +344,73 @@ def test_plan_decision_date_change_updates_related_devices_validity_period(facto
     # 4. Refresh the device plan from the database and assert its validity period was updated
     device_plan.refresh_from_db()
     assert device_plan.validity_period_start == new_decision_date
+
+
+@pytest.mark.django_db
+def test_plan_decision_date_change_logs_updated_device_validity_periods():
+    plan = PlanFactory(decision_date=date(2025, 1, 1))
+    other_plan = PlanFactory(decision_date=date(2025, 1, 1))
+    device_plans = [TrafficSignPlanFactory(plan=plan), FurnitureSignpostPlanFactory(plan=plan)]
+    other_device_plan = TrafficSignPlanFactory(plan=other_plan)
+    user = get_system_user()
+
+    with set_actor(user):
+        plan.decision_date = date(2025, 6, 15)
+        plan.save()
+
+    for device_plan in device_plans:
+        device_plan.refresh_from_db()
+        assert device_plan.validity_period_start == date(2025, 6, 15)
+        log_entry = LogEntry.objects.filter(
+            content_type=ContentType.objects.get_for_model(device_plan), object_pk=str(device_plan.pk)
+        ).latest()
+        assert log_entry.action == LogEntry.Action.UPDATE
+        assert log_entry.changes == {"validity_period_start": ["2025-01-01", "2025-06-15"]}
+        assert log_entry.actor == user
+    other_device_plan.refresh_from_db()
+    assert other_device_plan.validity_period_start == date(2025, 1, 1)
+
+
+@pytest.mark.django_db
+def test__plan__derived_locations_are_updated_on_save():
+    two_areas = MultiPolygon(
+        Polygon(
+            (
+                (MIN_X + 1.0, MIN_Y + 1.0, 1.0),
+                (MIN_X + 1.0, MIN_Y + 10.0, 1.0),
+                (MIN_X + 10.0, MIN_Y + 1.0, 1.0),
+                (MIN_X + 1.0, MIN_Y + 1.0, 1.0),
+            )
+        ),
+        Polygon(
+            (
+                (MIN_X + 20.0, MIN_Y + 20.0, 1.0),
+                (MIN_X + 20.0, MIN_Y + 30.0, 1.0),
+                (MIN_X + 30.0, MIN_Y + 20.0, 1.0),
+                (MIN_X + 20.0, MIN_Y + 20.0, 1.0),
+            )
+        ),
+        srid=settings.SRID,
+    )
+    plan = PlanFactory(location=test_multipolygon)
+    assert plan.convex_hull_location.equals(test_multipolygon[0])
+
+    plan.location = two_areas
+    plan.save()
+
+    assert plan.convex_hull_location.equals(two_areas.convex_hull)
+    assert all(z == 0.0 for *_, z in plan.convex_hull_location.coords[0])
+    for field_name in PLAN_SIMPLIFIED_LOCATION_FIELDS:
+        simplified_location = getattr(plan, field_name)
+        assert simplified_location.geom_type == "MultiPolygon"
+        assert simplified_location.hasz
+
+
+@pytest.mark.django_db
+def test__plan__derived_locations_are_not_logged():
+    plan = PlanFactory(location=test_multipolygon)
+
+    log_entry = LogEntry.objects.get_for_object(plan).get(action=LogEntry.Action.CREATE)
+
+    assert "location" in log_entry.changes_dict
+    assert not set(PLAN_DERIVED_LOCATION_FIELDS) & set(log_entry.changes_dict)
@@ -0,0 +1,117 @@
+import csv
+import io
+
+import pytest
+from django.core import mail
+from django.urls import reverse
+from openpyxl import load_workbook
+
+from traffic_control.enums import DeviceTypeTargetModel
+from traffic_control.models import AdditionalSignReal, ExportJob, ExportJobStatus
+from traffic_control.resources.additional_sign import AdditionalSignRealResource
+from traffic_control.services.export_job import export_job_create, export_job_run
+from traffic_control.tests.factories import AdditionalSignRealFactory, get_user, TrafficControlDeviceTypeFactory
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+def _create_additional_signs():
+    device_type_1 = TrafficControlDeviceTypeFactory(code="type1", target_model=DeviceTypeTargetModel.ADDITIONAL_SIGN)
+    device_type_2 = TrafficControlDeviceTypeFactory(code="type2", target_model=DeviceTypeTargetModel.ADDITIONAL_SIGN)
+    AdditionalSignRealFactory(device_type=device_type_1, content_s={"num": 30, "list": ["a", "b"]})
+    AdditionalSignRealFactory(device_type=device_type_2, content_s={"text": "Huoltoajo"})
+
+
+def _read_csv(job: ExportJob) -> list[dict]:
+    with job.file.open("rb") as f:
+        return list(csv.DictReader(io.StringIO(f.read().decode("utf-8"))))
+
+
+@pytest.mark.django_db
+def test__export_job_run__csv_matches_in_memory_export():
+    _create_additional_signs()
+    queryset = AdditionalSignReal.objects.order_by("source_id")
+    job = export_job_create(get_user(), queryset, AdditionalSignRealResource, "csv")
+
+    assert export_job_run(job)
+
+    job.refresh_from_db()
+    assert job.status == ExportJobStatus.FINISHED
+    assert job.row_count == 2
+    dataset = AdditionalSignRealResource().export(queryset=queryset)
+    rows = _read_csv(job)
+    assert list(rows[0].keys()) == dataset.headers
+    assert [row["id"] for row in rows] == [str(id) for id in dataset["id"]]
+    assert sorted(row["content_s.list"] for row in rows) == ["", '["a", "b"]']
+    assert sorted(row["content_s.text"] for row in rows) == ["", "Huoltoajo"]
+    assert len(mail.outbox) == 1
+    assert reverse("admin:traffic_control_exportjob_download", args=[job.pk]) in mail.outbox[0].body
+
+
+@pytest.mark.django_db
+def test__export_job_run__exports_selected_objects_in_stored_order():
+    _create_additional_signs()
+    unselected = AdditionalSignRealFactory()
+    queryset = AdditionalSignReal.objects.exclude(pk=unselected.pk).order_by("-source_id")
+    job = export_job_create(get_user(), queryset, AdditionalSignRealResource, "csv")
+
+    job.refresh_from_db()
+    assert job.object_ids == [str(pk) for pk in queryset.values_list("pk", flat=True)]
+    assert job.ordering == ["-source_id"]
+    assert export_job_run(job)
+
+    job.refresh_from_db()
+    assert [row["id"] for row in _read_csv(job)] == job.object_ids
+
+
+@pytest.mark.django_db
+def test__export_job_run__xlsx():
+    _create_additional_signs()
+    job = export_job_create(get_user(), AdditionalSignReal.objects.all(), AdditionalSignRealResource, "xlsx")
+
+    export_job_run(job)
+
+    job.refresh_from_db()
+    assert job.status == ExportJobStatus.FINISHED
+    with job.file.open("rb") as f:
+        rows = list(load_workbook(f, read_only=True).active.values)
+    assert len(rows) == 3
+    assert {"content_s.num", "content_s.list", "content_s.text"} <= set(rows[0])
+
+
+@pytest.mark.django_db
+def test__export_job_run__job_is_run_once():
+    _create_additional_signs()
+    job = export_job_create(get_user(), AdditionalSignReal.objects.all(), AdditionalSignRealResource, "csv")
+    stale_job = ExportJob.objects.get(pk=job.pk)
+
+    assert export_job_run(job)
+    assert not export_job_run(stale_job)
+
+
+@pytest.mark.django_db
+def test__export_admin_action__large_export_is_run_as_export_job(
+    admin_client, settings, django_capture_on_commit_callbacks
+):
+    settings.EXPORT_JOB_ROW_THRESHOLD = 2
+    _create_additional_signs()
+
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        response = admin_client.post(
+            reverse("admin:traffic_control_additionalsignreal_changelist"),
+            {
+                "action": "export_admin_action",
+                "file_format": "0",
+                "_selected_action": [str(pk) for pk in AdditionalSignReal.objects.values_list("pk", flat=True)],
+            },
+        )
+
+    assert response.status_code == 302
+    job = ExportJob.objects.get()
+    assert job.status == ExportJobStatus.PENDING
+    assert job.file_format == "csv"
+    assert job.resource_class == "traffic_control.resources.additional_sign.AdditionalSignRealResource"
+    assert len(callbacks) == 1
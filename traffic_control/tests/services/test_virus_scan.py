@@ -1,10 +1,22 @@
+import re
+
 import pytest
 import requests_mock
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import override_settings
 
 from traffic_control.services.virus_scan import clam_av_scan, get_clam_av_scan_url
 
 DUMMY_CLAMAV_URL = "https://test"
+INFECTED_MARKER = b"INFECTED"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
 
 
 @pytest.fixture
@@ -13,36 +25,76 @@ def mock_api():
         yield m
 
 
+def _stand_in_scanner(request, context):
+    """Reply like ClamAV REST API, reporting uploaded files containing INFECTED_MARKER as infected"""
+    body = request.body.read()
+    file_name = re.search(rb'filename="([^"]*)"', body).group(1).decode()
+    is_infected = INFECTED_MARKER in body
+    return {
+        "data": {
+            "result": [
+                {"name": file_name, "is_infected": is_infected, "viruses": ["streptokokki"] if is_infected else []}
+            ]
+        }
+    }
+
+
+def _file(name, content):
+    return "FILES", SimpleUploadedFile(name, content)
+
+
 @override_settings(CLAMAV_BASE_URL=DUMMY_CLAMAV_URL)
 def test_virus_scan_not_200(mock_api):
     mock_api.post(get_clam_av_scan_url("v1"), status_code=404, json={})
 
-    ret = clam_av_scan([])
+    ret = clam_av_scan([_file("file.txt", b"content")])
     assert ret["status_code"] == 404
     assert ret["errors"] == [{"detail": "Status code not 200", "viruses": ["ClamAV response not OK"]}]
 
 
-@override_settings(CLAMAV_URL=DUMMY_CLAMAV_URL)
-@pytest.mark.parametrize(
-    "fake_response",
-    [
-        {
-            "data": {
-                "result": [
-                    {"is_infected": True, "name": "Infected1", "viruses": ["streptokokki", "pneumokokki"]},
-                    {"is_infected": False, "name": "Ok", "viruses": []},
-                    {"is_infected": True, "name": "Infected2", "viruses": ["koli", "korona"]},
-                ]
-            }
-        }
-    ],
-)
-def test_virus_scan(mock_api, fake_response):
-    mock_api.post(get_clam_av_scan_url("v1"), status_code=200, json=fake_response)
+@override_settings(CLAMAV_BASE_URL=DUMMY_CLAMAV_URL)
+def test_virus_scan(mock_api):
+    mock_api.post(get_clam_av_scan_url("v1"), status_code=200, json=_stand_in_scanner)
 
-    ret = clam_av_scan([])
+    ret = clam_av_scan(
+        [
+            _file("Infected1.txt", b"1 " + INFECTED_MARKER),
+            _file("Ok.txt", b"clean"),
+            _file("Infected2.txt", b"2 " + INFECTED_MARKER),
+        ]
+    )
     assert ret["status_code"] == 200
     assert ret["errors"] == [
-        {"detail": "Infected1 is infected", "viruses": ["streptokokki", "pneumokokki"]},
-        {"detail": "Infected2 is infected", "viruses": ["koli", "korona"]},
+        {"detail": "Infected1.txt is infected", "viruses": ["streptokokki"]},
+        {"detail": "Infected2.txt is infected", "viruses": ["streptokokki"]},
     ]
+
+
+@override_settings(CLAMAV_BASE_URL=DUMMY_CLAMAV_URL)
+def test_virus_scan_identical_contents_are_scanned_once(mock_api):
+    mock_api.post(get_clam_av_scan_url("v1"), status_code=200, json=_stand_in_scanner)
+    files = [_file("a.txt", b"same"), _file("b.txt", b"same " + INFECTED_MARKER), _file("c.txt", b"same")]
+
+    first = clam_av_scan(files)
+    second = clam_av_scan([_file("d.txt", b"same"), _file("e.txt", b"same " + INFECTED_MARKER)])
+
+    assert mock_api.call_count == 2
+    assert first["errors"] == [{"detail": "b.txt is infected", "viruses": ["streptokokki"]}]
+    assert second["errors"] == [{"detail": "e.txt is infected", "viruses": ["streptokokki"]}]
+    # Files are rewound for saving after the scan
+    assert [file.read() for _, file in files] == [b"same", b"same " + INFECTED_MARKER, b"same"]
+
+
+@override_settings(CLAMAV_BASE_URL=DUMMY_CLAMAV_URL)
+def test_virus_scan_failed_scan_is_not_cached(mock_api):
+    mock_api.post(
+        get_clam_av_scan_url("v1"),
+        [{"status_code": 500, "json": {}}, {"status_code": 200, "json": _stand_in_scanner}],
+    )
+
+    first = clam_av_scan([_file("file.txt", b"content")])
+    second = clam_av_scan([_file("file.txt", b"content")])
+
+    assert first["status_code"] == 500
+    assert second == {"status_code": 200, "errors": []}
+    assert mock_api.call_count == 2
@@ -0,0 +1,173 @@
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.contrib.gis.geos import Point
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from traffic_control.enums import Lifecycle
+from traffic_control.models import TrafficSignReal
+from traffic_control.tests.factories import (
+    get_api_client,
+    get_owner,
+    get_user,
+    OperationalAreaFactory,
+    TrafficControlDeviceTypeFactory,
+    TrafficSignRealFactory,
+)
+from traffic_control.tests.utils import MIN_X, MIN_Y
+
+point_inside_area = Point(MIN_X + 20.0, MIN_Y + 20.0, 0.0, srid=settings.SRID)
+point_outside_area = Point(MIN_X + 1, MIN_Y + 1, 0.0, srid=settings.SRID)
+
+
+def batch_url():
+    return reverse("v1:trafficsignreal-batch")
+
+
+def get_batch_client(codenames=("add", "change", "delete")):
+    user = get_user(bypass_responsible_entity=True)
+    user.operational_areas.add(OperationalAreaFactory())
+    user.user_permissions.add(
+        *Permission.objects.filter(codename__in=[f"{codename}_trafficsignreal" for codename in codenames])
+    )
+    return get_api_client(user=user), user
+
+
+def get_create_data(location=point_inside_area):
+    return {
+        "location": location.ewkt,
+        "device_type": str(TrafficControlDeviceTypeFactory().pk),
+        "lifecycle": Lifecycle.ACTIVE.value,
+        "owner": str(get_owner().pk),
+    }
+
+
+@pytest.mark.django_db
+def test__batch__create_update_and_delete():
+    api_client, user = get_batch_client()
+    updated_sign = TrafficSignRealFactory(location=point_inside_area)
+    deleted_sign = TrafficSignRealFactory(location=point_inside_area)
+
+    response = api_client.post(
+        batch_url(),
+        {
+            "operations": [
+                {"action": "create", "data": get_create_data()},
+                {"action": "update", "id": str(updated_sign.pk), "data": {"txt": "Updated"}},
+                {"action": "delete", "id": str(deleted_sign.pk)},
+            ]
+        },
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert [(result["action"], result["status"]) for result in results] == [
+        ("create", status.HTTP_201_CREATED),
+        ("update", status.HTTP_200_OK),
+        ("delete", status.HTTP_204_NO_CONTENT),
+    ]
+    created_sign = TrafficSignReal.objects.get(pk=results[0]["id"])
+    assert created_sign.created_by == user
+    assert results[1]["data"]["txt"] == "Updated"
+    updated_sign.refresh_from_db()
+    assert updated_sign.txt == "Updated"
+    assert updated_sign.updated_by == user
+    deleted_sign.refresh_from_db()
+    assert not deleted_sign.is_active
+    assert deleted_sign.deleted_by == user
+
+
+@pytest.mark.django_db
+def test__batch__invalid_operations_are_reported_and_nothing_is_written():
+    api_client, _user = get_batch_client()
+    sign_outside_area = TrafficSignRealFactory(location=point_outside_area)
+    sign_count = TrafficSignReal.objects.count()
+
+    response = api_client.post(
+        batch_url(),
+        {
+            "operations": [
+                {"action": "create", "data": get_create_data()},
+                {"action": "create", "data": get_create_data(location=point_outside_area)},
+                {"action": "update", "id": str(sign_outside_area.pk), "data": {"txt": "Updated"}},
+                {"action": "delete", "id": "ae1ca6a2-67bc-4c2c-8d2f-b6e2ee5b5cd4"},
+                {"action": "create", "data": {**get_create_data(), "owner": "not-an-owner"}},
+            ]
+        },
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    errors = response.json()["operations"]
+    assert errors[0] == {}
+    assert errors[1] == {"non_field_errors": ["Location outside allowed operational area."]}
+    assert errors[2] == {"non_field_errors": ["Location outside allowed operational area."]}
+    assert errors[3] == {"id": ["Not found."]}
+    assert list(errors[4]["data"]) == ["owner"]
+    assert TrafficSignReal.objects.count() == sign_count
+    sign_outside_area.refresh_from_db()
+    assert sign_outside_area.txt is None
+
+
+@pytest.mark.django_db
+def test__batch__requires_model_permission_of_each_action():
+    api_client, _user = get_batch_client(codenames=("change",))
+    sign = TrafficSignRealFactory(location=point_inside_area)
+
+    response = api_client.post(
+        batch_url(),
+        {
+            "operations": [
+                {"action": "update", "id": str(sign.pk), "data": {"txt": "Updated"}},
+                {"action": "delete", "id": str(sign.pk)},
+            ]
+        },
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["operations"] == ["Objects can be updated or deleted only once in a batch: " + str(sign.pk)]
+
+    response = api_client.post(batch_url(), {"operations": [{"action": "delete", "id": str(sign.pk)}]}, format="json")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    sign.refresh_from_db()
+    assert sign.is_active
+
+
+@pytest.mark.django_db
+@override_settings(CITYINFRA_MAXIMUM_BATCH_OPERATIONS=2)
+def test__batch__maximum_number_of_operations():
+    api_client, _user = get_batch_client()
+
+    response = api_client.post(
+        batch_url(), {"operations": [{"action": "create", "data": get_create_data()}] * 3}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["operations"] == ["A batch may contain at most 2 operations."]
+
+
+@pytest.mark.django_db
+def test__batch__related_objects_are_fetched_once_per_field():
+    api_client, _user = get_batch_client()
+    device_type = TrafficControlDeviceTypeFactory()
+
+    def count_device_type_queries(sign_count):
+        signs = [TrafficSignRealFactory(location=point_inside_area) for _i in range(sign_count)]
+        operations = [
+            {"action": "update", "id": str(sign.pk), "data": {"device_type": str(device_type.pk)}} for sign in signs
+        ]
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.post(batch_url(), {"operations": operations}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        return len(
+            [query for query in context.captured_queries if 'FROM "traffic_control_device_type"' in query["sql"]]
+        )
+
+    assert count_device_type_queries(1) == count_device_type_queries(3)
@@ -0,0 +1,62 @@
+import pytest
+from django.db import transaction
+
+from traffic_control.benchmarks.cases import compare_results, create_context, get_benchmarks, run_benchmark
+from traffic_control.benchmarks.synthetic_city import generate_synthetic_city, is_synthetic_city_generated
+from traffic_control.models import MountReal, TrafficSignReal
+
+
+@pytest.mark.django_db
+def test__generate_synthetic_city__is_reproducible():
+    with transaction.atomic():
+        generate_synthetic_city(mount_count=20, seed=3)
+        locations = list(MountReal.objects.order_by("source_id").values_list("source_id", "location"))
+        transaction.set_rollback(True)
+
+    city = generate_synthetic_city(mount_count=20, seed=3)
+
+    assert is_synthetic_city_generated()
+    assert city.counts["traffic_control.MountReal"] == 20
+    assert city.counts["traffic_control.TrafficSignReal"] == TrafficSignReal.objects.count()
+    assert list(MountReal.objects.order_by("source_id").values_list("source_id", "location")) == locations
+
+
+@pytest.mark.django_db
+def test__run_benchmark__times_and_counts_queries(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    generate_synthetic_city(mount_count=20)
+    context = create_context(tmp_path, seed=1)
+    benchmarks = {f"{benchmark.group}/{benchmark.name}": benchmark for benchmark in get_benchmarks()}
+    mount_count = MountReal.objects.count()
+
+    results = [
+        run_benchmark(benchmarks[name], context, repeat=2).to_dict()
+        for name in ("api/trafficsignreal-list", "wfs/trafficsignreal-geojson", "api/plan-bulk-insert")
+    ]
+
+    assert all(result["repeat"] == 2 and result["queries"] > 0 for result in results)
+    assert all(result["min"] <= result["median"] <= result["max"] for result in results)
+    # Benchmarks are rolled back
+    assert MountReal.objects.count() == mount_count
+
+
+def test__compare_results__regressions():
+    baseline = [
+        {"group": "api", "name": "a", "median": 1.0, "queries": 5},
+        {"group": "api", "name": "b", "median": 1.0, "queries": 5},
+        {"group": "api", "name": "c", "median": 1.0, "queries": 5},
+    ]
+    results = [
+        {"group": "api", "name": "a", "median": 1.1, "queries": 5},
+        {"group": "api", "name": "b", "median": 1.5, "queries": 5},
+        {"group": "api", "name": "c", "median": 0.5, "queries": 6},
+        {"group": "api", "name": "new", "median": 0.5, "queries": 6},
+    ]
+
+    comparisons = compare_results(results, baseline, threshold=1.2)
+
+    assert [(comparison["name"], comparison["regression"]) for comparison in comparisons] == [
+        ("a", False),
+        ("b", True),
+        ("c", True),
+    ]
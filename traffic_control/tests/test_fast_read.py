@@ -0,0 +1,90 @@
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from traffic_control.models import TrafficSignRealFile
+from traffic_control.serializers.fast import get_fast_read_plan
+from traffic_control.serializers.plan import PlanSerializer
+from traffic_control.serializers.traffic_sign import TrafficSignRealSerializer
+from traffic_control.tests.factories import (
+    add_traffic_sign_real_operation,
+    get_additional_sign_real,
+    get_api_client,
+    get_barrier_real,
+    get_mount_real,
+    get_signpost_real,
+    get_traffic_light_real,
+    get_user,
+    TrafficSignRealFactory,
+)
+
+
+def get_list_contents(api_client, url, params=None):
+    """Return the contents of the list response with the fast read path, and with the regular serializer"""
+    response = api_client.get(url, data=params or {})
+    assert response.status_code == status.HTTP_200_OK
+    with override_settings(FAST_READ_SERIALIZERS_ENABLED=False):
+        slow_response = api_client.get(url, data=params or {})
+    assert slow_response.status_code == status.HTTP_200_OK
+    return response.content, slow_response.content
+
+
+def create_traffic_signs():
+    signs = [TrafficSignRealFactory(txt=f"Sign {i}") for i in range(3)]
+    add_traffic_sign_real_operation(signs[0])
+    add_traffic_sign_real_operation(signs[0])
+    TrafficSignRealFile.objects.create(traffic_sign_real=signs[1], file="realfiles/traffic_sign/a.txt", is_public=True)
+    TrafficSignRealFile.objects.create(traffic_sign_real=signs[1], file="realfiles/traffic_sign/b.txt", is_public=False)
+    return signs
+
+
+def test__fast_read_plan__is_compiled_for_device_serializers():
+    assert get_fast_read_plan(TrafficSignRealSerializer) is not None
+    # Method fields and source="*" are only supported by the regular serializer
+    assert get_fast_read_plan(PlanSerializer) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("authenticated", (False, True))
+@pytest.mark.parametrize("geo_format", ("", "geojson"))
+def test__fast_read__traffic_sign_real_list_equals_serializer_output(authenticated, geo_format):
+    create_traffic_signs()
+    api_client = get_api_client(user=get_user() if authenticated else None)
+
+    content, slow_content = get_list_contents(
+        api_client, reverse("v1:trafficsignreal-list"), {"geo_format": geo_format}
+    )
+
+    assert content == slow_content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", ({"fields": "id,location,device_type"}, {"omit": "files,txt"}, {"limit": 2}))
+def test__fast_read__traffic_sign_real_list_with_parameters_equals_serializer_output(params):
+    create_traffic_signs()
+    api_client = get_api_client(user=get_user())
+
+    content, slow_content = get_list_contents(api_client, reverse("v1:trafficsignreal-list"), params)
+
+    assert content == slow_content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "basename,create",
+    (
+        ("additionalsignreal", get_additional_sign_real),
+        ("barrierreal", get_barrier_real),
+        ("mountreal", get_mount_real),
+        ("signpostreal", get_signpost_real),
+        ("trafficlightreal", get_traffic_light_real),
+    ),
+)
+def test__fast_read__device_list_equals_serializer_output(basename, create):
+    create()
+    api_client = get_api_client(user=get_user())
+
+    content, slow_content = get_list_contents(api_client, reverse(f"v1:{basename}-list"))
+
+    assert content == slow_content
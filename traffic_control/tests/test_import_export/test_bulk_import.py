@@ -0,0 +1,105 @@
+import pytest
+from auditlog.models import LogEntry
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from traffic_control.enums import DeviceTypeTargetModel
+from traffic_control.models import AdditionalSignReal, MountReal
+from traffic_control.resources import MountRealResource
+from traffic_control.resources.additional_sign import AdditionalSignRealResource
+from traffic_control.tests.factories import (
+    AdditionalSignRealFactory,
+    get_owner,
+    MountRealFactory,
+    TrafficControlDeviceTypeFactory,
+    TrafficSignRealFactory,
+)
+from traffic_control.tests.test_import_export.utils import file_formats, get_import_dataset
+
+
+@pytest.fixture
+def bulk_import(settings):
+    settings.IMPORT_BULK_ROW_THRESHOLD = 1
+
+
+@pytest.mark.parametrize("format", file_formats)
+@pytest.mark.django_db
+def test__bulk_import__create(bulk_import, format):
+    MountRealFactory()
+    MountRealFactory()
+    dataset = get_import_dataset(MountRealResource, format=format, delete_columns=["id"])
+    MountReal.objects.all().delete()
+    LogEntry.objects.all().delete()
+
+    result = MountRealResource().import_data(dataset, raise_errors=True)
+
+    assert not result.has_errors()
+    assert MountReal.objects.count() == 2
+    assert LogEntry.objects.filter(action=LogEntry.Action.CREATE).count() == 2
+
+
+@pytest.mark.django_db
+def test__bulk_import__update(bulk_import):
+    owner = get_owner(name_fi="Uusi omistaja", name_en="New owner")
+    mount_reals = [MountRealFactory(), MountRealFactory()]
+    dataset = get_import_dataset(MountRealResource, format="csv")
+    dataset["owner__name_fi"] = [owner.name_fi] * len(dataset)
+    LogEntry.objects.all().delete()
+
+    result = MountRealResource().import_data(dataset, raise_errors=True)
+
+    assert not result.has_errors()
+    assert MountReal.objects.count() == 2
+    for mount_real in mount_reals:
+        mount_real.refresh_from_db()
+        assert mount_real.owner == owner
+        assert mount_real.updated_at > mount_real.created_at
+    log_entries = LogEntry.objects.filter(action=LogEntry.Action.UPDATE)
+    assert log_entries.count() == 2
+    assert all("owner" in log_entry.changes_dict for log_entry in log_entries)
+
+
+@pytest.mark.django_db
+def test__bulk_import__dry_run_writes_nothing(bulk_import):
+    MountRealFactory()
+    dataset = get_import_dataset(MountRealResource, format="csv", delete_columns=["id"])
+    MountReal.objects.all().delete()
+
+    result = MountRealResource().import_data(dataset, dry_run=True, raise_errors=True)
+
+    assert not result.has_errors()
+    assert [row.import_type for row in result.rows] == ["new"]
+    assert MountReal.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test__bulk_import__validates_content(bulk_import):
+    device_type = TrafficControlDeviceTypeFactory(
+        code="H20.1",
+        target_model=DeviceTypeTargetModel.ADDITIONAL_SIGN,
+        content_schema={"type": "object", "properties": {"num": {"type": "integer"}}, "required": ["num"]},
+    )
+    AdditionalSignRealFactory(device_type=device_type, content_s={"num": 30}, parent=TrafficSignRealFactory())
+    AdditionalSignRealFactory(device_type=device_type, content_s={"num": 50}, parent=TrafficSignRealFactory())
+    dataset = get_import_dataset(AdditionalSignRealResource, format="csv", delete_columns=["id"])
+    dataset["content_s.num"] = ["30", "not a number"]
+    AdditionalSignReal.objects.all().delete()
+
+    result = AdditionalSignRealResource().import_data(dataset)
+
+    assert result.has_validation_errors()
+    assert AdditionalSignReal.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test__import__foreign_keys_are_preloaded():
+    owner = get_owner()
+    for _ in range(3):
+        MountRealFactory(owner=owner)
+    dataset = get_import_dataset(MountRealResource, format="csv", delete_columns=["id"])
+
+    with CaptureQueriesContext(connection) as context:
+        MountRealResource().import_data(dataset, dry_run=True, raise_errors=True)
+
+    owner_queries = [query for query in context.captured_queries if 'FROM "traffic_control_owner"' in query["sql"]]
+    assert len(owner_queries) == 1
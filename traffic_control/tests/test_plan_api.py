@@ -4,13 +4,22 @@ from datetime import datetime
 import pytest
 from django.conf import settings
 from django.contrib.gis.geos import MultiPolygon
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework_gis.fields import GeoJsonDict
 
 from traffic_control.models import Plan
 from traffic_control.tests.api_utils import do_illegal_geometry_test
-from traffic_control.tests.factories import get_api_client, get_plan, get_user, PlanFactory
+from traffic_control.tests.factories import (
+    BarrierPlanFactory,
+    get_api_client,
+    get_plan,
+    get_user,
+    MountPlanFactory,
+    PlanFactory,
+)
 from traffic_control.tests.test_base_api import (
     illegal_multipolygon,
     test_multi_polygon,
@@ -51,6 +60,106 @@ def test_plan_detail():
     assert response.data.get("location") == plan.location.ewkt
 
 
+@pytest.mark.django_db
+def test_plan_detail_linked_objects():
+    api_client = get_api_client()
+    plan = get_plan()
+    mount_plans = [MountPlanFactory(plan=plan), MountPlanFactory(plan=plan)]
+    barrier_plan = BarrierPlanFactory(plan=plan)
+    MountPlanFactory(plan=get_plan(name="Other plan"))
+
+    response = api_client.get(reverse("v1:plan-detail", kwargs={"pk": plan.pk}))
+
+    assert response.status_code == status.HTTP_200_OK
+    linked_objects = response.data["linked_objects"]
+    assert sorted(linked_objects["mount_plan_ids"]) == sorted(str(mount_plan.pk) for mount_plan in mount_plans)
+    assert linked_objects["barrier_plan_ids"] == [str(barrier_plan.pk)]
+    assert linked_objects["signpost_plan_ids"] == []
+
+
+@pytest.mark.django_db
+def test_plan_list_summary():
+    api_client = get_api_client()
+    plan = get_plan()
+    MountPlanFactory(plan=plan)
+    MountPlanFactory(plan=plan)
+    BarrierPlanFactory(plan=plan)
+
+    response = api_client.get(reverse("v1:plan-list"), data={"fields": "summary"})
+
+    assert response.status_code == status.HTTP_200_OK
+    linked_objects = response.data["results"][0]["linked_objects"]
+    assert linked_objects["mount_plan_count"] == 2
+    assert linked_objects["barrier_plan_count"] == 1
+    assert linked_objects["signpost_plan_count"] == 0
+    assert "mount_plan_ids" not in linked_objects
+
+
+@pytest.mark.django_db
+def test_plan_list_summary_with_sparse_fieldset():
+    api_client = get_api_client()
+    plan = get_plan()
+    MountPlanFactory(plan=plan)
+
+    response = api_client.get(reverse("v1:plan-list"), data={"fields": "summary,id,linked_objects"})
+
+    assert response.status_code == status.HTTP_200_OK
+    result = response.data["results"][0]
+    assert set(result) == {"id", "linked_objects"}
+    assert result["linked_objects"]["mount_plan_count"] == 1
+
+
+@pytest.mark.django_db
+def test_plan_list_query_count_does_not_depend_on_device_plans():
+    api_client = get_api_client()
+    plan = get_plan(name="Plan 1")
+    MountPlanFactory(plan=plan)
+    with CaptureQueriesContext(connection) as single_plan_queries:
+        api_client.get(reverse("v1:plan-list"))
+
+    for i in range(2, 5):
+        plan = get_plan(name=f"Plan {i}")
+        MountPlanFactory(plan=plan)
+        BarrierPlanFactory(plan=plan)
+    with CaptureQueriesContext(connection) as many_plans_queries:
+        response = api_client.get(reverse("v1:plan-list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert all(len(plan["linked_objects"]["mount_plan_ids"]) == 1 for plan in response.data["results"])
+    assert len(many_plans_queries) == len(single_plan_queries)
+
+
+@pytest.mark.parametrize(
+    ("simplify", "expected_field"),
+    (
+        ("0.5", "location"),
+        ("1", "location_simplified_1m"),
+        ("10", "location_simplified_5m"),
+        ("100", "location_simplified_25m"),
+    ),
+)
+@pytest.mark.django_db
+def test_plan_detail_simplified_location(simplify, expected_field):
+    api_client = get_api_client()
+    plan = get_plan()
+
+    response = api_client.get(reverse("v1:plan-detail", kwargs={"pk": plan.pk}), data={"simplify": simplify})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["location"] == getattr(Plan.objects.get(pk=plan.pk), expected_field).ewkt
+    assert "convex_hull_location" not in response.data
+
+
+@pytest.mark.django_db
+def test_plan_detail_simplified_location_invalid_tolerance():
+    api_client = get_api_client()
+    plan = get_plan()
+
+    response = api_client.get(reverse("v1:plan-detail", kwargs={"pk": plan.pk}), data={"simplify": "abc"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.django_db
 def test_plan_detail_geojson():
     api_client = get_api_client()
@@ -0,0 +1,126 @@
+import pytest
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from traffic_control.enums import DeviceTypeTargetModel
+from traffic_control.models import TrafficControlDeviceType, TrafficSignReal
+from traffic_control.serializers.traffic_sign import TrafficSignRealSerializer
+from traffic_control.tests.factories import get_owner, TrafficControlDeviceTypeFactory, TrafficSignRealFactory
+from traffic_control.utils.data_version import bump_data_version
+from traffic_control.utils.reference_data import get_reference_object, get_related_reference_object
+
+
+def count_device_type_queries(context):
+    return len([query for query in context.captured_queries if 'FROM "traffic_control_device_type"' in query["sql"]])
+
+
+@pytest.mark.django_db(transaction=True)
+def test__reference_data__objects_are_cached_between_lookups():
+    device_type = TrafficControlDeviceTypeFactory()
+
+    assert get_reference_object(TrafficControlDeviceType, device_type.pk) == device_type
+    with CaptureQueriesContext(connection) as context:
+        assert get_reference_object(TrafficControlDeviceType, device_type.pk) == device_type
+
+    assert len(context.captured_queries) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test__reference_data__changes_of_the_current_process_are_seen_immediately():
+    device_type = TrafficControlDeviceTypeFactory(description="Old")
+    assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "Old"
+
+    device_type.description = "New"
+    device_type.save()
+
+    assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "New"
+
+
+@pytest.mark.django_db(transaction=True)
+def test__reference_data__changes_of_other_processes_are_seen_after_version_check():
+    device_type = TrafficControlDeviceTypeFactory(description="Old")
+    assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "Old"
+
+    # Changed by another process: no signals are sent in this process, only the data version is bumped
+    TrafficControlDeviceType.objects.filter(pk=device_type.pk).update(description="New")
+    bump_data_version(TrafficControlDeviceType._meta.db_table)
+    assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "Old"
+
+    with override_settings(REFERENCE_DATA_CACHE_VERSION_CHECK_INTERVAL=0):
+        assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "New"
+
+
+@pytest.mark.django_db
+def test__reference_data__changes_of_the_current_transaction_are_seen():
+    assert get_reference_object(TrafficControlDeviceType, TrafficControlDeviceTypeFactory().pk) is not None
+    device_type = TrafficControlDeviceTypeFactory()
+
+    assert get_reference_object(TrafficControlDeviceType, device_type.pk) == device_type
+
+
+@pytest.mark.django_db(transaction=True)
+def test__reference_data__rolled_back_changes_are_not_seen_by_the_next_transaction():
+    device_type = TrafficControlDeviceTypeFactory(description="Old")
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            device_type.description = "Rolled back"
+            device_type.save()
+            assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "Rolled back"
+            raise RuntimeError()
+
+    with transaction.atomic():
+        assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "Old"
+
+
+@pytest.mark.django_db(transaction=True)
+def test__reference_data__committed_changes_are_versioned_in_the_next_transaction():
+    device_type = TrafficControlDeviceTypeFactory(description="Old")
+    with transaction.atomic():
+        device_type.description = "Committed"
+        device_type.save()
+
+    with transaction.atomic():
+        assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "Committed"
+        # Changed by another process
+        TrafficControlDeviceType.objects.filter(pk=device_type.pk).update(description="New")
+        bump_data_version(TrafficControlDeviceType._meta.db_table)
+        with override_settings(REFERENCE_DATA_CACHE_VERSION_CHECK_INTERVAL=0):
+            assert get_reference_object(TrafficControlDeviceType, device_type.pk).description == "New"
+
+
+@pytest.mark.django_db
+def test__reference_data__related_object_is_resolved_without_query():
+    sign = TrafficSignReal.objects.get(pk=TrafficSignRealFactory().pk)
+    get_reference_object(TrafficControlDeviceType, sign.device_type_id)
+
+    with CaptureQueriesContext(connection) as context:
+        device_type = get_related_reference_object(sign, "device_type")
+
+    assert device_type.pk == sign.device_type_id
+    assert len(context.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test__reference_related_field__respects_queryset_filter():
+    allowed_device_type = TrafficControlDeviceTypeFactory(target_model=DeviceTypeTargetModel.TRAFFIC_SIGN)
+    other_device_type = TrafficControlDeviceTypeFactory(target_model=DeviceTypeTargetModel.BARRIER)
+    field = TrafficSignRealSerializer().fields["device_type"]
+
+    assert field.to_internal_value(str(allowed_device_type.pk)) == allowed_device_type
+    with CaptureQueriesContext(connection) as context:
+        assert field.to_internal_value(str(allowed_device_type.pk)) == allowed_device_type
+    assert count_device_type_queries(context) == 0
+
+    serializer = TrafficSignRealSerializer(
+        data={
+            "location": Point(25496751.5, 6673129.5, 1.5, srid=settings.SRID).ewkt,
+            "owner": str(get_owner().pk),
+            "device_type": str(other_device_type.pk),
+        }
+    )
+    assert not serializer.is_valid()
+    assert "device_type" in serializer.errors
@@ -25,18 +25,22 @@ from traffic_control.models import (
 )
 from traffic_control.services.common import (
     device_plan_replace,
+    device_plan_soft_delete,
     get_all_not_replaced_plans,
     get_all_replaced_plans,
 )
 from traffic_control.tests.factories import (
     AdditionalSignPlanFactory,
     BarrierPlanFactory,
+    get_user,
     MountPlanFactory,
     RoadMarkingPlanFactory,
     SignpostPlanFactory,
     TrafficLightPlanFactory,
     TrafficSignPlanFactory,
+    TrafficSignRealFactory,
 )
+from traffic_control.utils.data_version import get_data_version
 
 
 @pytest.mark.django_db
@@ -83,3 +87,38 @@ def test_get_all_replaced_plan_ids(real_model, plan_model, plan_replacement_mode
     not_replaced_ids = get_all_not_replaced_plans(plan_model)
     assert not_replaced_ids.count() == 1
     assert not_replaced_ids.first().id == new.id
+
+
+@pytest.mark.django_db
+def test_device_plan_replace_and_soft_delete_bump_real_data_version():
+    old = TrafficSignPlanFactory()
+    new = TrafficSignPlanFactory()
+    real = TrafficSignRealFactory(traffic_sign_plan=old)
+    version = get_data_version(TrafficSignReal._meta.db_table)
+
+    device_plan_replace(
+        old=old,
+        new=new,
+        real_model=TrafficSignReal,
+        replacement_model=TrafficSignPlanReplacement,
+        plan_relation_name="traffic_sign_plan",
+        unreplace_method=lambda x: x,
+    )
+
+    real.refresh_from_db()
+    assert real.traffic_sign_plan == new
+    replaced_version = get_data_version(TrafficSignReal._meta.db_table)
+    assert replaced_version != version
+
+    new.refresh_from_db()
+    device_plan_soft_delete(
+        real_model=TrafficSignReal,
+        plan_relation_name="traffic_sign_plan",
+        unreplace_method=lambda x: x,
+        instance=new,
+        user=get_user(),
+    )
+
+    real.refresh_from_db()
+    assert real.traffic_sign_plan == old
+    assert get_data_version(TrafficSignReal._meta.db_table) != replaced_version
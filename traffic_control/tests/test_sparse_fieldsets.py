@@ -0,0 +1,76 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from traffic_control.tests.factories import (
+    add_traffic_sign_real_operation,
+    get_api_client,
+    get_user,
+    TrafficSignRealFactory,
+)
+
+SIGN_TABLE = '"traffic_control_trafficsignreal"'
+
+
+def get_sign_queries(context):
+    return [query["sql"] for query in context.captured_queries if f"FROM {SIGN_TABLE}" in query["sql"]]
+
+
+@pytest.mark.django_db
+def test__sparse_fieldset__list_returns_requested_fields():
+    sign = TrafficSignRealFactory()
+    api_client = get_api_client(user=get_user())
+
+    response = api_client.get(reverse("v1:trafficsignreal-list"), data={"fields": "id,location"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [set(result) for result in response.data["results"]] == [{"id", "location"}]
+    assert response.data["results"][0]["id"] == str(sign.pk)
+
+
+@pytest.mark.django_db
+def test__sparse_fieldset__retrieve_omits_fields():
+    sign = TrafficSignRealFactory()
+    api_client = get_api_client(user=get_user())
+
+    response = api_client.get(
+        reverse("v1:trafficsignreal-detail", kwargs={"pk": sign.pk}), data={"omit": "files,operations"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["id"] == str(sign.pk)
+    assert "files" not in response.data
+    assert "operations" not in response.data
+    assert "txt" in response.data
+
+
+@pytest.mark.django_db
+def test__sparse_fieldset__projection_is_pushed_down_to_queryset():
+    sign = TrafficSignRealFactory()
+    add_traffic_sign_real_operation(sign)
+    api_client = get_api_client(user=get_user())
+
+    with CaptureQueriesContext(connection) as full_context:
+        api_client.get(reverse("v1:trafficsignreal-list"))
+    with CaptureQueriesContext(connection) as sparse_context:
+        response = api_client.get(reverse("v1:trafficsignreal-list"), data={"fields": "id,location"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(sparse_context.captured_queries) < len(full_context.captured_queries)
+    sign_query = get_sign_queries(sparse_context)[-1]
+    assert f'{SIGN_TABLE}."txt"' not in sign_query
+    assert '"traffic_control_plan"' not in sign_query
+    assert not [query for query in sparse_context.captured_queries if "operation" in query["sql"]]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("param", ("fields", "omit"))
+def test__sparse_fieldset__unknown_field(param):
+    api_client = get_api_client(user=get_user())
+
+    response = api_client.get(reverse("v1:trafficsignreal-list"), data={param: "id,not_a_field"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {param: ["Unknown fields: not_a_field"]}
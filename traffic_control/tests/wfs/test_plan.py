@@ -4,7 +4,7 @@ from traffic_control.tests.factories import PlanFactory
 from traffic_control.tests.wfs.wfs_utils import (
     EPSG_3879_URN,
     geojson_crs,
-    geojson_feature_multipolygon_coordinates,
+    geojson_feature_polygon_coordinates,
     geojson_get_features,
     gml_envelope,
     gml_feature_crs,
@@ -16,15 +16,13 @@ from traffic_control.tests.wfs.wfs_utils import (
     wfs_get_features_gml,
 )
 
-EXPECTED_MULTIPOLYGON_COORDINATES = [
+EXPECTED_POLYGON_COORDINATES = [
     [
-        [
-            [25487920.144, 6645450.071, 0.0],
-            [25487920.144, 6645451.071, 0.0],
-            [25487921.144, 6645451.071, 0.0],
-            [25487921.144, 6645450.071, 0.0],
-            [25487920.144, 6645450.071, 0.0],
-        ]
+        [25487920.144, 6645450.071, 0.0],
+        [25487920.144, 6645451.071, 0.0],
+        [25487921.144, 6645451.071, 0.0],
+        [25487921.144, 6645450.071, 0.0],
+        [25487920.144, 6645450.071, 0.0],
     ]
 ]
 
@@ -80,5 +78,5 @@ def test__wfs_plan__geojson():
 
     assert geojson_crs(geojson) == EPSG_3879_URN
 
-    # Coordinate order is always [X,Y,Z] in GeoJSON
-    assert geojson_feature_multipolygon_coordinates(feature) == EXPECTED_MULTIPOLYGON_COORDINATES
+    # Coordinate order is always [X,Y,Z] in GeoJSON. Plans are represented by the convex hull of their location.
+    assert geojson_feature_polygon_coordinates(feature) == EXPECTED_POLYGON_COORDINATES
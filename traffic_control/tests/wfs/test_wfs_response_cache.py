@@ -0,0 +1,175 @@
+import gzip
+import json
+
+import pytest
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.test import override_settings, RequestFactory
+from django.urls import reverse
+from rest_framework import status
+
+from traffic_control.models import TrafficControlDeviceType
+from traffic_control.tests.factories import get_api_client, TrafficSignRealFactory
+from traffic_control.tests.wfs.wfs_utils import test_point_helsinki, wfs_url_get_features
+from traffic_control.views.wfs.cache import cache_response, get_feature_type_dependencies
+from traffic_control.views.wfs.traffic_sign import TrafficSignRealFeatureType
+
+
+@pytest.fixture(autouse=True)
+def wfs_response_cache():
+    cache.clear()
+    with override_settings(WFS_RESPONSE_CACHE_ENABLED=True):
+        yield
+    cache.clear()
+
+
+def _get_content(response) -> bytes:
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+def _get_geojson(client, **extra):
+    response = client.get(wfs_url_get_features("trafficsignreal", output_format="geojson"), **extra)
+    content = _get_content(response)
+    return response, content
+
+
+@pytest.mark.django_db
+def test__wfs_response_cache__get_feature_is_served_from_cache():
+    client = get_api_client()
+    TrafficSignRealFactory(location=test_point_helsinki)
+
+    first_response, first_content = _get_geojson(client)
+    second_response, second_content = _get_geojson(client)
+
+    assert first_response.status_code == status.HTTP_200_OK
+    assert second_response.status_code == status.HTTP_200_OK
+    assert not second_response.streaming
+    assert second_content == first_content
+    assert len(json.loads(second_content)["features"]) == 1
+    assert second_response.has_header("ETag")
+
+
+@pytest.mark.django_db
+def test__wfs_response_cache__streamed_get_feature_is_stored_when_consumed():
+    client = get_api_client()
+    TrafficSignRealFactory(location=test_point_helsinki)
+
+    first_response = client.get(wfs_url_get_features("trafficsignreal", output_format="geojson"))
+    assert first_response.streaming
+    first_content = b"".join(first_response.streaming_content)
+    second_response, second_content = _get_geojson(client)
+
+    assert not second_response.streaming
+    assert second_content == first_content
+
+
+def test__wfs_response_cache__cache_response_passes_streamed_chunks_through():
+    request = RequestFactory().get("/wfs/")
+    response = StreamingHttpResponse(iter([b"first ", b"second"]), content_type="application/json")
+
+    response = cache_response(request, "wfs-test-key", response)
+
+    assert b"".join(response.streaming_content) == b"first second"
+    assert gzip.decompress(cache.get("wfs-test-key")["content"]) == b"first second"
+
+
+@pytest.mark.django_db
+def test__wfs_response_cache__data_change_invalidates_get_feature():
+    client = get_api_client()
+    TrafficSignRealFactory(location=test_point_helsinki)
+    _get_geojson(client)
+
+    TrafficSignRealFactory(location=test_point_helsinki)
+    _, content = _get_geojson(client)
+
+    assert len(json.loads(content)["features"]) == 2
+
+
+@pytest.mark.django_db
+def test__wfs_response_cache__related_table_change_invalidates_get_feature():
+    client = get_api_client()
+    traffic_sign = TrafficSignRealFactory(location=test_point_helsinki)
+    _get_geojson(client)
+
+    device_type = traffic_sign.device_type
+    device_type.description = "Changed description"
+    device_type.save(update_fields=["description"])
+    _, content = _get_geojson(client)
+
+    feature = json.loads(content)["features"][0]
+    assert feature["properties"]["device_type_description"] == "Changed description"
+
+
+@pytest.mark.django_db
+def test__wfs_response_cache__if_none_match_returns_not_modified():
+    client = get_api_client()
+    TrafficSignRealFactory(location=test_point_helsinki)
+    _get_geojson(client)
+    response, _ = _get_geojson(client)
+
+    not_modified_response, content = _get_geojson(client, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert content == b""
+
+
+@pytest.mark.django_db
+def test__wfs_response_cache__gzip_accepting_client_gets_compressed_content():
+    client = get_api_client()
+    TrafficSignRealFactory(location=test_point_helsinki)
+    _, uncompressed_content = _get_geojson(client)
+
+    response, content = _get_geojson(client, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+    assert response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(content) == uncompressed_content
+
+
+@pytest.mark.django_db
+def test__wfs_response_cache__get_capabilities_does_not_depend_on_data():
+    client = get_api_client()
+    url = f"{reverse('wfs-city-infrastructure')}?service=WFS&version=2.0.0&request=GetCapabilities"
+    first_content = _get_content(client.get(url))
+
+    TrafficSignRealFactory(location=test_point_helsinki)
+    response = client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not response.streaming
+    assert response.content == first_content
+
+
+@pytest.mark.django_db
+def test__wfs_response_cache__parameter_case_is_normalized():
+    client = get_api_client()
+    TrafficSignRealFactory(location=test_point_helsinki)
+    _get_geojson(client)
+
+    base_url = reverse("wfs-city-infrastructure")
+    response = client.get(
+        f"{base_url}?SERVICE=WFS&VERSION=2.0.0&REQUEST=getfeature&TYPENAMES=trafficsignreal&OUTPUTFORMAT=GeoJSON"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not response.streaming
+
+
+@override_settings(WFS_RESPONSE_CACHE_ENABLED=False)
+@pytest.mark.django_db
+def test__wfs_response_cache__disabled():
+    client = get_api_client()
+    _get_geojson(client)
+    response, _ = _get_geojson(client)
+
+    assert response.streaming
+    assert not response.has_header("ETag")
+
+
+def test__wfs_response_cache__feature_type_dependencies():
+    dependencies = get_feature_type_dependencies(TrafficSignRealFeatureType)
+
+    assert TrafficSignRealFeatureType.model._meta.db_table in dependencies
+    assert TrafficControlDeviceType._meta.db_table in dependencies
+    assert "users_user" not in dependencies
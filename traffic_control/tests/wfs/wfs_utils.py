@@ -170,6 +170,10 @@ def geojson_feature_point_coordinates(feature: dict) -> List[float]:
     return _get_feature_coordinates(feature, "Point")
 
 
+def geojson_feature_polygon_coordinates(feature: dict) -> List[float]:
+    return _get_feature_coordinates(feature, "Polygon")
+
+
 def geojson_feature_multipolygon_coordinates(feature: dict) -> List[float]:
     return _get_feature_coordinates(feature, "MultiPolygon")
 
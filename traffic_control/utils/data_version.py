@@ -0,0 +1,69 @@
+"""
+Per-table data version counters stored in the Django cache.
+
+A data version is an opaque integer that changes whenever rows of a versioned database table change. Saving and
+deleting model instances bumps the version through the post_save and post_delete signals (see
+traffic_control.signals). Bulk operations (bulk_create, bulk_update, QuerySet.update) and raw SQL send no such
+signals, so code writing versioned tables that way must call bump_data_version() itself. Response caches include the
+versions of the tables they read from in their cache keys, so bumping a version makes every cached response that
+depends on the table unreachable without having to know the individual cache keys.
+
+The counters must live in a cache shared by all worker processes for the invalidation to reach every worker.
+"""
+
+import time
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+DATA_VERSION_KEY_PREFIX = "data_version"
+
+
+def _get_data_version_key(db_table: str) -> str:
+    return f"{DATA_VERSION_KEY_PREFIX}:{db_table}"
+
+
+def _get_initial_data_version() -> int:
+    # Start from a time based value instead of zero so that a counter evicted from the cache can never be
+    # re-initialized to a value some stale cache entry was already stored with.
+    return time.time_ns()
+
+
+def get_data_versions(db_tables: Iterable[str]) -> Dict[str, int]:
+    """Return current data versions of given tables, initializing missing counters"""
+    keys = {_get_data_version_key(db_table): db_table for db_table in db_tables}
+    versions = cache.get_many(keys.keys())
+    for key in keys.keys() - versions.keys():
+        cache.add(key, _get_initial_data_version(), timeout=None)
+        versions[key] = cache.get(key)
+    return {db_table: versions[key] for key, db_table in keys.items()}
+
+
+def get_data_version(db_table: str) -> int:
+    return get_data_versions([db_table])[db_table]
+
+
+def _bump(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Counter did not exist (never read or evicted). Nothing can be cached against a missing counter.
+        cache.add(key, _get_initial_data_version(), timeout=None)
+
+
+def bump_data_version(db_table: str) -> None:
+    """
+    Bump the data version of given table.
+
+    The version is bumped immediately and once more after the surrounding transaction commits. The latter prevents
+    responses rendered from not yet committed data by concurrent requests from staying in the cache.
+    """
+    key = _get_data_version_key(db_table)
+    _bump(key)
+    transaction.on_commit(lambda: _bump(key))
+
+
+def bump_data_version_on_change(sender, **_kwargs) -> None:
+    """Signal receiver for post_save and post_delete that bumps the data version of the sender's table"""
+    bump_data_version(sender._meta.db_table)
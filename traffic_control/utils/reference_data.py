@@ -0,0 +1,174 @@
+"""
+Process-wide cache of the small, rarely changing reference tables (device types, owners, mount types, operation
+types and responsible entities).
+
+Every process keeps all rows of these tables in memory, so that resolving a reference is a dictionary lookup instead
+of a query. A table is reloaded when its data version (see traffic_control.utils.data_version) has changed, which is
+checked at most once per REFERENCE_DATA_CACHE_VERSION_CHECK_INTERVAL seconds. Changes made by the current process
+drop its copy immediately, and changes made by other processes are seen within the interval.
+
+The cached objects are shared by all threads and requests of the process, so they must be treated as read-only.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Type
+
+from django.conf import settings
+from django.db import models, transaction
+
+from traffic_control.utils.data_version import get_data_version
+
+
+@dataclass
+class ReferenceTable:
+    version: Optional[int]
+    objects_by_pk: Dict[Any, models.Model]
+    checked_at: float = 0.0
+    # Primary keys of filtered querysets, by the SQL of the queryset
+    filtered_pks: Dict[str, frozenset] = field(default_factory=dict)
+
+
+_tables: Dict[Type[models.Model], ReferenceTable] = {}
+
+# Tables changed by a not yet committed transaction of the current thread (_UncommittedChanges), with their copies
+# including those changes
+_local = threading.local()
+
+
+def get_reference_models() -> List[Type[models.Model]]:
+    from traffic_control.models import MountType, OperationType, Owner, ResponsibleEntity, TrafficControlDeviceType
+
+    return [TrafficControlDeviceType, Owner, MountType, OperationType, ResponsibleEntity]
+
+
+def is_reference_model(model: Type[models.Model]) -> bool:
+    return model in get_reference_models()
+
+
+class _UncommittedChanges:
+    """
+    Reference tables changed by the current transaction of this thread. Registered as an on_commit callback of the
+    transaction, which also tells whether the transaction is still going on: Django drops the callback when the
+    transaction, or the savepoint it was registered in, is rolled back.
+    """
+
+    def __init__(self):
+        self.tables: Dict[Type[models.Model], Optional[ReferenceTable]] = {}
+
+    def is_pending(self) -> bool:
+        connection = transaction.get_connection()
+        return connection.in_atomic_block and any(
+            func is self for _savepoint_ids, func, _robust in connection.run_on_commit
+        )
+
+    def __call__(self) -> None:
+        if getattr(_local, "changes", None) is self:
+            _local.changes = None
+        # Other threads may have reloaded the tables before the changes were committed
+        for model in self.tables:
+            _tables.pop(model, None)
+
+
+def _get_pending_changes() -> Optional[_UncommittedChanges]:
+    changes = getattr(_local, "changes", None)
+    if changes is not None and not changes.is_pending():
+        # The transaction that changed the tables has been committed or rolled back
+        changes = _local.changes = None
+    return changes
+
+
+def _get_uncommitted_tables() -> Dict[Type[models.Model], Optional[ReferenceTable]]:
+    changes = _get_pending_changes()
+    return changes.tables if changes is not None else {}
+
+
+def _load_table(model: Type[models.Model], version: Optional[int]) -> ReferenceTable:
+    return ReferenceTable(version=version, objects_by_pk={obj.pk: obj for obj in model.objects.all()})
+
+
+def get_reference_table(model: Type[models.Model]) -> ReferenceTable:
+    uncommitted_tables = _get_uncommitted_tables()
+    if model in uncommitted_tables:
+        # Other threads must not see the changes before they are committed, so they are kept in a copy of this thread
+        if uncommitted_tables[model] is None:
+            uncommitted_tables[model] = _load_table(model, version=None)
+        return uncommitted_tables[model]
+
+    now = time.monotonic()
+    table = _tables.get(model)
+    if table is not None and now - table.checked_at < settings.REFERENCE_DATA_CACHE_VERSION_CHECK_INTERVAL:
+        return table
+
+    # Read the version before the rows, so that a change made in between triggers another reload
+    version = get_data_version(model._meta.db_table)
+    if table is None or table.version != version:
+        table = _load_table(model, version)
+    table.checked_at = now
+    _tables[model] = table
+    return table
+
+
+def get_reference_objects(model: Type[models.Model]) -> List[models.Model]:
+    return list(get_reference_table(model).objects_by_pk.values())
+
+
+def get_reference_object(model: Type[models.Model], pk) -> Optional[models.Model]:
+    """Return the object of the reference model with given primary key, or None if there is no such object"""
+    return get_reference_table(model).objects_by_pk.get(pk)
+
+
+def get_reference_queryset_object(queryset: models.QuerySet, pk) -> Optional[models.Model]:
+    """
+    Return the object with given primary key if it is included in the queryset of a reference model, or None. The
+    primary keys matching a filtered queryset are queried once per table version.
+    """
+    table = get_reference_table(queryset.model)
+    obj = table.objects_by_pk.get(pk)
+    if obj is None or not queryset.query.where:
+        return obj
+
+    query_key = str(queryset.query)
+    pks = table.filtered_pks.get(query_key)
+    if pks is None:
+        pks = table.filtered_pks[query_key] = frozenset(queryset.values_list("pk", flat=True))
+    return obj if pk in pks else None
+
+
+def get_related_reference_object(instance: models.Model, field_name: str) -> Optional[models.Model]:
+    """
+    Return the reference object the foreign key `field_name` of `instance` points to. An object already cached on the
+    instance is returned as is, so that unsaved changes to it are respected.
+    """
+    fk_field = instance._meta.get_field(field_name)
+    if fk_field.is_cached(instance):
+        return getattr(instance, field_name)
+
+    pk = getattr(instance, fk_field.attname)
+    if pk is None:
+        return None
+    obj = get_reference_object(fk_field.related_model, pk)
+    return obj if obj is not None else getattr(instance, field_name)
+
+
+def clear_reference_data_cache(model: Optional[Type[models.Model]] = None) -> None:
+    """Drop the cached copy of given reference model, or of all of them, in the current process"""
+    if model is None:
+        _tables.clear()
+        _get_uncommitted_tables().clear()
+    else:
+        _tables.pop(model, None)
+        _get_uncommitted_tables().pop(model, None)
+
+
+def clear_reference_data_on_change(sender, **_kwargs) -> None:
+    """Signal receiver for post_save and post_delete of the reference models"""
+    _tables.pop(sender, None)
+    if transaction.get_connection().in_atomic_block:
+        changes = _get_pending_changes()
+        if changes is None:
+            changes = _local.changes = _UncommittedChanges()
+            transaction.on_commit(changes)
+        # Reloaded from the database by the next lookup of this thread, until the transaction ends
+        changes.tables[sender] = None
@@ -1,4 +1,6 @@
+import json
 import logging
+from functools import lru_cache
 from typing import List, Optional
 
 import jsonschema
@@ -19,7 +21,7 @@ def validate_structured_content(content, device_type: Optional[TrafficControlDev
         schema = None
 
     if schema is not None:
-        validator = jsonschema.Draft202012Validator(schema)
+        validator = _get_content_schema_validator(json.dumps(schema, sort_keys=True))
 
         for error in validator.iter_errors(content):
             message = error.message
@@ -44,6 +46,13 @@ def validate_structured_content(content, device_type: Optional[TrafficControlDev
     return validation_errors
 
 
+@lru_cache(maxsize=256)
+def _get_content_schema_validator(schema_json: str) -> jsonschema.Draft202012Validator:
+    """Return a validator for a content schema. Validators are cached, as an import validates many rows of the
+    same device types and building a validator from the schema is relatively expensive."""
+    return jsonschema.Draft202012Validator(json.loads(schema_json))
+
+
 class LibGeosLogFilter(logging.Filter):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
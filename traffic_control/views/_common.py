@@ -1,27 +1,43 @@
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core import exceptions
+from django.db import transaction
 from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from guardian.shortcuts import get_objects_for_user
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.filters import OrderingFilter
 from rest_framework.parsers import MultiPartParser
-from rest_framework.permissions import DjangoModelPermissionsOrAnonReadOnly
+from rest_framework.permissions import DjangoModelPermissions, DjangoModelPermissionsOrAnonReadOnly, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
 from traffic_control.mixins import AuditLoggingMixin
 from traffic_control.permissions import ObjectInsideOperationalAreaOrAnonReadOnly
-from traffic_control.schema import geo_format_parameter
+from traffic_control.schema import geo_format_parameter, omit_fields_parameter, sparse_fields_parameter
+from traffic_control.serializers.batch import (
+    BATCH_ACTION_CREATE,
+    BATCH_ACTION_DELETE,
+    BATCH_ACTION_METHODS,
+    BATCH_ACTION_UPDATE,
+    BatchInputSerializer,
+    BatchResponseSerializer,
+)
+from traffic_control.serializers.common import pre_resolve_related_fields
+from traffic_control.serializers.fast import get_fast_read_plan
 from traffic_control.services.virus_scan import add_virus_scan_errors_to_auditlog, get_error_details_message
 from traffic_control.utils import get_file_upload_obstacles
 
 __all__ = (
     "prefetch_replacements",
+    "BatchWriteMixin",
+    "SparseFieldsetMixin",
+    "FastReadMixin",
     "FileUploadViews",
     "TrafficControlViewSet",
     "PermissionFilteredFilePrefetchMixin",
@@ -46,8 +62,349 @@ def prefetch_replacements(queryset):
     )
 
 
-@extend_schema(methods=("get",), parameters=[geo_format_parameter])
-class TrafficControlViewSet(ModelViewSet, AuditLoggingMixin):
+class BatchWriteMixin:
+    """
+    Adds a batch/ endpoint that creates, updates (as PATCH) and soft-deletes many objects in one request.
+
+    All operations are validated before any of them is written: the objects to update or delete and the related
+    objects the operations refer to are fetched with one query per model, and the permissions, including the
+    operational area of the user, are checked for all operations at once. If any operation is invalid nothing is
+    written, and the errors are returned in the order of the operations. Otherwise the operations are written in one
+    transaction with the same perform_create/perform_update/perform_destroy as the single object endpoints.
+    """
+
+    @extend_schema(
+        summary="Create, update and delete many objects in one atomic transaction",
+        description=(
+            "Operations have the same permissions and validation as the corresponding single object POST, PATCH and "
+            "DELETE requests. If any of the operations fails, none of them is executed."
+        ),
+        request=BatchInputSerializer,
+        responses={200: BatchResponseSerializer, 400: dict},
+        methods=("POST",),
+    )
+    @action(detail=False, methods=["POST"], url_path="batch", permission_classes=[IsAuthenticated])
+    def batch(self, request, *args, **kwargs):
+        input_serializer = BatchInputSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        operations = input_serializer.validated_data["operations"]
+        self.check_batch_permissions(request, operations)
+
+        instances = self._get_batch_instances(operations)
+        errors = [{} for _operation in operations]
+        serializers = self._validate_batch_operations(operations, instances, errors)
+        self._check_batch_object_permissions(request, operations, instances, serializers, errors)
+        if any(errors):
+            raise ValidationError({"operations": errors})
+
+        with transaction.atomic():
+            written_instances = []
+            for operation, instance, serializer in zip(operations, instances, serializers):
+                if operation["action"] == BATCH_ACTION_CREATE:
+                    self.perform_create(serializer)
+                    instance = serializer.instance
+                elif operation["action"] == BATCH_ACTION_UPDATE:
+                    self.perform_update(serializer)
+                    instance = serializer.instance
+                else:
+                    self.perform_destroy(instance)
+                written_instances.append(instance)
+
+        return Response({"results": self._get_batch_results(operations, written_instances)})
+
+    def _get_batch_permissions(self):
+        # The batch action itself only requires authentication, the permissions of the viewset are checked per
+        # operation type
+        return [permission() for permission in type(self).permission_classes]
+
+    def check_batch_permissions(self, request, operations):
+        model = self.get_queryset().model
+        methods = {BATCH_ACTION_METHODS[operation["action"]] for operation in operations}
+        for permission in self._get_batch_permissions():
+            if isinstance(permission, DjangoModelPermissions):
+                perms = [perm for method in methods for perm in permission.get_required_permissions(method, model)]
+                has_permission = request.user.has_perms(perms)
+            else:
+                has_permission = permission.has_permission(request, self)
+            if not has_permission:
+                self.permission_denied(request, message=getattr(permission, "message", None))
+
+    def _get_batch_instances(self, operations):
+        """Fetch the objects to update and delete with one query, aligned with the operations"""
+        queryset = self.get_queryset()
+        pk_field = queryset.model._meta.pk
+        pks_by_id = {}
+        for operation in operations:
+            if operation["action"] == BATCH_ACTION_CREATE:
+                continue
+            try:
+                pks_by_id[operation["id"]] = pk_field.to_python(operation["id"])
+            except exceptions.ValidationError:
+                continue
+
+        instances_by_pk = {str(pk): instance for pk, instance in queryset.in_bulk(pks_by_id.values()).items()}
+        return [
+            instances_by_pk.get(str(pks_by_id[operation["id"]])) if operation.get("id") in pks_by_id else None
+            for operation in operations
+        ]
+
+    def _validate_batch_operations(self, operations, instances, errors):
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        serializers = []
+        for index, (operation, instance) in enumerate(zip(operations, instances)):
+            serializer = None
+            if operation["action"] == BATCH_ACTION_CREATE:
+                serializer = serializer_class(data=operation["data"], context=context)
+            elif instance is None:
+                errors[index] = {"id": [_("Not found.")]}
+            elif operation["action"] == BATCH_ACTION_UPDATE:
+                serializer = serializer_class(instance, data=operation["data"], partial=True, context=context)
+            serializers.append(serializer)
+
+        pre_resolve_related_fields(
+            [(serializer, operation["data"]) for operation, serializer in zip(operations, serializers) if serializer]
+        )
+        for index, serializer in enumerate(serializers):
+            if serializer and not serializer.is_valid():
+                errors[index] = {"data": serializer.errors}
+        return serializers
+
+    def _check_batch_object_permissions(self, request, operations, instances, serializers, errors):
+        permissions = self._get_batch_permissions()
+        checks_operational_area = any(
+            isinstance(permission, ObjectInsideOperationalAreaOrAnonReadOnly) for permission in permissions
+        )
+        object_permissions = [
+            permission
+            for permission in permissions
+            if not isinstance(permission, (DjangoModelPermissions, ObjectInsideOperationalAreaOrAnonReadOnly))
+        ]
+
+        # Created objects are checked by their new location, updated and deleted objects by their current one, as
+        # in the single object endpoints
+        indexes_and_locations = []
+        for index, (operation, instance, serializer) in enumerate(zip(operations, instances, serializers)):
+            if errors[index]:
+                continue
+            if operation["action"] == BATCH_ACTION_CREATE:
+                location = serializer.validated_data.get("location")
+                if location:
+                    indexes_and_locations.append((index, location))
+                continue
+
+            denied_permission = next(
+                (p for p in object_permissions if not p.has_object_permission(request, self, instance)), None
+            )
+            if denied_permission:
+                message = getattr(denied_permission, "message", None) or PermissionDenied.default_detail
+                errors[index] = {api_settings.NON_FIELD_ERRORS_KEY: [message]}
+            else:
+                indexes_and_locations.append((index, getattr(instance, "location", None)))
+
+        if not checks_operational_area or not indexes_and_locations:
+            return
+        locations = [location for _index, location in indexes_and_locations]
+        allowed = request.user.locations_are_in_operational_area(locations)
+        for (index, _location), is_allowed in zip(indexes_and_locations, allowed):
+            if not is_allowed:
+                errors[index] = {api_settings.NON_FIELD_ERRORS_KEY: [_("Location outside allowed operational area.")]}
+
+    def _get_batch_results(self, operations, written_instances):
+        output_serializer = self.serializer_classes.get("default")
+        context = self.get_serializer_context()
+        # Re-fetch the written objects with the prefetches of the viewset for serializing them
+        refreshed_instances = self.get_queryset().in_bulk(
+            [
+                instance.pk
+                for operation, instance in zip(operations, written_instances)
+                if operation["action"] != BATCH_ACTION_DELETE
+            ]
+        )
+
+        results = []
+        for operation, instance in zip(operations, written_instances):
+            if operation["action"] == BATCH_ACTION_DELETE:
+                # Objects without soft delete have no primary key after being deleted
+                results.append(
+                    {"action": operation["action"], "id": operation["id"], "status": status.HTTP_204_NO_CONTENT}
+                )
+                continue
+            results.append(
+                {
+                    "action": operation["action"],
+                    "id": str(instance.pk),
+                    "status": status.HTTP_201_CREATED
+                    if operation["action"] == BATCH_ACTION_CREATE
+                    else status.HTTP_200_OK,
+                    "data": output_serializer(refreshed_instances.get(instance.pk, instance), context=context).data,
+                }
+            )
+        return results
+
+
+def parse_field_names(value: str | None) -> list[str]:
+    """Parse a comma separated list of field names of a query parameter"""
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+def _get_serializer_field_sources(field: serializers.Field) -> set[str] | None:
+    """Return names of the model attributes the field is read from, or None if they are not known"""
+    if isinstance(field, serializers.SerializerMethodField):
+        required_fields = getattr(getattr(field.parent, field.method_name), "required_fields", None)
+        if required_fields is None:
+            return None
+        return {path.split("__")[0] for path in required_fields}
+    if field.source == "*":
+        return None
+    return {field.source.split(".")[0]}
+
+
+def _get_select_related_lookups(select_related: dict, prefix: str = "") -> list[str]:
+    lookups = []
+    for name, children in select_related.items():
+        lookup = f"{prefix}{name}"
+        lookups.extend(_get_select_related_lookups(children, f"{lookup}__") if children else [lookup])
+    return lookups
+
+
+def _get_prefetch_root(lookup) -> str:
+    return (lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup).split("__")[0]
+
+
+def project_queryset(queryset, attribute_names: set[str]):
+    """
+    Load only the given model attributes of the queryset: other concrete fields are deferred with only(), and
+    select_related and prefetch_related lookups of relations not in `attribute_names` are dropped. The queryset is
+    returned unchanged if some attribute is not a model field, relation or annotation, e.g. a property whose
+    dependencies are unknown.
+    """
+    opts = queryset.model._meta
+    select_related = queryset.query.select_related
+    if select_related is True or queryset.query.deferred_loading != (frozenset(), True):
+        # All relations are selected, or fields are already deferred by the viewset itself
+        return queryset
+
+    prefetch_roots = {_get_prefetch_root(lookup) for lookup in queryset._prefetch_related_lookups}
+    only_fields = {opts.pk.name}
+    for name in attribute_names:
+        try:
+            model_field = opts.get_field(name)
+        except exceptions.FieldDoesNotExist:
+            if name in queryset.query.annotations or name in prefetch_roots:
+                continue
+            return queryset
+        if model_field.concrete:
+            only_fields.add(model_field.name)
+
+    if select_related:
+        kept_select_related = {name: children for name, children in select_related.items() if name in only_fields}
+        queryset = queryset.select_related(None)
+        if kept_select_related:
+            queryset = queryset.select_related(*_get_select_related_lookups(kept_select_related))
+
+    prefetches = queryset._prefetch_related_lookups
+    kept_prefetches = [lookup for lookup in prefetches if _get_prefetch_root(lookup) in attribute_names]
+    if len(kept_prefetches) != len(prefetches):
+        queryset = queryset.prefetch_related(None).prefetch_related(*kept_prefetches)
+    return queryset.only(*only_fields)
+
+
+class SparseFieldsetMixin:
+    """
+    Lets clients of the reading actions choose the returned fields with the `fields` query parameter, or leave
+    fields out with `omit`. The projection is pushed down into the queryset with project_queryset(), so that only
+    the columns and relations the returned fields are read from are loaded. Fields whose sources are not known
+    (SerializerMethodFields without @requires_fields, source="*") keep the queryset as it is.
+    """
+
+    sparse_fieldset_actions = ("list", "retrieve")
+    # Values of the `fields` parameter with a special meaning in the viewset, which are not field names
+    sparse_fieldset_keywords = ()
+
+    def get_sparse_fieldset(self) -> tuple[set[str], set[str]]:
+        """Return names of the fields requested with `fields` and the fields left out with `omit`"""
+        if self.request is None or self.request.method != "GET" or self.action not in self.sparse_fieldset_actions:
+            return set(), set()
+        fields = set(parse_field_names(self.request.query_params.get("fields"))) - set(self.sparse_fieldset_keywords)
+        return fields, set(parse_field_names(self.request.query_params.get("omit")))
+
+    def is_field_requested(self, name: str) -> bool:
+        fields, omitted_fields = self.get_sparse_fieldset()
+        return name not in omitted_fields and (not fields or name in fields)
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields, omitted_fields = self.get_sparse_fieldset()
+        if fields or omitted_fields:
+            self._trim_serializer_fields(
+                serializer.child if isinstance(serializer, serializers.ListSerializer) else serializer,
+                fields,
+                omitted_fields,
+            )
+        return serializer
+
+    def _trim_serializer_fields(self, serializer, fields: set[str], omitted_fields: set[str]) -> None:
+        unknown_fields = (fields | omitted_fields) - set(serializer.fields)
+        if unknown_fields:
+            param = "fields" if unknown_fields & fields else "omit"
+            raise ValidationError(
+                {param: [_("Unknown fields: %(fields)s") % {"fields": ", ".join(sorted(unknown_fields))}]}
+            )
+        for name in list(serializer.fields):
+            if name in omitted_fields or (fields and name not in fields):
+                serializer.fields.pop(name)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields, omitted_fields = self.get_sparse_fieldset()
+        if not (fields or omitted_fields):
+            return queryset
+
+        attribute_names = set()
+        for field in self.get_serializer().fields.values():
+            sources = _get_serializer_field_sources(field)
+            if sources is None:
+                return queryset
+            attribute_names |= sources
+        return project_queryset(queryset, attribute_names)
+
+
+class FastReadMixin:
+    """
+    Serializes list responses from QuerySet.values() rows with the fast read plan of the serializer class (see
+    traffic_control.serializers.fast), skipping model instances. Serializers the plan can't be compiled for, e.g.
+    ones with SerializerMethodFields, are listed with the regular serializer.
+    """
+
+    def get_fast_read_plan(self):
+        if not settings.FAST_READ_SERIALIZERS_ENABLED:
+            return None
+        plan = get_fast_read_plan(self.get_serializer_class())
+        if plan is None:
+            return None
+        # Also validates the sparse fieldset parameters
+        serializer = self.get_serializer()
+        return plan.select(serializer.child if isinstance(serializer, serializers.ListSerializer) else serializer)
+
+    def list(self, request, *args, **kwargs):
+        plan = self.get_fast_read_plan()
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        values_queryset = plan.get_values_queryset(queryset)
+        page = self.paginate_queryset(values_queryset)
+        data = plan.serialize(
+            list(page if page is not None else values_queryset), queryset, self.get_serializer_context()
+        )
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+
+@extend_schema(methods=("get",), parameters=[geo_format_parameter, sparse_fields_parameter, omit_fields_parameter])
+class TrafficControlViewSet(FastReadMixin, SparseFieldsetMixin, BatchWriteMixin, ModelViewSet, AuditLoggingMixin):
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     ordering_fields = "__all__"
     ordering = ["-created_at"]
@@ -124,6 +481,7 @@ class TrafficControlViewSet(ModelViewSet, AuditLoggingMixin):
 class PermissionFilteredFilePrefetchMixin:
     # Mixin to automatically prefetch permission-filtered files to solve N+1 problems.
     # Requires the ViewSet to define file_queryset, file_related_name, and file_permission_codename.
+    # Files are not prefetched when they are left out with the sparse fieldset parameters of SparseFieldsetMixin.
 
     file_queryset = None
     file_related_name = "files"
@@ -135,6 +493,8 @@ class PermissionFilteredFilePrefetchMixin:
 
         if self.file_queryset is None or not self.file_permission_codename:
             return qs
+        if not self.is_field_requested(self.file_related_name):
+            return qs
 
         if user and user.is_authenticated:
             # Pre-warm Django's ContentType cache for the file model.  Guardian's
@@ -1,5 +1,4 @@
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
@@ -74,10 +73,8 @@ class AdditionalSignPlanViewSet(
     file_relation = "additional_sign_plan"
     file_permission_codename = "traffic_control.view_additionalsignplanfile"
 
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        additional_sign_plan_soft_delete(instance, request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+    def perform_destroy(self, instance):
+        additional_sign_plan_soft_delete(instance, self.request.user)
 
     @extend_schema(
         methods=("post",),
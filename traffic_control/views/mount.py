@@ -1,11 +1,9 @@
 from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
 from rest_framework.parsers import MultiPartParser
-from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 from traffic_control.filters import (
@@ -83,10 +81,8 @@ class MountPlanViewSet(
     file_relation = "mount_plan"
     file_permission_codename = "traffic_control.view_mountplanfile"
 
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        mount_plan_soft_delete(instance, request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+    def perform_destroy(self, instance):
+        mount_plan_soft_delete(instance, self.request.user)
 
     @extend_schema(
         methods=("post",),
@@ -1,24 +1,60 @@
-from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiExample
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiExample, OpenApiParameter
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from traffic_control.filters import PlanFilterSet
 from traffic_control.models import Plan
+from traffic_control.models.plan import PLAN_DERIVED_LOCATION_FIELDS, PLAN_SIMPLIFIED_LOCATION_FIELDS
 from traffic_control.schema import location_search_parameter
 from traffic_control.serializers.bulk_plan_insert import (
     BULK_PLAN_INSERT_MOCK_BATCH_PAYLOAD,
     BulkPlanInputResponseSerializer,
     BulkPlanInputSerializer,
 )
-from traffic_control.serializers.plan import PlanGeoJSONSerializer, PlanSerializer
-from traffic_control.views._common import TrafficControlViewSet
+from traffic_control.serializers.plan import (
+    PlanGeoJSONSerializer,
+    PlanSerializer,
+    PlanSummaryGeoJSONSerializer,
+    PlanSummarySerializer,
+)
+from traffic_control.views._common import parse_field_names, TrafficControlViewSet
+
+plan_simplify_parameter = OpenApiParameter(
+    name="simplify",
+    type=float,
+    required=False,
+    description=(
+        "Return the location simplified with the largest precomputed tolerance (in meters) that does not exceed "
+        "the given tolerance. Precomputed tolerances: "
+        + ", ".join(str(tolerance) for tolerance in PLAN_SIMPLIFIED_LOCATION_FIELDS.values())
+        + "."
+    ),
+)
+
+plan_fields_parameter = OpenApiParameter(
+    name="fields",
+    type=str,
+    required=False,
+    description=(
+        "Comma separated names of the fields to return. `summary` returns the numbers of the device plans of the "
+        "plans in `linked_objects` instead of their ids."
+    ),
+)
 
 
 @extend_schema_view(
     create=extend_schema(summary="Create new Plan"),
-    list=extend_schema(summary="Retrieve all Plans", parameters=[location_search_parameter]),
-    retrieve=extend_schema(summary="Retrieve single Plan"),
+    list=extend_schema(
+        summary="Retrieve all Plans",
+        parameters=[location_search_parameter, plan_fields_parameter, plan_simplify_parameter],
+    ),
+    retrieve=extend_schema(
+        summary="Retrieve single Plan",
+        parameters=[plan_fields_parameter, plan_simplify_parameter],
+    ),
     update=extend_schema(summary="Update single Plan"),
     partial_update=extend_schema(summary="Partially update single Plan"),
     destroy=extend_schema(summary="Soft-delete single Plan"),
@@ -28,18 +64,62 @@ class PlanViewSet(TrafficControlViewSet):
         "default": PlanSerializer,
         "geojson": PlanGeoJSONSerializer,
     }
-    queryset = (
-        Plan.objects.active()
-        .prefetch_related("additional_sign_plans")
-        .prefetch_related("barrier_plans")
-        .prefetch_related("mount_plans")
-        .prefetch_related("road_marking_plans")
-        .prefetch_related("signpost_plans")
-        .prefetch_related("traffic_light_plans")
-        .prefetch_related("traffic_sign_plans")
-        .prefetch_related("furniture_signpost_plans")
-    )
+    summary_serializer_classes = {
+        "default": PlanSummarySerializer,
+        "geojson": PlanSummaryGeoJSONSerializer,
+    }
+    queryset = Plan.objects.active()
     filterset_class = PlanFilterSet
+    sparse_fieldset_keywords = ("summary",)
+
+    def get_default_queryset(self):
+        queryset = super().get_default_queryset()
+        if self.request.method != "GET":
+            return queryset
+        location_field_name = self._get_location_field_name()
+        queryset = queryset.defer(
+            *(
+                field_name
+                for field_name in ("location", *PLAN_DERIVED_LOCATION_FIELDS)
+                if field_name != location_field_name
+            )
+        )
+        if not self.is_field_requested("linked_objects"):
+            return queryset
+        # Related device plans are annotated instead of prefetched, as plans may have thousands of them
+        if self._is_summary_requested():
+            return queryset.with_device_plan_counts()
+        return queryset.with_device_plan_ids()
+
+    def get_serializer_class(self):
+        if self.request.method == "GET" and self._is_summary_requested():
+            if self.request.query_params.get("geo_format") == "geojson":
+                return self.summary_serializer_classes["geojson"]
+            return self.summary_serializer_classes["default"]
+        return super().get_serializer_class()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method == "GET" and self._get_location_field_name() != "location":
+            context["plan_location_field"] = self._get_location_field_name()
+        return context
+
+    def _get_location_field_name(self) -> str:
+        """Name of the field the location of the plans is read from, depending on the `simplify` parameter"""
+        simplify = self.request.query_params.get("simplify")
+        if not simplify:
+            return "location"
+        try:
+            tolerance = float(simplify)
+        except ValueError:
+            raise ValidationError({"simplify": _("A valid number is required.")})
+        field_names = [
+            name for name, field_tolerance in PLAN_SIMPLIFIED_LOCATION_FIELDS.items() if field_tolerance <= tolerance
+        ]
+        return max(field_names, key=PLAN_SIMPLIFIED_LOCATION_FIELDS.get, default="location")
+
+    def _is_summary_requested(self) -> bool:
+        return "summary" in parse_field_names(self.request.query_params.get("fields"))
 
     @extend_schema(
         summary="Bulk create plans and their dependent objects in one atomic transaction",
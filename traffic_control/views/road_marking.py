@@ -1,8 +1,6 @@
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser
-from rest_framework.response import Response
 
 from traffic_control.filters import (
     RoadMarkingPlanFilterSet,
@@ -73,10 +71,8 @@ class RoadMarkingPlanViewSet(
     file_relation = "road_marking_plan"
     file_permission_codename = "traffic_control.view_roadmarkingplanfile"
 
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        road_marking_plan_soft_delete(instance, request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+    def perform_destroy(self, instance):
+        road_marking_plan_soft_delete(instance, self.request.user)
 
     @extend_schema(
         methods=("post",),
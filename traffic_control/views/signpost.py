@@ -1,8 +1,6 @@
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser
-from rest_framework.response import Response
 
 from traffic_control.filters import SignpostPlanFilterSet, SignpostRealFilterSet, SignpostRealOperationFilterSet
 from traffic_control.mixins import ReplaceableModelMixin
@@ -67,10 +65,8 @@ class SignpostPlanViewSet(
     def get_list_queryset(self):
         return prefetch_replacements(signpost_plan_get_active())
 
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        signpost_plan_soft_delete(instance, request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+    def perform_destroy(self, instance):
+        signpost_plan_soft_delete(instance, self.request.user)
 
     @extend_schema(
         methods=("post",),
@@ -1,8 +1,6 @@
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser
-from rest_framework.response import Response
 
 from traffic_control.filters import (
     TrafficLightPlanFilterSet,
@@ -76,10 +74,8 @@ class TrafficLightPlanViewSet(
     def get_list_queryset(self):
         return prefetch_replacements(traffic_light_plan_get_active())
 
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        traffic_light_plan_soft_delete(instance, request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+    def perform_destroy(self, instance):
+        traffic_light_plan_soft_delete(instance, self.request.user)
 
     @extend_schema(
         methods=("post",),
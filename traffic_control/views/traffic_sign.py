@@ -1,12 +1,11 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
 from rest_framework.parsers import MultiPartParser
-from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from admin_helper.optimizer import QuerySetOptimizerViewSetMixin
 from traffic_control.filters import (
     TrafficControlDeviceTypeFilterSet,
     TrafficSignPlanFilterSet,
@@ -87,7 +86,11 @@ class TrafficControlDeviceTypeViewSet(ModelViewSet, AuditLoggingMixin):
     destroy=extend_schema(summary="Soft-delete single TrafficSign Plan"),
 )
 class TrafficSignPlanViewSet(
-    PermissionFilteredFilePrefetchMixin, TrafficControlViewSet, FileUploadViews, ReplaceableModelMixin
+    QuerySetOptimizerViewSetMixin,
+    PermissionFilteredFilePrefetchMixin,
+    TrafficControlViewSet,
+    FileUploadViews,
+    ReplaceableModelMixin,
 ):
     serializer_classes = {
         "default": TrafficSignPlanOutputSerializer,
@@ -102,10 +105,8 @@ class TrafficSignPlanViewSet(
     file_relation = "traffic_sign_plan"
     file_permission_codename = "traffic_control.view_trafficsignplanfile"
 
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        traffic_sign_plan_soft_delete(instance, request.user)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+    def perform_destroy(self, instance):
+        traffic_sign_plan_soft_delete(instance, self.request.user)
 
     @extend_schema(
         methods=("post",),
@@ -157,7 +158,9 @@ class TrafficSignPlanViewSet(
     partial_update=extend_schema(summary="Partially update single TrafficSign Real"),
     destroy=extend_schema(summary="Soft-delete single TrafficSign Real"),
 )
-class TrafficSignRealViewSet(PermissionFilteredFilePrefetchMixin, TrafficControlViewSet, FileUploadViews):
+class TrafficSignRealViewSet(
+    QuerySetOptimizerViewSetMixin, PermissionFilteredFilePrefetchMixin, TrafficControlViewSet, FileUploadViews
+):
     serializer_classes = {
         "default": TrafficSignRealSerializer,
         "geojson": TrafficSignRealGeoJSONSerializer,
@@ -0,0 +1,266 @@
+"""
+Server-side response cache for the WFS endpoint.
+
+GetFeature responses are cached under a key built from the normalized request parameters and from the data versions
+(see `traffic_control.utils.data_version`) of every table the requested feature types read from. Saving or deleting
+a row of such a table, or bumping its version explicitly after bulk writes, invalidates the cached responses.
+
+GetCapabilities and DescribeFeatureType responses only describe the service, so they are keyed by the service version
+and the feature type configuration instead of data versions.
+
+Responses are stored gzip compressed and served as such to clients accepting gzip. An ETag is attached to every
+cached response and conditional requests with a matching If-None-Match header are answered with 304 Not Modified.
+"""
+
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import models
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from gisserver.features import FeatureType
+
+from cityinfra.metrics import record_cache_hit
+from traffic_control.utils.data_version import get_data_versions
+
+WFS_RESPONSE_CACHE_KEY_PREFIX = "wfs:response"
+
+DATA_OPERATIONS = {"GETFEATURE"}
+SERVICE_OPERATIONS = {"GETCAPABILITIES", "DESCRIBEFEATURETYPE"}
+
+# Parameters whose values are case-insensitive keywords and can be lower-cased for the cache key
+_CASE_INSENSITIVE_PARAMETERS = {"SERVICE", "REQUEST", "OUTPUTFORMAT", "RESULTTYPE"}
+_TYPE_NAME_PARAMETERS = ("TYPENAMES", "TYPENAME")
+_PASSED_HEADERS = ("Content-Disposition",)
+
+
+def get_feature_type_dependencies(feature_type: FeatureType) -> Set[str]:
+    """
+    Return database tables whose content can affect the output of given feature type.
+
+    These are the table of the feature type's model, tables of its forward relations (fields rendered through
+    `model_attribute` paths like `device_type.code`) and tables of its reverse one-to-one relations (replacements).
+    The user model is excluded, as it's saved on every login and only its primary key is rendered.
+    """
+    return _get_model_dependencies(feature_type.model)
+
+
+@lru_cache(maxsize=None)
+def _get_model_dependencies(model) -> Set[str]:
+    user_model = get_user_model()
+    tables = {model._meta.db_table}
+    for field in model._meta.get_fields():
+        related_model = field.related_model
+        if related_model is None or related_model is user_model:
+            continue
+        if field.many_to_one or field.one_to_one:
+            tables.add(related_model._meta.db_table)
+    return tables
+
+
+def get_dependency_models(feature_types: Iterable[FeatureType]) -> List[type[models.Model]]:
+    """Return all models whose changes must invalidate cached responses of given feature types"""
+    from django.apps import apps
+
+    tables = set().union(*(get_feature_type_dependencies(feature_type) for feature_type in feature_types))
+    return [model for model in apps.get_models() if model._meta.db_table in tables]
+
+
+def _normalize_parameters(kvp: Dict[str, str]) -> List[List[str]]:
+    parameters = []
+    for key, value in kvp.items():
+        value = value.strip()
+        if not value:
+            continue
+        if key in _CASE_INSENSITIVE_PARAMETERS:
+            value = value.lower()
+        elif key in _TYPE_NAME_PARAMETERS:
+            value = ",".join(type_name.strip() for type_name in value.split(","))
+        parameters.append([key, value])
+    return sorted(parameters)
+
+
+def _get_requested_feature_types(kvp: Dict[str, str], feature_types: List[FeatureType]) -> List[FeatureType]:
+    raw_type_names = next((kvp[key] for key in _TYPE_NAME_PARAMETERS if kvp.get(key)), "")
+    # Drop namespace prefixes (app:trafficsignreal) and parenthesized joins, only the names matter here
+    requested = {
+        type_name.strip(" ()").split(":")[-1].lower() for type_name in raw_type_names.split(",") if type_name.strip()
+    }
+    matched = [feature_type for feature_type in feature_types if feature_type.name.lower() in requested]
+    if not matched or len(matched) < len(requested):
+        # Stored queries and unknown type names could touch any of the feature types
+        return feature_types
+    return matched
+
+
+def _get_service_fingerprint(view) -> str:
+    configuration = [
+        settings.VERSION,
+        view.xml_namespace,
+        [
+            [
+                feature_type.name,
+                [field.name if hasattr(field, "name") else str(field) for field in (feature_type._fields or [])],
+                [str(crs) for crs in [feature_type._crs, *feature_type.other_crs]],
+            ]
+            for feature_type in view.feature_types
+        ],
+    ]
+    return hashlib.sha256(json.dumps(configuration, default=str).encode()).hexdigest()
+
+
+def get_response_cache_key(view) -> Optional[str]:
+    """Return the cache key of the WFS request handled by given view, or None when it must not be cached"""
+    operation = view.KVP.get("REQUEST", "").strip().upper()
+    if operation in DATA_OPERATIONS:
+        tables = set().union(
+            *(
+                get_feature_type_dependencies(feature_type)
+                for feature_type in _get_requested_feature_types(view.KVP, view.feature_types)
+            )
+        )
+        dependency = sorted(get_data_versions(tables).items())
+    elif operation in SERVICE_OPERATIONS:
+        dependency = view.service_fingerprint
+    else:
+        return None
+
+    # Response documents contain absolute URLs to the service, so the host is part of the key
+    key_data = [view.request.build_absolute_uri(view.request.path), _normalize_parameters(view.KVP), dependency]
+    digest = hashlib.sha256(json.dumps(key_data).encode()).hexdigest()
+    return f"{WFS_RESPONSE_CACHE_KEY_PREFIX}:{operation.lower()}:{digest}"
+
+
+def _get_timeout(cache_key: str) -> int:
+    if cache_key.startswith(f"{WFS_RESPONSE_CACHE_KEY_PREFIX}:getfeature:"):
+        return settings.WFS_RESPONSE_CACHE_TIMEOUT
+    return settings.WFS_SERVICE_RESPONSE_CACHE_TIMEOUT
+
+
+def _make_etag(content: bytes) -> str:
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def _accepts_gzip(request) -> bool:
+    return "gzip" in request.headers.get("Accept-Encoding", "").lower()
+
+
+def _is_not_modified(request, etag: str) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    return "*" in etags or etag in etags
+
+
+def _store_response(cache_key: str, content: bytes, etag: str, content_type: str, headers: Dict[str, str]):
+    entry = {
+        "content": gzip.compress(content, compresslevel=6),
+        "etag": etag,
+        "content_type": content_type,
+        "headers": headers,
+    }
+    cache.set(cache_key, entry, timeout=_get_timeout(cache_key))
+
+
+def response_from_cache_entry(request, entry: dict) -> HttpResponse:
+    """Build a response from a cached entry, answering conditional and gzip accepting requests without rework"""
+    if _is_not_modified(request, entry["etag"]):
+        response = HttpResponseNotModified()
+    elif _accepts_gzip(request):
+        response = HttpResponse(entry["content"], content_type=entry["content_type"])
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(gzip.decompress(entry["content"]), content_type=entry["content_type"])
+
+    for name, value in entry["headers"].items():
+        response[name] = value
+    response["ETag"] = entry["etag"]
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def _caching_stream(cache_key: str, streaming_content: Iterable[bytes], content_type: str, headers: Dict[str, str]):
+    """
+    Pass through the streamed chunks while collecting them into the cache.
+
+    Streams larger than WFS_RESPONSE_CACHE_MAX_SIZE are not cached. When rendering fails mid-stream the exception
+    propagates through here and nothing gets stored.
+    """
+    max_size = settings.WFS_RESPONSE_CACHE_MAX_SIZE
+    chunks = []
+    size = 0
+    for chunk in streaming_content:
+        if chunks is not None:
+            size += len(chunk)
+            if size > max_size:
+                chunks = None
+            else:
+                chunks.append(chunk)
+        yield chunk
+
+    if chunks is not None:
+        content = b"".join(chunks)
+        _store_response(cache_key, content, _make_etag(content), content_type, headers)
+
+
+def cache_response(request, cache_key: str, response):
+    """Store a freshly rendered response into the cache and attach the cache related headers"""
+    if response.status_code != 200 or response.has_header("Content-Encoding"):
+        return response
+
+    headers = {name: response[name] for name in _PASSED_HEADERS if response.has_header(name)}
+    if response.streaming:
+        # The original iterator is read here, streaming_content of the response is replaced by the generator itself
+        response.streaming_content = _caching_stream(
+            cache_key, response.streaming_content, response["Content-Type"], headers
+        )
+        return response
+
+    content = response.content
+    if len(content) > settings.WFS_RESPONSE_CACHE_MAX_SIZE:
+        return response
+
+    etag = _make_etag(content)
+    _store_response(cache_key, content, etag, response["Content-Type"], headers)
+    if _is_not_modified(request, etag):
+        response = HttpResponseNotModified()
+        for name, value in headers.items():
+            response[name] = value
+    response["ETag"] = etag
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+class WFSResponseCacheMixin:
+    """WFSView mixin that serves WFS operations from the response cache when possible"""
+
+    @property
+    def service_fingerprint(self) -> str:
+        cls = type(self)
+        if "_service_fingerprint" not in cls.__dict__:
+            cls._service_fingerprint = _get_service_fingerprint(self)
+        return cls._service_fingerprint
+
+    def call_operation(self, wfs_method_cls):
+        if not settings.WFS_RESPONSE_CACHE_ENABLED or self.request.method != "GET":
+            return super().call_operation(wfs_method_cls)
+
+        cache_key = get_response_cache_key(self)
+        if cache_key is None:
+            return super().call_operation(wfs_method_cls)
+
+        entry = cache.get(cache_key)
+        if entry is not None:
+            record_cache_hit()
+            return response_from_cache_entry(self.request, entry)
+
+        response = super().call_operation(wfs_method_cls)
+        return cache_response(self.request, cache_key, response)
@@ -183,11 +183,6 @@ class CentroidLocationXsdElement(XsdElement):
         return getattr(instance, "centroid_location", None)
 
 
-class ConvexHullLocationXsdElement(XsdElement):
-    def get_value(self, instance: models.Model):
-        return getattr(instance, "convex_hull_location", None)
-
-
 class IconXsdElement(XsdElement):
     def get_value(self, instance: models.Model):
         # instance needs to have device_type field
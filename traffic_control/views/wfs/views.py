@@ -17,10 +17,11 @@ from traffic_control.views.wfs import (
     TrafficSignPlanFeatureType,
     TrafficSignRealFeatureType,
 )
+from traffic_control.views.wfs.cache import WFSResponseCacheMixin
 from traffic_control.views.wfs.common import CustomGetFeature
 
 
-class CityInfrastructureWFSView(WFSView):
+class CityInfrastructureWFSView(WFSResponseCacheMixin, WFSView):
     service_description = ServiceDescription(title="City Infra WFS API")
 
     xml_namespace = f"http://{settings.HOSTNAME}/wfs"
@@ -75,10 +75,32 @@ class User(AbstractUser):
 
         groups = Group.objects.filter(user=self).prefetch_related("operational_area", "operational_area__areas")
         return (
-            self.operational_areas.filter(location__contains=location).exists()
-            or groups.filter(operational_area__areas__location__contains=location).exists()
+            self.operational_areas.filter(is_active=True, location__contains=location).exists()
+            or groups.filter(
+                operational_area__areas__is_active=True, operational_area__areas__location__contains=location
+            ).exists()
         )
 
+    def locations_are_in_operational_area(self, locations) -> list[bool]:
+        """
+        Check for each of the given locations if it is within the operational area defined for user. The areas are
+        fetched once, instead of querying them for each location as location_is_in_operational_area does.
+        """
+        if self.is_superuser or self.bypass_operational_area:
+            return [True for _location in locations]
+
+        from traffic_control.models import OperationalArea
+
+        areas = (
+            OperationalArea.objects.filter(Q(users=self) | Q(groups__group__user=self), is_active=True)
+            .distinct()
+            .values_list("location", flat=True)
+        )
+        prepared_areas = [area.prepared for area in areas if area]
+        return [
+            location is not None and any(area.contains(location) for area in prepared_areas) for location in locations
+        ]
+
     def has_bypass_responsible_entity_permission(self):
         return self.is_superuser or self.bypass_responsible_entity
 
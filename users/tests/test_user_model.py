@@ -86,6 +86,22 @@ def test__user_group_operational_area__contains_location(location, expected):
     assert in_area == expected
 
 
+@pytest.mark.parametrize("via_group", (False, True))
+@pytest.mark.django_db
+def test__user_operational_area__inactive_area_does_not_contain_location(via_group):
+    user = get_user()
+    oa = OperationalAreaFactory(location=area, is_active=False)
+    if via_group:
+        group = Group.objects.create(name="test group")
+        user.groups.add(group)
+        GroupOperationalArea.objects.create(group=group).areas.add(oa)
+    else:
+        user.operational_areas.add(oa)
+
+    assert not user.location_is_in_operational_area(point_inside_area)
+    assert user.locations_are_in_operational_area([point_inside_area]) == [False]
+
+
 @pytest.mark.django_db
 def test__user_permissions_changed_to_auditlog():
     user = get_user()